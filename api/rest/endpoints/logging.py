@@ -68,18 +68,10 @@ async def get_agent_sessions(
 ) -> Dict[str, Any]:
     """Get agent session logs with optional filtering."""
     try:
-        # Get all log entries
-        entries = agent_logger.entries
-
-        # Apply filters
-        if agent_name:
-            entries = [e for e in entries if e.agent_name == agent_name]
-
-        if workflow_id:
-            entries = [e for e in entries if e.workflow_id == workflow_id]
-
-        # Sort by timestamp (most recent first) and limit
-        entries = sorted(entries, key=lambda x: x.timestamp, reverse=True)[:limit]
+        # Most recent first, served from the agent/workflow indexes
+        entries = agent_logger.entries.recent(
+            limit, agent_name=agent_name or None, workflow_id=workflow_id or None
+        )
 
         # Convert to dict format
         sessions = [entry.to_dict() for entry in entries]
@@ -110,7 +102,7 @@ async def get_agent_performance(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         # Get recent entries
-        recent_entries = [e for e in agent_logger.entries if e.timestamp >= cutoff_time]
+        recent_entries = agent_logger.entries.since(cutoff_time)
 
         # Analyze performance by agent
         agent_stats = {}
@@ -187,10 +179,8 @@ async def get_cost_breakdown(
         # Get recent LLM response entries
         llm_entries = [
             e
-            for e in agent_logger.entries
-            if e.timestamp >= cutoff_time
-            and e.interaction_type.value == "llm_response"
-            and e.cost_usd is not None
+            for e in agent_logger.entries.since(cutoff_time)
+            if e.interaction_type.value == "llm_response" and e.cost_usd is not None
         ]
 
         # Analyze costs
@@ -283,7 +273,7 @@ async def export_logs(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         # Get recent entries
-        recent_entries = [e for e in agent_logger.entries if e.timestamp >= cutoff_time]
+        recent_entries = agent_logger.entries.since(cutoff_time)
 
         if format == "json":
             export_data = {
@@ -13,7 +13,20 @@ from dotenv import load_dotenv
 load_dotenv(dotenv_path=Path(".env"), override=False)
 
 from core.infrastructure.config.settings import get_settings
-from .v1.endpoints import content, workflows, agents, system, knowledge_base
+from core.infrastructure.container import init_app_container
+from core.infrastructure.database.supabase_io import supabase_io
+from core.infrastructure.database.supabase_tracker import flush_all_trackers
+from core.infrastructure.logging.agent_logger import agent_logger
+from core.infrastructure.logging.event_loop_monitor import event_loop_monitor
+from core.infrastructure.logging.metrics import install_metrics
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
+from core.infrastructure.external_services.service_account_token import (
+    close_token_providers,
+)
+from core.infrastructure.jobs.job_queue import get_job_queue
+from .v1.endpoints import content, workflows, agents, system, knowledge_base, jobs
 from .endpoints import logging as logging_endpoints
 from .middleware import LoggingMiddleware
 from .exceptions import setup_exception_handlers
@@ -48,11 +61,37 @@ async def lifespan(app: FastAPI):
     if not settings.has_any_provider():
         logger.warning("No AI providers configured. Some features may not work.")
 
+    # Shared repositories, providers and tools for every request
+    init_app_container(settings)
+
     # Initialize services here if needed
+    event_loop_monitor.start()
+
+    # Background generation and embedding backfill jobs (recovers runs
+    # interrupted by a restart)
+    job_queue = get_job_queue()
+    if job_queue is not None:
+        job_queue.register_handler(
+            content.CONTENT_GENERATION_JOB, content.run_generation_job
+        )
+        job_queue.register_handler(
+            knowledge_base.EMBEDDING_BACKFILL_JOB,
+            knowledge_base.run_embedding_backfill_job,
+        )
+        await job_queue.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down CGSRef API...")
+    if job_queue is not None:
+        await job_queue.stop()
+    await event_loop_monitor.stop()
+    await http_client_registry.aclose()
+    close_token_providers()
+    flush_all_trackers()
+    supabase_io.shutdown(wait=True)
+    agent_logger.entries.flush()
 
 
 def create_app() -> FastAPI:
@@ -84,6 +123,9 @@ def create_app() -> FastAPI:
     # Add custom middleware
     app.add_middleware(LoggingMiddleware)
 
+    # Prometheus request latency + /metrics
+    install_metrics(app, app_name="cgs_api")
+
     # Setup exception handlers
     setup_exception_handlers(app)
 
@@ -93,6 +135,7 @@ def create_app() -> FastAPI:
     app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
     app.include_router(system.router, prefix="/api/v1/system", tags=["system"])
     app.include_router(knowledge_base.router, prefix="/api/v1", tags=["knowledge-base"])
+    app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["jobs"])
     app.include_router(logging_endpoints.router, tags=["logging"])
 
     # Health check endpoint
@@ -1,6 +1,5 @@
 """FastAPI dependencies for dependency injection."""
 
-from functools import lru_cache
 from typing import Optional
 
 from core.application.use_cases.generate_content import GenerateContentUseCase
@@ -11,49 +10,42 @@ from core.infrastructure.repositories.yaml_agent_repository import YamlAgentRepo
 from core.infrastructure.repositories.file_workflow_repository import (
     FileWorkflowRepository,
 )
-from core.infrastructure.external_services.openai_adapter import OpenAIAdapter
+from core.infrastructure.container import get_app_container
 from core.infrastructure.factories.provider_factory import LLMProviderFactory
 from core.infrastructure.config.settings import get_settings
 from core.domain.value_objects.provider_config import LLMProvider
 
 
-@lru_cache()
 def get_content_repository() -> FileContentRepository:
     """Get content repository instance."""
-    settings = get_settings()
-    return FileContentRepository(settings.output_dir)
+    return get_app_container().content_repository
 
 
-@lru_cache()
 def get_agent_repository() -> YamlAgentRepository:
     """Get agent repository instance."""
-    settings = get_settings()
-    return YamlAgentRepository(settings.profiles_dir)
+    return get_app_container().agent_repository
 
 
-@lru_cache()
 def get_workflow_repository() -> FileWorkflowRepository:
     """Get workflow repository instance."""
-    settings = get_settings()
-    return FileWorkflowRepository(settings.workflows_dir)
+    return get_app_container().workflow_repository
 
 
 def get_llm_provider(provider_type: Optional[str] = None):
-    """Get LLM provider instance with dynamic provider selection."""
+    """Get the shared LLM provider instance with dynamic provider selection."""
     settings = get_settings()
+    container = get_app_container()
 
-    # Use factory to create provider
     if provider_type:
         try:
-            provider_enum = LLMProvider(provider_type)
-            return LLMProviderFactory.create_provider(provider_enum, settings)
+            return container.get_provider(LLMProvider(provider_type))
         except ValueError:
             # Invalid provider type, fall back to default
             pass
 
     # Use default provider
     provider_enum = LLMProviderFactory.get_default_provider(settings)
-    return LLMProviderFactory.create_provider(provider_enum, settings)
+    return container.get_provider(provider_enum)
 
 
 def get_content_use_case(
@@ -65,8 +57,12 @@ def get_content_use_case(
     """Get content generation use case with dynamic provider selection.
     Allows overriding model/temperature/max_tokens so that the AgentExecutor
     uses exactly the configuration selected in the frontend for this request.
+
+    Repositories, provider adapters and tools come from the application
+    container; only the executor and provider config are built per request.
     """
     settings = get_settings()
+    container = get_app_container()
 
     # Resolve provider enum
     if provider_type:
@@ -77,8 +73,8 @@ def get_content_use_case(
     else:
         provider_enum = LLMProviderFactory.get_default_provider(settings)
 
-    # Create provider instance
-    llm_provider = LLMProviderFactory.create_provider(provider_enum, settings)
+    # Shared provider instance (created once per provider type)
+    llm_provider = container.get_provider(provider_enum)
 
     # Use overrides when provided, otherwise fallback to settings/defaults
     eff_temperature = (
@@ -93,12 +89,13 @@ def get_content_use_case(
     )
 
     return GenerateContentUseCase(
-        content_repository=get_content_repository(),
-        workflow_repository=get_workflow_repository(),
-        agent_repository=get_agent_repository(),
+        content_repository=container.content_repository,
+        workflow_repository=container.workflow_repository,
+        agent_repository=container.agent_repository,
         llm_provider=llm_provider,
         provider_config=provider_config,
         rag_service=None,  # Would be implemented later
-        serper_api_key=settings.serper_api_key,
-        perplexity_api_key=settings.perplexity_api_key,
+        agent_executor=container.create_agent_executor(provider_enum, provider_config),
+        rag_tool=container.rag_tool,
+        tracker=container.tracker,
     )
@@ -1,5 +1,5 @@
 """API v1 endpoints."""
 
-from . import content, workflows, agents, system, knowledge_base
+from . import content, workflows, agents, system, knowledge_base, jobs
 
-__all__ = ["content", "workflows", "agents", "system", "knowledge_base"]
+__all__ = ["content", "workflows", "agents", "system", "knowledge_base", "jobs"]
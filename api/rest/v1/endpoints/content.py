@@ -1,9 +1,12 @@
 """Content generation endpoints."""
 
+import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from core.application.use_cases.generate_content import GenerateContentUseCase
@@ -15,9 +18,14 @@ from core.domain.entities.content import ContentType, ContentFormat
 from core.domain.value_objects.provider_config import ProviderConfig, LLMProvider
 from core.domain.value_objects.generation_params import GenerationParams
 from core.infrastructure.factories.provider_factory import LLMProviderFactory
+from core.infrastructure.jobs.job_store import Job
 from core.infrastructure.config.settings import get_settings
+from core.infrastructure.orchestration.generation_events import GenerationEventStream
+from core.infrastructure.repositories.file_content_repository import (
+    FileContentRepository,
+)
 from core.infrastructure.workflows.registry import invalidate_workflow_cache
-from ..dependencies import get_content_use_case
+from ..dependencies import get_content_repository, get_content_use_case
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +126,211 @@ class ContentListResponseModel(BaseModel):
     client_profile: Optional[str] = None
 
 
+class ContentSearchHitModel(ContentListResponseModel):
+    """API model for a full-text search hit."""
+
+    score: float
+    snippet: str
+    tags: List[str] = []
+
+
+class ContentSearchResponseModel(BaseModel):
+    """API model for full-text search results."""
+
+    query: str
+    total_count: int
+    limit: int
+    offset: int
+    results: List[ContentSearchHitModel]
+    took_ms: float
+
+
+def _build_content_request(
+    request: ContentGenerationRequestModel,
+) -> ContentGenerationRequest:
+    """Convert the API model into the application request DTO."""
+    try:
+        provider_config = ProviderConfig(
+            provider=LLMProvider(request.provider),
+            model=request.model,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens,
+        )
+        logger.info("Provider config created successfully")
+    except Exception as e:
+        logger.error(f"Error creating provider config: {str(e)}")
+        raise
+
+    # Build generation params based on workflow type
+    generation_params_dict = {
+        "topic": request.topic,
+        "content_type": ContentType(request.content_type),
+        "content_format": ContentFormat(request.content_format),
+        "target_word_count": request.target_word_count,
+        "custom_instructions": request.custom_instructions,
+        "target_audience": request.target_audience
+        or request.target,  # Use target if available
+        "include_sources": request.include_sources,
+        "include_statistics": request.include_statistics,
+        "image_style": request.image_style,
+        "image_provider": request.image_provider,
+    }
+
+    # Add workflow-specific parameters
+    if request.workflow_type == "enhanced_article":
+        generation_params_dict.update(
+            {
+                "target": request.target,
+                "context": request.context,
+                "tone": request.tone,
+                "include_examples": request.include_examples,
+            }
+        )
+    elif request.workflow_type == "newsletter_premium":
+        generation_params_dict.update(
+            {
+                "newsletter_topic": request.newsletter_topic,
+                "edition_number": request.edition_number,
+                "featured_sections": request.featured_sections,
+            }
+        )
+
+    try:
+        generation_params = GenerationParams(**generation_params_dict)
+        logger.info("Generation params created successfully")
+    except Exception as e:
+        logger.error(f"Error creating generation params: {str(e)}")
+        logger.error(f"Generation params dict: {generation_params_dict}")
+        raise
+
+    try:
+        content_request = ContentGenerationRequest(
+            topic=request.topic,
+            content_type=ContentType(request.content_type),
+            content_format=ContentFormat(request.content_format),
+            client_profile=request.client_profile,
+            workflow_type=request.workflow_type,
+            provider_config=provider_config,
+            generation_params=generation_params,
+            custom_instructions=request.custom_instructions,
+            context=request.context,
+        )
+        logger.info("Content request created successfully")
+    except Exception as e:
+        logger.error(f"Error creating content request: {str(e)}")
+        raise
+
+    return content_request
+
+
+def _apply_selected_documents(
+    use_case: GenerateContentUseCase, request: ContentGenerationRequestModel
+) -> None:
+    """Pass selected documents (if any) to the RAG tool so agents restrict retrieval."""
+    try:
+        if hasattr(request, "selected_documents") and request.selected_documents:
+            logger.info(
+                f"📎 Selected documents provided: {len(request.selected_documents)}"
+            )
+            try:
+                # Set selection on the use case's RAG tool
+                use_case.rag_tool.set_selected_documents(request.selected_documents)
+                logger.info("RAG tool selection set successfully")
+            except Exception as sel_err:  # pragma: no cover
+                logger.warning(
+                    f"Failed to set selected documents on RAG tool: {sel_err}"
+                )
+        else:
+            # Clear any previous selection
+            try:
+                use_case.rag_tool.set_selected_documents(None)
+            except Exception:
+                pass
+    except Exception as e:
+        logger.warning(f"Issue handling selected_documents: {e}")
+
+
+def _to_response_model(
+    response: ContentGenerationResponse,
+) -> ContentGenerationResponseModel:
+    """Convert the application response DTO into the API model."""
+    # Convert workflow metrics if present
+    workflow_metrics = None
+    if response.workflow_metrics:
+        workflow_metrics = WorkflowMetricsModel(
+            total_cost=response.workflow_metrics.total_cost,
+            total_tokens=response.workflow_metrics.total_tokens,
+            duration_seconds=response.workflow_metrics.duration_seconds,
+            agents_used=response.workflow_metrics.agents_used,
+            success_rate=response.workflow_metrics.success_rate,
+            tasks_completed=response.workflow_metrics.tasks_completed,
+            tasks_failed=response.workflow_metrics.tasks_failed,
+            tool_calls=response.workflow_metrics.tool_calls,
+            llm_calls=response.workflow_metrics.llm_calls,
+        )
+
+    return ContentGenerationResponseModel(
+        content_id=str(response.content_id),
+        title=response.title,
+        body=response.body,
+        content_type=response.content_type.value,
+        content_format=response.content_format.value,
+        workflow_id=str(response.workflow_id) if response.workflow_id else None,
+        generation_time_seconds=response.generation_time_seconds,
+        word_count=response.word_count,
+        character_count=response.character_count,
+        reading_time_minutes=response.reading_time_minutes,
+        tasks_completed=response.tasks_completed,
+        total_tasks=response.total_tasks,
+        success=response.success,
+        error_message=response.error_message,
+        warnings=response.warnings,
+        metadata=response.metadata,
+        workflow_metrics=workflow_metrics,
+        generated_image=response.generated_image,
+        image_metadata=response.image_metadata,
+    )
+
+
+def _get_request_use_case(
+    request: ContentGenerationRequestModel,
+) -> GenerateContentUseCase:
+    """Get a use case bound to the provider requested by the client."""
+    logger.info(f"🔧 Requested provider: {request.provider}")
+    use_case = get_content_use_case(
+        provider_type=request.provider,
+        model=request.model,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens,
+    )
+    logger.info(f"✅ Use case created with provider: {request.provider}")
+    return use_case
+
+
+CONTENT_GENERATION_JOB = "content_generation"
+
+
+async def run_generation_job(job: Job) -> Dict[str, Any]:
+    """
+    Job-queue handler that runs one queued content generation.
+
+    The job payload is a serialized ``ContentGenerationRequestModel``; the
+    result stored on the job matches the ``/generate`` response body.
+
+    Raises:
+        RuntimeError: If the generation did not succeed
+    """
+    request = ContentGenerationRequestModel(**job.payload)
+    use_case = _get_request_use_case(request)
+    content_request = _build_content_request(request)
+    _apply_selected_documents(use_case, request)
+
+    response = await use_case.execute(content_request)
+    if not response.success:
+        raise RuntimeError(response.error_message or "Content generation failed")
+    return _to_response_model(response).dict()
+
+
 @router.post("/generate", response_model=ContentGenerationResponseModel)
 async def generate_content(
     request: ContentGenerationRequestModel, background_tasks: BackgroundTasks
@@ -130,111 +343,13 @@ async def generate_content(
     """
     try:
         logger.info(f"Received content generation request: {request.dict()}")
-        logger.info(f"🔧 Requested provider: {request.provider}")
 
         # Get use case with dynamic provider selection
-        use_case = get_content_use_case(
-            provider_type=request.provider,
-            model=request.model,
-            temperature=request.temperature,
-            max_tokens=request.max_tokens,
-        )
-        logger.info(f"✅ Use case created with provider: {request.provider}")
+        use_case = _get_request_use_case(request)
 
         # Convert API model to application DTO
-        try:
-            provider_config = ProviderConfig(
-                provider=LLMProvider(request.provider),
-                model=request.model,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-            )
-            logger.info("Provider config created successfully")
-        except Exception as e:
-            logger.error(f"Error creating provider config: {str(e)}")
-            raise
-
-        # Build generation params based on workflow type
-        generation_params_dict = {
-            "topic": request.topic,
-            "content_type": ContentType(request.content_type),
-            "content_format": ContentFormat(request.content_format),
-            "target_word_count": request.target_word_count,
-            "custom_instructions": request.custom_instructions,
-            "target_audience": request.target_audience
-            or request.target,  # Use target if available
-            "include_sources": request.include_sources,
-            "include_statistics": request.include_statistics,
-            "image_style": request.image_style,
-            "image_provider": request.image_provider,
-        }
-
-        # Add workflow-specific parameters
-        if request.workflow_type == "enhanced_article":
-            generation_params_dict.update(
-                {
-                    "target": request.target,
-                    "context": request.context,
-                    "tone": request.tone,
-                    "include_examples": request.include_examples,
-                }
-            )
-        elif request.workflow_type == "newsletter_premium":
-            generation_params_dict.update(
-                {
-                    "newsletter_topic": request.newsletter_topic,
-                    "edition_number": request.edition_number,
-                    "featured_sections": request.featured_sections,
-                }
-            )
-
-        try:
-            generation_params = GenerationParams(**generation_params_dict)
-            logger.info("Generation params created successfully")
-        except Exception as e:
-            logger.error(f"Error creating generation params: {str(e)}")
-            logger.error(f"Generation params dict: {generation_params_dict}")
-            raise
-
-        try:
-            content_request = ContentGenerationRequest(
-                topic=request.topic,
-                content_type=ContentType(request.content_type),
-                content_format=ContentFormat(request.content_format),
-                client_profile=request.client_profile,
-                workflow_type=request.workflow_type,
-                provider_config=provider_config,
-                generation_params=generation_params,
-                custom_instructions=request.custom_instructions,
-                context=request.context,
-            )
-            logger.info("Content request created successfully")
-        except Exception as e:
-            logger.error(f"Error creating content request: {str(e)}")
-            raise
-
-        # Pass selected documents (if any) to the RAG tool so agents restrict retrieval
-        try:
-            if hasattr(request, "selected_documents") and request.selected_documents:
-                logger.info(
-                    f"📎 Selected documents provided: {len(request.selected_documents)}"
-                )
-                try:
-                    # Set selection on the use case's RAG tool
-                    use_case.rag_tool.set_selected_documents(request.selected_documents)
-                    logger.info("RAG tool selection set successfully")
-                except Exception as sel_err:  # pragma: no cover
-                    logger.warning(
-                        f"Failed to set selected documents on RAG tool: {sel_err}"
-                    )
-            else:
-                # Clear any previous selection
-                try:
-                    use_case.rag_tool.set_selected_documents(None)
-                except Exception:
-                    pass
-        except Exception as e:
-            logger.warning(f"Issue handling selected_documents: {e}")
+        content_request = _build_content_request(request)
+        _apply_selected_documents(use_case, request)
 
         # Execute content generation
         logger.info("Starting content generation execution")
@@ -245,44 +360,33 @@ async def generate_content(
             logger.error(f"Error during content generation: {str(e)}")
             raise
 
-        # Convert workflow metrics if present
-        workflow_metrics = None
-        if response.workflow_metrics:
-            workflow_metrics = WorkflowMetricsModel(
-                total_cost=response.workflow_metrics.total_cost,
-                total_tokens=response.workflow_metrics.total_tokens,
-                duration_seconds=response.workflow_metrics.duration_seconds,
-                agents_used=response.workflow_metrics.agents_used,
-                success_rate=response.workflow_metrics.success_rate,
-                tasks_completed=response.workflow_metrics.tasks_completed,
-                tasks_failed=response.workflow_metrics.tasks_failed,
-                tool_calls=response.workflow_metrics.tool_calls,
-                llm_calls=response.workflow_metrics.llm_calls,
-            )
-
         # Convert application DTO to API model
-        return ContentGenerationResponseModel(
-            content_id=str(response.content_id),
-            title=response.title,
-            body=response.body,
-            content_type=response.content_type.value,
-            content_format=response.content_format.value,
-            workflow_id=str(response.workflow_id) if response.workflow_id else None,
-            generation_time_seconds=response.generation_time_seconds,
-            word_count=response.word_count,
-            character_count=response.character_count,
-            reading_time_minutes=response.reading_time_minutes,
-            tasks_completed=response.tasks_completed,
-            total_tasks=response.total_tasks,
-            success=response.success,
-            error_message=response.error_message,
-            warnings=response.warnings,
-            metadata=response.metadata,
-            workflow_metrics=workflow_metrics,
-            generated_image=response.generated_image,
-            image_metadata=response.image_metadata,
-        )
+        return _to_response_model(response)
+
+    except ValueError as e:
+        logger.error(f"Validation error in content generation: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error in content generation: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/generate/stream")
+async def generate_content_stream(request: ContentGenerationRequestModel):
+    """
+    Generate content and stream progress as server-sent events.
 
+    Emits ``workflow_started``, ``task_started``/``task_completed`` (or
+    ``task_failed``) for every workflow task, ``token`` events while the final
+    writing task generates, and a closing ``result`` or ``error`` event whose
+    payload matches the ``/generate`` response. Closing the connection cancels
+    the generation.
+    """
+    try:
+        logger.info(f"Received streaming generation request: {request.dict()}")
+        use_case = _get_request_use_case(request)
+        content_request = _build_content_request(request)
+        _apply_selected_documents(use_case, request)
     except ValueError as e:
         logger.error(f"Validation error in content generation: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -290,6 +394,43 @@ async def generate_content(
         logger.error(f"Error in content generation: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+    event_stream = GenerationEventStream()
+
+    async def run_generation() -> None:
+        try:
+            response = await use_case.execute(
+                content_request, event_stream=event_stream
+            )
+            if response.success:
+                event_stream.emit("result", _to_response_model(response).dict())
+            else:
+                event_stream.emit("error", {"message": response.error_message})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Streaming content generation failed: {str(e)}")
+            event_stream.emit("error", {"message": "Internal server error"})
+        finally:
+            event_stream.close()
+
+    generation = asyncio.create_task(run_generation())
+
+    async def sse_frames():
+        try:
+            async for frame in event_stream.sse():
+                yield frame
+        finally:
+            # Client went away before the workflow finished
+            if not generation.done():
+                logger.info("🛑 Stream closed by client, cancelling generation")
+                generation.cancel()
+
+    return StreamingResponse(
+        sse_frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.get("/", response_model=List[ContentListResponseModel])
 async def list_content(
@@ -303,15 +444,88 @@ async def list_content(
     List generated content with optional filtering.
     """
     try:
-        # This would need to be implemented in the use case
-        # For now, return empty list
-        return []
+        list_summaries = getattr(use_case.content_repository, "list_summaries", None)
+        if list_summaries is None:
+            return []
+
+        # Served from the repository's metadata index; bodies are not read
+        summaries = await list_summaries(
+            limit=limit,
+            offset=offset,
+            content_type=content_type,
+            client_profile=client_profile,
+        )
+        return [
+            ContentListResponseModel(
+                content_id=item["id"],
+                title=item["title"],
+                content_type=item["content_type"],
+                status=item["status"],
+                created_at=item["created_at"],
+                word_count=item["word_count"],
+                client_profile=item["client_profile"],
+            )
+            for item in summaries
+        ]
 
     except Exception as e:
         logger.error(f"Error listing content: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/search", response_model=ContentSearchResponseModel)
+async def search_content(
+    q: str = Query(..., min_length=1, description="Full-text query"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    content_type: Optional[str] = None,
+    client_profile: Optional[str] = None,
+    repository: FileContentRepository = Depends(get_content_repository),
+):
+    """
+    Search generated content by relevance (BM25 over title, tags and body).
+
+    Every query term must match. The last term, and any term ending in
+    ``*``, also matches as a prefix once it is at least three characters.
+    """
+    try:
+        started = time.perf_counter()
+        found = await repository.search_index(
+            q,
+            limit=limit,
+            offset=offset,
+            client_profile=client_profile,
+            content_type=content_type,
+        )
+        results = [
+            ContentSearchHitModel(
+                content_id=hit["id"],
+                title=hit["title"],
+                content_type=hit["content_type"],
+                status=hit["status"],
+                created_at=hit["created_at"],
+                word_count=hit["word_count"],
+                client_profile=hit["client_profile"],
+                score=hit["score"],
+                snippet=hit["snippet"] or "",
+                tags=hit["tags"],
+            )
+            for hit in found["results"]
+        ]
+        return ContentSearchResponseModel(
+            query=q,
+            total_count=found["total_count"],
+            limit=limit,
+            offset=offset,
+            results=results,
+            took_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    except Exception as e:
+        logger.error(f"Error searching content: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 class ProviderInfo(BaseModel):
     """Information about an LLM provider."""
 
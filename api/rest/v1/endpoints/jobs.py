@@ -0,0 +1,82 @@
+"""Background job endpoints for content generation."""
+
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import Field
+
+from core.infrastructure.jobs.job_queue import JobQueue, get_job_queue
+from core.infrastructure.jobs.job_store import JobStatus
+from .content import CONTENT_GENERATION_JOB, ContentGenerationRequestModel
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+class ContentJobRequestModel(ContentGenerationRequestModel):
+    """Content generation request submitted as a background job."""
+
+    priority: int = Field(default=0, ge=-10, le=10)
+
+
+def _require_queue() -> JobQueue:
+    job_queue = get_job_queue()
+    if job_queue is None or not job_queue.started:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return job_queue
+
+
+@router.post("", status_code=202)
+async def submit_content_job(request: ContentJobRequestModel) -> Dict[str, Any]:
+    """
+    Queue a content generation run and return its job id immediately.
+
+    Poll ``GET /api/v1/jobs/{job_id}``; once ``status`` is ``succeeded`` the
+    ``result`` field holds the same body ``/content/generate`` returns.
+    """
+    job_queue = _require_queue()
+    payload = request.dict(exclude={"priority"})
+    job = await job_queue.submit(
+        CONTENT_GENERATION_JOB,
+        payload,
+        client_id=request.client_profile or request.client_name,
+        priority=request.priority,
+    )
+    return job.to_dict()
+
+
+@router.get("")
+async def list_jobs(
+    client_id: Optional[str] = Query(None, description="Filter by client"),
+    status: Optional[JobStatus] = Query(None, description="Filter by status"),
+    limit: int = Query(50, ge=1, le=500),
+) -> Dict[str, Any]:
+    """List jobs, newest first."""
+    job_queue = _require_queue()
+    jobs = await job_queue.list_jobs(client_id=client_id, status=status, limit=limit)
+    return {"jobs": [job.to_dict() for job in jobs], "total_count": len(jobs)}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str) -> Dict[str, Any]:
+    """Get the status and, when finished, the result of a job."""
+    job = await _require_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    """Cancel a queued or running job."""
+    job = await _require_queue().cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.finished and job.status != JobStatus.CANCELLED:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job already finished with status {job.status.value}",
+        )
+    return job.to_dict()
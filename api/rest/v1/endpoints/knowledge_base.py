@@ -5,7 +5,11 @@ from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 
+from core.infrastructure.database.supabase_io import supabase_io
 from core.infrastructure.database.supabase_tracker import SupabaseTracker
+from core.infrastructure.jobs.job_queue import JobQueue, get_job_queue
+from core.infrastructure.jobs.job_store import Job
+from core.infrastructure.tools.embedding_backfill import EmbeddingBackfill
 from core.infrastructure.tools.rag_tool import RAGTool
 
 
@@ -55,10 +59,10 @@ class DocumentContentResponse(BaseModel):
 
 
 def get_rag_tool():
-    """Get RAG tool instance with fallback support."""
-    from core.infrastructure.tools.rag_tool import RAGTool
+    """Get the shared RAG tool instance with fallback support."""
+    from core.infrastructure.container import get_app_container
 
-    return RAGTool()
+    return get_app_container().rag_tool
 
 
 @router.get("/clients/{client_name}/documents", response_model=ClientDocumentsResponse)
@@ -284,65 +288,136 @@ async def upload_document(
         raise HTTPException(status_code=500, detail=f"Error uploading document: {e}")
 
 
-@router.post("/clients/{client_name}/backfill-embeddings")
+EMBEDDING_BACKFILL_JOB = "embedding_backfill"
+
+
+def _backfill_lane(client_name: str) -> str:
+    # Own fairness lane so a long backfill never holds the client's generation slot
+    return f"{client_name}:embeddings"
+
+
+def _require_job_queue() -> JobQueue:
+    job_queue = get_job_queue()
+    if job_queue is None or not job_queue.started:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return job_queue
+
+
+async def run_embedding_backfill_job(job: Job) -> Dict[str, Any]:
+    """
+    Job-queue handler that chunks and embeds a client's documents.
+
+    Progress is checkpointed on the job after every page of documents, so an
+    attempt retried after a restart resumes from the last checkpoint.
+    """
+    from core.infrastructure.config.settings import get_settings
+    from core.infrastructure.container import get_app_container
+
+    settings = get_settings()
+    rag_tool = get_app_container().rag_tool
+    if rag_tool.supabase is None:
+        raise RuntimeError("Supabase client not configured")
+
+    backfill = EmbeddingBackfill(
+        rag_tool,
+        page_size=job.payload.get("page_size") or settings.rag_backfill_page_size,
+        concurrency=job.payload.get("concurrency") or settings.rag_backfill_concurrency,
+        chunk_size=settings.rag_chunk_size,
+        chunk_overlap=settings.rag_chunk_overlap,
+    )
+    job_queue = get_job_queue()
+
+    async def checkpoint(progress: Dict[str, Any]) -> None:
+        if job_queue is not None:
+            await job_queue.save_progress(job, progress)
+
+    progress = await backfill.run(
+        job.payload["client_id"],
+        rechunk=job.payload.get("rechunk", False),
+        progress=job.progress,
+        on_progress=checkpoint,
+    )
+    # Re-chunked documents change what RAG search returns
+    rag_tool.invalidate_cached_results(job.payload["client_name"])
+    return {"client": job.payload["client_name"], **progress}
+
+
+@router.post("/clients/{client_name}/backfill-embeddings", status_code=202)
 async def backfill_embeddings(
-    client_name: str, limit: int = 100, rag_tool: RAGTool = Depends(get_rag_tool)
+    client_name: str,
+    rechunk: bool = False,
+    concurrency: Optional[int] = Query(None, ge=1, le=16),
+    page_size: Optional[int] = Query(None, ge=1, le=500),
+    rag_tool: RAGTool = Depends(get_rag_tool),
 ) -> Dict[str, Any]:
-    """Backfill missing embeddings for a client's documents (no scripts required)."""
+    """Queue a chunk-and-embed backfill of a client's documents (no scripts required).
+
+    Documents without chunks are indexed; with ``rechunk=true`` already
+    chunked documents are re-indexed too (e.g. after changing
+    RAG_CHUNK_SIZE/RAG_CHUNK_OVERLAP). Returns the job immediately; if a
+    backfill for the client is already queued or running, that job is
+    returned instead of starting a second one.
+    """
+    job_queue = _require_job_queue()
+    if rag_tool.supabase is None:
+        raise HTTPException(status_code=500, detail="Supabase not configured")
     try:
-        supabase = rag_tool.supabase
-        # Resolve client id
-        client_res = (
-            supabase.table("clients")
+        client_res = await supabase_io.execute(
+            rag_tool.supabase.table("clients")
             .select("id")
             .eq("name", client_name)
             .single()
-            .execute()
-        )
-        client_data = client_res.data
-        if not client_data:
-            raise HTTPException(
-                status_code=404, detail=f"Client {client_name} not found"
-            )
-        client_id = client_data["id"]
-
-        # Fetch docs with null embeddings
-        docs_res = (
-            supabase.table("documents")
-            .select("id,title,content")
-            .eq("client_id", client_id)
-            .is_("embedding", "null")
-            .limit(limit)
-            .execute()
         )
-        docs = docs_res.data or []
-
-        updated = 0
-        for doc in docs:
-            emb = rag_tool._embed_text(doc.get("content", ""))
-            try:
-                supabase.table("documents").update({"embedding": emb}).eq(
-                    "id", doc["id"]
-                ).execute()
-                updated += 1
-            except Exception as ue:  # pragma: no cover
-                logger.warning(f"Failed to update embedding for {doc.get('id')}: {ue}")
-                continue
-
-        return {
-            "status": "ok",
-            "client": client_name,
-            "updated": updated,
-            "total_candidates": len(docs),
-        }
-
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Error backfilling embeddings for {client_name}: {e}")
+        logger.error(f"Error resolving client {client_name} for backfill: {e}")
         raise HTTPException(
             status_code=500, detail=f"Error backfilling embeddings: {e}"
         )
+    if not client_res.data:
+        raise HTTPException(status_code=404, detail=f"Client {client_name} not found")
+
+    for job in await job_queue.list_jobs(client_id=_backfill_lane(client_name)):
+        if job.kind == EMBEDDING_BACKFILL_JOB and not job.finished:
+            logger.info(f"♻️ Embedding backfill already active for {client_name}")
+            return job.to_dict()
+
+    job = await job_queue.submit(
+        EMBEDDING_BACKFILL_JOB,
+        {
+            "client_name": client_name,
+            "client_id": client_res.data["id"],
+            "rechunk": rechunk,
+            "concurrency": concurrency,
+            "page_size": page_size,
+        },
+        client_id=_backfill_lane(client_name),
+    )
+    return job.to_dict()
+
+
+@router.get("/clients/{client_name}/backfill-embeddings")
+async def list_backfill_jobs(
+    client_name: str, limit: int = Query(10, ge=1, le=100)
+) -> Dict[str, Any]:
+    """List a client's embedding backfill jobs with their progress, newest first."""
+    jobs = await _require_job_queue().list_jobs(
+        client_id=_backfill_lane(client_name), limit=limit
+    )
+    jobs = [job for job in jobs if job.kind == EMBEDDING_BACKFILL_JOB]
+    return {"jobs": [job.to_dict() for job in jobs], "total_count": len(jobs)}
+
+
+@router.get("/clients/{client_name}/backfill-embeddings/{job_id}")
+async def get_backfill_job(client_name: str, job_id: str) -> Dict[str, Any]:
+    """Get the status and checkpointed progress of an embedding backfill."""
+    job = await _require_job_queue().get(job_id)
+    if (
+        job is None
+        or job.kind != EMBEDDING_BACKFILL_JOB
+        or job.client_id != _backfill_lane(client_name)
+    ):
+        raise HTTPException(status_code=404, detail="Backfill job not found")
+    return job.to_dict()
 
 
 @router.get("/clients", response_model=List[str])
@@ -5,7 +5,13 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Dict, Any
 
+from core.infrastructure.cache.embedding_cache import get_embedding_cache
 from core.infrastructure.config.settings import get_settings
+from core.infrastructure.database.supabase_io import supabase_io
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
+from core.infrastructure.logging.event_loop_monitor import event_loop_monitor
 
 logger = logging.getLogger(__name__)
 
@@ -101,3 +107,22 @@ async def get_config():
         "rag_enabled": settings.rag_enabled,
         "websocket_enabled": settings.websocket_enabled,
     }
+
+
+@router.get("/io")
+async def get_io_status():
+    """Get event-loop lag, Supabase pool and HTTP connection-reuse statistics."""
+    return {
+        "event_loop": event_loop_monitor.get_stats(),
+        "supabase": supabase_io.get_stats(),
+        "http": http_client_registry.get_stats(),
+    }
+
+
+@router.get("/cache")
+async def get_cache_status():
+    """Get embedding cache hit rates and tier sizes."""
+    embedding_cache = get_embedding_cache()
+    return {
+        "embeddings": embedding_cache.get_stats() if embedding_cache else None,
+    }
@@ -21,6 +21,10 @@ from ..interfaces.llm_provider_interface import LLMProviderInterface
 from ..interfaces.rag_interface import RAGInterface
 from ...infrastructure.orchestration.task_orchestrator import TaskOrchestrator
 from ...infrastructure.orchestration.agent_executor import AgentExecutor
+from ...infrastructure.orchestration.generation_events import (
+    EVENT_STREAM_KEY,
+    GenerationEventStream,
+)
 from ...infrastructure.tools.web_search_tool import WebSearchTool
 from ...infrastructure.logging.agent_logger import agent_logger
 from ...infrastructure.tools.rag_tool import RAGTool
@@ -30,6 +34,7 @@ from ...infrastructure.workflows.registry import (
     list_available_workflows,
 )
 from ...infrastructure.database.supabase_tracker import get_tracker, SupabaseTracker
+from ...infrastructure.database.supabase_io import supabase_io
 from ...infrastructure import workflows as _workflows  # Ensure handlers are registered
 
 
@@ -54,7 +59,20 @@ class GenerateContentUseCase:
         rag_service: Optional[RAGInterface] = None,
         serper_api_key: Optional[str] = None,
         perplexity_api_key: Optional[str] = None,
+        agent_executor: Optional[AgentExecutor] = None,
+        rag_tool: Optional[RAGTool] = None,
+        tracker: Optional[SupabaseTracker] = None,
     ):
+        """
+        Initialize the use case.
+
+        Args:
+            agent_executor: Executor with tools already registered (e.g. from the
+                application container); built with fresh tools when omitted
+            rag_tool: RAG tool behind the executor's RAG tools, so per-run
+                selection and tracking reach the tool the agents call
+            tracker: Shared tracker; resolved with ``get_tracker()`` when omitted
+        """
         self.content_repository = content_repository
         self.workflow_repository = workflow_repository
         self.agent_repository = agent_repository
@@ -64,30 +82,39 @@ class GenerateContentUseCase:
 
         # Initialize orchestration components
         self.task_orchestrator = TaskOrchestrator(workflow_repository)
-        self.agent_executor = AgentExecutor(
-            agent_repository, llm_provider, provider_config
-        )
+        if agent_executor is not None:
+            self.agent_executor = agent_executor
+            self.rag_tool = rag_tool or RAGTool()
+        else:
+            self.agent_executor = AgentExecutor(
+                agent_repository, llm_provider, provider_config
+            )
 
-        # Initialize tools
-        self.web_search_tool = WebSearchTool(serper_api_key)
-        self.rag_tool = RAGTool()
-        # Do not pull provider model from env; pass explicitly if needed
-        self.perplexity_tool = PerplexityResearchTool(perplexity_api_key)
+            # Initialize tools
+            self.web_search_tool = WebSearchTool(serper_api_key)
+            self.rag_tool = RAGTool()
+            # Do not pull provider model from env; pass explicitly if needed
+            self.perplexity_tool = PerplexityResearchTool(perplexity_api_key)
 
-        # Register tools with agent executor
-        self._register_tools()
+            # Register tools with agent executor
+            self._register_tools()
 
         # Optional tracking
-        self.tracker: Optional[SupabaseTracker] = get_tracker()
+        self.tracker: Optional[SupabaseTracker] = (
+            tracker if tracker is not None else get_tracker()
+        )
 
     async def execute(
-        self, request: ContentGenerationRequest
+        self,
+        request: ContentGenerationRequest,
+        event_stream: Optional[GenerationEventStream] = None,
     ) -> ContentGenerationResponse:
         """
         Execute content generation using dynamic workflow system.
 
         Args:
             request: Content generation request
+            event_stream: Optional sink for task progress and streamed tokens
 
         Returns:
             Content generation response
@@ -103,7 +130,8 @@ class GenerateContentUseCase:
                     # Get agent executor info for tracking
                     agent_executor_info = f"{self.agent_executor.__class__.__name__}({self.provider_config.provider.value})"
 
-                    run_id = self.tracker.start_workflow_run(
+                    run_id = await supabase_io.run(
+                        self.tracker.start_workflow_run,
                         client_name=request.client_profile or "default",
                         workflow_name=request.workflow_type or "content_generation",
                         topic=request.topic,
@@ -132,6 +160,8 @@ class GenerateContentUseCase:
 
             # 1. Build dynamic context from request
             context = await self._build_dynamic_context(request)
+            if event_stream is not None:
+                context[EVENT_STREAM_KEY] = event_stream
             if run_id:
                 context["run_id"] = run_id
                 context["tracker"] = self.tracker
@@ -148,6 +178,15 @@ class GenerateContentUseCase:
                     f"🔧 No workflow_type specified, defaulting to: {workflow_type}"
                 )
 
+            if event_stream is not None:
+                event_stream.emit(
+                    "workflow_started",
+                    {
+                        "workflow_id": context.get("workflow_id"),
+                        "workflow_type": workflow_type,
+                    },
+                )
+
             workflow_result = await self._execute_dynamic_workflow(
                 workflow_type, context
             )
@@ -0,0 +1,241 @@
+"""
+Content-addressed cache for text embeddings.
+
+Vectors are keyed on ``sha256(model + normalized text)``, so re-embedding the
+same query or an unchanged document chunk never reaches the embeddings API.
+An in-memory LRU sits in front of a persistent SQLite table that stores each
+vector as a float32 blob. Lookups and writes are batched: one SQL statement
+per batch of keys rather than one per text.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_SQL_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_embeddings_created ON embeddings (created_at);
+"""
+
+
+def normalize_text(text: str) -> str:
+    """Canonicalize text before hashing: NFC, collapsed whitespace, trimmed."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def embedding_key(model: str, text: str) -> str:
+    material = f"{model}\0{normalize_text(text)}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU + SQLite cache of float32 embedding vectors."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = 4096,
+        max_disk_entries: int = 100_000,
+    ):
+        self.db_path = db_path
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, array]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+        self._stats = {
+            "lookups": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "disk_evictions": 0,
+        }
+        if db_path:
+            if db_path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.executescript(_SCHEMA)
+                self._disk_entries = self._conn.execute(
+                    "SELECT COUNT(*) FROM embeddings"
+                ).fetchone()[0]
+
+    def _remember(self, key: str, vector: array) -> None:
+        # Caller holds the lock
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Look up vectors for ``texts``; misses are ``None``.
+
+        Args:
+            model: Embedding model the vectors must come from
+            texts: Texts to look up, in order
+
+        Returns:
+            One vector (or ``None``) per input text
+        """
+        keys = [embedding_key(model, text) for text in texts]
+        found: Dict[str, array] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            memory_hits = sum(1 for key in keys if key in found)
+
+            missing = list(dict.fromkeys(key for key in keys if key not in found))
+            if missing and self._conn is not None:
+                for start in range(0, len(missing), _SQL_BATCH_SIZE):
+                    batch = missing[start : start + _SQL_BATCH_SIZE]
+                    rows = self._conn.execute(
+                        "SELECT key, vector FROM embeddings WHERE key IN"
+                        f" ({', '.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = array("f")
+                        vector.frombytes(blob)
+                        found[key] = vector
+                        self._remember(key, vector)
+
+            hits = sum(1 for key in keys if key in found)
+            self._stats["lookups"] += len(keys)
+            self._stats["memory_hits"] += memory_hits
+            self._stats["disk_hits"] += hits - memory_hits
+            self._stats["misses"] += len(keys) - hits
+
+        return [found[key].tolist() if key in found else None for key in keys]
+
+    def set_many(
+        self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """Store one vector per text in both tiers."""
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text, values in zip(texts, vectors):
+                key = embedding_key(model, text)
+                vector = array("f", values)
+                self._remember(key, vector)
+                rows.append((key, model, len(vector), vector.tobytes(), now))
+            self._stats["sets"] += len(rows)
+            if self._conn is None or not rows:
+                return
+            try:
+                with self._conn:
+                    before = self._conn.total_changes
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO embeddings"
+                        " (key, model, dimensions, vector, created_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._disk_entries += self._conn.total_changes - before
+                    if self._disk_entries > self.max_disk_entries:
+                        self._evict_disk()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Failed to persist {len(rows)} embeddings: {e}")
+
+    def _evict_disk(self) -> None:
+        """Drop the oldest rows until the table is under 90% of its cap."""
+        # Caller holds the lock inside a transaction
+        excess = self._disk_entries - int(self.max_disk_entries * 0.9)
+        evicted = self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN"
+            " (SELECT key FROM embeddings ORDER BY created_at LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._disk_entries -= evicted
+        self._stats["disk_evictions"] += evicted
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM embeddings")
+                self._disk_entries = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and tier sizes."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = self._disk_entries
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        stats["hit_rate"] = hits / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _embedding_cache_settings() -> Dict[str, Any]:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    settings = get_runtime_settings()
+    return {
+        "enabled": settings.embedding_cache_enabled,
+        "max_entries": settings.embedding_cache_max_entries,
+        "max_disk_entries": settings.embedding_cache_max_disk_entries,
+        "db_path": (
+            os.path.join(settings.cache_dir, "embeddings.sqlite3")
+            if settings.embedding_cache_disk_enabled
+            else None
+        ),
+    }
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+_embedding_cache_loaded = False
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide embedding cache, or ``None`` when disabled."""
+    global _embedding_cache, _embedding_cache_loaded
+    if not _embedding_cache_loaded:
+        config = _embedding_cache_settings()
+        if config["enabled"]:
+            try:
+                _embedding_cache = EmbeddingCache(
+                    db_path=config["db_path"],
+                    max_entries=config["max_entries"],
+                    max_disk_entries=config["max_disk_entries"],
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Embedding cache disk tier unavailable: {e}")
+                _embedding_cache = EmbeddingCache(max_entries=config["max_entries"])
+        _embedding_cache_loaded = True
+    return _embedding_cache
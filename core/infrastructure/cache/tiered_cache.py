@@ -0,0 +1,184 @@
+"""
+Two-tier key/value cache: an in-memory LRU in front of an optional disk tier.
+
+Entries expire after a TTL. The disk tier stores one JSON file per key and
+evicts the least recently written files once it grows past ``disk_max_bytes``.
+Values must be JSON-serializable when the disk tier is enabled.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TieredCache:
+    """Thread-safe LRU + disk cache with TTL and size-based eviction."""
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 512,
+        ttl_seconds: Optional[float] = 86400.0,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.name = name
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self._memory: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+        }
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(
+                f.stat().st_size for f in self.disk_dir.glob("*.json")
+            )
+
+    def _expires_at(self, ttl_seconds: Optional[float]) -> Optional[float]:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        return time.time() + ttl if ttl else None
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.json"  # type: ignore[operator]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default``."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["hits"] += 1
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+        value = self._read_disk(key, now) if self.disk_dir is not None else _MISSING
+        with self._lock:
+            if value is _MISSING:
+                self._stats["misses"] += 1
+                return default
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` (``ttl_seconds`` overrides the default TTL)."""
+        expires_at = self._expires_at(ttl_seconds)
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            self._stats["sets"] += 1
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats["evictions"] += 1
+        if self.disk_dir is not None:
+            self._write_disk(key, expires_at, value)
+
+    def _read_disk(self, key: str, now: float) -> Any:
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            logger.warning(f"⚠️ Unreadable {self.name} cache entry {key}: {e}")
+            return _MISSING
+
+        expires_at = payload.get("expires_at")
+        if expires_at is not None and expires_at <= now:
+            self._remove_disk(path)
+            return _MISSING
+
+        value = payload.get("value")
+        with self._lock:
+            # Promote to memory so the next lookup skips the disk
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+        return value
+
+    def _write_disk(self, key: str, expires_at: Optional[float], value: Any) -> None:
+        path = self._disk_path(key)
+        try:
+            data = json.dumps({"expires_at": expires_at, "value": value})
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._disk_bytes += len(data.encode("utf-8")) - old_size
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to write {self.name} cache entry {key}: {e}")
+            return
+        if self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _remove_disk(self, path: Path) -> None:
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _evict_disk(self) -> None:
+        """Delete the oldest files until the disk tier is under 90% of its cap."""
+        target = int(self.disk_max_bytes * 0.9)
+
+        def _mtime(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        files = sorted(self.disk_dir.glob("*.json"), key=_mtime)  # type: ignore[union-attr]
+        for path in files:
+            if self._disk_bytes <= target:
+                break
+            self._remove_disk(path)
+            with self._lock:
+                self._stats["disk_evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_dir is not None:
+            for path in self.disk_dir.glob("*.json"):
+                self._remove_disk(path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._disk_bytes if self.disk_dir else 0
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,235 @@
+"""
+Memoized results for paid, read-only tool calls (web search and RAG).
+
+Results are keyed on the canonical tool name plus normalized parameters and
+kept for a per-tool TTL: web search results go stale quickly, client RAG
+content changes rarely. Entries can also carry a tag (the client a RAG result
+was read from); writes to that client invalidate every entry stored before
+them. Concurrent identical calls are coalesced so only one upstream request
+is made.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..tools.tool_names import ToolNames
+from .tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+# Tools whose output only depends on their input; anything else is never cached
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    ToolNames.WEB_SEARCH_SERPER: 900.0,
+    ToolNames.WEB_SEARCH_PERPLEXITY: 900.0,
+    ToolNames.RAG_GET_CLIENT_CONTENT: 3600.0,
+    ToolNames.RAG_SEARCH_CONTENT: 3600.0,
+}
+
+# Search engines ignore case; RAG client and document lookups do not
+_CASE_INSENSITIVE_TOOLS = frozenset(
+    {ToolNames.WEB_SEARCH_SERPER, ToolNames.WEB_SEARCH_PERPLEXITY}
+)
+
+# Tool outputs that report a failure rather than a result
+_ERROR_PREFIXES = (
+    "error",
+    "[fallback]",
+    "supabase client not configured",
+    "no client specified",
+)
+# Lookups that missed (e.g. a misspelt client or document name)
+_NOT_FOUND_RE = re.compile(r"^(client|document|knowledge base)\b.*\bnot found\b")
+
+
+def rag_cache_tag(client_name: str) -> str:
+    """Tag for cached results that depend on a client's knowledge base."""
+    return f"rag:{client_name.strip().lower()}"
+
+
+class ToolResultCache:
+    """Per-tool TTL cache with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        disk_dir: Optional[str] = None,
+    ):
+        self.ttls = dict(DEFAULT_TOOL_TTLS if ttls is None else ttls)
+        self.cache = TieredCache(
+            name="tool_results", max_entries=max_entries, disk_dir=disk_dir
+        )
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        return self.ttls.get(tool_name, 0) > 0
+
+    @staticmethod
+    def normalize_input(tool_input: str, casefold: bool = False) -> str:
+        """Canonicalize raw tool input: trim parameters, collapse whitespace."""
+        parts = [re.sub(r"\s+", " ", part).strip() for part in tool_input.split(",")]
+        normalized = ",".join(part for part in parts if part)
+        return normalized.casefold() if casefold else normalized
+
+    def make_key(self, tool_name: str, tool_input: str, scope: Any = None) -> str:
+        casefold = tool_name in _CASE_INSENSITIVE_TOOLS
+        material = json.dumps(
+            [tool_name, self.normalize_input(tool_input, casefold), scope],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _count(self, tool_name: str, outcome: str) -> None:
+        stats = self._stats.setdefault(
+            tool_name, {"hits": 0, "misses": 0, "coalesced": 0}
+        )
+        stats[outcome] += 1
+
+    async def get_or_execute(
+        self,
+        tool_name: str,
+        tool_input: str,
+        execute: Callable[[], Awaitable[Any]],
+        scope: Any = None,
+        is_cacheable_result: Optional[Callable[[Any], bool]] = None,
+        tag: Optional[str] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Return the cached result for a tool call, executing it on a miss.
+
+        Args:
+            tool_name: Canonical tool name
+            tool_input: Raw tool input (normalized for the key)
+            execute: Coroutine factory that performs the real call
+            scope: Extra state the result depends on (e.g. a document filter)
+            is_cacheable_result: Predicate rejecting results that must not be stored
+            tag: Invalidation tag; ``invalidate(tag)`` discards the entry
+
+        Returns:
+            Tuple of (result, served_from_cache)
+        """
+        key = self.make_key(tool_name, tool_input, scope)
+
+        cached = await asyncio.to_thread(self._get_fresh, key, tag)
+        if cached is not None:
+            self._count(tool_name, "hits")
+            logger.info(f"♻️ Tool cache hit: {tool_name}")
+            return cached, True
+
+        pending = self._inflight.get(key)
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            self._count(tool_name, "coalesced")
+            logger.info(f"🔗 Coalesced concurrent {tool_name} call")
+            return await asyncio.shield(pending), True
+
+        self._count(tool_name, "misses")
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        # An invalidation that lands while the call runs must win
+        started_at = time.time()
+        try:
+            result = await execute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; avoid "exception was never retrieved" noise
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            if is_cacheable_result is None or is_cacheable_result(result):
+                entry = {"result": result, "stored_at": started_at}
+                await asyncio.to_thread(
+                    self.cache.set, key, entry, self.ttls[tool_name]
+                )
+            return result, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def _get_fresh(self, key: str, tag: Optional[str]) -> Any:
+        entry = self.cache.get(key)
+        if not isinstance(entry, dict) or "result" not in entry:
+            return None
+        if tag is not None:
+            invalidated_at = self.cache.get(self._tag_key(tag))
+            if invalidated_at is not None and entry["stored_at"] <= invalidated_at:
+                return None
+        return entry["result"]
+
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        # Disk entries are named after their key, so keep it filename-safe
+        return "tag-" + hashlib.sha256(tag.encode("utf-8")).hexdigest()
+
+    def invalidate(self, tag: str) -> None:
+        """Discard every entry stored under ``tag`` before now."""
+        # The marker only has to outlive the entries it shadows
+        ttl = max(self.ttls.values(), default=0) or None
+        self.cache.set(self._tag_key(tag), time.time(), ttl)
+        logger.info(f"🧹 Tool cache invalidated: {tag}")
+
+    @staticmethod
+    def looks_like_error(output_text: str) -> bool:
+        text = (output_text or "").strip().lower()
+        if not text or text.startswith(_ERROR_PREFIXES):
+            return True
+        return _NOT_FOUND_RE.match(text) is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-tool hit/miss counters plus the backing cache stats."""
+        return {
+            "tools": {name: dict(counters) for name, counters in self._stats.items()},
+            "cache": self.cache.get_stats(),
+        }
+
+
+def _tool_cache_settings() -> Dict[str, Any]:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    settings = get_runtime_settings()
+    return {
+        "enabled": settings.tool_cache_enabled,
+        "max_entries": settings.tool_cache_max_entries,
+        "web_search_ttl": settings.tool_cache_web_search_ttl_seconds,
+        "rag_ttl": settings.tool_cache_rag_ttl_seconds,
+        "disk_dir": (
+            os.path.join(settings.cache_dir, "tool_results")
+            if settings.tool_cache_disk_enabled
+            else None
+        ),
+    }
+
+
+_tool_result_cache: Optional[ToolResultCache] = None
+_tool_result_cache_loaded = False
+
+
+def get_tool_result_cache() -> Optional[ToolResultCache]:
+    """Return the process-wide tool result cache, or ``None`` when disabled."""
+    global _tool_result_cache, _tool_result_cache_loaded
+    if not _tool_result_cache_loaded:
+        config = _tool_cache_settings()
+        if config["enabled"]:
+            _tool_result_cache = ToolResultCache(
+                ttls={
+                    ToolNames.WEB_SEARCH_SERPER: config["web_search_ttl"],
+                    ToolNames.WEB_SEARCH_PERPLEXITY: config["web_search_ttl"],
+                    ToolNames.RAG_GET_CLIENT_CONTENT: config["rag_ttl"],
+                    ToolNames.RAG_SEARCH_CONTENT: config["rag_ttl"],
+                },
+                max_entries=config["max_entries"],
+                disk_dir=config["disk_dir"],
+            )
+        _tool_result_cache_loaded = True
+    return _tool_result_cache
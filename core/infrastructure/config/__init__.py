@@ -1,7 +1,13 @@
 """Infrastructure configuration."""
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_runtime_settings, get_settings
 from .environment import Environment
 from .providers import ProviderSettings
 
-__all__ = ["Settings", "get_settings", "Environment", "ProviderSettings"]
+__all__ = [
+    "Settings",
+    "get_settings",
+    "get_runtime_settings",
+    "Environment",
+    "ProviderSettings",
+]
@@ -3,7 +3,7 @@
 import os
 from typing import Optional, Dict, Any, List
 from pathlib import Path
-from pydantic import Field, validator
+from pydantic import Field, ValidationError, validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
@@ -58,6 +58,9 @@ class Settings(BaseSettings):
         default="aiplatform.googleapis.com", env="VERTEX_API_ENDPOINT"
     )
     vertex_api_version: str = Field(default="v1", env="VERTEX_API_VERSION")
+    gemini_max_concurrent_requests: int = Field(
+        default=8, env="GEMINI_MAX_CONCURRENT_REQUESTS"
+    )
 
     # Service Account path (optional, for Vertex AI OAuth2)
     google_application_credentials: Optional[str] = Field(
@@ -96,6 +99,63 @@ class Settings(BaseSettings):
     rag_chunk_size: int = Field(default=1000, env="RAG_CHUNK_SIZE")
     rag_chunk_overlap: int = Field(default=200, env="RAG_CHUNK_OVERLAP")
     rag_max_results: int = Field(default=5, env="RAG_MAX_RESULTS")
+    # Token cap for rag_get_client_content (0 returns the whole knowledge base);
+    # agents override it with metadata.rag_context_token_budget
+    rag_context_token_budget: int = Field(default=8000, env="RAG_CONTEXT_TOKEN_BUDGET")
+    # Embedding backfill job: documents per checkpoint, parallel embedding requests
+    rag_backfill_page_size: int = Field(default=50, env="RAG_BACKFILL_PAGE_SIZE")
+    rag_backfill_concurrency: int = Field(default=4, env="RAG_BACKFILL_CONCURRENCY")
+
+    # LLM response cache (only deterministic requests are cached)
+    llm_cache_enabled: bool = Field(default=True, env="LLM_CACHE_ENABLED")
+    llm_cache_max_temperature: float = Field(
+        default=0.0, env="LLM_CACHE_MAX_TEMPERATURE"
+    )
+    llm_cache_max_entries: int = Field(default=512, env="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_seconds: float = Field(default=86400.0, env="LLM_CACHE_TTL_SECONDS")
+    llm_cache_disk_enabled: bool = Field(default=False, env="LLM_CACHE_DISK_ENABLED")
+    llm_cache_disk_max_mb: int = Field(default=256, env="LLM_CACHE_DISK_MAX_MB")
+
+    # In-memory agent interaction log (ring buffer, optional JSONL spill)
+    agent_log_max_entries: int = Field(default=50000, env="AGENT_LOG_MAX_ENTRIES")
+    agent_log_spill_path: Optional[str] = Field(
+        default=None, env="AGENT_LOG_SPILL_PATH"
+    )
+    agent_log_session_ttl_seconds: float = Field(
+        default=21600.0, env="AGENT_LOG_SESSION_TTL_SECONDS"
+    )
+
+    # Tool result cache (web search and RAG lookups)
+    tool_cache_enabled: bool = Field(default=True, env="TOOL_CACHE_ENABLED")
+    tool_cache_max_entries: int = Field(default=1024, env="TOOL_CACHE_MAX_ENTRIES")
+    tool_cache_web_search_ttl_seconds: float = Field(
+        default=900.0, env="TOOL_CACHE_WEB_SEARCH_TTL_SECONDS"
+    )
+    tool_cache_rag_ttl_seconds: float = Field(
+        default=3600.0, env="TOOL_CACHE_RAG_TTL_SECONDS"
+    )
+    tool_cache_disk_enabled: bool = Field(default=False, env="TOOL_CACHE_DISK_ENABLED")
+
+    # Embedding cache keyed on model + text hash (LRU + SQLite under cache_dir)
+    embedding_cache_enabled: bool = Field(default=True, env="EMBEDDING_CACHE_ENABLED")
+    embedding_cache_max_entries: int = Field(
+        default=4096, env="EMBEDDING_CACHE_MAX_ENTRIES"
+    )
+    embedding_cache_disk_enabled: bool = Field(
+        default=True, env="EMBEDDING_CACHE_DISK_ENABLED"
+    )
+    embedding_cache_max_disk_entries: int = Field(
+        default=100000, env="EMBEDDING_CACHE_MAX_DISK_ENTRIES"
+    )
+
+    # Background job queue for content generation runs (SQLite-backed)
+    job_queue_enabled: bool = Field(default=True, env="JOB_QUEUE_ENABLED")
+    job_queue_db_path: str = Field(default="data/jobs.sqlite3", env="JOB_QUEUE_DB_PATH")
+    job_queue_workers: int = Field(default=2, env="JOB_QUEUE_WORKERS")
+    job_queue_max_running_per_client: int = Field(
+        default=1, env="JOB_QUEUE_MAX_RUNNING_PER_CLIENT"
+    )
+    job_queue_max_attempts: int = Field(default=2, env="JOB_QUEUE_MAX_ATTEMPTS")
 
     # ChromaDB settings
     chroma_host: str = Field(default="localhost", env="CHROMA_HOST")
@@ -104,6 +164,21 @@ class Settings(BaseSettings):
         default="data/chroma", env="CHROMA_PERSIST_DIRECTORY"
     )
 
+    # Outbound HTTP connection pool settings
+    http_pool_max_connections: int = Field(default=100, env="HTTP_POOL_MAX_CONNECTIONS")
+    http_pool_max_keepalive_connections: int = Field(
+        default=20, env="HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    http_pool_keepalive_expiry_seconds: float = Field(
+        default=30.0, env="HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS"
+    )
+    http2_enabled: bool = Field(default=True, env="HTTP2_ENABLED")
+    serper_max_concurrency: int = Field(default=4, env="SERPER_MAX_CONCURRENCY")
+    # Token bucket on Serper calls (0 disables); bursts up to one second's worth
+    serper_requests_per_second: float = Field(
+        default=5.0, env="SERPER_REQUESTS_PER_SECOND"
+    )
+
     # Logging settings
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     log_format: str = Field(
@@ -130,6 +205,16 @@ class Settings(BaseSettings):
     supabase_url: Optional[str] = Field(default=None, env="SUPABASE_URL")
     supabase_anon_key: Optional[str] = Field(default=None, env="SUPABASE_ANON_KEY")
     use_supabase: bool = Field(default=False, env="USE_SUPABASE")
+    supabase_max_workers: int = Field(default=8, env="SUPABASE_MAX_WORKERS")
+    supabase_telemetry_batch_size: int = Field(
+        default=50, env="SUPABASE_TELEMETRY_BATCH_SIZE"
+    )
+    supabase_telemetry_flush_interval_seconds: float = Field(
+        default=2.0, env="SUPABASE_TELEMETRY_FLUSH_INTERVAL_SECONDS"
+    )
+    supabase_telemetry_max_buffered_rows: int = Field(
+        default=5000, env="SUPABASE_TELEMETRY_MAX_BUFFERED_ROWS"
+    )
     # Tool cost tracking (optional overrides; tools also read directly from os.getenv)
     serper_cost_per_call_usd: Optional[float] = Field(default=None, env="SERPER_COST_PER_CALL_USD")
     perplexity_cost_per_call_usd: Optional[float] = Field(default=None, env="PERPLEXITY_COST_PER_CALL_USD")
@@ -269,3 +354,20 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+def get_runtime_settings() -> Settings:
+    """Get settings for infrastructure that must start without ``SECRET_KEY``.
+
+    Job workers, caches, pools and loggers also run inside the onboarding
+    service, which does not configure the core secret key. When that key is
+    the only thing missing, settings are loaded with an empty key so every
+    other field still comes from the environment with its declared default.
+    Any other validation error is raised.
+    """
+    try:
+        return get_settings()
+    except ValidationError as exc:
+        if any(error["loc"] != ("secret_key",) for error in exc.errors()):
+            raise
+        return Settings(secret_key="")
@@ -0,0 +1,208 @@
+"""Process-wide application container.
+
+Holds the dependencies that are expensive to build and safe to share across
+requests: repositories, LLM provider adapters (and their HTTP clients), tool
+instances and the tool registry handed to every ``AgentExecutor``. The API
+lifespan builds it once; requests only add their per-run state (run id,
+tracker binding, selected documents), which tools keep in context variables.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from ..domain.value_objects.provider_config import LLMProvider, ProviderConfig
+from .config.settings import Settings, get_settings
+from .database.supabase_tracker import SupabaseTracker, get_tracker
+from .factories.provider_factory import LLMProviderFactory, ProviderManager
+from .orchestration.agent_executor import AgentExecutor
+from .repositories.file_content_repository import FileContentRepository
+from .repositories.file_workflow_repository import FileWorkflowRepository
+from .repositories.yaml_agent_repository import YamlAgentRepository
+from .tools.brand_style_guide_tool import BrandStyleGuideTool
+from .tools.image_generation_tool import image_generation_tool
+from .tools.perplexity_research_tool import PerplexityResearchTool
+from .tools.rag_tool import RAGTool
+from .tools.tool_names import ToolNames
+from .tools.web_search_tool import WebSearchTool
+
+logger = logging.getLogger(__name__)
+
+# Settings-based tool pricing, exported once for tools that read os.getenv
+_TOOL_COST_ENV = {
+    "serper_cost_per_call_usd": "SERPER_COST_PER_CALL_USD",
+    "perplexity_cost_per_call_usd": "PERPLEXITY_COST_PER_CALL_USD",
+    "perplexity_cost_per_1k_tokens": "PERPLEXITY_COST_PER_1K_TOKENS",
+    "perplexity_sonar_cost_per_1k_tokens_input": (
+        "PERPLEXITY_SONAR_COST_PER_1K_TOKENS_INPUT"
+    ),
+    "perplexity_sonar_cost_per_1k_tokens_output": (
+        "PERPLEXITY_SONAR_COST_PER_1K_TOKENS_OUTPUT"
+    ),
+    "perplexity_sonar_pro_cost_per_1k_tokens_input": (
+        "PERPLEXITY_SONAR_PRO_COST_PER_1K_TOKENS_INPUT"
+    ),
+    "perplexity_sonar_pro_cost_per_1k_tokens_output": (
+        "PERPLEXITY_SONAR_PRO_COST_PER_1K_TOKENS_OUTPUT"
+    ),
+    "openai_image_cost_usd": "OPENAI_IMAGE_COST_USD",
+    "openai_image_cost_low_usd": "OPENAI_IMAGE_COST_LOW_USD",
+    "openai_image_cost_medium_usd": "OPENAI_IMAGE_COST_MEDIUM_USD",
+    "openai_image_cost_high_usd": "OPENAI_IMAGE_COST_HIGH_USD",
+    "gemini_image_cost_usd": "GEMINI_IMAGE_COST_USD",
+}
+
+
+def _seed_tool_cost_env(settings: Settings) -> None:
+    for field_name, env_key in _TOOL_COST_ENV.items():
+        value = getattr(settings, field_name, None)
+        if value is not None:
+            os.environ[env_key] = str(value)
+
+
+class AppContainer:
+    """Long-lived dependencies shared by every content generation run."""
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        _seed_tool_cost_env(settings)
+
+        self.content_repository = FileContentRepository(settings.output_dir)
+        self.workflow_repository = FileWorkflowRepository(settings.workflows_dir)
+        self.agent_repository = YamlAgentRepository(settings.profiles_dir)
+        self.providers = ProviderManager(settings)
+        self.tracker: Optional[SupabaseTracker] = get_tracker()
+
+        self.web_search_tool = WebSearchTool(
+            settings.serper_api_key,
+            max_concurrency=settings.serper_max_concurrency,
+        )
+        self.rag_tool = RAGTool()
+        self.perplexity_tool = PerplexityResearchTool(settings.perplexity_api_key)
+        self.brand_style_tool = BrandStyleGuideTool()
+        self.tool_registry = self._build_tool_registry()
+
+        # ProviderManager is not thread-safe; sync endpoints run in a threadpool
+        self._provider_lock = threading.Lock()
+        logger.info(
+            f"🏗️ Application container ready with {len(self.tool_registry)} tools"
+        )
+
+    def _build_tool_registry(self) -> Dict[str, Dict[str, Any]]:
+        settings = self.settings
+        return {
+            ToolNames.WEB_SEARCH_SERPER: {
+                "function": self.web_search_tool.search,
+                "description": "Search the web for current information and trends",
+                "metadata": {
+                    "provider": "serper",
+                    "category": "web_search",
+                    # Prefer Settings-based pricing (loaded from .env), fallback to tool defaults
+                    "cost_per_call_usd": settings.serper_cost_per_call_usd
+                    or self.web_search_tool.cost_per_call_usd,
+                    "cost_source": (
+                        "env"
+                        if settings.serper_cost_per_call_usd is not None
+                        else self.web_search_tool.cost_source
+                    ),
+                },
+            },
+            ToolNames.RAG_GET_CLIENT_CONTENT: {
+                "function": self.rag_tool.get_client_content,
+                "description": "Retrieve content from client knowledge base",
+                "metadata": {
+                    "provider": "rag",
+                    "category": "knowledge_base",
+                    "cost_per_call_usd": 0.0,
+                },
+            },
+            ToolNames.RAG_SEARCH_CONTENT: {
+                "function": self.rag_tool.search_content,
+                "description": "Search within client knowledge base",
+                "metadata": {
+                    "provider": "rag",
+                    "category": "knowledge_base",
+                    "cost_per_call_usd": 0.0,
+                },
+            },
+            ToolNames.WEB_SEARCH_PERPLEXITY: {
+                "function": self.perplexity_tool.search,
+                "description": "Search using Perplexity AI",
+                "metadata": {
+                    "provider": "perplexity",
+                    "category": "web_research",
+                    "cost_per_call_usd": self.perplexity_tool.cost_per_call_usd,
+                    "cost_per_1k_tokens_usd": self.perplexity_tool.cost_per_token_usd
+                    * 1000,
+                    "cost_source": self.perplexity_tool.cost_source,
+                    "token_cost_source": self.perplexity_tool.token_cost_source,
+                },
+            },
+            ToolNames.IMAGE_GENERATION: {
+                "function": image_generation_tool,
+                "description": "Generate contextual images for the final article",
+                "metadata": {
+                    "provider": "image_generation",
+                    "category": "creative",
+                    "cost_override_key": "image_generation_tool",
+                },
+            },
+            ToolNames.BRAND_STYLE_GUIDE: {
+                "function": self.brand_style_tool.get_style,
+                "description": "Retrieve brand palette and visual guardrails",
+                "metadata": {
+                    "provider": "brand_style",
+                    "category": "knowledge_base",
+                    "cost_per_call_usd": 0.0,
+                },
+            },
+        }
+
+    def get_provider(self, provider_type: LLMProvider):
+        """Return the shared adapter for a provider type, creating it once."""
+        with self._provider_lock:
+            return self.providers.get_provider(provider_type)
+
+    def create_agent_executor(
+        self,
+        provider_type: Optional[LLMProvider] = None,
+        provider_config: Optional[ProviderConfig] = None,
+    ) -> AgentExecutor:
+        """
+        Create an executor bound to shared providers and tools.
+
+        Executors are cheap; they are created per run so tool-call semaphores
+        stay per run.
+        """
+        if provider_type is None:
+            provider_type = LLMProviderFactory.get_default_provider(self.settings)
+        if provider_config is None:
+            provider_config = LLMProviderFactory.create_provider_config(
+                provider_type, self.settings
+            )
+        executor = AgentExecutor(
+            agent_repository=self.agent_repository,
+            llm_provider=self.get_provider(provider_type),
+            provider_config=provider_config,
+        )
+        executor.register_tools(self.tool_registry)
+        return executor
+
+
+_container: Optional[AppContainer] = None
+_container_lock = threading.Lock()
+
+
+def init_app_container(settings: Optional[Settings] = None) -> AppContainer:
+    """Build the process-wide container (called from the API lifespan)."""
+    global _container
+    with _container_lock:
+        if _container is None:
+            _container = AppContainer(settings or get_settings())
+        return _container
+
+
+def get_app_container() -> AppContainer:
+    """Return the process-wide container, building it on first use."""
+    return _container or init_app_container()
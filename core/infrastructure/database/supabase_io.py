@@ -0,0 +1,173 @@
+"""Non-blocking access layer for the synchronous supabase-py client.
+
+supabase-py's ``.execute()`` performs a blocking HTTP round trip. Calling it
+from ``async def`` code stalls the event loop, so every query issued from the
+API goes through :data:`supabase_io`, which runs it on a dedicated, bounded
+thread pool. Clients are shared per (url, key) so their HTTP connection pools
+are reused across the tracker, the RAG tool and the onboarding repositories.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    # supabase>=2
+    from supabase import create_client
+except Exception:  # pragma: no cover - optional dependency
+    create_client = None  # type: ignore
+
+DEFAULT_MAX_WORKERS = 8
+
+_clients: Dict[Tuple[str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def get_supabase_client(url: str, key: str):
+    """Return the process-wide Supabase client for the given credentials."""
+    if create_client is None:
+        raise RuntimeError(
+            "supabase package not installed. Run: pip install supabase>=2.0.0"
+        )
+    with _clients_lock:
+        client = _clients.get((url, key))
+        if client is None:
+            client = create_client(url, key)
+            _clients[(url, key)] = client
+            logger.info("Created shared Supabase client")
+        return client
+
+
+class SupabaseIO:
+    """Runs blocking Supabase calls off the event loop on a bounded pool."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "calls": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "background_submitted": 0,
+            "background_failed": 0,
+            "total_wait_ms": 0.0,
+            "total_duration_ms": 0.0,
+        }
+
+    @property
+    def max_workers(self) -> int:
+        if self._max_workers is None:
+            self._max_workers = self._resolve_max_workers()
+        return self._max_workers
+
+    @staticmethod
+    def _resolve_max_workers() -> int:
+        try:
+            from core.infrastructure.config.settings import get_settings
+
+            return max(1, int(get_settings().supabase_max_workers))
+        except Exception:
+            workers = os.getenv("SUPABASE_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+            return max(1, int(workers))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="supabase-io"
+                )
+            return self._executor
+
+    def _timed(self, fn: Callable[[], Any], queued_at: float) -> Any:
+        started = time.perf_counter()
+        with self._lock:
+            self._stats["calls"] += 1
+            self._stats["in_flight"] += 1
+            self._stats["total_wait_ms"] += (started - queued_at) * 1000
+        try:
+            return fn()
+        except Exception:
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+                self._stats["total_duration_ms"] += (
+                    time.perf_counter() - started
+                ) * 1000
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking callable on the Supabase pool and await its result."""
+        call = functools.partial(fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._timed, call, time.perf_counter()
+        )
+
+    async def execute(self, query: Any) -> Any:
+        """Await ``query.execute()`` for a postgrest/rpc builder."""
+        return await self.run(query.execute)
+
+    def submit(
+        self, fn: Callable[[], Any], description: str = "supabase call"
+    ) -> Optional[Future]:
+        """
+        Fire-and-forget a blocking call.
+
+        Inside a running event loop the call is queued on the pool and errors are
+        logged; without a loop (CLI, scripts, tests) it runs inline.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                fn()
+            except Exception as e:  # pragma: no cover
+                logger.warning(f"Error in {description}: {e}")
+            return None
+
+        with self._lock:
+            self._stats["background_submitted"] += 1
+        future = self._get_executor().submit(self._timed, fn, time.perf_counter())
+
+        def _log_failure(done: Future) -> None:
+            error = done.exception()
+            if error is not None:
+                with self._lock:
+                    self._stats["background_failed"] += 1
+                logger.warning(f"Error in {description}: {error}")
+
+        future.add_done_callback(_log_failure)
+        return future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool usage counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        calls = stats["calls"] or 1
+        stats["max_workers"] = self.max_workers
+        stats["avg_wait_ms"] = stats["total_wait_ms"] / calls
+        stats["avg_duration_ms"] = stats["total_duration_ms"] / calls
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Drain pending calls and release the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# Global Supabase I/O instance
+supabase_io = SupabaseIO()
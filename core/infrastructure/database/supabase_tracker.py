@@ -7,10 +7,21 @@ both SUPABASE_URL and SUPABASE_ANON_KEY are configured in environment.
 from __future__ import annotations
 
 import logging
+import threading
+import weakref
+from concurrent.futures import Future, wait
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from core.infrastructure.config.settings import get_settings
+from core.infrastructure.database.supabase_io import (
+    get_supabase_client,
+    supabase_io,
+)
+from core.infrastructure.logging.metrics import (
+    register_queue_depth,
+    telemetry_rows_dropped_total,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +33,10 @@ except Exception:  # pragma: no cover - optional dependency
     Client = object  # type: ignore
 
 
+# Trackers with a write-behind buffer, flushed together at app shutdown
+_active_trackers: "weakref.WeakSet[SupabaseTracker]" = weakref.WeakSet()
+
+
 class SupabaseTracker:
     def __init__(self) -> None:
         settings = get_settings()
@@ -32,9 +47,191 @@ class SupabaseTracker:
                 "supabase package not installed. Run: pip install supabase>=2.0.0"
             )
 
-        self.client: Client = create_client(
+        # Shared per-process client so the HTTP connection pool is reused
+        self.client: Client = get_supabase_client(
             settings.supabase_url, settings.supabase_anon_key
         )
+        self._init_write_behind(
+            batch_size=settings.supabase_telemetry_batch_size,
+            flush_interval_seconds=settings.supabase_telemetry_flush_interval_seconds,
+            max_buffered_rows=settings.supabase_telemetry_max_buffered_rows,
+        )
+
+    # ------------- Write-behind telemetry buffer -------------
+    def _init_write_behind(
+        self,
+        batch_size: int = 50,
+        flush_interval_seconds: float = 2.0,
+        max_buffered_rows: int = 5000,
+    ) -> None:
+        """
+        Set up the per-table write-behind buffer.
+
+        Telemetry rows are buffered and written as bulk inserts once a table
+        reaches ``batch_size`` rows or ``flush_interval_seconds`` have passed.
+        Rows buffered or in flight are capped at ``max_buffered_rows``. Callers
+        run on the event loop, so hitting the cap never waits: the buffered rows
+        are handed to the write pool and the new row is dropped and counted in
+        ``rows_dropped`` (and ``telemetry_rows_dropped_total``) until in-flight
+        writes bring the backlog back under the cap.
+        """
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_buffered_rows = max(self.batch_size, max_buffered_rows)
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending_rows = 0
+        self._buffer_lock = threading.Lock()
+        self._shedding = False
+        self._in_flight: Set[Future] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._telemetry_stats = {
+            "rows_buffered": 0,
+            "rows_flushed": 0,
+            "rows_failed": 0,
+            "rows_dropped": 0,
+            "batches_flushed": 0,
+            "batches_failed": 0,
+        }
+        _active_trackers.add(self)
+
+    def _insert(self, table: str, data: Dict[str, Any], description: str) -> None:
+        """Queue a telemetry row for a batched, off-loop insert."""
+        if not self._reserve_row():
+            telemetry_rows_dropped_total.labels(table=table).inc()
+            logger.debug(f"Telemetry buffer full, dropped row while {description}")
+            return
+
+        batch: Optional[List[Dict[str, Any]]] = None
+        with self._buffer_lock:
+            rows = self._buffers.setdefault(table, [])
+            rows.append(data)
+            self._telemetry_stats["rows_buffered"] += 1
+            if len(rows) >= self.batch_size:
+                batch = self._buffers.pop(table)
+            else:
+                self._schedule_flush()
+
+        if batch:
+            self._write_batch(table, batch)
+
+    def _reserve_row(self) -> bool:
+        """Claim room for one row; never blocks when the cap is hit."""
+        with self._buffer_lock:
+            if self._pending_rows < self.max_buffered_rows:
+                self._shedding = False
+                self._pending_rows += 1
+                return True
+            self._telemetry_stats["rows_dropped"] += 1
+            started_shedding, self._shedding = not self._shedding, True
+            has_buffered_rows = bool(self._buffers)
+
+        if started_shedding:
+            logger.warning(
+                f"Telemetry buffer full ({self.max_buffered_rows} rows), "
+                "dropping rows until Supabase catches up"
+            )
+        # Buffered rows only drain once written; submit them without waiting
+        if has_buffered_rows:
+            self.flush()
+        return False
+
+    def _schedule_flush(self) -> None:
+        """Arm the interval flush timer (caller holds ``_buffer_lock``)."""
+        if self._flush_timer is not None:
+            return
+        timer = threading.Timer(self.flush_interval_seconds, self.flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _write_batch(self, table: str, rows: List[Dict[str, Any]]) -> Optional[Future]:
+        """Submit a bulk insert of ``rows`` into ``table``."""
+
+        def _bulk_insert() -> None:
+            written = 0
+            try:
+                # PostgREST bulk inserts need the same columns on every row
+                groups: Dict[tuple, List[Dict[str, Any]]] = {}
+                for row in rows:
+                    groups.setdefault(tuple(sorted(row)), []).append(row)
+                for group in groups.values():
+                    written += self._insert_group(table, group)
+            finally:
+                with self._buffer_lock:
+                    stats = self._telemetry_stats
+                    stats["rows_flushed"] += written
+                    stats["rows_failed"] += len(rows) - written
+                    failed = written < len(rows)
+                    stats["batches_failed" if failed else "batches_flushed"] += 1
+                    self._pending_rows -= len(rows)
+
+        future = supabase_io.submit(
+            _bulk_insert, f"flushing {len(rows)} rows to {table}"
+        )
+        if future is not None:
+            with self._buffer_lock:
+                self._in_flight.add(future)
+            future.add_done_callback(self._forget_in_flight)
+        return future
+
+    def _forget_in_flight(self, future: Future) -> None:
+        with self._buffer_lock:
+            self._in_flight.discard(future)
+
+    def _insert_group(self, table: str, group: List[Dict[str, Any]]) -> int:
+        """Bulk insert one column group, falling back to per-row inserts."""
+        try:
+            self.client.table(table).insert(group).execute()
+            return len(group)
+        except Exception as e:
+            if len(group) == 1:
+                logger.warning(f"Failed to insert telemetry row into {table}: {e}")
+                return 0
+            logger.warning(
+                f"Bulk insert of {len(group)} rows into {table} failed ({e}), "
+                "retrying row by row"
+            )
+        written = 0
+        for row in group:
+            try:
+                self.client.table(table).insert(row).execute()
+                written += 1
+            except Exception as e:
+                logger.warning(f"Failed to insert telemetry row into {table}: {e}")
+        return written
+
+    def flush(self, wait_for_completion: bool = False) -> List[Future]:
+        """
+        Write out every buffered telemetry row.
+
+        Args:
+            wait_for_completion: Block until the bulk inserts have finished
+
+        Returns:
+            Futures of the bulk inserts submitted to the background pool
+        """
+        with self._buffer_lock:
+            buffers, self._buffers = self._buffers, {}
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+
+        futures: List[Future] = []
+        for table, rows in buffers.items():
+            future = self._write_batch(table, rows)
+            if future is not None:
+                futures.append(future)
+        if wait_for_completion and futures:
+            wait(futures)
+        return futures
+
+    def get_telemetry_stats(self) -> Dict[str, Any]:
+        """Return write-behind buffer counters."""
+        with self._buffer_lock:
+            stats = dict(self._telemetry_stats)
+            stats["rows_pending"] = self._pending_rows
+            stats["tables_buffered"] = sorted(self._buffers)
+        return stats
 
     # ------------- Workflow run lifecycle -------------
     def start_workflow_run(
@@ -69,7 +266,15 @@ class SupabaseTracker:
         cost: Optional[float] = None,
         tokens: Optional[int] = None,
     ) -> None:
-        """Complete a workflow run with optional metrics."""
+        """Complete a workflow run with optional metrics.
+
+        The status update is only sent once every telemetry write for the run
+        (buffered or already in flight) has finished, without blocking the
+        caller.
+        """
+        self.flush()
+        with self._buffer_lock:
+            pending = list(self._in_flight)
         update_data: Dict[str, Any] = {
             "status": status,
             "completed_at": datetime.utcnow().isoformat() + "Z",
@@ -80,12 +285,35 @@ class SupabaseTracker:
             update_data["total_cost_usd"] = cost
         if tokens is not None:
             update_data["total_tokens"] = tokens
-        try:
+
+        description = f"completing workflow run {run_id}"
+
+        def _complete() -> None:
             self.client.table("workflow_runs").update(update_data).eq(
                 "id", run_id
             ).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error completing workflow run {run_id}: {e}")
+
+        if not pending:
+            supabase_io.submit(_complete, description)
+            return
+
+        # Chain on the telemetry writes instead of waiting on a pool worker,
+        # which could deadlock a saturated pool
+        remaining = [len(pending)]
+        lock = threading.Lock()
+
+        def _on_written(_: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                _complete()
+            except Exception as e:
+                logger.warning(f"Error in {description}: {e}")
+
+        for future in pending:
+            future.add_done_callback(_on_written)
 
     # ------------- Detailed logging -------------
     def log_agent_execution(
@@ -129,10 +357,9 @@ class SupabaseTracker:
                 data["duration_seconds"] = round(float(duration_seconds), 3)
             except Exception:
                 data["duration_seconds"] = None
-        try:
-            self.client.table("agent_executions").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error logging agent execution for run {run_id}: {e}")
+        self._insert(
+            "agent_executions", data, f"logging agent execution for run {run_id}"
+        )
 
     def add_log(
         self,
@@ -151,10 +378,7 @@ class SupabaseTracker:
             data["agent_name"] = agent_name
         if metadata:
             data["metadata"] = metadata
-        try:
-            self.client.table("run_logs").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error adding log for run {run_id}: {e}")
+        self._insert("run_logs", data, f"adding log for run {run_id}")
 
     # ------------- Cost event logging (LLM & Tools) -------------
     def log_llm_call(
@@ -188,10 +412,9 @@ class SupabaseTracker:
                 data["duration_seconds"] = round(float(duration_seconds), 3)
             except Exception:
                 data["duration_seconds"] = None
-        try:
-            self.client.table("run_cost_events").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error logging LLM cost event for run {run_id}: {e}")
+        self._insert(
+            "run_cost_events", data, f"logging LLM cost event for run {run_id}"
+        )
 
     def log_tool_execution(
         self,
@@ -228,10 +451,9 @@ class SupabaseTracker:
                 data["duration_seconds"] = round(float(duration_seconds), 3)
             except Exception:
                 data["duration_seconds"] = None
-        try:
-            self.client.table("run_cost_events").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error logging tool cost event for run {run_id}: {e}")
+        self._insert(
+            "run_cost_events", data, f"logging tool cost event for run {run_id}"
+        )
 
     # ------------- RAG document tracking -------------
     def log_rag_document(
@@ -241,6 +463,7 @@ class SupabaseTracker:
         document_path: str,
         source_url: Optional[str] = None,
         agent_name: Optional[str] = None,
+        status: Optional[str] = None,
     ) -> None:
         data: Dict[str, Any] = {
             "run_id": run_id,
@@ -251,10 +474,10 @@ class SupabaseTracker:
             data["source_url"] = source_url
         if agent_name:
             data["agent_name"] = agent_name
-        try:
-            self.client.table("run_documents").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error logging RAG document for run {run_id}: {e}")
+        if status:
+            # included / truncated / dropped by the context token budget
+            data["status"] = status
+        self._insert("run_documents", data, f"logging RAG document for run {run_id}")
 
     def log_rag_chunk(
         self,
@@ -272,10 +495,7 @@ class SupabaseTracker:
         }
         if score is not None:
             data["similarity_score"] = score
-        try:
-            self.client.table("run_document_chunks").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error logging RAG chunk for run {run_id}: {e}")
+        self._insert("run_document_chunks", data, f"logging RAG chunk for run {run_id}")
 
     def save_run_content(
         self,
@@ -294,10 +514,9 @@ class SupabaseTracker:
             "metadata": (metadata or {})
             | {"client_name": client_name, "workflow_name": workflow_name},
         }
-        try:
-            self.client.table("content_generations").insert(data).execute()
-        except Exception as e:  # pragma: no cover
-            logger.warning(f"Error saving run content for run {run_id}: {e}")
+        self._insert(
+            "content_generations", data, f"saving run content for run {run_id}"
+        )
 
     # ------------- Queries -------------
     def get_run_history(
@@ -384,6 +603,23 @@ class SupabaseTracker:
             return None
 
 
+def flush_all_trackers(wait_for_completion: bool = True) -> None:
+    """Flush the write-behind buffers of every live tracker (app shutdown)."""
+    for tracker in list(_active_trackers):
+        try:
+            tracker.flush(wait_for_completion=wait_for_completion)
+        except Exception as e:  # pragma: no cover
+            logger.warning(f"Error flushing tracker telemetry: {e}")
+
+
+def _telemetry_rows_pending() -> int:
+    return sum(t.get_telemetry_stats()["rows_pending"] for t in list(_active_trackers))
+
+
+register_queue_depth("telemetry_rows_pending", _telemetry_rows_pending)
+register_queue_depth("supabase_in_flight", lambda: supabase_io.get_stats()["in_flight"])
+
+
 # Factory function
 
 
@@ -0,0 +1,195 @@
+"""Content-addressed response cache in front of any LLM provider."""
+
+import asyncio
+import hashlib
+import json
+import logging
+from contextvars import ContextVar
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from ...application.interfaces.llm_provider_interface import (
+    LLMProviderInterface,
+    LLMResponse,
+    LLMStreamChunk,
+)
+from ...domain.value_objects.provider_config import ProviderConfig
+from ..cache.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+# Set by CachingLLMProvider for the calling task: True when the last
+# generation was served from the cache (read by AgentExecutor for cost reporting)
+llm_cache_hit: ContextVar[bool] = ContextVar("llm_cache_hit", default=False)
+
+
+class CachingLLMProvider(LLMProviderInterface):
+    """
+    Decorator provider that caches generations by request content.
+
+    Requests are keyed on provider, model, sampling settings, system message
+    and prompt. Only deterministic requests (temperature at or below
+    ``max_cacheable_temperature``) are cached; everything else passes through.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProviderInterface,
+        cache: TieredCache,
+        max_cacheable_temperature: float = 0.0,
+    ):
+        self.provider = provider
+        self.cache = cache
+        self.max_cacheable_temperature = max_cacheable_temperature
+
+    def __getattr__(self, name: str) -> Any:
+        # Adapter-specific helpers (e.g. generate_image) go to the wrapped provider
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _is_cacheable(self, config: ProviderConfig) -> bool:
+        return config.temperature <= self.max_cacheable_temperature
+
+    @staticmethod
+    def _cache_key(kind: str, config: ProviderConfig, payload: Any) -> str:
+        material = json.dumps(
+            {
+                "kind": kind,
+                "provider": config.provider.value,
+                "model": config.model,
+                "temperature": config.temperature,
+                "top_p": config.top_p,
+                "max_tokens": config.max_tokens,
+                "payload": payload,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def _lookup(self, key: str) -> Any:
+        return await asyncio.to_thread(self.cache.get, key)
+
+    async def _store(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.cache.set, key, value)
+
+    async def generate_content(
+        self, prompt: str, config: ProviderConfig, system_message: Optional[str] = None
+    ) -> str:
+        """Generate content, serving identical deterministic requests from cache."""
+        llm_cache_hit.set(False)
+        if not self._is_cacheable(config):
+            return await self.provider.generate_content(prompt, config, system_message)
+
+        key = self._cache_key("text", config, [system_message, prompt])
+        cached = await self._lookup(key)
+        if cached is not None:
+            llm_cache_hit.set(True)
+            logger.info(f"♻️ LLM cache hit: {config.provider.value}/{config.model}")
+            return cached
+
+        content = await self.provider.generate_content(prompt, config, system_message)
+        content_text = getattr(content, "content", content)
+        if isinstance(content_text, str) and content_text:
+            await self._store(key, content_text)
+        return content
+
+    async def generate_content_detailed(
+        self, prompt: str, config: ProviderConfig, system_message: Optional[str] = None
+    ) -> LLMResponse:
+        """Generate a detailed response, serving identical requests from cache."""
+        llm_cache_hit.set(False)
+        if not self._is_cacheable(config):
+            return await self.provider.generate_content_detailed(
+                prompt, config, system_message
+            )
+
+        key = self._cache_key("detailed", config, [system_message, prompt])
+        cached = await self._lookup(key)
+        if cached is not None:
+            llm_cache_hit.set(True)
+            return self._from_cached(cached)
+
+        response = await self.provider.generate_content_detailed(
+            prompt, config, system_message
+        )
+        await self._store(key, self._to_cached(response))
+        return response
+
+    async def chat_completion(
+        self, messages: List[Dict[str, str]], config: ProviderConfig
+    ) -> LLMResponse:
+        """Perform chat completion, serving identical requests from cache."""
+        llm_cache_hit.set(False)
+        if not self._is_cacheable(config):
+            return await self.provider.chat_completion(messages, config)
+
+        key = self._cache_key("chat", config, messages)
+        cached = await self._lookup(key)
+        if cached is not None:
+            llm_cache_hit.set(True)
+            return self._from_cached(cached)
+
+        response = await self.provider.chat_completion(messages, config)
+        await self._store(key, self._to_cached(response))
+        return response
+
+    @staticmethod
+    def _to_cached(response: LLMResponse) -> Dict[str, Any]:
+        data = asdict(response)
+        # Provider metadata may hold SDK objects; keep only JSON-safe values
+        data["metadata"] = json.loads(json.dumps(data["metadata"], default=str))
+        return data
+
+    @staticmethod
+    def _from_cached(data: Dict[str, Any]) -> LLMResponse:
+        response = LLMResponse(**data)
+        response.metadata = {**response.metadata, "cache_hit": True}
+        return response
+
+    async def generate_content_stream(
+        self, prompt: str, config: ProviderConfig, system_message: Optional[str] = None
+    ) -> AsyncGenerator[LLMStreamChunk, None]:
+        """Stream content (streams are never cached)."""
+        async for chunk in self.provider.generate_content_stream(
+            prompt, config, system_message
+        ):
+            yield chunk
+
+    async def validate_config(self, config: ProviderConfig) -> bool:
+        return await self.provider.validate_config(config)
+
+    async def get_available_models(
+        self, config: ProviderConfig
+    ) -> List[Dict[str, Any]]:
+        return await self.provider.get_available_models(config)
+
+    async def estimate_tokens(self, text: str, model: str) -> int:
+        return await self.provider.estimate_tokens(text, model)
+
+    async def check_health(self, config: ProviderConfig) -> Dict[str, Any]:
+        return await self.provider.check_health(config)
+
+
+_llm_response_cache: Optional[TieredCache] = None
+
+
+def get_llm_response_cache(settings: Any) -> TieredCache:
+    """Return the process-wide LLM response cache configured from settings."""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        disk_dir = (
+            str(Path(settings.cache_dir) / "llm_responses")
+            if settings.llm_cache_disk_enabled
+            else None
+        )
+        _llm_response_cache = TieredCache(
+            name="llm_responses",
+            max_entries=settings.llm_cache_max_entries,
+            ttl_seconds=settings.llm_cache_ttl_seconds,
+            disk_dir=disk_dir,
+            disk_max_bytes=settings.llm_cache_disk_max_mb * 1024 * 1024,
+        )
+    return _llm_response_cache
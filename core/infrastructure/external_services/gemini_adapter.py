@@ -1,11 +1,14 @@
 """Google Gemini service adapter."""
 
+import asyncio
 import logging
 import os
 import base64
 
 import time
-from typing import Dict, List, Optional, Any, AsyncGenerator
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any, AsyncGenerator, AsyncIterator, Tuple
 import httpx
 import google.generativeai as genai
 from google.generativeai.types import GenerateContentResponse
@@ -16,9 +19,18 @@ from ...application.interfaces.llm_provider_interface import (
     LLMStreamChunk,
 )
 from ...domain.value_objects.provider_config import ProviderConfig, LLMProvider
+from .http_client_registry import http_client_registry
+from .service_account_token import get_token_provider
 
 logger = logging.getLogger(__name__)
 
+# Vertex SDK models are stateless, so they are shared across adapter instances
+_vertex_models: Dict[Tuple[Optional[str], Optional[str], str], Any] = {}
+# Limits in-flight SDK generations per event loop
+_generation_semaphores: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+) = weakref.WeakKeyDictionary()
+
 
 class GeminiAdapter(LLMProviderInterface):
     """
@@ -37,6 +49,7 @@ class GeminiAdapter(LLMProviderInterface):
         endpoint: str = "aiplatform.googleapis.com",
         api_version: str = "v1",
         sa_credentials_path: Optional[str] = None,
+        max_concurrent_requests: Optional[int] = None,
     ):
         self.api_key = api_key
         self.project_id = project_id
@@ -48,6 +61,37 @@ class GeminiAdapter(LLMProviderInterface):
         self.sa_credentials_path = sa_credentials_path
         self._model_cache: Dict[str, Any] = {}
         self._vertex_initialized: bool = False
+        self.max_concurrent_requests = max(
+            1,
+            max_concurrent_requests
+            or int(os.environ.get("GEMINI_MAX_CONCURRENT_REQUESTS", "8")),
+        )
+
+    @asynccontextmanager
+    async def _generation_slot(self) -> AsyncIterator[None]:
+        """Bound the number of concurrent SDK generations on this event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = _generation_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            _generation_semaphores[loop] = semaphore
+        async with semaphore:
+            yield
+
+    def _get_vertex_model(self, model_name: str) -> Any:
+        """Get or create a Vertex SDK GenerativeModel, cached per model."""
+        key = (self.project_id, self.location, model_name)
+        model = _vertex_models.get(key)
+        if model is None:
+            try:
+                from vertexai.preview.generative_models import GenerativeModel  # type: ignore
+            except ImportError:  # pragma: no cover
+                from vertexai.generative_models import GenerativeModel  # type: ignore
+
+            model = GenerativeModel(model_name)
+            _vertex_models[key] = model
+            logger.debug(f"Created new Gemini model (Vertex SDK): {model_name}")
+        return model
 
     def _get_model(self, config: ProviderConfig):
         """Get or create Gemini model (AI Studio SDK fallback)."""
@@ -89,10 +133,11 @@ class GeminiAdapter(LLMProviderInterface):
         api = "streamGenerateContent" if stream else "generateContent"
         return f"https://{self.endpoint}/{self.api_version}/publishers/google/models/{model}:{api}"
 
-    def _get_sa_bearer_token(self) -> Optional[str]:
+    async def _get_sa_bearer_token(self) -> Optional[str]:
         """Return OAuth2 Bearer token from Service Account.
         Checks GOOGLE_APPLICATION_CREDENTIALS env var first, then adapter-provided path.
-        Lazily imports google-auth to avoid hard dependency when not using SA.
+        The token is cached per credentials file and refreshed in the background
+        before expiry (see ``service_account_token``).
         """
         try:
             path = (
@@ -101,15 +146,7 @@ class GeminiAdapter(LLMProviderInterface):
             )
             if not path:
                 return None
-            # Lazy import to avoid ImportError at startup if dependency not installed
-            from google.oauth2 import service_account  # type: ignore
-            from google.auth.transport.requests import Request  # type: ignore
-
-            creds = service_account.Credentials.from_service_account_file(
-                path, scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
-            creds.refresh(Request())
-            return creds.token
+            return await get_token_provider(path).get_token()
         except Exception as e:
             logger.warning(f"Service Account auth not available: {e}")
             return None
@@ -166,7 +203,7 @@ class GeminiAdapter(LLMProviderInterface):
         params: Optional[Dict[str, str]] = None
 
         # Prefer Service Account bearer token when available
-        token = self._get_sa_bearer_token()
+        token = await self._get_sa_bearer_token()
         if token:
             # With OAuth2 bearer token we can call the project-scoped endpoint
             url = self._vertex_endpoint_url(model, stream=stream)
@@ -187,8 +224,10 @@ class GeminiAdapter(LLMProviderInterface):
             )
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.post(url, json=body, headers=headers, params=params)
+            client = http_client_registry.get_client(url)
+            resp = await client.post(
+                url, json=body, headers=headers, params=params, timeout=timeout
+            )
             resp.raise_for_status()
             return resp.json()
         except httpx.ReadTimeout as te:
@@ -282,7 +321,8 @@ class GeminiAdapter(LLMProviderInterface):
             model = self._get_model(config)
             full_prompt = f"{system_message}\n\n{prompt}" if system_message else prompt
             logger.debug(f"AI Studio request with model: {config.model}")
-            response = model.generate_content(full_prompt)
+            async with self._generation_slot():
+                response = await model.generate_content_async(full_prompt)
             if not response.text:
                 raise ValueError("Gemini returned empty response")
             return response.text
@@ -310,21 +350,17 @@ class GeminiAdapter(LLMProviderInterface):
                         DefaultCredentialsError = tuple()  # type: ignore
 
                     try:
-                        try:
-                            from vertexai.preview.generative_models import GenerativeModel  # type: ignore
-                        except ImportError:  # pragma: no cover
-                            from vertexai.generative_models import GenerativeModel  # type: ignore
-
                         inputs: list[str] = []
                         if system_message:
                             inputs.append(str(system_message))
                         inputs.append(str(prompt))
 
-                        model = GenerativeModel(config.model)
+                        model = self._get_vertex_model(config.model)
                         logger.debug(
                             f"Vertex SDK generate_content_detailed model={config.model} project={self.project_id} location={self.location}"
                         )
-                        response = model.generate_content(inputs)
+                        async with self._generation_slot():
+                            response = await model.generate_content_async(inputs)
                         end_time = time.time()
                         text = getattr(response, "text", None)
                         if not text:
@@ -408,7 +444,8 @@ class GeminiAdapter(LLMProviderInterface):
                     f"{system_message}\n\n{prompt}" if system_message else prompt
                 )
                 logger.debug(f"AI Studio detailed request with model: {config.model}")
-                response = model.generate_content(full_prompt)
+                async with self._generation_slot():
+                    response = await model.generate_content_async(full_prompt)
                 end_time = time.time()
                 if not response.text:
                     raise ValueError("Gemini returned empty response")
@@ -470,29 +507,27 @@ class GeminiAdapter(LLMProviderInterface):
             if self.use_vertex:
                 self._init_vertex()
                 try:
-                    try:
-                        from vertexai.preview.generative_models import GenerativeModel  # type: ignore
-                    except ImportError:  # pragma: no cover
-                        from vertexai.generative_models import GenerativeModel  # type: ignore
-
                     inputs: list[str] = []
                     if system_message:
                         inputs.append(str(system_message))
                     inputs.append(str(prompt))
 
-                    model = GenerativeModel(config.model)
+                    model = self._get_vertex_model(config.model)
                     logger.debug(
                         f"Vertex SDK streaming model={config.model} project={self.project_id} location={self.location}"
                     )
-                    response = model.generate_content(inputs, stream=True)
-                    for chunk in response:
-                        text = getattr(chunk, "text", "")
-                        if text:
-                            yield LLMStreamChunk(
-                                content=text,
-                                is_final=False,
-                                metadata={"provider": "gemini"},
-                            )
+                    async with self._generation_slot():
+                        response = await model.generate_content_async(
+                            inputs, stream=True
+                        )
+                        async for chunk in response:
+                            text = getattr(chunk, "text", "")
+                            if text:
+                                yield LLMStreamChunk(
+                                    content=text,
+                                    is_final=False,
+                                    metadata={"provider": "gemini"},
+                                )
                     yield LLMStreamChunk(
                         content="", is_final=True, metadata={"provider": "gemini"}
                     )
@@ -505,14 +540,15 @@ class GeminiAdapter(LLMProviderInterface):
             model = self._get_model(config)
             full_prompt = f"{system_message}\n\n{prompt}" if system_message else prompt
             logger.debug(f"AI Studio streaming with model: {config.model}")
-            response = model.generate_content(full_prompt, stream=True)
-            for chunk in response:
-                if chunk.text:
-                    yield LLMStreamChunk(
-                        content=chunk.text,
-                        is_final=False,
-                        metadata={"provider": "gemini"},
-                    )
+            async with self._generation_slot():
+                response = await model.generate_content_async(full_prompt, stream=True)
+                async for chunk in response:
+                    if chunk.text:
+                        yield LLMStreamChunk(
+                            content=chunk.text,
+                            is_final=False,
+                            metadata={"provider": "gemini"},
+                        )
             yield LLMStreamChunk(
                 content="", is_final=True, metadata={"provider": "gemini"}
             )
@@ -587,7 +623,8 @@ class GeminiAdapter(LLMProviderInterface):
             last_message = chat_history[-1]["parts"][0]["text"] if chat_history else ""
             if system_message:
                 last_message = f"{system_message}\n\n{last_message}"
-            response = chat.send_message(last_message)
+            async with self._generation_slot():
+                response = await chat.send_message_async(last_message)
             end_time = time.time()
             if not response.text:
                 raise ValueError("Gemini returned empty response")
@@ -636,7 +673,7 @@ class GeminiAdapter(LLMProviderInterface):
 
             if self.use_vertex:
                 # Prefer Service Account; fallback to API key
-                sa_token = self._get_sa_bearer_token()
+                sa_token = await self._get_sa_bearer_token()
                 if not sa_token and not (config.api_key or self.api_key):
                     return False
                 # Minimal ping using generateContent
@@ -712,7 +749,7 @@ class GeminiAdapter(LLMProviderInterface):
         try:
             if self.use_vertex:
                 # Prefer Service Account; fallback to API key if SA is not available
-                sa_token = self._get_sa_bearer_token()
+                sa_token = await self._get_sa_bearer_token()
                 if not sa_token:
                     api_key = config.api_key or self.api_key
                     if not api_key:
@@ -749,7 +786,9 @@ class GeminiAdapter(LLMProviderInterface):
 
             # Test with a simple request
             model_name = config.model if config.model else "gemini-pro"
-            response = genai.GenerativeModel(model_name).generate_content("Hello")
+            response = await genai.GenerativeModel(model_name).generate_content_async(
+                "Hello"
+            )
             return {
                 "status": "healthy",
                 "provider": "gemini",
@@ -0,0 +1,165 @@
+"""Process-wide registry of pooled HTTP clients, one per upstream host.
+
+Opening an ``httpx.AsyncClient`` per call pays a TCP + TLS handshake every
+time. Adapters instead ask the registry for the client of their upstream host,
+which keeps connections alive across calls. Clients are bound to the event
+loop that created them, so each loop gets its own set; clients of a loop that
+has closed are released on the next lookup, and the rest are closed from the
+FastAPI lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from typing import Any, Dict, Set, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_ClientKey = Tuple[str, bool]
+
+
+def _pool_settings() -> Dict[str, Any]:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    settings = get_runtime_settings()
+    return {
+        "max_connections": settings.http_pool_max_connections,
+        "max_keepalive_connections": settings.http_pool_max_keepalive_connections,
+        "keepalive_expiry": settings.http_pool_keepalive_expiry_seconds,
+        "http2": settings.http2_enabled,
+    }
+
+
+class HttpClientRegistry:
+    """Hands out one pooled ``httpx.AsyncClient`` per upstream host."""
+
+    def __init__(self) -> None:
+        self._clients: Dict[
+            asyncio.AbstractEventLoop, Dict[_ClientKey, httpx.AsyncClient]
+        ] = {}
+        self._closing: Set[asyncio.Task] = set()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        parsed = httpx.URL(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.host}{port}"
+
+    def get_client(self, url: str, verify: bool = True) -> httpx.AsyncClient:
+        """
+        Return the pooled client for the host of ``url``.
+
+        Args:
+            url: Any URL on the upstream host
+            verify: Verify TLS certificates (clients are pooled per setting)
+
+        Returns:
+            Shared client for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._clients.get(loop)
+        if clients is None:
+            # Clients cannot be shared across event loops (CLI runs, tests)
+            self._release_closed_loops()
+            clients = self._clients[loop] = {}
+
+        host = self._host_of(url)
+        key = (host, verify)
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = self._create_client(host, verify)
+            clients[key] = client
+        return client
+
+    def _release_closed_loops(self) -> None:
+        """Close, in the background, the clients of event loops that have closed."""
+        for loop in [loop for loop in self._clients if loop.is_closed()]:
+            for client in self._clients.pop(loop).values():
+                task = asyncio.ensure_future(self._close_client(client, loop))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_client(
+        client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Close ``client`` on the loop that owns its connections when possible."""
+        if client.is_closed:
+            return
+        try:
+            if loop.is_running() and loop is not asyncio.get_running_loop():
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+                )
+            else:
+                # A closed owner loop cannot finish a graceful shutdown, but
+                # closing the pool still releases its sockets
+                await client.aclose()
+        except Exception as e:
+            logger.debug(f"Error closing pooled HTTP client: {e}")
+
+    def _create_client(self, host: str, verify: bool) -> httpx.AsyncClient:
+        pool = _pool_settings()
+        # HTTP/2 needs the optional ``h2`` package (pip install httpx[http2])
+        http2 = pool["http2"] and importlib.util.find_spec("h2") is not None
+        stats = self._stats.setdefault(
+            host, {"clients_created": 0, "requests": 0, "connections_opened": 0}
+        )
+        stats["clients_created"] += 1
+
+        async def _trace(event: str, info: Dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                stats["connections_opened"] += 1
+
+        async def _on_request(request: httpx.Request) -> None:
+            stats["requests"] += 1
+            request.extensions["trace"] = _trace
+
+        logger.info(f"🌐 Creating pooled HTTP client for {host} (http2={http2})")
+        return httpx.AsyncClient(
+            http2=http2,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=pool["max_connections"],
+                max_keepalive_connections=pool["max_keepalive_connections"],
+                keepalive_expiry=pool["keepalive_expiry"],
+            ),
+            event_hooks={"request": [_on_request]},
+        )
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-host request and connection-reuse counters."""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for host, counters in self._stats.items():
+            requests = counters["requests"]
+            reused = max(0, requests - counters["connections_opened"])
+            stats[host] = {
+                **counters,
+                "connections_reused": reused,
+                "reuse_ratio": (reused / requests) if requests else 0.0,
+            }
+        return stats
+
+    async def aclose(self) -> None:
+        """Close every pooled client, whichever event loop created it."""
+        by_loop, self._clients = self._clients, {}
+        count = 0
+        for loop, clients in by_loop.items():
+            for client in clients.values():
+                await self._close_client(client, loop)
+                count += 1
+        current = asyncio.get_running_loop()
+        closing = [task for task in self._closing if task.get_loop() is current]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+        if count:
+            logger.info(f"🌐 Closed {count} pooled HTTP clients")
+
+
+# Global HTTP client registry instance
+http_client_registry = HttpClientRegistry()
@@ -0,0 +1,186 @@
+"""Cached Google service-account bearer tokens.
+
+Loading the service-account JSON and calling ``creds.refresh()`` is blocking
+disk and network I/O. Providers are shared per credentials file: the token is
+kept in memory and refreshed on a background thread shortly before it expires,
+so callers on the event loop only ever read the cached value.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
+
+def _load_service_account(path: str) -> Any:
+    # Lazy import to avoid a hard google-auth dependency when SA is unused
+    from google.oauth2 import service_account  # type: ignore
+
+    return service_account.Credentials.from_service_account_file(
+        path, scopes=[CLOUD_PLATFORM_SCOPE]
+    )
+
+
+def _auth_request() -> Any:
+    from google.auth.transport.requests import Request  # type: ignore
+
+    return Request()
+
+
+class ServiceAccountTokenProvider:
+    """Keeps a service-account bearer token fresh in the background."""
+
+    def __init__(
+        self,
+        path: str,
+        refresh_margin_seconds: float = 300.0,
+        credentials_loader: Callable[[str], Any] = _load_service_account,
+        request_factory: Callable[[], Any] = _auth_request,
+    ):
+        self.path = path
+        self.refresh_margin = timedelta(seconds=refresh_margin_seconds)
+        self._credentials_loader = credentials_loader
+        self._request_factory = request_factory
+        self._credentials: Any = None
+        self._lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_at: Optional[datetime] = None
+        self._refreshing = False
+        self.refresh_count = 0
+
+    def _expiry(self) -> Optional[datetime]:
+        # google-auth reports expiry as a naive UTC datetime
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is not None and expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return expiry
+
+    def _cached_token(self) -> Optional[str]:
+        """Return the cached token if it has not expired yet."""
+        token = getattr(self._credentials, "token", None)
+        expiry = self._expiry()
+        if not token:
+            return None
+        if expiry is not None and expiry <= datetime.now(timezone.utc):
+            return None
+        return token
+
+    def _needs_refresh_soon(self) -> bool:
+        # Same due time as the refresh timer, so short-lived tokens are only
+        # refreshed on access once they pass their half-life
+        refresh_at = self._refresh_at
+        return refresh_at is not None and datetime.now(timezone.utc) >= refresh_at
+
+    def refresh(self, force: bool = True) -> Optional[str]:
+        """
+        Load credentials if needed and fetch a new token (blocking).
+
+        Args:
+            force: Refresh even if a valid token is cached. Cold-start callers
+                pass ``False`` so that, once one of them has fetched a token,
+                the others waiting on the lock reuse it.
+        """
+        with self._lock:
+            if not force:
+                token = self._cached_token()
+                if token:
+                    return token
+            if self._credentials is None:
+                self._credentials = self._credentials_loader(self.path)
+            self._credentials.refresh(self._request_factory())
+            self.refresh_count += 1
+            self._refreshing = False
+            self._schedule_refresh()
+            logger.debug(
+                f"🔑 Refreshed service account token (expires {self._expiry()})"
+            )
+            return self._credentials.token
+
+    def _schedule_refresh(self) -> None:
+        """Arm a timer that refreshes the token before it expires (holds lock)."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        expiry = self._expiry()
+        if expiry is None:
+            self._refresh_at = None
+            return
+        now = datetime.now(timezone.utc)
+        remaining = (expiry - now).total_seconds()
+        margin = self.refresh_margin.total_seconds()
+        # Tokens shorter-lived than the margin refresh at half-life, not in a loop
+        delay = max(0.0, remaining - margin if remaining > margin else remaining / 2)
+        self._refresh_at = now + timedelta(seconds=delay)
+        timer = threading.Timer(delay, self._refresh_in_background)
+        timer.daemon = True
+        self._refresh_timer = timer
+        timer.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            with self._lock:
+                self._refreshing = False
+            logger.warning(f"Background service account token refresh failed: {e}")
+
+    def _start_background_refresh(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._refresh_in_background, name="sa-token-refresh", daemon=True
+        ).start()
+
+    async def get_token(self) -> Optional[str]:
+        """
+        Return a valid bearer token without blocking the event loop.
+
+        A cached token is returned immediately (kicking off a background
+        refresh if it is about to expire). Only when no valid token exists yet
+        is the refresh awaited, on a worker thread.
+        """
+        token = self._cached_token()
+        if token:
+            if self._needs_refresh_soon():
+                self._start_background_refresh()
+            return token
+        return await asyncio.to_thread(self.refresh, False)
+
+    def close(self) -> None:
+        """Cancel the scheduled refresh."""
+        with self._lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
+
+_providers: Dict[str, ServiceAccountTokenProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_token_provider(path: str) -> ServiceAccountTokenProvider:
+    """Return the process-wide token provider for a service-account file."""
+    with _providers_lock:
+        provider = _providers.get(path)
+        if provider is None:
+            provider = ServiceAccountTokenProvider(path)
+            _providers[path] = provider
+        return provider
+
+
+def close_token_providers() -> None:
+    """Cancel every provider's scheduled refresh (app shutdown)."""
+    with _providers_lock:
+        providers = list(_providers.values())
+        _providers.clear()
+    for provider in providers:
+        provider.close()
@@ -56,7 +56,15 @@ class AgentFactory:
                     logger.debug(
                         f"🔍 Searching for client-specific agent '{name}' in profile '{client_profile}'"
                     )
-                    client_agents = await getattr(self.agent_repository, "get_by_client_profile")(client_profile)  # type: ignore[attr-defined]
+                    lookup = getattr(
+                        self.agent_repository, "get_by_profile_and_name", None
+                    )
+                    if lookup is not None:
+                        # Indexed repositories resolve (profile, name) directly
+                        match = await lookup(client_profile, name)
+                        client_agents = [match] if match else []
+                    else:
+                        client_agents = await getattr(self.agent_repository, "get_by_client_profile")(client_profile)  # type: ignore[attr-defined]
                     logger.debug(
                         f"📋 Found {len(client_agents)} agents for profile '{client_profile}': {[a.name for a in client_agents]}"
                     )
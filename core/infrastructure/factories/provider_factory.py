@@ -10,6 +10,10 @@ from ...infrastructure.external_services.openai_adapter import OpenAIAdapter
 from ...infrastructure.external_services.anthropic_adapter import AnthropicAdapter
 from ...infrastructure.external_services.deepseek_adapter import DeepSeekAdapter
 from ...infrastructure.external_services.gemini_adapter import GeminiAdapter
+from ...infrastructure.external_services.caching_provider import (
+    CachingLLMProvider,
+    get_llm_response_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,20 @@ class LLMProviderFactory:
         Raises:
             ValueError: If provider type is unsupported or API key is missing
         """
+        provider = LLMProviderFactory._create_uncached_provider(provider_type, settings)
+        if not settings.llm_cache_enabled:
+            return provider
+        return CachingLLMProvider(
+            provider,
+            get_llm_response_cache(settings),
+            max_cacheable_temperature=settings.llm_cache_max_temperature,
+        )
+
+    @staticmethod
+    def _create_uncached_provider(
+        provider_type: LLMProvider, settings: Settings
+    ) -> LLMProviderInterface:
+        """Create the bare adapter for a provider type."""
         logger.info(f"🏭 Creating provider: {provider_type.value}")
 
         if provider_type == LLMProvider.OPENAI:
@@ -86,6 +104,7 @@ class LLMProviderFactory:
                 endpoint=settings.vertex_api_endpoint,
                 api_version=settings.vertex_api_version,
                 sa_credentials_path=sa_path,
+                max_concurrent_requests=settings.gemini_max_concurrent_requests,
             )
 
         else:
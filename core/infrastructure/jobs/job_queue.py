@@ -0,0 +1,290 @@
+"""Asynchronous worker pool over the durable job store.
+
+Submitting a job only writes a row and wakes a worker; a fixed pool of asyncio
+workers claims jobs and runs the handler registered for the job's ``kind``.
+
+Dispatch order:
+    1. Highest priority first.
+    2. Within a priority, clients take turns: the client served least
+       recently goes first, and a client never has more than
+       ``max_running_per_client`` jobs running at once.
+    3. Within a client, oldest job first.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ..logging.metrics import register_queue_depth
+from .job_store import Job, JobStatus, SQLiteJobStore
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job], Awaitable[Optional[Dict[str, Any]]]]
+
+
+class JobQueue:
+    """Worker pool that runs persisted jobs with priorities and fairness."""
+
+    def __init__(
+        self,
+        store: SQLiteJobStore,
+        workers: int = 2,
+        max_running_per_client: int = 1,
+        max_attempts: int = 2,
+        poll_interval_seconds: float = 5.0,
+    ):
+        self.store = store
+        self.workers = max(1, workers)
+        self.max_running_per_client = max_running_per_client
+        self.max_attempts = max(1, max_attempts)
+        self.poll_interval_seconds = poll_interval_seconds
+        self._handlers: Dict[str, JobHandler] = {}
+        self._worker_tasks: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._running_by_client: Dict[str, int] = {}
+        self._last_served: Dict[str, float] = {}
+        self._cancel_requested: Set[str] = set()
+        # Created in start() so they bind to the serving event loop
+        self._wakeup: Optional[asyncio.Event] = None
+        self._claim_lock: Optional[asyncio.Lock] = None
+        self._stopping = False
+
+    def register_handler(self, kind: str, handler: JobHandler) -> None:
+        """Register the coroutine that runs jobs of ``kind``."""
+        self._handlers[kind] = handler
+
+    @property
+    def started(self) -> bool:
+        return bool(self._worker_tasks)
+
+    async def start(self) -> None:
+        """Recover interrupted jobs and start the worker pool."""
+        if self.started:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._claim_lock = asyncio.Lock()
+
+        requeued, failed = await asyncio.to_thread(
+            self.store.recover_interrupted, self.max_attempts
+        )
+        if requeued or failed:
+            logger.info(
+                f"♻️ Recovered interrupted jobs: "
+                f"{requeued} requeued, {failed} failed"
+            )
+
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(index), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+        self._wakeup.set()
+        logger.info(f"🚀 Job queue started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """Stop workers; jobs still running are requeued for the next start."""
+        if not self.started:
+            return
+        self._stopping = True
+        for task in list(self._running.values()):
+            task.cancel()
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("🛑 Job queue stopped")
+
+    async def submit(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        client_id: Optional[str] = None,
+        priority: int = 0,
+    ) -> Job:
+        """Persist a new job and wake a worker; returns immediately."""
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind: {kind}")
+        job = Job(
+            kind=kind,
+            payload=payload,
+            client_id=client_id or "default",
+            priority=priority,
+        )
+        await asyncio.to_thread(self.store.insert, job)
+        logger.info(
+            f"📥 Job queued: {job.id} "
+            f"({kind}, client={job.client_id}, priority={priority})"
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def list_jobs(
+        self,
+        client_id: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        limit: int = 100,
+    ) -> List[Job]:
+        return await asyncio.to_thread(self.store.list_jobs, client_id, status, limit)
+
+    async def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            The job after cancellation, or ``None`` if it does not exist
+        """
+        if await asyncio.to_thread(self.store.cancel_if_queued, job_id):
+            logger.info(f"🚫 Cancelled queued job: {job_id}")
+        else:
+            task = self._running.get(job_id)
+            if task is not None and not task.done():
+                self._cancel_requested.add(job_id)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                if task.cancelled():
+                    await asyncio.to_thread(
+                        self.store.finish, job_id, JobStatus.CANCELLED
+                    )
+                    logger.info(f"🚫 Cancelled running job: {job_id}")
+        return await self.get(job_id)
+
+    async def save_progress(self, job: Job, progress: Dict[str, Any]) -> None:
+        """Persist a running job's checkpoint; a retried attempt receives it."""
+        job.progress = dict(progress)
+        await asyncio.to_thread(self.store.save_progress, job.id, job.progress)
+
+    def queued_count(self) -> int:
+        return self.store.count_by_status().get(JobStatus.QUEUED.value, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": len(self._running),
+            "running_by_client": dict(self._running_by_client),
+            "jobs_by_status": self.store.count_by_status(),
+        }
+
+    async def _worker(self, index: int) -> None:
+        while not self._stopping:
+            # Clear before claiming so a submit racing with the claim re-wakes us
+            self._wakeup.clear()
+            job = await self._claim()
+            if job is None:
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    def _claim_next(
+        self, busy_clients: List[str], last_served: Dict[str, float]
+    ) -> Optional[Job]:
+        heads = self.store.client_heads(busy_clients)
+        for client_id, job_id, _ in sorted(
+            heads, key=lambda head: (last_served.get(head[0], 0.0), head[2])
+        ):
+            job = self.store.mark_running(job_id)
+            if job is not None:
+                return job
+        return None
+
+    async def _claim(self) -> Optional[Job]:
+        async with self._claim_lock:
+            limit = self.max_running_per_client
+            busy = [
+                client
+                for client, running in self._running_by_client.items()
+                if limit > 0 and running >= limit
+            ]
+            job = await asyncio.to_thread(
+                self._claim_next, busy, dict(self._last_served)
+            )
+            if job is not None:
+                self._running_by_client[job.client_id] = (
+                    self._running_by_client.get(job.client_id, 0) + 1
+                )
+                self._last_served[job.client_id] = time.monotonic()
+            return job
+
+    async def _run(self, job: Job) -> None:
+        handler = self._handlers.get(job.kind)
+        logger.info(f"🔄 Running job {job.id} ({job.kind}, attempt {job.attempts})")
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job kind: {job.kind}")
+            task = asyncio.create_task(handler(job))
+            self._running[job.id] = task
+            try:
+                result = await task
+            except asyncio.CancelledError:
+                if job.id in self._cancel_requested:
+                    # cancel() records the final status
+                    return
+                # Shutdown: leave the job for the next process to pick up
+                await asyncio.to_thread(self.store.requeue, job.id)
+                raise
+            await asyncio.to_thread(
+                self.store.finish, job.id, JobStatus.SUCCEEDED, result
+            )
+            logger.info(f"✅ Job succeeded: {job.id}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Job failed: {job.id} - {e}")
+            await asyncio.to_thread(
+                self.store.finish, job.id, JobStatus.FAILED, None, str(e)
+            )
+        finally:
+            self._running.pop(job.id, None)
+            self._cancel_requested.discard(job.id)
+            remaining = self._running_by_client.get(job.client_id, 1) - 1
+            if remaining > 0:
+                self._running_by_client[job.client_id] = remaining
+            else:
+                self._running_by_client.pop(job.client_id, None)
+            # A freed client slot may unblock a queued job
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+
+def _job_queue_settings() -> Dict[str, Any]:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    settings = get_runtime_settings()
+    return {
+        "enabled": settings.job_queue_enabled,
+        "db_path": settings.job_queue_db_path,
+        "workers": settings.job_queue_workers,
+        "max_running_per_client": settings.job_queue_max_running_per_client,
+        "max_attempts": settings.job_queue_max_attempts,
+    }
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_loaded = False
+
+
+def get_job_queue() -> Optional[JobQueue]:
+    """Return the process-wide job queue, or ``None`` when disabled."""
+    global _job_queue, _job_queue_loaded
+    if not _job_queue_loaded:
+        config = _job_queue_settings()
+        if config["enabled"]:
+            _job_queue = JobQueue(
+                SQLiteJobStore(config["db_path"]),
+                workers=config["workers"],
+                max_running_per_client=config["max_running_per_client"],
+                max_attempts=config["max_attempts"],
+            )
+            register_queue_depth("jobs_queued", _job_queue.queued_count)
+        _job_queue_loaded = True
+    return _job_queue
@@ -0,0 +1,317 @@
+"""SQLite persistence for background jobs.
+
+Every state change is written through to a local SQLite database (WAL mode) so
+queued and interrupted jobs survive a process restart. The store is
+synchronous and thread-safe; the async ``JobQueue`` calls it via
+``asyncio.to_thread``.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class JobStatus(str, Enum):
+    """Lifecycle states of a job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+@dataclass
+class Job:
+    """A unit of background work and its outcome."""
+
+    kind: str
+    payload: Dict[str, Any]
+    client_id: str = "default"
+    priority: int = 0
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: JobStatus = JobStatus.QUEUED
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    # Checkpoint a long-running handler saves so a retry can resume
+    progress: Optional[Dict[str, Any]] = None
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self, include_payload: bool = False) -> Dict[str, Any]:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "client_id": self.client_id,
+            "priority": self.priority,
+            "status": self.status.value,
+            "result": self.result,
+            "error": self.error,
+            "progress": self.progress,
+            "attempts": self.attempts,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_payload:
+            data["payload"] = self.payload
+        return data
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    progress TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_dispatch
+    ON jobs (status, priority, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_client ON jobs (client_id, created_at);
+"""
+
+
+class SQLiteJobStore:
+    """Durable job table backed by a single SQLite file."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            columns = {
+                row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")
+            }
+            if "progress" not in columns:
+                # Databases created before progress checkpoints existed
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN progress TEXT")
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            id=row["id"],
+            kind=row["kind"],
+            client_id=row["client_id"],
+            priority=row["priority"],
+            status=JobStatus(row["status"]),
+            payload=json.loads(row["payload"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            progress=json.loads(row["progress"]) if row["progress"] else None,
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
+
+    def insert(self, job: Job) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, client_id, priority, status, payload,"
+                " attempts, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.id,
+                    job.kind,
+                    job.client_id,
+                    job.priority,
+                    job.status.value,
+                    json.dumps(job.payload, default=str),
+                    job.attempts,
+                    job.created_at,
+                ),
+            )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        client_id: Optional[str] = None,
+        status: Optional[JobStatus] = None,
+        limit: int = 100,
+    ) -> List[Job]:
+        """Return jobs newest first, optionally filtered by client and status."""
+        clauses, params = [], []
+        if client_id is not None:
+            clauses.append("client_id = ?")
+            params.append(client_id)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def client_heads(
+        self, exclude_clients: Sequence[str] = ()
+    ) -> List[Tuple[str, str, float]]:
+        """
+        Return ``(client_id, job_id, created_at)`` of each client's oldest job
+        at the highest queued priority, skipping ``exclude_clients``.
+        """
+        exclude = list(exclude_clients)
+        not_in = (
+            f"AND client_id NOT IN ({', '.join('?' * len(exclude))})" if exclude else ""
+        )
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT MAX(priority) FROM jobs WHERE status = ? {not_in}",
+                (JobStatus.QUEUED.value, *exclude),
+            ).fetchone()
+            if row[0] is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT client_id, id, MIN(created_at) AS created_at FROM jobs"
+                f" WHERE status = ? AND priority = ? {not_in} GROUP BY client_id",
+                (JobStatus.QUEUED.value, row[0], *exclude),
+            ).fetchall()
+        return [(r["client_id"], r["id"], r["created_at"]) for r in rows]
+
+    def mark_running(self, job_id: str) -> Optional[Job]:
+        """Move a queued job to running; ``None`` if it is no longer queued."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, attempts = attempts + 1"
+                " WHERE id = ? AND status = ?",
+                (JobStatus.RUNNING.value, time.time(), job_id, JobStatus.QUEUED.value),
+            )
+            if cursor.rowcount == 0:
+                return None
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row)
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?"
+                " WHERE id = ?",
+                (
+                    JobStatus(status).value,
+                    json.dumps(result, default=str) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def save_progress(self, job_id: str, progress: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ? WHERE id = ?",
+                (json.dumps(progress, default=str), job_id),
+            )
+
+    def cancel_if_queued(self, job_id: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?"
+                " WHERE id = ? AND status = ?",
+                (
+                    JobStatus.CANCELLED.value,
+                    time.time(),
+                    job_id,
+                    JobStatus.QUEUED.value,
+                ),
+            )
+        return cursor.rowcount > 0
+
+    def requeue(self, job_id: str) -> None:
+        """
+        Put a running job back in the queue (e.g. on shutdown).
+
+        The attempt taken by ``mark_running`` is given back, so graceful
+        restarts never count against ``max_attempts``; only crash recoveries do.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL,"
+                " attempts = MAX(attempts - 1, 0)"
+                " WHERE id = ? AND status = ?",
+                (JobStatus.QUEUED.value, job_id, JobStatus.RUNNING.value),
+            )
+
+    def recover_interrupted(self, max_attempts: int) -> Tuple[int, int]:
+        """
+        Requeue jobs left running by a crashed process.
+
+        Jobs that already used ``max_attempts`` attempts are failed instead so
+        a job that crashes the process cannot loop forever.
+
+        Returns:
+            ``(requeued, failed)`` counts
+        """
+        running = JobStatus.RUNNING.value
+        with self._lock, self._conn:
+            failed = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ?"
+                " WHERE status = ? AND attempts >= ?",
+                (
+                    JobStatus.FAILED.value,
+                    "Interrupted by a restart too many times",
+                    time.time(),
+                    running,
+                    max_attempts,
+                ),
+            ).rowcount
+            requeued = self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?",
+                (JobStatus.QUEUED.value, running),
+            ).rowcount
+        return requeued, failed
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -2,13 +2,19 @@
 
 import logging
 import json
+import sys
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from uuid import UUID, uuid4
 from dataclasses import dataclass, field
 from enum import Enum
 
+from .log_entry_store import LogEntryStore
+
+# Slotted entries keep the in-memory log compact (dataclass slots need 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class LogLevel(Enum):
     """Log levels for agent interactions."""
@@ -36,7 +42,7 @@ class InteractionType(Enum):
     DECISION_POINT = "decision_point"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LogEntry:
     """Structured log entry for agent interactions."""
 
@@ -75,16 +81,48 @@ class LogEntry:
         }
 
 
+def _store_settings() -> Dict[str, Any]:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    settings = get_runtime_settings()
+    return {
+        "max_entries": settings.agent_log_max_entries,
+        "spill_path": settings.agent_log_spill_path,
+        "session_ttl_seconds": settings.agent_log_session_ttl_seconds,
+    }
+
+
 class AgentLogger:
     """Advanced logger for AI agents and tools interactions."""
 
+    # How often start_agent_session sweeps sessions that were never ended
+    SESSION_PRUNE_INTERVAL_SECONDS = 60.0
+
     def __init__(
-        self, name: str = "agent_logger", tracker=None, run_id: Optional[str] = None
+        self,
+        name: str = "agent_logger",
+        tracker=None,
+        run_id: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        spill_path: Optional[str] = None,
+        session_ttl_seconds: Optional[float] = None,
     ):
+        config = _store_settings()
         self.name = name
         self.logger = logging.getLogger(name)
-        self.entries: List[LogEntry] = []
+        self.entries = LogEntryStore(
+            max_entries=max_entries or config["max_entries"],
+            spill_path=spill_path or config["spill_path"],
+        )
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
+        self.session_ttl_seconds = (
+            session_ttl_seconds
+            if session_ttl_seconds is not None
+            else config["session_ttl_seconds"]
+        )
+        self._last_session_prune = time.time()
+        # Callbacks fed every entry as it is logged (e.g. workflow aggregation)
+        self._listeners: List[Callable[[LogEntry], None]] = []
         self.tracker = tracker
         self.run_id = run_id
 
@@ -98,6 +136,10 @@ class AgentLogger:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.DEBUG)
 
+    def add_listener(self, listener: Callable[[LogEntry], None]) -> None:
+        """Register a callback invoked with every new log entry."""
+        self._listeners.append(listener)
+
     def set_tracker(self, tracker, run_id: str) -> None:
         """Attach Supabase tracker and run identifier."""
         self.tracker = tracker
@@ -112,6 +154,7 @@ class AgentLogger:
         task_description: str,
     ) -> str:
         """Start a new agent execution session."""
+        self._prune_stale_sessions()
         session_id = str(uuid4())
 
         self.active_sessions[session_id] = {
@@ -406,6 +449,8 @@ class AgentLogger:
         tokens_used: int,
         cost_usd: float,
         duration_ms: float,
+        cache_hit: bool = False,
+        cost_saved_usd: float = 0.0,
     ):
         """Log an LLM response."""
         session = self.active_sessions.get(session_id, {})
@@ -421,7 +466,11 @@ class AgentLogger:
             agent_name=session.get("agent_name"),
             task_id=session.get("task_id"),
             workflow_id=session.get("workflow_id"),
-            message=f"✅ LLM RESPONSE: {provider}/{model} ({tokens_used} tokens, ${cost_usd:.4f})",
+            message=(
+                f"♻️ LLM RESPONSE (cached): {provider}/{model} (saved ${cost_saved_usd:.4f})"
+                if cache_hit
+                else f"✅ LLM RESPONSE: {provider}/{model} ({tokens_used} tokens, ${cost_usd:.4f})"
+            ),
             data={
                 "session_id": session_id,
                 "request_id": request_id,
@@ -433,6 +482,8 @@ class AgentLogger:
                 ),
                 "tokens_used": tokens_used,
                 "cost_usd": cost_usd,
+                "cache_hit": cache_hit,
+                "cost_saved_usd": cost_saved_usd,
             },
             duration_ms=duration_ms,
             tokens_used=tokens_used,
@@ -477,6 +528,11 @@ class AgentLogger:
     def _log_entry(self, entry: LogEntry):
         """Internal method to log an entry."""
         self.entries.append(entry)
+        for listener in self._listeners:
+            try:
+                listener(entry)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Log entry listener failed: {e}")
 
         # Format message for console output
         prefix = self._get_interaction_prefix(entry.interaction_type)
@@ -514,6 +570,23 @@ class AgentLogger:
         }
         return prefixes.get(interaction_type, "ℹ️")
 
+    def _prune_stale_sessions(self) -> None:
+        """Drop sessions that were started but never ended (e.g. crashed tasks)."""
+        now = time.time()
+        if now - self._last_session_prune < self.SESSION_PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_session_prune = now
+        cutoff = now - self.session_ttl_seconds
+        stale = [
+            session_id
+            for session_id, session in self.active_sessions.items()
+            if session["start_time"] < cutoff
+        ]
+        for session_id in stale:
+            del self.active_sessions[session_id]
+        if stale:
+            self.logger.warning(f"🧹 Pruned {len(stale)} stale agent sessions")
+
     def get_session_summary(self, session_id: str) -> Dict[str, Any]:
         """Get summary of a session."""
         if session_id not in self.active_sessions:
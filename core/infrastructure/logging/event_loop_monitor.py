@@ -0,0 +1,92 @@
+"""
+Event-loop lag monitoring for the FastAPI services.
+
+A background task sleeps for a fixed interval and measures how late it wakes
+up. Any lateness is time the loop spent running blocking code, so a healthy
+service keeps the lag close to zero.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopLagMonitor:
+    """Samples event-loop scheduling lag over a rolling window."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.5,
+        window_size: int = 240,
+        warn_threshold_ms: float = 250.0,
+    ):
+        self.interval_seconds = interval_seconds
+        self.warn_threshold_ms = warn_threshold_ms
+        self.samples: Deque[float] = deque(maxlen=window_size)
+        self.max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.get_running_loop().create_task(self._sample_loop())
+        logger.info("⏱️ Event loop lag monitor started")
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sample_loop(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval_seconds)
+            lag_ms = max(
+                0.0, (time.perf_counter() - started - self.interval_seconds) * 1000
+            )
+            self.record(lag_ms)
+
+    def record(self, lag_ms: float) -> None:
+        """Record a single lag sample."""
+        self.samples.append(lag_ms)
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        if lag_ms > self.warn_threshold_ms:
+            logger.warning(f"⚠️ Event loop blocked for {lag_ms:.0f}ms")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return lag statistics for the rolling window."""
+        if not self.samples:
+            return {
+                "running": self._task is not None and not self._task.done(),
+                "samples": 0,
+                "current_lag_ms": 0.0,
+                "avg_lag_ms": 0.0,
+                "p95_lag_ms": 0.0,
+                "max_lag_ms": self.max_lag_ms,
+            }
+
+        ordered = sorted(self.samples)
+        p95_index = min(len(ordered) - 1, int(len(ordered) * 0.95))
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "samples": len(ordered),
+            "current_lag_ms": self.samples[-1],
+            "avg_lag_ms": sum(ordered) / len(ordered),
+            "p95_lag_ms": ordered[p95_index],
+            "max_lag_ms": self.max_lag_ms,
+        }
+
+
+# Global event loop monitor instance
+event_loop_monitor = EventLoopLagMonitor()
@@ -0,0 +1,169 @@
+"""Bounded, indexed in-memory store for agent log entries.
+
+Entries live in a fixed-size ring buffer; the oldest entry is evicted (and
+optionally spilled to a JSONL file) when the buffer is full. Secondary indexes
+by workflow, session and agent keep filtered lookups proportional to the
+number of results instead of the size of the whole log.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEXES: Dict[str, Callable[[Any], Optional[str]]] = {
+    "workflow_id": lambda entry: entry.workflow_id,
+    "session_id": lambda entry: (entry.data or {}).get("session_id"),
+    "agent_name": lambda entry: entry.agent_name,
+}
+
+
+class LogEntryStore:
+    """Ring buffer of log entries with per-key secondary indexes."""
+
+    def __init__(
+        self,
+        max_entries: int = 50000,
+        spill_path: Optional[str] = None,
+        spill_batch_size: int = 200,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.spill_path = spill_path
+        self.spill_batch_size = max(1, spill_batch_size)
+        self._entries: Deque[Any] = deque()
+        self._indexes: Dict[str, Dict[str, Deque[Any]]] = {name: {} for name in INDEXES}
+        self._spill_buffer: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self.evicted_count = 0
+        self.spilled_count = 0
+
+    def append(self, entry: Any) -> None:
+        """Add an entry, evicting the oldest one when the buffer is full."""
+        with self._lock:
+            self._entries.append(entry)
+            for name, key_of in INDEXES.items():
+                key = key_of(entry)
+                if key is not None:
+                    self._indexes[name].setdefault(key, deque()).append(entry)
+            while len(self._entries) > self.max_entries:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        entry = self._entries.popleft()
+        # The globally oldest entry is also the oldest in each of its indexes
+        for name, key_of in INDEXES.items():
+            key = key_of(entry)
+            if key is None:
+                continue
+            bucket = self._indexes[name].get(key)
+            if bucket and bucket[0] is entry:
+                bucket.popleft()
+                if not bucket:
+                    del self._indexes[name][key]
+        self.evicted_count += 1
+        if self.spill_path:
+            self._spill_buffer.append(entry.to_dict())
+            if len(self._spill_buffer) >= self.spill_batch_size:
+                self._flush_spill()
+
+    def _flush_spill(self) -> None:
+        rows, self._spill_buffer = self._spill_buffer, []
+        if not rows:
+            return
+        try:
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, default=str) + "\n")
+            self.spilled_count += len(rows)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to spill {len(rows)} agent log entries: {e}")
+
+    def flush(self) -> None:
+        """Write any pending evicted entries to the spill file."""
+        with self._lock:
+            if self.spill_path:
+                self._flush_spill()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            snapshot = list(self._entries)
+        return iter(snapshot)
+
+    def by_workflow(self, workflow_id: str) -> List[Any]:
+        """Return a workflow's entries in insertion order."""
+        return self._lookup("workflow_id", workflow_id)
+
+    def by_session(self, session_id: str) -> List[Any]:
+        """Return an agent session's entries in insertion order."""
+        return self._lookup("session_id", session_id)
+
+    def by_agent(self, agent_name: str) -> List[Any]:
+        """Return an agent's entries in insertion order."""
+        return self._lookup("agent_name", agent_name)
+
+    def _lookup(self, index: str, key: str) -> List[Any]:
+        with self._lock:
+            return list(self._indexes[index].get(key, ()))
+
+    def recent(
+        self,
+        limit: int,
+        agent_name: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Return up to ``limit`` entries, most recent first.
+
+        Filtering walks the smaller matching index backwards, so the cost is
+        bounded by the number of matching entries rather than the log size.
+        """
+        with self._lock:
+            candidates: Any = self._entries
+            if agent_name is not None:
+                candidates = self._indexes["agent_name"].get(agent_name, ())
+            if workflow_id is not None:
+                by_workflow = self._indexes["workflow_id"].get(workflow_id, ())
+                if agent_name is None or len(by_workflow) < len(candidates):
+                    candidates = by_workflow
+
+            results: List[Any] = []
+            for entry in reversed(candidates):
+                if agent_name is not None and entry.agent_name != agent_name:
+                    continue
+                if workflow_id is not None and entry.workflow_id != workflow_id:
+                    continue
+                results.append(entry)
+                if len(results) >= limit:
+                    break
+            return results
+
+    def since(self, cutoff: datetime) -> List[Any]:
+        """Return entries logged at or after ``cutoff`` in insertion order."""
+        with self._lock:
+            results: List[Any] = []
+            for entry in reversed(self._entries):
+                if entry.timestamp < cutoff:
+                    break
+                results.append(entry)
+        results.reverse()
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return buffer occupancy and eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evicted": self.evicted_count,
+                "spilled": self.spilled_count,
+                "indexed_workflows": len(self._indexes["workflow_id"]),
+                "indexed_sessions": len(self._indexes["session_id"]),
+                "indexed_agents": len(self._indexes["agent_name"]),
+            }
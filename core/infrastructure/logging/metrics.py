@@ -0,0 +1,308 @@
+"""Prometheus metrics shared by the core and onboarding FastAPI apps.
+
+Latency/token/cost histograms are recorded where the work happens (agent
+executor, workflow reporter, HTTP middleware); gauges for event-loop lag and
+queue depths are refreshed when ``/metrics`` is scraped.
+
+Label values that come from callers (models, tools, tenants...) are bounded:
+each label keeps at most ``MAX_LABEL_VALUES`` distinct values and folds the
+rest into ``"other"`` so a misbehaving client cannot explode cardinality.
+
+``prometheus_client`` is optional; without it every metric is a no-op and
+``/metrics`` returns 503.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import (
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        Counter,
+        Gauge,
+        Histogram,
+        generate_latest,
+    )
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without the dependency
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+MAX_LABEL_VALUES = 50
+OVERFLOW_LABEL = "other"
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+WORKFLOW_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800)
+TOKEN_BUCKETS = (100, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+COST_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class _NoopMetric:
+    """Stand-in used when prometheus_client is not installed."""
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+
+class _BoundedLabels:
+    """Caps the number of distinct values seen per (metric, label)."""
+
+    def __init__(self, max_values: int = MAX_LABEL_VALUES):
+        self.max_values = max_values
+        self._seen: Dict[Tuple[str, str], Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def bound(self, metric: str, label: str, value: Any) -> str:
+        value = str(value) if value not in (None, "") else "unknown"
+        key = (metric, label)
+        with self._lock:
+            seen = self._seen.setdefault(key, set())
+            if value in seen:
+                return value
+            if len(seen) >= self.max_values:
+                return OVERFLOW_LABEL
+            seen.add(value)
+            return value
+
+
+_label_limiter = _BoundedLabels()
+
+
+class BoundedMetric:
+    """Wraps a labelled metric so every label value goes through the limiter."""
+
+    def __init__(self, metric: Any, name: str):
+        self._metric = metric
+        self._name = name
+
+    def labels(self, **labels: Any) -> Any:
+        bounded = {
+            label: _label_limiter.bound(self._name, label, value)
+            for label, value in labels.items()
+        }
+        return self._metric.labels(**bounded)
+
+
+registry = CollectorRegistry() if PROMETHEUS_AVAILABLE else None
+
+
+def _metric(kind: str, name: str, doc: str, labels: Iterable[str], **kwargs: Any):
+    if not PROMETHEUS_AVAILABLE:
+        return _NoopMetric()
+    factory = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}[kind]
+    metric = factory(name, doc, list(labels), registry=registry, **kwargs)
+    return BoundedMetric(metric, name)
+
+
+http_request_duration_seconds = _metric(
+    "histogram",
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["app", "method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+llm_request_duration_seconds = _metric(
+    "histogram",
+    "llm_request_duration_seconds",
+    "LLM generation latency",
+    ["provider", "model", "cache"],
+    buckets=LATENCY_BUCKETS,
+)
+llm_tokens_per_request = _metric(
+    "histogram",
+    "llm_tokens_per_request",
+    "Tokens used per LLM request",
+    ["provider", "model", "kind"],
+    buckets=TOKEN_BUCKETS,
+)
+llm_cost_usd_total = _metric(
+    "counter", "llm_cost_usd_total", "LLM spend in USD", ["provider", "model"]
+)
+tool_call_duration_seconds = _metric(
+    "histogram",
+    "tool_call_duration_seconds",
+    "Tool call latency",
+    ["tool", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+tool_call_cost_usd = _metric(
+    "histogram",
+    "tool_call_cost_usd",
+    "Cost per tool call in USD",
+    ["tool"],
+    buckets=COST_BUCKETS,
+)
+workflow_duration_seconds = _metric(
+    "histogram",
+    "workflow_duration_seconds",
+    "Workflow execution time",
+    ["workflow_type", "status"],
+    buckets=WORKFLOW_BUCKETS,
+)
+event_loop_lag_seconds = _metric(
+    "gauge", "event_loop_lag_seconds", "Event loop lag", ["stat"]
+)
+queue_depth = _metric("gauge", "queue_depth", "Items waiting per queue", ["queue"])
+telemetry_rows_dropped_total = _metric(
+    "counter",
+    "telemetry_rows_dropped_total",
+    "Telemetry rows dropped because the write-behind buffer stayed full",
+    ["table"],
+)
+
+# Onboarding service metrics (imported via onboarding.infrastructure.metrics)
+onboarding_cards_created_total = _metric(
+    "counter",
+    "onboarding_cards_created_total",
+    "Cards created by onboarding",
+    ["tenant_id", "card_type"],
+)
+onboarding_batch_duration_ms = _metric(
+    "histogram",
+    "onboarding_batch_duration_ms",
+    "Card batch generation time in milliseconds",
+    ["tenant_id"],
+    buckets=(100, 500, 1000, 5000, 10000, 30000, 60000, 120000),
+)
+onboarding_errors_total = _metric(
+    "counter",
+    "onboarding_errors_total",
+    "Onboarding pipeline errors",
+    ["tenant_id", "error_type"],
+)
+onboarding_partial_creation_total = _metric(
+    "counter",
+    "onboarding_partial_creation_total",
+    "Card batches that were only partially created",
+    ["tenant_id"],
+)
+
+
+def observe_llm_call(
+    provider: str,
+    model: str,
+    duration_seconds: float,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cost_usd: float = 0.0,
+    cache_hit: bool = False,
+) -> None:
+    """Record latency, tokens and spend of one LLM generation."""
+    cache = "hit" if cache_hit else "miss"
+    llm_request_duration_seconds.labels(
+        provider=provider, model=model, cache=cache
+    ).observe(duration_seconds)
+    if prompt_tokens:
+        llm_tokens_per_request.labels(
+            provider=provider, model=model, kind="prompt"
+        ).observe(prompt_tokens)
+    if completion_tokens:
+        llm_tokens_per_request.labels(
+            provider=provider, model=model, kind="completion"
+        ).observe(completion_tokens)
+    if cost_usd:
+        llm_cost_usd_total.labels(provider=provider, model=model).inc(cost_usd)
+
+
+def observe_tool_call(
+    tool: str, duration_seconds: float, cost_usd: float = 0.0, success: bool = True
+) -> None:
+    """Record latency and cost of one tool call."""
+    status = "success" if success else "error"
+    tool_call_duration_seconds.labels(tool=tool, status=status).observe(
+        duration_seconds
+    )
+    if success:
+        tool_call_cost_usd.labels(tool=tool).observe(cost_usd or 0.0)
+
+
+def observe_workflow(
+    workflow_type: str, duration_seconds: float, success: bool
+) -> None:
+    """Record the duration of a finished workflow."""
+    workflow_duration_seconds.labels(
+        workflow_type=workflow_type, status="success" if success else "failed"
+    ).observe(duration_seconds)
+
+
+_queue_depth_sources: Dict[str, Callable[[], float]] = {}
+
+
+def register_queue_depth(name: str, source: Callable[[], float]) -> None:
+    """Expose ``source()`` as ``queue_depth{queue=name}`` at scrape time."""
+    _queue_depth_sources[name] = source
+
+
+def _refresh_gauges() -> None:
+    from .event_loop_monitor import event_loop_monitor
+
+    lag = event_loop_monitor.get_stats()
+    for stat in ("current", "avg", "p95", "max"):
+        event_loop_lag_seconds.labels(stat=stat).set(lag[f"{stat}_lag_ms"] / 1000.0)
+
+    for name, source in list(_queue_depth_sources.items()):
+        try:
+            queue_depth.labels(queue=name).set(float(source()))
+        except Exception as e:
+            logger.debug(f"Queue depth source {name} failed: {e}")
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return the exposition payload and its content type."""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client is not installed\n", CONTENT_TYPE_LATEST
+    _refresh_gauges()
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def install_metrics(app: Any, app_name: str) -> None:
+    """
+    Add request-latency middleware and a ``/metrics`` endpoint to a FastAPI app.
+
+    Args:
+        app: FastAPI application
+        app_name: Value of the ``app`` label on HTTP metrics
+    """
+    from fastapi import Request, Response
+
+    @app.middleware("http")
+    async def _observe_request(request: Request, call_next: Callable) -> Response:
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            # Route templates (not raw paths) keep the label set bounded
+            route = request.scope.get("route")
+            http_request_duration_seconds.labels(
+                app=app_name,
+                method=request.method,
+                route=getattr(route, "path", "unmatched"),
+                status=f"{status // 100}xx",
+            ).observe(time.perf_counter() - start)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint() -> Response:
+        body, content_type = render_metrics()
+        return Response(
+            content=body,
+            media_type=content_type,
+            status_code=200 if PROMETHEUS_AVAILABLE else 503,
+        )
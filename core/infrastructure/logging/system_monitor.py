@@ -6,12 +6,15 @@ import logging
 import psutil
 import time
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import json
 
+from .time_series import MetricRingBuffer, RollupSeries
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,22 +62,54 @@ class ErrorSummary:
     error_rate_trend: str  # increasing, stable, decreasing
 
 
+# Numeric SystemMetrics fields kept as time series
+METRIC_FIELDS = (
+    "cpu_percent",
+    "memory_percent",
+    "memory_used_gb",
+    "disk_percent",
+    "active_connections",
+    "process_count",
+    "load_average",
+)
+
+# Rollup resolutions in seconds
+ROLLUP_RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600}
+
+HISTORY_SECONDS = 24 * 3600
+
+
 class SystemMonitor:
     """
     Comprehensive system monitoring for application health and performance.
 
     This monitor tracks system resources, application health, error rates,
-    and provides alerts for critical issues.
+    and provides alerts for critical issues. Samples are collected off the
+    event loop and kept in fixed-size ring buffers (24h of raw samples per
+    metric) plus 1m/5m/1h rollups; persistence is an append-only JSONL file.
     """
 
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(self, log_dir: str = "logs", interval_seconds: int = 60):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
 
         self.start_time = datetime.utcnow()
-        self.metrics_history: List[SystemMetrics] = []
-        self.health_history: List[ApplicationHealth] = []
-        self.error_history: List[Dict[str, Any]] = []
+        self.interval_seconds = max(1, interval_seconds)
+        capacity = HISTORY_SECONDS // self.interval_seconds
+        self.metric_series: Dict[str, MetricRingBuffer] = {
+            name: MetricRingBuffer(capacity) for name in METRIC_FIELDS
+        }
+        self.rollups: Dict[str, Dict[str, RollupSeries]] = {
+            name: {
+                label: RollupSeries(resolution, HISTORY_SECONDS)
+                for label, resolution in ROLLUP_RESOLUTIONS.items()
+            }
+            for name in METRIC_FIELDS
+        }
+        self.latest_metrics: Optional[SystemMetrics] = None
+        self.latest_health: Optional[ApplicationHealth] = None
+        self.health_samples = 0
+        self.error_history: Deque[Dict[str, Any]] = deque(maxlen=10000)
 
         self.monitoring_enabled = True
         self.alert_thresholds = {
@@ -85,29 +120,37 @@ class SystemMonitor:
             "response_time_ms": 5000.0,
         }
 
+        # Prime psutil so later non-blocking cpu_percent calls measure the interval
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+
         logger.info("🔍 System monitor initialized")
 
-    async def start_monitoring(self, interval_seconds: int = 60):
+    async def start_monitoring(self, interval_seconds: Optional[int] = None):
         """Start continuous system monitoring."""
+        interval_seconds = interval_seconds or self.interval_seconds
         logger.info(f"📊 Starting system monitoring (interval: {interval_seconds}s)")
 
         while self.monitoring_enabled:
             try:
-                # Collect system metrics
-                metrics = self.collect_system_metrics()
-                self.metrics_history.append(metrics)
+                # psutil calls (net_connections, pids) can be slow; keep them off the loop
+                metrics = await asyncio.to_thread(self.collect_system_metrics)
+                self.record_metrics(metrics)
 
                 # Collect application health
                 health = await self.collect_application_health()
-                self.health_history.append(health)
+                self.latest_health = health
+                self.health_samples += 1
 
                 # Check for alerts
                 await self.check_alerts(metrics, health)
 
-                # Cleanup old data (keep last 24 hours)
+                # Drop errors older than 24 hours
                 self.cleanup_old_data()
 
-                # Save metrics to file
+                # Append the sample to today's metrics file
                 await self.save_metrics()
 
                 await asyncio.sleep(interval_seconds)
@@ -119,9 +162,8 @@ class SystemMonitor:
     def collect_system_metrics(self) -> SystemMetrics:
         """Collect current system performance metrics."""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
-
+            # CPU usage since the previous call (non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             # Memory usage
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
@@ -189,27 +231,22 @@ class SystemMonitor:
             uptime_seconds = (datetime.utcnow() - self.start_time).total_seconds()
 
             # Get error rate from recent history
-            recent_errors = [
-                e
-                for e in self.error_history
-                if datetime.fromisoformat(e["timestamp"])
-                > datetime.utcnow() - timedelta(hours=1)
-            ]
+            failed_requests = self._count_errors_since(
+                datetime.utcnow() - timedelta(hours=1)
+            )
 
             # Simulate request metrics (in real implementation, get from request tracker)
-            total_requests = len(self.health_history) * 10  # Rough estimate
-            failed_requests = len(recent_errors)
+            total_requests = self.health_samples * 10  # Rough estimate
             error_rate = failed_requests / max(total_requests, 1)
 
             # Determine health status
+            cpu_percent = (
+                self.latest_metrics.cpu_percent if self.latest_metrics else 0.0
+            )
             status = "healthy"
-            if error_rate > 0.1 or (
-                self.metrics_history and self.metrics_history[-1].cpu_percent > 90
-            ):
+            if error_rate > 0.1 or cpu_percent > 90:
                 status = "unhealthy"
-            elif error_rate > 0.05 or (
-                self.metrics_history and self.metrics_history[-1].cpu_percent > 80
-            ):
+            elif error_rate > 0.05 or cpu_percent > 80:
                 status = "degraded"
 
             # Simulate response time (in real implementation, track actual response times)
@@ -279,6 +316,18 @@ class SystemMonitor:
         for alert in alerts:
             logger.warning(f"🚨 ALERT: {alert}")
 
+    def record_metrics(self, metrics: SystemMetrics) -> None:
+        """Append a sample to the per-metric ring buffers and rollups."""
+        self.latest_metrics = metrics
+        timestamp = metrics.timestamp.replace(tzinfo=timezone.utc).timestamp()
+        for name in METRIC_FIELDS:
+            value = getattr(metrics, name)
+            if value is None:
+                continue
+            self.metric_series[name].append(timestamp, float(value))
+            for rollup in self.rollups[name].values():
+                rollup.add(timestamp, float(value))
+
     def log_error(self, error_type: str, message: str, details: Dict[str, Any] = None):
         """Log an application error for tracking."""
         error_entry = {
@@ -289,59 +338,75 @@ class SystemMonitor:
         }
 
         self.error_history.append(error_entry)
+        self.cleanup_old_data()
 
-        # Keep only recent errors (last 24 hours)
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        self.error_history = [
-            e
-            for e in self.error_history
-            if datetime.fromisoformat(e["timestamp"]) > cutoff
-        ]
+    def _count_errors_since(self, cutoff: datetime) -> int:
+        """Count errors newer than ``cutoff`` (errors are stored oldest first)."""
+        count = 0
+        for error in reversed(self.error_history):
+            if datetime.fromisoformat(error["timestamp"]) <= cutoff:
+                break
+            count += 1
+        return count
 
     def cleanup_old_data(self):
-        """Remove old monitoring data to prevent memory buildup."""
+        """Drop errors older than 24 hours (metric buffers are fixed-size)."""
         cutoff = datetime.utcnow() - timedelta(hours=24)
-
-        self.metrics_history = [m for m in self.metrics_history if m.timestamp > cutoff]
-
-        self.health_history = [h for h in self.health_history if h.timestamp > cutoff]
+        while self.error_history and (
+            datetime.fromisoformat(self.error_history[0]["timestamp"]) <= cutoff
+        ):
+            self.error_history.popleft()
 
     async def save_metrics(self):
-        """Save current metrics to file."""
-        try:
-            metrics_file = (
-                self.log_dir
-                / f"system_metrics_{datetime.utcnow().strftime('%Y%m%d')}.json"
-            )
-
-            data = {
-                "last_updated": datetime.utcnow().isoformat(),
-                "latest_metrics": (
-                    asdict(self.metrics_history[-1]) if self.metrics_history else None
-                ),
-                "latest_health": (
-                    asdict(self.health_history[-1]) if self.health_history else None
-                ),
-                "recent_errors": self.error_history[-10:],  # Last 10 errors
-                "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
-            }
-
-            with open(metrics_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+        """Append the latest sample to today's JSONL metrics file."""
+        if self.latest_metrics is None:
+            return
+        metrics_file = (
+            self.log_dir
+            / f"system_metrics_{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
+        )
+        line = json.dumps(
+            {
+                "metrics": asdict(self.latest_metrics),
+                "health": asdict(self.latest_health) if self.latest_health else None,
+            },
+            default=str,
+        )
+
+        def _append() -> None:
+            with open(metrics_file, "a") as f:
+                f.write(line + "\n")
 
+        try:
+            await asyncio.to_thread(_append)
         except Exception as e:
             logger.error(f"❌ Error saving metrics: {e}")
 
+    def get_rollups(self) -> Dict[str, Dict[str, Any]]:
+        """Return the latest 1m/5m/1h rollup (avg/min/max) for every metric."""
+        return {
+            label: {name: self.rollups[name][label].current() for name in METRIC_FIELDS}
+            for label in ROLLUP_RESOLUTIONS
+        }
+
+    def get_series(self, metric: str, resolution: Optional[str] = None) -> List[Any]:
+        """Return raw samples of ``metric`` or its buckets at ``resolution``."""
+        if resolution:
+            return self.rollups[metric][resolution].buckets()
+        return self.metric_series[metric].samples()
+
     def get_current_status(self) -> Dict[str, Any]:
         """Get current system status summary."""
-        latest_metrics = self.metrics_history[-1] if self.metrics_history else None
-        latest_health = self.health_history[-1] if self.health_history else None
-
         return {
             "timestamp": datetime.utcnow().isoformat(),
             "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
-            "system_metrics": asdict(latest_metrics) if latest_metrics else None,
-            "application_health": asdict(latest_health) if latest_health else None,
+            "system_metrics": (
+                asdict(self.latest_metrics) if self.latest_metrics else None
+            ),
+            "application_health": (
+                asdict(self.latest_health) if self.latest_health else None
+            ),
+            "rollups": self.get_rollups(),
             "recent_errors": len(self.error_history),
             "monitoring_enabled": self.monitoring_enabled,
         }
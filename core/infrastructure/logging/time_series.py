@@ -0,0 +1,114 @@
+"""Fixed-memory time-series primitives used by the system monitor.
+
+``MetricRingBuffer`` keeps the raw samples of one metric in preallocated
+``array('d')`` storage. ``RollupSeries`` downsamples the same samples into
+fixed-width buckets (count/sum/min/max) so summaries over 1m/5m/1h windows are
+read in constant time.
+"""
+
+import math
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class MetricRingBuffer:
+    """Array-backed ring buffer of (timestamp, value) samples."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._timestamps = array("d", [0.0]) * self.capacity
+        self._values = array("d", [0.0]) * self.capacity
+        self._head = 0  # next slot to write
+        self._size = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._timestamps[self._head] = timestamp
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def latest(self) -> Optional[Tuple[float, float]]:
+        if not self._size:
+            return None
+        index = (self._head - 1) % self.capacity
+        return self._timestamps[index], self._values[index]
+
+    def samples(self, since: Optional[float] = None) -> List[Tuple[float, float]]:
+        """Return samples oldest first, optionally only those at or after ``since``."""
+        start = (self._head - self._size) % self.capacity
+        result = []
+        for offset in range(self._size):
+            index = (start + offset) % self.capacity
+            timestamp = self._timestamps[index]
+            if since is None or timestamp >= since:
+                result.append((timestamp, self._values[index]))
+        return result
+
+
+class RollupSeries:
+    """Downsampled buckets of a metric at a fixed resolution."""
+
+    def __init__(self, resolution_seconds: int, retention_seconds: int):
+        self.resolution = resolution_seconds
+        self._closed: Deque[Tuple[float, int, float, float, float]] = deque(
+            maxlen=max(1, retention_seconds // resolution_seconds)
+        )
+        self._bucket_start: Optional[float] = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def add(self, timestamp: float, value: float) -> None:
+        bucket_start = timestamp - (timestamp % self.resolution)
+        if self._bucket_start is not None and bucket_start != self._bucket_start:
+            self._close()
+        if self._bucket_start is None:
+            self._bucket_start = bucket_start
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def _close(self) -> None:
+        if self._count:
+            self._closed.append(
+                (self._bucket_start, self._count, self._sum, self._min, self._max)
+            )
+        self._bucket_start = None
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @staticmethod
+    def _as_dict(bucket: Tuple[float, int, float, float, float]) -> Dict[str, Any]:
+        start, count, total, low, high = bucket
+        return {
+            "bucket_start": start,
+            "count": count,
+            "avg": total / count,
+            "min": low,
+            "max": high,
+        }
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Return the most recent bucket (the open one if it has samples)."""
+        if self._count:
+            return self._as_dict(
+                (self._bucket_start, self._count, self._sum, self._min, self._max)
+            )
+        if self._closed:
+            return self._as_dict(self._closed[-1])
+        return None
+
+    def buckets(self) -> List[Dict[str, Any]]:
+        """Return closed buckets oldest first, followed by the open bucket."""
+        result = [self._as_dict(bucket) for bucket in self._closed]
+        if self._count:
+            result.append(self.current())
+        return result
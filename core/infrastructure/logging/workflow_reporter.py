@@ -4,13 +4,15 @@ Workflow completion reporting system for comprehensive analytics and cost tracki
 
 import logging
 import json
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Deque, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from uuid import uuid4
 
-from .agent_logger import agent_logger, LogEntry, InteractionType
+from .agent_logger import AgentLogger, agent_logger, LogEntry, InteractionType
 from .cost_calculator import CostBreakdown, TokenUsage
+from .metrics import observe_workflow
 
 logger = logging.getLogger(__name__)
 
@@ -60,10 +62,15 @@ class WorkflowMetrics:
     # Tool usage metrics
     total_tool_calls: int = 0
     tool_usage_breakdown: Dict[str, int] = None
+    tool_cache_hits: Dict[str, int] = None
+    tool_cache_misses: Dict[str, int] = None
+    cost_saved_by_tool_cache: float = 0.0
 
     # LLM usage metrics
     total_llm_calls: int = 0
     llm_usage_breakdown: Dict[str, int] = None
+    llm_cache_hits: int = 0
+    cost_saved_by_cache: float = 0.0
 
     # Quality metrics
     final_output_length: int = 0
@@ -80,6 +87,10 @@ class WorkflowMetrics:
             self.agents_used = []
         if self.tool_usage_breakdown is None:
             self.tool_usage_breakdown = {}
+        if self.tool_cache_hits is None:
+            self.tool_cache_hits = {}
+        if self.tool_cache_misses is None:
+            self.tool_cache_misses = {}
         if self.llm_usage_breakdown is None:
             self.llm_usage_breakdown = {}
 
@@ -92,9 +103,21 @@ class WorkflowReporter:
     workflow execution, costs, performance, and resource usage.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        source: Optional[AgentLogger] = None,
+        retention_days: int = 30,
+        max_completed_workflows: int = 1000,
+    ):
         self.active_workflows: Dict[str, WorkflowMetrics] = {}
-        self.completed_workflows: List[WorkflowMetrics] = []
+        # Completed workflows in completion order, evicted by age and count
+        self.completed_workflows: Deque[WorkflowMetrics] = deque()
+        self._completed_by_id: Dict[str, WorkflowMetrics] = {}
+        self.retention = timedelta(days=retention_days)
+        self.max_completed_workflows = max(1, max_completed_workflows)
+        # Running aggregates per active workflow, fed by record_entry
+        self._aggregation: Dict[str, Dict[str, Any]] = {}
+        (source or agent_logger).add_listener(self.record_entry)
         logger.info("📊 Workflow reporter initialized")
 
     def start_workflow_tracking(
@@ -110,6 +133,12 @@ class WorkflowReporter:
         )
 
         self.active_workflows[workflow_id] = metrics
+        self._aggregation[workflow_id] = {
+            "agent_sessions": {},
+            "agent_performance": {},
+            "task_outputs": {},
+            "entry_count": 0,
+        }
 
         logger.info(
             f"📈 Started tracking workflow: {workflow_type} " f"(ID: {workflow_id})"
@@ -123,7 +152,8 @@ class WorkflowReporter:
             logger.warning(f"⚠️ Workflow {workflow_id} not found in active tracking")
             return None
 
-        metrics = self.active_workflows[workflow_id]
+        metrics = self.active_workflows.pop(workflow_id)
+        state = self._aggregation.pop(workflow_id)
         metrics.end_time = datetime.utcnow()
         metrics.total_duration_ms = (
             metrics.end_time - metrics.start_time
@@ -136,10 +166,11 @@ class WorkflowReporter:
         ) = self._resolve_final_output_details(
             workflow_id=workflow_id,
             final_output=final_output,
+            task_outputs=state["task_outputs"],
         )
 
-        # Analyze agent logs for this workflow
-        self._analyze_workflow_logs(metrics)
+        # Metrics were aggregated as entries were logged; just finalize them
+        self._finalize_workflow_metrics(metrics, state)
 
         # Calculate success rate
         total_tasks = metrics.tasks_completed + metrics.tasks_failed
@@ -147,8 +178,10 @@ class WorkflowReporter:
             metrics.success_rate = metrics.tasks_completed / total_tasks
 
         # Move to completed workflows
-        self.completed_workflows.append(metrics)
-        del self.active_workflows[workflow_id]
+        self._store_completed(metrics)
+        observe_workflow(
+            metrics.workflow_type, metrics.total_duration_ms / 1000, success
+        )
 
         # Log completion summary
         self._log_workflow_completion(metrics)
@@ -159,6 +192,7 @@ class WorkflowReporter:
         self,
         workflow_id: str,
         final_output: str,
+        task_outputs: Optional[Dict[str, Tuple[int, str]]] = None,
     ) -> tuple[int, str]:
         """Resolve the final output length/preview with fallbacks."""
 
@@ -175,52 +209,52 @@ class WorkflowReporter:
             "task1_brief",
         ]
 
-        # Gather agent end entries once for efficiency
-        relevant_entries = [
-            entry
-            for entry in agent_logger.entries
-            if entry.workflow_id == workflow_id
-            and entry.interaction_type == InteractionType.AGENT_END
-        ]
-
+        # Latest AGENT_END output per task, recorded as entries were logged
+        task_outputs = task_outputs or {}
         for task_id in fallback_task_order:
-            for entry in reversed(relevant_entries):
-                if entry.task_id != task_id:
-                    continue
-
-                data = entry.data or {}
-                length = int(data.get("final_output_length") or 0)
-                preview = data.get("final_output_preview") or ""
-
-                if length > 0:
-                    return length, preview
-                if preview:
-                    return len(preview), preview
+            if task_id in task_outputs:
+                return task_outputs[task_id]
 
         return 0, ""
 
-    def _analyze_workflow_logs(self, metrics: WorkflowMetrics) -> None:
-        """Analyze agent logs to extract detailed metrics."""
-        workflow_entries = [
-            entry
-            for entry in agent_logger.entries
-            if entry.workflow_id == metrics.workflow_id
-        ]
+    def record_entry(self, entry: LogEntry) -> None:
+        """
+        Fold a freshly logged entry into its workflow's running metrics.
 
-        if not workflow_entries:
-            logger.warning(f"⚠️ No log entries found for workflow {metrics.workflow_id}")
+        Registered as an ``agent_logger`` listener so completing a workflow
+        does not need to rescan the log.
+        """
+        metrics = self.active_workflows.get(entry.workflow_id)
+        if metrics is None:
             return
 
-        # Track agents and their performance
-        agent_sessions = {}
-        agent_performance = {}
-
-        # Analyze each log entry
-        for entry in workflow_entries:
-            self._process_log_entry(entry, metrics, agent_sessions, agent_performance)
+        state = self._aggregation[entry.workflow_id]
+        self._process_log_entry(
+            entry, metrics, state["agent_sessions"], state["agent_performance"]
+        )
+        state["entry_count"] += 1
+
+        if entry.interaction_type == InteractionType.AGENT_END and entry.task_id:
+            data = entry.data or {}
+            length = int(data.get("final_output_length") or 0)
+            preview = data.get("final_output_preview") or ""
+            if length > 0:
+                state["task_outputs"][entry.task_id] = (length, preview)
+            elif preview:
+                state["task_outputs"][entry.task_id] = (len(preview), preview)
+
+    def _finalize_workflow_metrics(
+        self, metrics: WorkflowMetrics, state: Dict[str, Any]
+    ) -> None:
+        """Turn the running per-agent aggregates into the final report."""
+        if not state["entry_count"]:
+            logger.warning(
+                f"⚠️ No log entries found for workflow {metrics.workflow_id}"
+            )
+            return
 
         # Finalize agent performance metrics
-        for agent_id, perf_data in agent_performance.items():
+        for agent_id, perf_data in state["agent_performance"].items():
             if perf_data["llm_calls"] > 0:
                 perf_data["avg_response_time_ms"] = (
                     perf_data["total_duration_ms"] / perf_data["llm_calls"]
@@ -241,10 +275,10 @@ class WorkflowReporter:
 
             metrics.agents_used.append(agent_perf)
 
-        metrics.total_agent_sessions = len(agent_sessions)
+        metrics.total_agent_sessions = len(state["agent_sessions"])
 
         logger.debug(
-            f"📊 Analyzed {len(workflow_entries)} log entries for workflow {metrics.workflow_id}"
+            f"📊 Aggregated {state['entry_count']} log entries for workflow {metrics.workflow_id}"
         )
 
     def _process_log_entry(
@@ -300,6 +334,10 @@ class WorkflowReporter:
         elif entry.interaction_type == InteractionType.LLM_RESPONSE:
             metrics.total_llm_calls += 1
 
+            if entry.data.get("cache_hit"):
+                metrics.llm_cache_hits += 1
+                metrics.cost_saved_by_cache += entry.data.get("cost_saved_usd", 0.0)
+
             if entry.tokens_used:
                 metrics.total_tokens += entry.tokens_used
 
@@ -344,6 +382,18 @@ class WorkflowReporter:
                 metrics.tool_usage_breakdown[tool_name] = 0
             metrics.tool_usage_breakdown[tool_name] += 1
 
+            # Track tool cache effectiveness (only cacheable tools report it)
+            if "cache_hit" in entry.data:
+                counters = (
+                    metrics.tool_cache_hits
+                    if entry.data["cache_hit"]
+                    else metrics.tool_cache_misses
+                )
+                counters[tool_name] = counters.get(tool_name, 0) + 1
+                metrics.cost_saved_by_tool_cache += entry.data.get(
+                    "cost_saved_usd", 0.0
+                )
+
             # Update agent performance
             if entry.agent_id in agent_performance:
                 agent_performance[entry.agent_id]["tool_calls"] += 1
@@ -388,6 +438,11 @@ class WorkflowReporter:
         logger.info(f"📊 Success Rate: {metrics.success_rate:.1%}")
         logger.info(f"🛠️ Tool Calls: {metrics.total_tool_calls}")
         logger.info(f"🧠 LLM Calls: {metrics.total_llm_calls}")
+        if metrics.llm_cache_hits:
+            logger.info(
+                f"♻️ LLM Cache Hits: {metrics.llm_cache_hits} "
+                f"(saved ${metrics.cost_saved_by_cache:.6f})"
+            )
         logger.info(f"📄 Output Length: {metrics.final_output_length:,} characters")
 
         # Cost breakdown by provider
@@ -401,6 +456,12 @@ class WorkflowReporter:
             for tool, cost in metrics.cost_breakdown_by_tool.items():
                 logger.info(f"   {tool}: ${cost:.6f}")
 
+        if metrics.tool_cache_hits:
+            logger.info(
+                f"♻️ Tool Cache Hits: {sum(metrics.tool_cache_hits.values())} "
+                f"(saved ${metrics.cost_saved_by_tool_cache:.6f})"
+            )
+
         # Agent performance summary
         if metrics.agents_used:
             logger.info("🤖 Agent Performance:")
@@ -414,6 +475,19 @@ class WorkflowReporter:
 
         logger.info("=" * 80)
 
+    def _store_completed(self, metrics: WorkflowMetrics) -> None:
+        """Keep a completed workflow, evicting the oldest past retention or cap."""
+        self.completed_workflows.append(metrics)
+        self._completed_by_id[metrics.workflow_id] = metrics
+        cutoff = datetime.utcnow() - self.retention
+        while self.completed_workflows and (
+            len(self.completed_workflows) > self.max_completed_workflows
+            or self.completed_workflows[0].start_time < cutoff
+        ):
+            evicted = self.completed_workflows.popleft()
+            if self._completed_by_id.get(evicted.workflow_id) is evicted:
+                del self._completed_by_id[evicted.workflow_id]
+
     def get_workflow_report(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed report for a specific workflow."""
         # Check active workflows
@@ -421,9 +495,9 @@ class WorkflowReporter:
             return asdict(self.active_workflows[workflow_id])
 
         # Check completed workflows
-        for workflow in self.completed_workflows:
-            if workflow.workflow_id == workflow_id:
-                return asdict(workflow)
+        workflow = self._completed_by_id.get(workflow_id)
+        if workflow is not None:
+            return asdict(workflow)
 
         return None
 
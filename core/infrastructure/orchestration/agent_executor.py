@@ -1,19 +1,29 @@
 """Agent executor for task execution."""
 
+import asyncio
 import json
 import logging
 import re
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from ...application.interfaces.llm_provider_interface import LLMProviderInterface
+from ...application.interfaces.llm_provider_interface import (
+    LLMProviderInterface,
+    LLMResponse,
+)
 from ...domain.entities.agent import Agent
 from ...domain.repositories.agent_repository import AgentRepository
 from ...domain.value_objects.provider_config import ProviderConfig
+from ..cache.tool_result_cache import ToolResultCache, get_tool_result_cache
+from ..external_services.caching_provider import llm_cache_hit
 from ..logging.agent_logger import InteractionType, LogLevel, agent_logger
 from ..logging.cost_calculator import CostBreakdown, TokenUsage, cost_calculator
+from ..logging.metrics import observe_llm_call, observe_tool_call
 from ..logging.tool_cost_calculator import tool_cost_calculator
+from ..tools.tool_names import ToolNames
+from .generation_events import STREAM_TOKENS_KEY, get_event_stream
 from .simple_system_prompt_builder import SimpleSystemPromptBuilder
 
 logger = logging.getLogger(__name__)
@@ -41,12 +51,22 @@ class AgentExecutor:
         agent_repository: AgentRepository,
         llm_provider: LLMProviderInterface,
         provider_config: ProviderConfig,
+        parallel_tool_calls: bool = True,
+        max_concurrent_tool_calls: int = 4,
+        tool_result_cache: Optional[ToolResultCache] = None,
     ):
         self.agent_repository = agent_repository
         self.llm_provider = llm_provider
         self.provider_config = provider_config
         self.tools_registry = {}
         self.system_prompt_builder = SimpleSystemPromptBuilder()
+        self.parallel_tool_calls = parallel_tool_calls
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
+        # Created lazily so they bind to the running event loop
+        self._global_tool_semaphore: Optional[asyncio.Semaphore] = None
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Shared across executors so repeated lookups hit across runs
+        self.tool_result_cache = tool_result_cache or get_tool_result_cache()
 
     def register_tool(
         self,
@@ -121,6 +141,9 @@ class AgentExecutor:
                     next_action="Preparing prompt with tool instructions",
                 )
 
+            # Let RAG pack client content for this agent's task and budget
+            self._set_rag_context_request(agent, task_description, context)
+
             # Prepare prompt
             prompt = self._prepare_prompt(task_description, context, agent_tools)
 
@@ -141,10 +164,20 @@ class AgentExecutor:
             logger.debug(
                 f"system_prompt_source=builder_v1, length={len(system_message)}"
             )
-            llm_response = await self.llm_provider.generate_content(
-                prompt=prompt, config=dynamic_config, system_message=system_message
-            )
+            llm_cache_hit.set(False)
+            event_stream = get_event_stream(context)
+            if event_stream and context.get(STREAM_TOKENS_KEY) and not agent_tools:
+                # Tool markers cannot be resolved mid-stream, so only tool-less
+                # agents stream; others fall back to a buffered call below
+                llm_response = await self._stream_llm_response(
+                    prompt, dynamic_config, system_message, event_stream, context
+                )
+            else:
+                llm_response = await self.llm_provider.generate_content(
+                    prompt=prompt, config=dynamic_config, system_message=system_message
+                )
             duration_ms = (time.time() - start_time) * 1000
+            cache_hit = llm_cache_hit.get()
 
             # Extract actual response content
             response = (
@@ -163,6 +196,23 @@ class AgentExecutor:
                 token_usage=token_usage,
             )
 
+            # Cache hits cost nothing; keep what the call would have cost as savings
+            cost_saved = 0.0
+            if cache_hit:
+                cost_saved = cost_breakdown.total_cost
+                token_usage = TokenUsage()
+                cost_breakdown = CostBreakdown()
+
+            observe_llm_call(
+                provider=dynamic_config.provider.value,
+                model=dynamic_config.model,
+                duration_seconds=duration_ms / 1000,
+                prompt_tokens=token_usage.prompt_tokens,
+                completion_tokens=token_usage.completion_tokens,
+                cost_usd=cost_breakdown.total_cost,
+                cache_hit=cache_hit,
+            )
+
             # Log LLM response with real usage data
             agent_logger.log_llm_response(
                 session_id=session_id,
@@ -173,6 +223,8 @@ class AgentExecutor:
                 tokens_used=token_usage.total_tokens,
                 cost_usd=cost_breakdown.total_cost,
                 duration_ms=duration_ms,
+                cache_hit=cache_hit,
+                cost_saved_usd=cost_saved,
             )
 
             # Persist LLM cost event to Supabase (if tracker configured)
@@ -190,7 +242,7 @@ class AgentExecutor:
                         tokens_total=token_usage.total_tokens,
                         cost_usd=cost_breakdown.total_cost,
                         duration_seconds=duration_ms / 1000.0,
-                        metadata={},
+                        metadata={"cache_hit": True} if cache_hit else {},
                     )
             except Exception as e:  # pragma: no cover
                 logger.warning(f"Tracker log_llm_call failed: {e}")
@@ -234,6 +286,65 @@ class AgentExecutor:
             )
             raise
 
+    def _set_rag_context_request(
+        self, agent: Agent, task_description: str, context: Dict[str, Any]
+    ) -> None:
+        """Pass the task text and its context token budget to the RAG tool."""
+        entry = self.tools_registry.get(ToolNames.RAG_GET_CLIENT_CONTENT) or {}
+        rag_tool = getattr(entry.get("function"), "__self__", None)
+        set_context_request = getattr(rag_tool, "set_context_request", None)
+        if set_context_request is None:
+            return
+        # Task context wins over the agent's YAML metadata; None uses settings
+        budget = context.get(
+            "rag_context_token_budget",
+            (agent.metadata or {}).get("rag_context_token_budget"),
+        )
+        set_context_request(task_description[:4000], budget)
+
+    async def _stream_llm_response(
+        self,
+        prompt: str,
+        config: ProviderConfig,
+        system_message: str,
+        event_stream: Any,
+        context: Dict[str, Any],
+    ) -> LLMResponse:
+        """
+        Stream a generation, emitting a ``token`` event per chunk.
+
+        Streaming APIs do not report usage, so token counts are estimated the
+        same way as ``_estimate_token_usage``.
+
+        Returns:
+            The assembled response, shaped like ``generate_content`` output
+        """
+        task_id = context.get("task_id")
+        parts: List[str] = []
+        async for chunk in self.llm_provider.generate_content_stream(
+            prompt=prompt, config=config, system_message=system_message
+        ):
+            if chunk.content:
+                parts.append(chunk.content)
+                event_stream.emit(
+                    "token", {"task_id": task_id, "content": chunk.content}
+                )
+
+        content = "".join(parts)
+        completion_tokens = len(content.split())
+        prompt_tokens = len(f"{system_message or ''} {prompt}".split())
+        return LLMResponse(
+            content=content,
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+            model=config.model,
+            finish_reason="stop",
+            metadata={"streamed": True, "usage_estimated": True},
+        )
+
     def _prepare_system_message(
         self, agent: Agent, context: Dict[str, Any] = None
     ) -> str:
@@ -330,7 +441,9 @@ class AgentExecutor:
         Process tool calls in the agent's response.
 
         This function looks for tool calls in the format [TOOL_NAME] input [/TOOL_NAME]
-        and executes the corresponding tools.
+        and executes the corresponding tools. When ``parallel_tool_calls`` is
+        enabled the calls run concurrently, bounded by ``max_concurrent_tool_calls``
+        and by the optional ``max_concurrency`` entry of each tool's metadata.
 
         Args:
             agent_response: The agent's response text
@@ -341,7 +454,7 @@ class AgentExecutor:
         """
         # Find all tool calls
         tool_pattern = r"\[(\w+)\](.*?)\[/\1\]"
-        tool_calls = re.findall(tool_pattern, agent_response, re.DOTALL)
+        tool_calls = list(re.finditer(tool_pattern, agent_response, re.DOTALL))
 
         if not tool_calls:
             if session_id:
@@ -353,37 +466,114 @@ class AgentExecutor:
                 )
             return agent_response
 
+        parallel = self.parallel_tool_calls and len(tool_calls) > 1
         if session_id:
             agent_logger.log_agent_thinking(
                 session_id=session_id,
                 thought=f"Detected {len(tool_calls)} tool calls",
-                reasoning=f"Tools to execute: {[call[0] for call in tool_calls]}",
-                next_action="Processing tool calls sequentially",
+                reasoning=f"Tools to execute: {[call.group(1) for call in tool_calls]}",
+                next_action=(
+                    "Processing tool calls concurrently"
+                    if parallel
+                    else "Processing tool calls sequentially"
+                ),
             )
 
         # Process each tool call
-        for tool_name, tool_input in tool_calls:
-            from ..tools.tool_names import ALIASES
+        if parallel:
+            replacements = await asyncio.gather(
+                *[
+                    self._process_tool_call(
+                        call.group(1),
+                        call.group(2),
+                        session_id,
+                        agent_name,
+                        tracker=tracker,
+                        run_id=run_id,
+                    )
+                    for call in tool_calls
+                ]
+            )
+        else:
+            replacements = []
+            for call in tool_calls:
+                replacements.append(
+                    await self._process_tool_call(
+                        call.group(1),
+                        call.group(2),
+                        session_id,
+                        agent_name,
+                        tracker=tracker,
+                        run_id=run_id,
+                    )
+                )
 
-            original_tool_name = tool_name
-            canonical_tool_name = ALIASES.get(original_tool_name, original_tool_name)
+        # Splice results back at the original position of each tool call
+        parts = []
+        last_end = 0
+        for call, replacement in zip(tool_calls, replacements):
+            parts.append(agent_response[last_end : call.start()])
+            parts.append(replacement)
+            last_end = call.end()
+        parts.append(agent_response[last_end:])
+
+        return "".join(parts)
+
+    def _get_tool_semaphores(self, tool_name: str, tool_metadata: Dict[str, Any]):
+        """Return the global and per-tool semaphores bounding tool execution."""
+        if self._global_tool_semaphore is None:
+            self._global_tool_semaphore = asyncio.Semaphore(
+                max(1, self.max_concurrent_tool_calls)
+            )
+        if tool_name not in self._tool_semaphores:
+            limit = (
+                tool_metadata.get("max_concurrency") or self.max_concurrent_tool_calls
+            )
+            self._tool_semaphores[tool_name] = asyncio.Semaphore(max(1, int(limit)))
+        return self._global_tool_semaphore, self._tool_semaphores[tool_name]
 
-            if canonical_tool_name in self.tools_registry:
-                tool_info = self.tools_registry[canonical_tool_name]
-                tool_metadata = tool_info.get("metadata", {})
+    async def _process_tool_call(
+        self,
+        tool_name: str,
+        tool_input: str,
+        session_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        tracker=None,
+        run_id: Optional[str] = None,
+    ) -> str:
+        """
+        Execute a single tool call and return the text that replaces it.
 
-                # Log tool call start
-                call_id = None
-                if session_id:
-                    call_id = agent_logger.log_tool_call(
-                        session_id=session_id,
-                        tool_name=original_tool_name,
-                        tool_input=tool_input.strip(),
-                        tool_description=tool_info["description"],
-                        metadata=tool_metadata,
-                    )
+        Tool failures are logged and rendered as ``[TOOL ERROR]`` blocks so a
+        failing call never aborts its siblings.
+        """
+        from ..tools.tool_names import ALIASES
 
-                try:
+        original_tool_name = tool_name
+        canonical_tool_name = ALIASES.get(original_tool_name, original_tool_name)
+
+        if canonical_tool_name in self.tools_registry:
+            tool_info = self.tools_registry[canonical_tool_name]
+            tool_metadata = tool_info.get("metadata", {})
+
+            # Log tool call start
+            call_id = None
+            if session_id:
+                call_id = agent_logger.log_tool_call(
+                    session_id=session_id,
+                    tool_name=original_tool_name,
+                    tool_input=tool_input.strip(),
+                    tool_description=tool_info["description"],
+                    metadata=tool_metadata,
+                )
+
+            global_semaphore, tool_semaphore = self._get_tool_semaphores(
+                canonical_tool_name, tool_metadata
+            )
+            try:
+                # Queue on the tool's own limit first so calls waiting for a
+                # saturated tool do not hold global slots other tools could use
+                async with tool_semaphore, global_semaphore:
                     # Execute the tool with timing
                     start_time = time.time()
                     tool_function = tool_info["function"]
@@ -398,120 +588,110 @@ class AgentExecutor:
                     )
                     duration_ms = (time.time() - start_time) * 1000
 
-                    execution_metadata = dict(execution_result.metadata or {})
-                    if tool_metadata:
-                        execution_metadata = {
-                            **tool_metadata,
-                            **execution_metadata,
-                        }
+                execution_metadata = dict(execution_result.metadata or {})
+                if tool_metadata:
+                    execution_metadata = {
+                        **tool_metadata,
+                        **execution_metadata,
+                    }
 
-                    cost_details = tool_cost_calculator.calculate_cost(
-                        canonical_tool_name, tool_metadata, execution_metadata
-                    )
-                    if cost_details.cost_usd:
-                        execution_metadata["cost_usd"] = cost_details.cost_usd
-                    execution_metadata.setdefault(
-                        "cost_source", cost_details.source
+                cost_details = tool_cost_calculator.calculate_cost(
+                    canonical_tool_name, tool_metadata, execution_metadata
+                )
+                if cost_details.cost_usd:
+                    execution_metadata["cost_usd"] = cost_details.cost_usd
+                execution_metadata.setdefault("cost_source", cost_details.source)
+                execution_metadata.setdefault("units", cost_details.units)
+                observe_tool_call(
+                    canonical_tool_name, duration_ms / 1000, cost_details.cost_usd
+                )
+
+                # Log successful tool response
+                if session_id and call_id:
+                    agent_logger.log_tool_response(
+                        session_id=session_id,
+                        call_id=call_id,
+                        tool_name=original_tool_name,
+                        tool_output=execution_result.output_text,
+                        duration_ms=duration_ms,
+                        success=True,
+                        cost_usd=cost_details.cost_usd,
+                        metadata=execution_metadata,
                     )
-                    execution_metadata.setdefault("units", cost_details.units)
 
-                    # Log successful tool response
-                    if session_id and call_id:
-                        agent_logger.log_tool_response(
-                            session_id=session_id,
-                            call_id=call_id,
+                # Also persist tool cost event to Supabase (if tracker configured)
+                try:
+                    if tracker and run_id:
+                        tracker.log_tool_execution(
+                            run_id=run_id,
+                            agent_name=agent_name,
                             tool_name=original_tool_name,
-                            tool_output=execution_result.output_text,
-                            duration_ms=duration_ms,
-                            success=True,
+                            provider_name=execution_metadata.get("provider"),
+                            units=cost_details.units,
+                            unit_cost_usd=execution_metadata.get("unit_cost_usd"),
+                            usage_tokens=execution_metadata.get("usage_tokens"),
+                            cost_per_1k_tokens_usd=execution_metadata.get(
+                                "cost_per_1k_tokens_usd"
+                            ),
                             cost_usd=cost_details.cost_usd,
+                            cost_source=execution_metadata.get("cost_source")
+                            or cost_details.source,
+                            duration_seconds=duration_ms / 1000.0,
                             metadata=execution_metadata,
                         )
+                except Exception as e:  # pragma: no cover
+                    logger.warning(f"Tracker log_tool_execution failed: {e}")
 
-                    # Also persist tool cost event to Supabase (if tracker configured)
-                    try:
-                        if tracker and run_id:
-                            tracker.log_tool_execution(
-                                run_id=run_id,
-                                agent_name=agent_name,
-                                tool_name=original_tool_name,
-                                provider_name=execution_metadata.get("provider"),
-                                units=cost_details.units,
-                                unit_cost_usd=execution_metadata.get("unit_cost_usd"),
-                                usage_tokens=execution_metadata.get("usage_tokens"),
-                                cost_per_1k_tokens_usd=execution_metadata.get("cost_per_1k_tokens_usd"),
-                                cost_usd=cost_details.cost_usd,
-                                cost_source=execution_metadata.get("cost_source") or cost_details.source,
-                                duration_seconds=duration_ms / 1000.0,
-                                metadata=execution_metadata,
-                            )
-                    except Exception as e:  # pragma: no cover
-                        logger.warning(f"Tracker log_tool_execution failed: {e}")
-
-                    # Replace the tool call with the result
-                    tool_call = (
-                        f"[{original_tool_name}]{tool_input}[/{original_tool_name}]"
-                    )
-                    tool_result_text = (
-                        f"[{original_tool_name} RESULT]\n"
-                        f"{execution_result.output_text}\n"
-                        f"[/{original_tool_name} RESULT]"
-                    )
-                    agent_response = agent_response.replace(
-                        tool_call, tool_result_text
-                    )
-
-                except Exception as e:
-                    duration_ms = (
-                        (time.time() - start_time) * 1000
-                        if "start_time" in locals()
-                        else 0
-                    )
+                # Replace the tool call with the result
+                return (
+                    f"[{original_tool_name} RESULT]\n"
+                    f"{execution_result.output_text}\n"
+                    f"[/{original_tool_name} RESULT]"
+                )
 
-                    # Log tool error
-                    if session_id and call_id:
-                        agent_logger.log_tool_error(
-                            session_id=session_id,
-                            call_id=call_id,
-                            tool_name=tool_name,
-                            error=e,
-                            duration_ms=duration_ms,
-                            metadata=tool_metadata,
-                        )
+            except Exception as e:
+                duration_ms = (
+                    (time.time() - start_time) * 1000 if "start_time" in locals() else 0
+                )
 
-                    # Replace with error message
-                    tool_call = f"[{tool_name}]{tool_input}[/{tool_name}]"
-                    error_text = (
-                        f"[{tool_name} ERROR] {str(e)} [/{tool_name} ERROR]"
-                    )
-                    agent_response = agent_response.replace(tool_call, error_text)
-            else:
-                # Tool not found - log error
-                if session_id:
-                    call_id = agent_logger.log_tool_call(
-                        session_id=session_id,
-                        tool_name=tool_name,
-                        tool_input=tool_input.strip(),
-                        tool_description="Tool not found",
-                        metadata={"provider": "unknown"},
-                    )
+                observe_tool_call(
+                    canonical_tool_name, duration_ms / 1000, success=False
+                )
 
+                # Log tool error
+                if session_id and call_id:
                     agent_logger.log_tool_error(
                         session_id=session_id,
                         call_id=call_id,
                         tool_name=tool_name,
-                        error=Exception(
-                            f"Tool '{tool_name}' not found in registry"
-                        ),
-                        duration_ms=0,
-                        metadata={"provider": "unknown"},
+                        error=e,
+                        duration_ms=duration_ms,
+                        metadata=tool_metadata,
                     )
 
-                tool_call = f"[{tool_name}]{tool_input}[/{tool_name}]"
-                error_text = f"[{tool_name} ERROR] Tool not found [/{tool_name} ERROR]"
-                agent_response = agent_response.replace(tool_call, error_text)
+                # Replace with error message
+                return f"[{tool_name} ERROR] {str(e)} [/{tool_name} ERROR]"
+        else:
+            # Tool not found - log error
+            if session_id:
+                call_id = agent_logger.log_tool_call(
+                    session_id=session_id,
+                    tool_name=tool_name,
+                    tool_input=tool_input.strip(),
+                    tool_description="Tool not found",
+                    metadata={"provider": "unknown"},
+                )
 
-        return agent_response
+                agent_logger.log_tool_error(
+                    session_id=session_id,
+                    call_id=call_id,
+                    tool_name=tool_name,
+                    error=Exception(f"Tool '{tool_name}' not found in registry"),
+                    duration_ms=0,
+                    metadata={"provider": "unknown"},
+                )
+
+            return f"[{tool_name} ERROR] Tool not found [/{tool_name} ERROR]"
 
     async def _execute_tool_with_params(
         self,
@@ -520,6 +700,76 @@ class AgentExecutor:
         tool_input: str,
         agent_name: Optional[str] = None,
         tool_metadata: Optional[Dict[str, Any]] = None,
+    ) -> ToolExecutionResult:
+        """
+        Execute a tool, serving repeated read-only lookups from the tool cache.
+
+        Cache hits (and calls coalesced onto an identical in-flight call) are
+        reported with zero cost; ``cost_saved_usd`` records what they would
+        have cost.
+        """
+        cache = self.tool_result_cache
+        if cache is None or not cache.is_cacheable(tool_name):
+            return await self._run_tool_with_params(
+                tool_name, tool_function, tool_input, agent_name, tool_metadata
+            )
+
+        # Tools whose results depend on extra state (RAG document filters,
+        # client content) describe it through optional hooks on their owner
+        owner = getattr(tool_function, "__self__", None)
+        cache_scope = getattr(owner, "cache_scope", None)
+        cache_tag = getattr(owner, "cache_tag", None)
+        record_tracking = getattr(owner, "record_tracking", None)
+        replay_tracking = getattr(owner, "replay_tracking", None)
+
+        async def _execute() -> Dict[str, Any]:
+            recorder = (
+                record_tracking() if callable(record_tracking) else nullcontext([])
+            )
+            with recorder as tracking:
+                result = await self._run_tool_with_params(
+                    tool_name, tool_function, tool_input, agent_name, tool_metadata
+                )
+            return {
+                "output_text": result.output_text,
+                # Provider metadata may hold SDK objects; keep only JSON-safe values
+                "metadata": json.loads(json.dumps(result.metadata, default=str)),
+                # Run-tracking calls, replayed for runs served from the cache
+                "tracking": json.loads(json.dumps(tracking, default=str)),
+            }
+
+        cached, hit = await cache.get_or_execute(
+            tool_name,
+            tool_input,
+            _execute,
+            scope=cache_scope(tool_name) if callable(cache_scope) else None,
+            is_cacheable_result=lambda r: not cache.looks_like_error(r["output_text"]),
+            tag=cache_tag(tool_name, tool_input) if callable(cache_tag) else None,
+        )
+
+        metadata = {**(tool_metadata or {}), **cached["metadata"], "cache_hit": hit}
+        if hit:
+            saved = tool_cost_calculator.calculate_cost(
+                tool_name, tool_metadata, cached["metadata"]
+            )
+            metadata.update(
+                cost_usd=0.0, cost_source="cache", cost_saved_usd=saved.cost_usd
+            )
+            if cached.get("tracking") and callable(replay_tracking):
+                replay_tracking(cached["tracking"], agent_name)
+        return ToolExecutionResult(
+            output_text=cached["output_text"],
+            raw_output=cached["output_text"],
+            metadata=metadata,
+        )
+
+    async def _run_tool_with_params(
+        self,
+        tool_name: str,
+        tool_function: callable,
+        tool_input: str,
+        agent_name: Optional[str] = None,
+        tool_metadata: Optional[Dict[str, Any]] = None,
     ) -> ToolExecutionResult:
         """
         Execute tool with proper parameter parsing and validation.
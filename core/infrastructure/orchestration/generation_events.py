@@ -0,0 +1,83 @@
+"""Progress events for streamed content generation.
+
+A ``GenerationEventStream`` is placed in the workflow context under
+``EVENT_STREAM_KEY``. Workflow handlers emit task lifecycle events, the agent
+executor emits ``token`` events while the final writing task streams, and the
+API layer drains the stream as server-sent events.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+EVENT_STREAM_KEY = "event_stream"
+STREAM_TOKENS_KEY = "stream_tokens"
+
+_CLOSED = object()
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Encode one event in the ``text/event-stream`` wire format."""
+    payload = json.dumps(data, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class GenerationEventStream:
+    """Single-consumer queue of ``(event, data)`` pairs for one generation run."""
+
+    def __init__(self, heartbeat_seconds: float = 15.0):
+        self.heartbeat_seconds = heartbeat_seconds
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self._closed = False
+        self.emitted_count = 0
+
+    def emit(self, event: str, data: Optional[Dict[str, Any]] = None) -> None:
+        """Queue an event; events emitted after ``close`` are dropped."""
+        if self._closed:
+            logger.debug(f"Dropping '{event}' event emitted after stream close")
+            return
+        self._queue.put_nowait((event, data or {}))
+        self.emitted_count += 1
+
+    def close(self) -> None:
+        """Signal the consumer that no more events will follow."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put_nowait(_CLOSED)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def sse(self) -> AsyncIterator[str]:
+        """
+        Yield events encoded as SSE frames until the stream is closed.
+
+        A comment frame is sent whenever no event arrived for
+        ``heartbeat_seconds`` so proxies do not drop the connection during
+        long research tasks.
+        """
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    self._queue.get(), timeout=self.heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if item is _CLOSED:
+                return
+            event, data = item
+            yield format_sse(event, data)
+
+
+def get_event_stream(
+    context: Optional[Dict[str, Any]],
+) -> Optional[GenerationEventStream]:
+    """Return the event stream attached to a workflow context, if any."""
+    if not context:
+        return None
+    return context.get(EVENT_STREAM_KEY)
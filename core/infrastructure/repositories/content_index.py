@@ -0,0 +1,420 @@
+"""SQLite metadata index for the file-based content repository.
+
+The JSON metadata and markdown body files stay the source of truth; this
+sidecar holds the queryable columns (title, client, type, status, dates,
+tags, word count) plus the serialized metadata so filters, listings and
+``get_recent`` never open the per-content files. An FTS5 table over title,
+tags and body (sharing the metadata row's rowid) provides BM25-ranked
+full-text search with snippets. The index is synchronous and thread-safe;
+the repository calls it via ``asyncio.to_thread``.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content_index (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    client_profile TEXT,
+    content_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    workflow_id TEXT,
+    topic TEXT NOT NULL DEFAULT '',
+    tags TEXT NOT NULL DEFAULT '[]',
+    word_count INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    metadata TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_content_created ON content_index (created_at);
+CREATE INDEX IF NOT EXISTS idx_content_client
+    ON content_index (client_profile, created_at);
+CREATE INDEX IF NOT EXISTS idx_content_type ON content_index (content_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_content_status ON content_index (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_content_title ON content_index (title);
+CREATE INDEX IF NOT EXISTS idx_content_workflow ON content_index (workflow_id);
+CREATE TABLE IF NOT EXISTS content_tags (
+    tag TEXT NOT NULL,
+    content_id TEXT NOT NULL,
+    PRIMARY KEY (tag, content_id)
+);
+CREATE INDEX IF NOT EXISTS idx_content_tags_content ON content_tags (content_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5(
+    title, tags, body,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+# bm25() column weights for (title, tags, body)
+_BM25_WEIGHTS = "5.0, 3.0, 1.0"
+_TOKEN_RE = re.compile(r"(\w+)(\*?)", re.UNICODE)
+_MIN_PREFIX_CHARS = 3
+
+SUMMARY_COLUMNS = (
+    "id",
+    "title",
+    "client_profile",
+    "content_type",
+    "status",
+    "workflow_id",
+    "topic",
+    "tags",
+    "word_count",
+    "created_at",
+    "updated_at",
+)
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def to_match_query(text: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query matching documents with every term.
+
+    Terms are quoted so user input cannot inject FTS5 syntax. The last term
+    always matches as a prefix so partially typed queries find results; any
+    other term does when it ends in ``*``. Prefixes shorter than
+    ``_MIN_PREFIX_CHARS`` only match whole terms, to stay selective.
+    """
+    tokens = _TOKEN_RE.findall(text)
+    terms = []
+    for position, (token, star) in enumerate(tokens, start=1):
+        wants_prefix = star or position == len(tokens)
+        prefix = wants_prefix and len(token) >= _MIN_PREFIX_CHARS
+        terms.append(f'"{token}"*' if prefix else f'"{token}"')
+    return " ".join(terms) or None
+
+
+class SQLiteContentIndex:
+    """Content metadata table backed by a single SQLite file."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT INTO content_fts (content_fts, rank) VALUES ('rank', ?)",
+                (f"bm25({_BM25_WEIGHTS})",),
+            )
+
+    @staticmethod
+    def _row_values(metadata: Dict[str, Any]) -> tuple:
+        tags = list(metadata.get("tags") or [])
+        return (
+            str(metadata["id"]),
+            metadata.get("title") or "",
+            metadata.get("client_profile"),
+            metadata.get("content_type") or "article",
+            metadata.get("status") or "draft",
+            metadata.get("workflow_id"),
+            metadata.get("topic") or "",
+            json.dumps(tags, ensure_ascii=False),
+            int((metadata.get("metrics") or {}).get("word_count") or 0),
+            metadata.get("created_at") or "",
+            metadata.get("updated_at"),
+            json.dumps(metadata, ensure_ascii=False, default=str),
+        )
+
+    def _upsert_locked(
+        self, metadata: Dict[str, Any], body: Optional[str] = None
+    ) -> None:
+        values = self._row_values(metadata)
+        content_id = values[0]
+        # ON CONFLICT keeps the rowid stable; content_fts rows share it
+        self._conn.execute(
+            "INSERT INTO content_index (id, title, client_profile, content_type,"
+            " status, workflow_id, topic, tags, word_count, created_at,"
+            " updated_at, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(id) DO UPDATE SET title = excluded.title,"
+            " client_profile = excluded.client_profile,"
+            " content_type = excluded.content_type, status = excluded.status,"
+            " workflow_id = excluded.workflow_id, topic = excluded.topic,"
+            " tags = excluded.tags, word_count = excluded.word_count,"
+            " created_at = excluded.created_at, updated_at = excluded.updated_at,"
+            " metadata = excluded.metadata",
+            values,
+        )
+        self._conn.execute(
+            "DELETE FROM content_tags WHERE content_id = ?", (content_id,)
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO content_tags (tag, content_id) VALUES (?, ?)",
+            [(tag, content_id) for tag in metadata.get("tags") or []],
+        )
+        if body is not None:
+            self._index_text_locked(
+                content_id, values[1], metadata.get("tags") or [], body
+            )
+
+    def _index_text_locked(
+        self, content_id: str, title: str, tags: Sequence[str], body: str
+    ) -> None:
+        row = self._conn.execute(
+            "SELECT rowid FROM content_index WHERE id = ?", (content_id,)
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM content_fts WHERE rowid = ?", (row[0],))
+        self._conn.execute(
+            "INSERT INTO content_fts (rowid, title, tags, body) VALUES (?, ?, ?, ?)",
+            (row[0], title, " ".join(tags), body),
+        )
+
+    def upsert(self, metadata: Dict[str, Any], body: Optional[str] = None) -> None:
+        """
+        Insert or replace a content's metadata (``to_dict`` without body).
+
+        Args:
+            metadata: Serialized content metadata
+            body: Content body; when given the full-text entry is refreshed
+        """
+        with self._lock, self._conn:
+            self._upsert_locked(metadata, body)
+
+    def upsert_many(self, items: Iterable[Tuple[Dict[str, Any], Optional[str]]]) -> int:
+        """Upsert ``(metadata, body)`` pairs in a single transaction."""
+        count = 0
+        with self._lock, self._conn:
+            for metadata, body in items:
+                self._upsert_locked(metadata, body)
+                count += 1
+        return count
+
+    def index_text(self, content_id: str, body: str) -> None:
+        """(Re)build the full-text entry of already indexed content."""
+        metadata = self.get(content_id)
+        if metadata is None:
+            return
+        with self._lock, self._conn:
+            self._index_text_locked(
+                str(content_id),
+                metadata.get("title") or "",
+                metadata.get("tags") or [],
+                body,
+            )
+
+    def ids_missing_text(self) -> List[str]:
+        """Ids of indexed content that has no full-text entry yet."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT c.id FROM content_index c"
+                " LEFT JOIN content_fts f ON f.rowid = c.rowid WHERE f.rowid IS NULL"
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def delete(self, content_ids: Sequence[str]) -> int:
+        ids = [str(content_id) for content_id in content_ids]
+        if not ids:
+            return 0
+        placeholders = ", ".join("?" * len(ids))
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM content_fts WHERE rowid IN (SELECT rowid FROM"
+                f" content_index WHERE id IN ({placeholders}))",
+                ids,
+            )
+            self._conn.execute(
+                f"DELETE FROM content_tags WHERE content_id IN ({placeholders})", ids
+            )
+            return self._conn.execute(
+                f"DELETE FROM content_index WHERE id IN ({placeholders})", ids
+            ).rowcount
+
+    def ids(self) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT id FROM content_index").fetchall()
+        return {row["id"] for row in rows}
+
+    def get(self, content_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata FROM content_index WHERE id = ?", (str(content_id),)
+            ).fetchone()
+        return json.loads(row["metadata"]) if row else None
+
+    def query(
+        self,
+        *,
+        title: Optional[str] = None,
+        client_profile: Optional[str] = None,
+        content_type: Optional[str] = None,
+        status: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        topic_contains: Optional[str] = None,
+        any_tags: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        summary: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return matching rows, newest first.
+
+        Args:
+            topic_contains: Case-insensitive substring match on the topic
+            any_tags: Match content carrying at least one of these tags
+            summary: Return the indexed columns instead of the full metadata
+
+        Returns:
+            Metadata dicts (or summary dicts when ``summary`` is set)
+        """
+        clauses, params = [], []
+        for column, value in (
+            ("title", title),
+            ("client_profile", client_profile),
+            ("content_type", content_type),
+            ("status", status),
+            ("workflow_id", workflow_id),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(str(value))
+        if topic_contains is not None:
+            clauses.append("topic LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(topic_contains))
+        if any_tags is not None:
+            tags = list(any_tags)
+            if not tags:
+                return []
+            clauses.append(
+                "id IN (SELECT content_id FROM content_tags"
+                f" WHERE tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns = ", ".join(SUMMARY_COLUMNS) if summary else "metadata"
+        sql = (
+            f"SELECT {columns} FROM content_index {where}"
+            " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        )
+        params.extend([-1 if limit is None else limit, offset])
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        if not summary:
+            return [json.loads(row["metadata"]) for row in rows]
+        results = []
+        for row in rows:
+            item = dict(row)
+            item["tags"] = json.loads(item["tags"])
+            results.append(item)
+        return results
+
+    def search(
+        self,
+        text: str,
+        *,
+        client_profile: Optional[str] = None,
+        content_type: Optional[str] = None,
+        limit: Optional[int] = 20,
+        offset: int = 0,
+        snippet_tokens: int = 24,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Full-text search ranked by BM25 (title and tags weigh more than body).
+
+        Every match is ranked, so ``total_hits`` always agrees with the pages
+        that can be fetched; only the requested page is sorted out and given
+        snippets.
+
+        Args:
+            text: Free-text query; every term must match (``term*`` for a
+                prefix match)
+            limit: Page size (``None`` for all hits)
+            offset: Page offset
+            snippet_tokens: Approximate snippet length in tokens
+
+        Returns:
+            ``(total_hits, page)`` where each hit holds the summary columns,
+            ``score`` (higher is better) and a ``snippet`` with ``<mark>`` tags
+        """
+        match = to_match_query(text)
+        if match is None:
+            return 0, []
+
+        clauses, params = ["content_fts MATCH ?"], [match]
+        for column, value in (
+            ("client_profile", client_profile),
+            ("content_type", content_type),
+        ):
+            if value is not None:
+                clauses.append(f"c.{column} = ?")
+                params.append(str(value))
+        from_clause = "FROM content_fts"
+        if len(clauses) > 1:
+            from_clause += " JOIN content_index c ON c.rowid = content_fts.rowid"
+
+        with self._lock:
+            total = self._conn.execute(
+                f"SELECT COUNT(*) {from_clause} WHERE {' AND '.join(clauses)}",
+                params,
+            ).fetchone()[0]
+            if total == 0:
+                return 0, []
+
+            # Rank and paginate first; snippets are then built for the page only
+            page = self._conn.execute(
+                "SELECT content_fts.rowid AS rowid, content_fts.rank AS rank"
+                f" {from_clause} WHERE {' AND '.join(clauses)}"
+                " ORDER BY content_fts.rank LIMIT ? OFFSET ?",
+                (*params, -1 if limit is None else limit, offset),
+            ).fetchall()
+            if not page:
+                return total, []
+
+            rowids = [row["rowid"] for row in page]
+            placeholders = ", ".join("?" * len(rowids))
+            snippets = {
+                row["rowid"]: row["snippet"]
+                for row in self._conn.execute(
+                    "SELECT rowid, snippet(content_fts, -1, '<mark>', '</mark>',"
+                    " '…', ?) AS snippet FROM content_fts"
+                    f" WHERE content_fts MATCH ? AND rowid IN ({placeholders})",
+                    (snippet_tokens, match, *rowids),
+                )
+            }
+            columns = ", ".join(SUMMARY_COLUMNS)
+            summaries = {
+                row["rowid"]: row
+                for row in self._conn.execute(
+                    f"SELECT rowid, {columns} FROM content_index"
+                    f" WHERE rowid IN ({placeholders})",
+                    rowids,
+                )
+            }
+
+        hits = []
+        for row in page:
+            summary = summaries.get(row["rowid"])
+            if summary is None:
+                continue
+            hit = {column: summary[column] for column in SUMMARY_COLUMNS}
+            hit["tags"] = json.loads(hit["tags"])
+            hit["score"] = -row["rank"]
+            hit["snippet"] = snippets.get(row["rowid"], "")
+            hits.append(hit)
+        return total, hits
+
+    def count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM content_index").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,14 +1,16 @@
 """File-based content repository implementation."""
 
+import asyncio
 import json
 import logging
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 from pathlib import Path
 from datetime import datetime
 
 from ...domain.entities.content import Content, ContentType, ContentStatus
 from ...domain.repositories.content_repository import ContentRepository
+from .content_index import SQLiteContentIndex
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,8 @@ class FileContentRepository(ContentRepository):
 
     This implementation stores content as JSON files in the filesystem,
     providing a simple persistence mechanism without requiring a database.
+    Queries are answered from an SQLite metadata index kept next to the
+    files; bodies are only read for the content actually returned.
     """
 
     def __init__(self, base_path: str = "data/output"):
@@ -29,6 +33,54 @@ class FileContentRepository(ContentRepository):
         (self.base_path / "content").mkdir(exist_ok=True)
         (self.base_path / "metadata").mkdir(exist_ok=True)
 
+        self._index = SQLiteContentIndex(str(self.base_path / "index.sqlite3"))
+        self._sync_index()
+
+    def _sync_index(self) -> None:
+        """Backfill content missing from the index and drop stale rows."""
+        on_disk = {
+            path.stem: path for path in (self.base_path / "metadata").glob("*.json")
+        }
+        indexed = self._index.ids()
+
+        def missing():
+            for content_id in on_disk.keys() - indexed:
+                try:
+                    with open(on_disk[content_id], "r", encoding="utf-8") as f:
+                        metadata = json.load(f)
+                    metadata["id"] = str(UUID(content_id))
+                    yield metadata, self._read_body(content_id)
+                except (ValueError, Exception) as e:
+                    logger.warning(
+                        f"Failed to index content from {on_disk[content_id]}: {str(e)}"
+                    )
+
+        added = self._index.upsert_many(missing())
+        removed = self._index.delete(list(indexed - on_disk.keys()))
+
+        # Indexes created before full-text search only hold metadata
+        texts = 0
+        for content_id in self._index.ids_missing_text():
+            body = self._read_body(content_id)
+            if body is not None:
+                self._index.index_text(content_id, body)
+                texts += 1
+
+        if added or removed or texts:
+            logger.info(
+                f"🗂️ Content index synced: {added} added, {removed} removed, "
+                f"{texts} full-text entries built ({self._index.count()} total)"
+            )
+
+    def _read_body(self, content_id: Any) -> Optional[str]:
+        try:
+            with open(
+                self._get_content_file_path(content_id), "r", encoding="utf-8"
+            ) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
     def _get_content_file_path(self, content_id: UUID) -> Path:
         """Get file path for content body."""
         return self.base_path / "content" / f"{content_id}.md"
@@ -53,6 +105,8 @@ class FileContentRepository(ContentRepository):
             with open(metadata_file, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
 
+            await asyncio.to_thread(self._index.upsert, metadata, content.body)
+
             logger.info(f"Saved content {content.id} to {content_file}")
             return content
 
@@ -84,69 +138,90 @@ class FileContentRepository(ContentRepository):
             logger.error(f"Failed to load content {content_id}: {str(e)}")
             return None
 
+    def _load_bodies(self, rows: List[Dict[str, Any]]) -> List[Content]:
+        """Attach bodies to indexed metadata, skipping content whose body is gone."""
+        content_list = []
+        for metadata in rows:
+            content_file = self._get_content_file_path(metadata["id"])
+            try:
+                with open(content_file, "r", encoding="utf-8") as f:
+                    metadata["body"] = f.read()
+                content_list.append(Content.from_dict(metadata))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(f"Failed to load content from {content_file}: {str(e)}")
+        return content_list
+
+    async def _query(self, **filters: Any) -> List[Content]:
+        """Filter through the metadata index and load only the matching bodies."""
+
+        def run() -> List[Content]:
+            return self._load_bodies(self._index.query(**filters))
+
+        return await asyncio.to_thread(run)
+
     async def get_by_title(self, title: str) -> Optional[Content]:
         """Get content by title."""
-        all_content = await self.get_all()
-        for content in all_content:
-            if content.title == title:
-                return content
-        return None
+        matches = await self._query(title=title, limit=1)
+        return matches[0] if matches else None
 
     async def get_by_workflow_id(self, workflow_id: UUID) -> List[Content]:
         """Get content by workflow ID."""
-        all_content = await self.get_all()
-        return [c for c in all_content if c.workflow_id == workflow_id]
+        return await self._query(workflow_id=str(workflow_id))
 
     async def get_by_type(self, content_type: ContentType) -> List[Content]:
         """Get content by type."""
-        all_content = await self.get_all()
-        return [c for c in all_content if c.content_type == content_type]
+        return await self._query(content_type=content_type.value)
 
     async def get_by_status(self, status: ContentStatus) -> List[Content]:
         """Get content by status."""
-        all_content = await self.get_all()
-        return [c for c in all_content if c.status == status]
+        return await self._query(status=status.value)
 
     async def get_by_client_profile(self, profile_name: str) -> List[Content]:
         """Get content by client profile."""
-        all_content = await self.get_all()
-        return [c for c in all_content if c.client_profile == profile_name]
+        return await self._query(client_profile=profile_name)
 
     async def get_by_topic(self, topic: str) -> List[Content]:
         """Get content by topic."""
-        all_content = await self.get_all()
-        return [c for c in all_content if topic.lower() in c.topic.lower()]
+        return await self._query(topic_contains=topic)
 
     async def get_by_tags(self, tags: List[str]) -> List[Content]:
         """Get content by tags."""
-        all_content = await self.get_all()
-        result = []
-        for content in all_content:
-            if any(tag in content.tags for tag in tags):
-                result.append(content)
-        return result
+        return await self._query(any_tags=tags)
 
     async def get_all(self) -> List[Content]:
         """Get all content."""
-        content_list = []
-        metadata_dir = self.base_path / "metadata"
-
-        for metadata_file in metadata_dir.glob("*.json"):
-            try:
-                content_id = UUID(metadata_file.stem)
-                content = await self.get_by_id(content_id)
-                if content:
-                    content_list.append(content)
-            except (ValueError, Exception) as e:
-                logger.warning(f"Failed to load content from {metadata_file}: {str(e)}")
-
-        return content_list
+        return await self._query()
 
     async def get_recent(self, limit: int = 10) -> List[Content]:
         """Get recent content."""
-        all_content = await self.get_all()
-        sorted_content = sorted(all_content, key=lambda x: x.created_at, reverse=True)
-        return sorted_content[:limit]
+        return await self._query(limit=limit)
+
+    async def list_summaries(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        content_type: Optional[str] = None,
+        client_profile: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List indexed content metadata, newest first, without reading bodies.
+
+        Returns:
+            Dicts with id, title, client_profile, content_type, status,
+            workflow_id, topic, tags, word_count, created_at and updated_at
+        """
+        return await asyncio.to_thread(
+            self._index.query,
+            content_type=content_type,
+            client_profile=client_profile,
+            status=status,
+            limit=limit,
+            offset=offset,
+            summary=True,
+        )
 
     async def get_published(self) -> List[Content]:
         """Get published content."""
@@ -180,6 +255,8 @@ class FileContentRepository(ContentRepository):
                 metadata_file.unlink()
                 deleted = True
 
+            await asyncio.to_thread(self._index.delete, [str(content_id)])
+
             if deleted:
                 logger.info(f"Deleted content {content_id}")
 
@@ -196,20 +273,43 @@ class FileContentRepository(ContentRepository):
         return metadata_file.exists() and content_file.exists()
 
     async def search(self, query: str) -> List[Content]:
-        """Search content."""
-        all_content = await self.get_all()
-        query_lower = query.lower()
-
-        results = []
-        for content in all_content:
-            if (
-                query_lower in content.title.lower()
-                or query_lower in content.body.lower()
-                or any(query_lower in tag.lower() for tag in content.tags)
-            ):
-                results.append(content)
-
-        return results
+        """Search content (full-text, best matches first)."""
+
+        def run() -> List[Content]:
+            _, hits = self._index.search(query, limit=None)
+            rows = []
+            for hit in hits:
+                metadata = self._index.get(hit["id"])
+                if metadata is not None:
+                    rows.append(metadata)
+            return self._load_bodies(rows)
+
+        return await asyncio.to_thread(run)
+
+    async def search_index(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        client_profile: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Ranked full-text search returning summaries and snippets, not bodies.
+
+        Returns:
+            Dict with ``total_count`` and ``results`` (summary columns plus
+            ``score`` and ``snippet``)
+        """
+        total, hits = await asyncio.to_thread(
+            self._index.search,
+            query,
+            client_profile=client_profile,
+            content_type=content_type,
+            limit=limit,
+            offset=offset,
+        )
+        return {"total_count": total, "results": hits}
 
     async def get_content_metrics(self, content_id: UUID) -> Optional[dict]:
         """Get content metrics."""
@@ -1,9 +1,14 @@
 """YAML-based agent repository implementation."""
 
+import copy
+import re
+import threading
+import time
 import yaml
 import logging
 import asyncio
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from pathlib import Path
 
@@ -13,49 +18,192 @@ from ...domain.repositories.agent_repository import AgentRepository
 logger = logging.getLogger(__name__)
 
 
+def normalize_agent_name(name: str) -> str:
+    """Normalize an agent name to snake_case for permissive matching."""
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def _read_agent_file(file_path: Path) -> Optional[Agent]:
+    """Parse an agent YAML file (blocking)."""
+    try:
+        if not file_path.exists():
+            return None
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+        return Agent(
+            name=data.get("name", file_path.stem),
+            role=AgentRole(data.get("role", "researcher")),
+            goal=data.get("goal", ""),
+            backstory=data.get("backstory", ""),
+            system_message=data.get("system_message", ""),
+            tools=data.get("tools", []),
+            examples=data.get("examples", []),
+            metadata=data.get("metadata", {}),
+            is_active=data.get("is_active", True),
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to load agent from {file_path}: {str(e)}")
+        return None
+
+
+def _clone(agent: Agent) -> Agent:
+    """Copy a cached agent so callers cannot mutate the catalog."""
+    clone = copy.copy(agent)
+    clone.tools = list(agent.tools)
+    clone.examples = list(agent.examples)
+    clone.metadata = copy.deepcopy(agent.metadata)
+    return clone
+
+
+@dataclass
+class _CatalogEntry:
+    profile: str
+    signature: Tuple[int, int]  # (mtime_ns, size)
+    agent: Optional[Agent]
+
+
+@dataclass
+class _CatalogIndex:
+    agents: List[Agent] = field(default_factory=list)
+    by_profile: Dict[str, List[Agent]] = field(default_factory=dict)
+    by_profile_name: Dict[Tuple[str, str], List[Agent]] = field(default_factory=dict)
+    by_file_name: Dict[str, List[Agent]] = field(default_factory=dict)
+    by_id: Dict[UUID, Agent] = field(default_factory=dict)
+    by_role: Dict[AgentRole, List[Agent]] = field(default_factory=dict)
+
+
+class _AgentCatalog:
+    """
+    Parsed agent YAML files with lookup indexes.
+
+    Files are parsed once and re-validated against their mtime and size at
+    most every ``refresh_interval_seconds``; only added or changed files are
+    parsed again. Agents keep their id across reloads of the same file.
+    """
+
+    def __init__(self, base_path: Path, refresh_interval_seconds: float):
+        self.base_path = base_path
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._entries: Dict[Path, _CatalogEntry] = {}
+        self._index = _CatalogIndex()
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> _CatalogIndex:
+        return self._index
+
+    @property
+    def stale(self) -> bool:
+        checked_at = self._checked_at
+        return (
+            checked_at is None
+            or time.monotonic() - checked_at >= self.refresh_interval_seconds
+        )
+
+    def invalidate(self, file_path: Optional[Path] = None) -> None:
+        """Force a rescan on next access, optionally reparsing one file."""
+        with self._lock:
+            entry = self._entries.get(file_path) if file_path else None
+            if entry is not None:
+                entry.signature = (-1, -1)
+            self._checked_at = None
+
+    def _scan(self) -> Dict[Path, Tuple[str, Tuple[int, int]]]:
+        found: Dict[Path, Tuple[str, Tuple[int, int]]] = {}
+        if not self.base_path.is_dir():
+            return found
+        for profile_dir in sorted(self.base_path.iterdir()):
+            agents_dir = profile_dir / "agents"
+            if not agents_dir.is_dir():
+                continue
+            for agent_file in sorted(agents_dir.glob("*.yaml")):
+                try:
+                    stat = agent_file.stat()
+                except OSError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                found[agent_file] = (profile_dir.name, signature)
+        return found
+
+    def refresh(self) -> None:
+        """Rescan the profiles tree and reparse changed files (blocking)."""
+        with self._lock:
+            if not self.stale:
+                return
+            entries: Dict[Path, _CatalogEntry] = {}
+            parsed = 0
+            for file_path, (profile, signature) in self._scan().items():
+                entry = self._entries.get(file_path)
+                if entry is None or entry.signature != signature:
+                    agent = _read_agent_file(file_path)
+                    if agent is not None:
+                        agent.metadata["client_profile"] = profile
+                        if entry is not None and entry.agent is not None:
+                            agent.id = entry.agent.id
+                    entry = _CatalogEntry(profile, signature, agent)
+                    parsed += 1
+                entries[file_path] = entry
+
+            if parsed or entries.keys() != self._entries.keys():
+                self._entries = entries
+                self._index = self._build_index(entries)
+                logger.info(
+                    f"📇 Agent catalog loaded {len(self._index.agents)} agents "
+                    f"({parsed} files parsed) from {self.base_path}"
+                )
+            self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _build_index(entries: Dict[Path, _CatalogEntry]) -> _CatalogIndex:
+        index = _CatalogIndex()
+        for file_path, entry in entries.items():
+            agent = entry.agent
+            if agent is None:
+                continue
+            index.agents.append(agent)
+            index.by_profile.setdefault(entry.profile, []).append(agent)
+            for key in {agent.name, normalize_agent_name(agent.name)}:
+                index.by_profile_name.setdefault((entry.profile, key), []).append(agent)
+            index.by_file_name.setdefault(file_path.stem, []).append(agent)
+            index.by_id[agent.id] = agent
+            index.by_role.setdefault(agent.role, []).append(agent)
+        return index
+
+
 class YamlAgentRepository(AgentRepository):
     """
     YAML-based implementation of AgentRepository.
 
     This implementation stores agent configurations as YAML files,
-    organized by client profiles.
+    organized by client profiles. Reads are served from an in-memory
+    catalog that is re-validated against file mtimes, so resolving an
+    agent is a dictionary lookup rather than directory I/O and YAML parsing.
     """
 
-    def __init__(self, base_path: str = "data/profiles"):
+    def __init__(
+        self, base_path: str = "data/profiles", refresh_interval_seconds: float = 2.0
+    ):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._catalog = _AgentCatalog(self.base_path, refresh_interval_seconds)
 
     def _get_agent_file_path(self, client_profile: str, agent_name: str) -> Path:
         """Get file path for agent configuration."""
         return self.base_path / client_profile / "agents" / f"{agent_name}.yaml"
 
+    async def _get_index(self) -> _CatalogIndex:
+        """Return the catalog index, rescanning off the loop when stale."""
+        if self._catalog.stale:
+            await asyncio.to_thread(self._catalog.refresh)
+        return self._catalog.index
+
     async def _load_agent_from_file(self, file_path: Path) -> Optional[Agent]:
         """Load agent from YAML file without blocking the event loop."""
-        try:
-            if not file_path.exists():
-                return None
-
-            def read_file() -> dict:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f)
-
-            data = await asyncio.to_thread(read_file)
-
-            return Agent(
-                name=data.get("name", file_path.stem),
-                role=AgentRole(data.get("role", "researcher")),
-                goal=data.get("goal", ""),
-                backstory=data.get("backstory", ""),
-                system_message=data.get("system_message", ""),
-                tools=data.get("tools", []),
-                examples=data.get("examples", []),
-                metadata=data.get("metadata", {}),
-                is_active=data.get("is_active", True),
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to load agent from {file_path}: {str(e)}")
-            return None
+        return await asyncio.to_thread(_read_agent_file, file_path)
 
     async def _save_agent_to_file(self, agent: Agent, file_path: Path) -> bool:
         """Save agent to YAML file without blocking the event loop."""
@@ -84,6 +232,8 @@ class YamlAgentRepository(AgentRepository):
         except Exception as e:
             logger.error(f"Failed to save agent to {file_path}: {str(e)}")
             return False
+        finally:
+            self._catalog.invalidate(file_path)
 
     async def save(self, agent: Agent) -> Agent:
         """Save an agent."""
@@ -99,51 +249,48 @@ class YamlAgentRepository(AgentRepository):
 
     async def get_by_id(self, agent_id: UUID) -> Optional[Agent]:
         """Get an agent by ID."""
-        # For YAML implementation, we search through all files
-        all_agents = await self.get_all()
-        for agent in all_agents:
-            if agent.id == agent_id:
-                return agent
-        return None
+        agent = (await self._get_index()).by_id.get(agent_id)
+        return _clone(agent) if agent else None
 
     async def get_by_name(self, name: str) -> Optional[Agent]:
         """Get an agent by name (returns only active agents)."""
-        # Search through all client profiles
-        for profile_dir in self.base_path.iterdir():
-            if profile_dir.is_dir():
-                agents_dir = profile_dir / "agents"
-                if agents_dir.exists():
-                    agent_file = agents_dir / f"{name}.yaml"
-                    agent = await self._load_agent_from_file(agent_file)
-                    if agent and getattr(agent, "is_active", True):
-                        return agent
+        # Matches the file name across client profiles
+        for agent in (await self._get_index()).by_file_name.get(name, []):
+            if getattr(agent, "is_active", True):
+                return _clone(agent)
         return None
 
+    async def get_by_profile_and_name(
+        self, profile_name: str, name: str
+    ) -> Optional[Agent]:
+        """
+        Get a client profile's agent by exact or normalized name.
+
+        Active agents are preferred; an inactive match is returned only when
+        no active one exists so callers can report it.
+        """
+        index = await self._get_index()
+        matches = index.by_profile_name.get(
+            (profile_name, name)
+        ) or index.by_profile_name.get((profile_name, normalize_agent_name(name)), [])
+        for agent in matches:
+            if getattr(agent, "is_active", True):
+                return _clone(agent)
+        return _clone(matches[0]) if matches else None
+
     async def get_by_role(self, role: AgentRole) -> List[Agent]:
         """Get all agents with a specific role."""
-        all_agents = await self.get_all()
-        return [agent for agent in all_agents if agent.role == role]
+        index = await self._get_index()
+        return [_clone(agent) for agent in index.by_role.get(role, [])]
 
     async def get_all(self) -> List[Agent]:
         """Get all agents."""
-        agents = []
-
-        for profile_dir in self.base_path.iterdir():
-            if profile_dir.is_dir():
-                agents_dir = profile_dir / "agents"
-                if agents_dir.exists():
-                    for agent_file in agents_dir.glob("*.yaml"):
-                        agent = await self._load_agent_from_file(agent_file)
-                        if agent:
-                            agent.metadata["client_profile"] = profile_dir.name
-                            agents.append(agent)
-
-        return agents
+        return [_clone(agent) for agent in (await self._get_index()).agents]
 
     async def get_active(self) -> List[Agent]:
         """Get all active agents."""
-        all_agents = await self.get_all()
-        return [agent for agent in all_agents if agent.is_active]
+        index = await self._get_index()
+        return [_clone(agent) for agent in index.agents if agent.is_active]
 
     async def update(self, agent: Agent) -> Agent:
         """Update an existing agent."""
@@ -165,48 +312,39 @@ class YamlAgentRepository(AgentRepository):
                 return True
         except Exception as e:
             logger.error(f"Failed to delete agent file {file_path}: {str(e)}")
+        finally:
+            self._catalog.invalidate(file_path)
 
         return False
 
     async def exists(self, agent_id: UUID) -> bool:
         """Check if an agent exists."""
-        agent = await self.get_by_id(agent_id)
-        return agent is not None
+        return agent_id in (await self._get_index()).by_id
 
     async def get_by_client_profile(self, profile_name: str) -> List[Agent]:
         """Get agents configured for a specific client profile."""
-        agents = []
-        profile_dir = self.base_path / profile_name
-
-        if profile_dir.exists():
-            agents_dir = profile_dir / "agents"
-            if agents_dir.exists():
-                for agent_file in agents_dir.glob("*.yaml"):
-                    agent = await self._load_agent_from_file(agent_file)
-                    if agent:
-                        agent.metadata["client_profile"] = profile_name
-                        agents.append(agent)
-
-        return agents
+        index = await self._get_index()
+        return [_clone(agent) for agent in index.by_profile.get(profile_name, [])]
 
     async def get_agents_with_tool(self, tool_name: str) -> List[Agent]:
         """Get agents that can use a specific tool."""
-        all_agents = await self.get_all()
-        return [agent for agent in all_agents if agent.can_use_tool(tool_name)]
+        index = await self._get_index()
+        return [
+            _clone(agent) for agent in index.agents if agent.can_use_tool(tool_name)
+        ]
 
     async def search(self, query: str) -> List[Agent]:
         """Search agents by name, role, or description."""
-        all_agents = await self.get_all()
         query_lower = query.lower()
 
         results = []
-        for agent in all_agents:
+        for agent in (await self._get_index()).agents:
             if (
                 query_lower in agent.name.lower()
                 or query_lower in agent.role.value.lower()
                 or query_lower in agent.goal.lower()
                 or query_lower in agent.backstory.lower()
             ):
-                results.append(agent)
+                results.append(_clone(agent))
 
         return results
@@ -0,0 +1,324 @@
+"""Token-budgeted assembly of a client's knowledge base into prompt context.
+
+Documents are grouped into the same COMPANY INFORMATION / CONTENT GUIDELINES /
+KNOWLEDGE BASE / OTHER DOCUMENTS sections ``rag_get_client_content`` has
+always returned. When they do not fit the token budget, paragraphs repeated
+across documents are dropped first. The documents are then chunked, and
+chunks are ranked by category priority plus BM25 relevance to the task and
+packed greedily until the budget is spent. Chunks are rendered back in
+document order.
+"""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .document_chunker import DocumentChunk, chunk_markdown, count_tokens
+
+COMPANY = "company"
+GUIDELINES = "guidelines"
+KNOWLEDGE = "knowledge"
+OTHER = "other"
+
+# Filename patterns per category, checked in order
+_CATEGORY_TERMS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (COMPANY, ("company", "about", "profile", "overview", "brand")),
+    (
+        GUIDELINES,
+        (
+            "guideline",
+            "guide",
+            "best_practice",
+            "best-practice",
+            "rule",
+            "instruction",
+            "style",
+        ),
+    ),
+    (KNOWLEDGE, ("knowledge", "kb", "reference", "detail", "info")),
+)
+
+SECTION_HEADERS: Dict[str, str] = {
+    COMPANY: """## COMPANY INFORMATION
+
+The following documents contain essential information about the company, its brand, and positioning.
+This information should be reflected in all content creation.
+""",
+    GUIDELINES: """\n## CONTENT GUIDELINES
+
+The following documents contain guidelines and best practices for content creation.
+These should be strictly followed when generating content.
+""",
+    KNOWLEDGE: """\n## KNOWLEDGE BASE
+
+The following documents contain detailed knowledge that can be referenced and incorporated into content.
+Use this information as needed to enhance content accuracy and depth.
+""",
+    OTHER: """\n## OTHER DOCUMENTS
+
+The following documents contain additional information that may be relevant to content creation.
+""",
+}
+
+# Higher weight wins; relevance (0..1) is added on top, scaled so a highly
+# relevant chunk can outrank a barely relevant one from the category above
+_CATEGORY_WEIGHTS = {COMPANY: 3.0, GUIDELINES: 2.0, KNOWLEDGE: 1.0, OTHER: 0.0}
+_RELEVANCE_WEIGHT = 1.5
+# Paragraphs shorter than this (normalized) are never treated as duplicates
+_MIN_DEDUPE_CHARS = 40
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def categorize_document(name: str) -> str:
+    """Map a document name to its context section by filename pattern."""
+    lowered = name.lower()
+    for category, terms in _CATEGORY_TERMS:
+        if any(term in lowered for term in terms):
+            return category
+    return OTHER
+
+
+@dataclass
+class ContextDocument:
+    """A knowledge base document offered to the assembler."""
+
+    name: str
+    content: str
+    category: str = ""
+    # Path or title reported to run tracking (defaults to ``name``)
+    source: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.category:
+            self.category = categorize_document(self.name)
+        if not self.source:
+            self.source = self.name
+
+
+@dataclass
+class AssembledContext:
+    """Packed context plus what made it in."""
+
+    text: str
+    tokens: int
+    included: List[str] = field(default_factory=list)
+    truncated: List[str] = field(default_factory=list)
+    dropped: List[str] = field(default_factory=list)
+    duplicate_paragraphs: int = 0
+
+    def status_of(self, name: str) -> str:
+        if name in self.truncated:
+            return "truncated"
+        if name in self.dropped:
+            return "dropped"
+        return "included"
+
+
+def _render(sections: Dict[str, List[Tuple[str, str]]]) -> str:
+    output: List[str] = []
+    for category in (COMPANY, GUIDELINES, KNOWLEDGE, OTHER):
+        documents = sections.get(category)
+        if not documents:
+            continue
+        output.append(SECTION_HEADERS[category])
+        for name, content in documents:
+            output.append(f"### {name}\n\n{content}\n\n")
+    return "\n\n".join(output)
+
+
+def render_full(documents: Sequence[ContextDocument]) -> str:
+    """Render every document in full (the unbudgeted layout)."""
+    sections: Dict[str, List[Tuple[str, str]]] = {}
+    for doc in documents:
+        sections.setdefault(doc.category, []).append((doc.name, doc.content))
+    return _render(sections)
+
+
+def _normalize_paragraph(paragraph: str) -> str:
+    return " ".join(_TOKEN_RE.findall(paragraph.lower()))
+
+
+def _dedupe(documents: Sequence[ContextDocument]) -> Tuple[List[ContextDocument], int]:
+    """Drop paragraphs already seen in a higher-priority document."""
+    seen: Set[str] = set()
+    removed = 0
+    result = []
+    for doc in documents:
+        kept = []
+        for paragraph in re.split(r"\n\s*\n", doc.content):
+            key = _normalize_paragraph(paragraph)
+            heading = paragraph.lstrip().startswith("#")
+            if len(key) >= _MIN_DEDUPE_CHARS and not heading:
+                if key in seen:
+                    removed += 1
+                    continue
+                seen.add(key)
+            kept.append(paragraph)
+        result.append(
+            ContextDocument(doc.name, "\n\n".join(kept), doc.category, doc.source)
+        )
+    return result, removed
+
+
+def _relevance(chunks: Sequence[DocumentChunk], query: Optional[str]) -> List[float]:
+    """BM25 of each chunk against ``query``, scaled to 0..1."""
+    terms = set(_TOKEN_RE.findall((query or "").lower()))
+    if not terms or not chunks:
+        return [0.0] * len(chunks)
+    counts = [
+        Counter(_TOKEN_RE.findall(f"{c.heading} {c.content}".lower())) for c in chunks
+    ]
+    lengths = [sum(count.values()) for count in counts]
+    avgdl = (sum(lengths) / len(lengths)) or 1.0
+    n = len(chunks)
+    k1, b = 1.2, 0.75
+    scores = [0.0] * n
+    for term in terms:
+        df = sum(1 for count in counts if term in count)
+        if not df:
+            continue
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for i, count in enumerate(counts):
+            tf = count.get(term)
+            if tf:
+                norm = k1 * (1 - b + b * lengths[i] / avgdl)
+                scores[i] += idf * tf * (k1 + 1) / (tf + norm)
+    top = max(scores)
+    return [score / top for score in scores] if top > 0 else scores
+
+
+def assemble_context(
+    documents: Sequence[ContextDocument],
+    token_budget: int,
+    query: Optional[str] = None,
+    chunk_tokens: int = 400,
+) -> AssembledContext:
+    """
+    Pack documents into at most ``token_budget`` tokens of prompt context.
+
+    Args:
+        documents: Candidate documents in their natural order
+        token_budget: Maximum tokens of the returned text (<= 0 disables the limit)
+        query: Task text chunks are ranked against
+        chunk_tokens: Granularity at which oversized documents are cut
+
+    Returns:
+        The rendered context and the documents included, truncated or dropped
+    """
+    documents = list(documents)
+    names = [doc.name for doc in documents]
+    full_text = render_full(documents)
+    full_tokens = count_tokens(full_text)
+    if token_budget <= 0 or full_tokens <= token_budget:
+        return AssembledContext(text=full_text, tokens=full_tokens, included=names)
+
+    ordered = sorted(
+        range(len(documents)),
+        key=lambda i: -_CATEGORY_WEIGHTS.get(documents[i].category, 0.0),
+    )
+    deduped, duplicates = _dedupe([documents[i] for i in ordered])
+    deduped_text = render_full(deduped)
+    deduped_tokens = count_tokens(deduped_text)
+    if deduped_tokens <= token_budget:
+        return AssembledContext(
+            text=deduped_text,
+            tokens=deduped_tokens,
+            included=names,
+            duplicate_paragraphs=duplicates,
+        )
+
+    # Leave room for the note listing omitted documents
+    budget = token_budget - min(token_budget // 10, count_tokens(", ".join(names)) + 32)
+
+    # Rank every chunk, then pack greedily in rank order
+    candidates: List[Tuple[int, DocumentChunk]] = []
+    for position, doc in enumerate(deduped):
+        for chunk in chunk_markdown(doc.content, chunk_tokens, overlap_tokens=0):
+            candidates.append((position, chunk))
+    relevance = _relevance([chunk for _, chunk in candidates], query)
+    ranked = sorted(
+        range(len(candidates)),
+        key=lambda i: (
+            -(
+                _CATEGORY_WEIGHTS.get(deduped[candidates[i][0]].category, 0.0)
+                + _RELEVANCE_WEIGHT * relevance[i]
+            ),
+            candidates[i][0],
+            candidates[i][1].index,
+        ),
+    )
+
+    used = 0
+    open_sections: Set[str] = set()
+    open_documents: Set[int] = set()
+    chosen: List[int] = []
+    for i in ranked:
+        position, chunk = candidates[i]
+        doc = deduped[position]
+        cost = count_tokens(f"#### {chunk.heading}\n\n{chunk.content}\n\n")
+        if position not in open_documents:
+            cost += count_tokens(f"### {doc.name} (excerpts)\n\n")
+        if doc.category not in open_sections:
+            cost += count_tokens(SECTION_HEADERS[doc.category])
+        if used + cost > budget:
+            continue
+        used += cost
+        open_documents.add(position)
+        open_sections.add(doc.category)
+        chosen.append(i)
+
+    chunk_counts = Counter(position for position, _ in candidates)
+
+    def render(selected: List[int]) -> Tuple[str, List[str], List[str], List[str]]:
+        by_document: Dict[int, List[DocumentChunk]] = {}
+        for i in selected:
+            position, chunk = candidates[i]
+            by_document.setdefault(position, []).append(chunk)
+        sections: Dict[str, List[Tuple[str, str]]] = {}
+        included, truncated = [], []
+        for position, doc in enumerate(deduped):
+            chunks = sorted(by_document.get(position, []), key=lambda c: c.index)
+            if not chunks:
+                continue
+            parts, heading = [], None
+            for chunk in chunks:
+                if chunk.heading and chunk.heading != heading:
+                    parts.append(f"#### {chunk.heading}")
+                    heading = chunk.heading
+                parts.append(chunk.content)
+            title = doc.name
+            if len(chunks) < chunk_counts[position]:
+                title = f"{doc.name} (excerpts)"
+                truncated.append(doc.name)
+            else:
+                included.append(doc.name)
+            sections.setdefault(doc.category, []).append((title, "\n\n".join(parts)))
+        dropped = [name for name in names if name not in included + truncated]
+        text = _render(sections)
+        if dropped:
+            text += (
+                "\n\n_Omitted to fit the context budget: "
+                + ", ".join(dropped)
+                + ". Request a document by name to read it in full._"
+            )
+        return text, included, truncated, dropped
+
+    # Per-chunk costs are estimates; shed the lowest-ranked chunks until it fits
+    text, included, truncated, dropped = render(chosen)
+    tokens = count_tokens(text)
+    while tokens > token_budget and chosen:
+        chosen.pop()
+        text, included, truncated, dropped = render(chosen)
+        tokens = count_tokens(text)
+
+    return AssembledContext(
+        text=text,
+        tokens=tokens,
+        included=included,
+        truncated=truncated,
+        dropped=dropped,
+        duplicate_paragraphs=duplicates,
+    )
@@ -0,0 +1,180 @@
+"""Token-aware markdown chunking for knowledge base retrieval.
+
+Documents are split at markdown headings first, so a chunk never spans two
+sections, then packed paragraph by paragraph (falling back to sentences and
+words for oversized paragraphs) up to a token budget, with a tail of the
+previous chunk repeated as overlap.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+try:  # Optional dependency for exact token counts
+    import tiktoken  # type: ignore
+except Exception:  # pragma: no cover
+    tiktoken = None
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_APPROX_TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        return None
+    try:
+        # Encoding used by the text-embedding-3 models
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # pragma: no cover - encoding files unavailable offline
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else approximate by words."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(_APPROX_TOKEN_RE.findall(text))
+
+
+@dataclass
+class DocumentChunk:
+    """A contiguous piece of a document under a single heading path."""
+
+    index: int
+    content: str
+    heading: str
+    token_count: int
+
+    @property
+    def embedding_text(self) -> str:
+        """Text to embed: the heading path gives the chunk its context."""
+        return f"{self.heading}\n\n{self.content}" if self.heading else self.content
+
+
+def _sections(text: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(heading_path, body)`` per markdown section, ignoring code fences."""
+    path: List[Tuple[int, str]] = []
+    lines: List[str] = []
+    in_fence = False
+
+    def flush() -> Optional[Tuple[str, str]]:
+        body = "\n".join(lines).strip()
+        return (" > ".join(title for _, title in path), body) if body else None
+
+    for line in text.splitlines():
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match is None:
+            lines.append(line)
+            continue
+        section = flush()
+        if section:
+            yield section
+        lines = []
+        level = len(match.group(1))
+        path = [(lvl, title) for lvl, title in path if lvl < level]
+        path.append((level, match.group(2).strip()))
+
+    section = flush()
+    if section:
+        yield section
+
+
+def _split_oversized(text: str, max_tokens: int, window_tokens: int) -> List[str]:
+    """Split a paragraph into sentences, and long sentences into word windows."""
+    pieces: List[str] = []
+    for sentence in _SENTENCE_RE.split(text):
+        if count_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        window: List[str] = []
+        size = 0
+        for word in sentence.split():
+            word_tokens = count_tokens(word)
+            if window and size + word_tokens > window_tokens:
+                pieces.append(" ".join(window))
+                window, size = [], 0
+            window.append(word)
+            size += word_tokens
+        if window:
+            pieces.append(" ".join(window))
+    return pieces
+
+
+def _units(body: str, max_tokens: int, overlap_tokens: int) -> List[Tuple[str, int]]:
+    # Word windows sized to the overlap so consecutive chunks can share one
+    window_tokens = overlap_tokens or max_tokens
+    units = []
+    for paragraph in re.split(r"\n\s*\n", body):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        tokens = count_tokens(paragraph)
+        if tokens <= max_tokens:
+            units.append((paragraph, tokens))
+        else:
+            units.extend(
+                (piece, count_tokens(piece))
+                for piece in _split_oversized(paragraph, max_tokens, window_tokens)
+            )
+    return units
+
+
+def chunk_markdown(
+    text: str, max_tokens: int = 1000, overlap_tokens: int = 200
+) -> List[DocumentChunk]:
+    """
+    Split a markdown document into overlapping, heading-bounded chunks.
+
+    Args:
+        text: Markdown source
+        max_tokens: Upper bound on tokens per chunk (heading excluded)
+        overlap_tokens: Tokens of trailing context repeated in the next chunk
+
+    Returns:
+        Chunks in document order
+    """
+    max_tokens = max(1, max_tokens)
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+    chunks: List[DocumentChunk] = []
+
+    for heading, body in _sections(text):
+        current: List[Tuple[str, int]] = []
+        has_new = False
+
+        def emit() -> None:
+            content = "\n\n".join(unit for unit, _ in current)
+            chunks.append(
+                DocumentChunk(
+                    index=len(chunks),
+                    content=content,
+                    heading=heading,
+                    token_count=sum(tokens for _, tokens in current),
+                )
+            )
+
+        for unit, tokens in _units(body, max_tokens, overlap_tokens):
+            if has_new and sum(t for _, t in current) + tokens > max_tokens:
+                emit()
+                # Carry the tail of the previous chunk as overlap
+                tail: List[Tuple[str, int]] = []
+                for previous in reversed(current):
+                    if sum(t for _, t in tail) + previous[1] > overlap_tokens:
+                        break
+                    tail.insert(0, previous)
+                current, has_new = tail, False
+                if sum(t for _, t in current) + tokens > max_tokens:
+                    current = []
+            current.append((unit, tokens))
+            has_new = True
+
+        if has_new:
+            emit()
+
+    return chunks
@@ -0,0 +1,268 @@
+"""Resumable chunk-and-embed backfill for a client's knowledge base documents.
+
+Documents are walked in ``id`` order one page at a time. Each page is chunked,
+its chunks are embedded in provider-sized batches with bounded concurrency,
+and each document's chunks are replaced in a single transaction. After every
+page the cursor (last document id) is checkpointed, so an interrupted run
+continues where it stopped instead of re-embedding the whole knowledge base.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from ..database.supabase_io import supabase_io
+from .document_chunker import DocumentChunk, chunk_markdown
+from .rag_tool import EMBEDDING_BATCH_SIZE, RAGTool
+
+logger = logging.getLogger(__name__)
+
+# The embeddings API caps a request at 300k input tokens; stay well below it
+EMBEDDING_MAX_BATCH_TOKENS = 250_000
+# Failed document ids kept in the checkpoint (the counter is always exact)
+MAX_REPORTED_FAILURES = 100
+
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def embedding_batches(
+    token_counts: List[int],
+    max_inputs: int = EMBEDDING_BATCH_SIZE,
+    max_tokens: int = EMBEDDING_MAX_BATCH_TOKENS,
+) -> List[Tuple[int, int]]:
+    """
+    Group consecutive inputs into ``[start, end)`` ranges that fit one request.
+
+    Args:
+        token_counts: Token count of each input, in order
+        max_inputs: Maximum inputs per request
+        max_tokens: Maximum total tokens per request
+
+    Returns:
+        Index ranges covering every input exactly once
+    """
+    batches: List[Tuple[int, int]] = []
+    start, tokens = 0, 0
+    for position, count in enumerate(token_counts):
+        size = position - start
+        if size and (size >= max_inputs or tokens + count > max_tokens):
+            batches.append((start, position))
+            start, tokens = position, 0
+        tokens += count
+    if start < len(token_counts):
+        batches.append((start, len(token_counts)))
+    return batches
+
+
+class EmbeddingBackfill:
+    """Chunk and embed a client's documents in checkpointed pages."""
+
+    def __init__(
+        self,
+        rag_tool: RAGTool,
+        page_size: int = 50,
+        concurrency: int = 4,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+    ):
+        self.rag_tool = rag_tool
+        self.page_size = max(1, page_size)
+        self.concurrency = max(1, concurrency)
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    async def run(
+        self,
+        client_id: str,
+        rechunk: bool = False,
+        progress: Optional[Dict[str, Any]] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Backfill chunks and embeddings, resuming from ``progress`` if given.
+
+        Args:
+            client_id: Supabase id of the client whose documents are indexed
+            rechunk: Re-index documents that already have chunks
+            progress: Checkpoint of an earlier, interrupted run
+            on_progress: Awaited with the checkpoint after every page
+
+        Returns:
+            The final progress counters
+        """
+        state: Dict[str, Any] = {
+            "cursor": None,
+            "total_documents": None,
+            "scanned": 0,
+            "indexed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "chunks": 0,
+            "embedding_requests": 0,
+            "failed_document_ids": [],
+        }
+        state.update(progress or {})
+        if state["cursor"] is not None:
+            logger.info(
+                f"♻️ Resuming embedding backfill after document {state['cursor']} "
+                f"({state['scanned']} scanned)"
+            )
+        if state["total_documents"] is None:
+            state["total_documents"] = await supabase_io.run(
+                self._count_documents, client_id
+            )
+
+        while True:
+            documents = await supabase_io.run(
+                self._fetch_page, client_id, state["cursor"]
+            )
+            if not documents:
+                break
+            await self._process_page(documents, rechunk, state)
+            state["cursor"] = documents[-1]["id"]
+            state["scanned"] += len(documents)
+            if on_progress is not None:
+                await on_progress(dict(state))
+            logger.info(
+                f"📚 Embedding backfill: {state['scanned']}/"
+                f"{state['total_documents']} documents scanned, "
+                f"{state['indexed']} indexed, {state['chunks']} chunks"
+            )
+            if len(documents) < self.page_size:
+                break
+
+        return state
+
+    async def _process_page(
+        self,
+        documents: List[Dict[str, Any]],
+        rechunk: bool,
+        state: Dict[str, Any],
+    ) -> None:
+        if not rechunk:
+            chunked = await supabase_io.run(
+                self._chunked_document_ids, [doc["id"] for doc in documents]
+            )
+            state["skipped"] += sum(1 for doc in documents if doc["id"] in chunked)
+            documents = [doc for doc in documents if doc["id"] not in chunked]
+        if not documents:
+            return
+
+        chunks_by_doc = await asyncio.to_thread(self._chunk_documents, documents)
+        entries = [
+            (position, chunk)
+            for position, chunks in enumerate(chunks_by_doc)
+            for chunk in chunks
+        ]
+        vectors: List[Optional[List[float]]] = [None] * len(entries)
+        failed: Set[int] = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def embed(start: int, end: int) -> None:
+            texts = [chunk.embedding_text for _, chunk in entries[start:end]]
+            async with semaphore:
+                try:
+                    batch = await asyncio.to_thread(self.rag_tool._embed_texts, texts)
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️ Embedding batch of {len(texts)} chunks failed: {e}"
+                    )
+                    failed.update(position for position, _ in entries[start:end])
+                    return
+            vectors[start:end] = batch
+
+        batches = embedding_batches([chunk.token_count for _, chunk in entries])
+        await asyncio.gather(*(embed(start, end) for start, end in batches))
+        state["embedding_requests"] += len(batches)
+
+        # A document is written only when all of its chunks were embedded
+        completed: List[Tuple[Dict[str, Any], List[DocumentChunk], List]] = []
+        offset = 0
+        for position, doc in enumerate(documents):
+            count = len(chunks_by_doc[position])
+            if position in failed:
+                state["failed"] += 1
+                if len(state["failed_document_ids"]) < MAX_REPORTED_FAILURES:
+                    state["failed_document_ids"].append(doc["id"])
+            else:
+                completed.append(
+                    (doc, chunks_by_doc[position], vectors[offset : offset + count])
+                )
+            offset += count
+
+        if completed:
+            state["chunks"] += await supabase_io.run(self._write_page, completed)
+            state["indexed"] += len(completed)
+
+    def _chunk_documents(
+        self, documents: List[Dict[str, Any]]
+    ) -> List[List[DocumentChunk]]:
+        return [
+            chunk_markdown(
+                doc.get("content") or "",
+                max_tokens=self.chunk_size,
+                overlap_tokens=self.chunk_overlap,
+            )
+            for doc in documents
+        ]
+
+    def _count_documents(self, client_id: str) -> Optional[int]:
+        response = (
+            self.rag_tool.supabase.table("documents")
+            .select("id", count="exact")
+            .eq("client_id", client_id)
+            .limit(1)
+            .execute()
+        )
+        return response.count
+
+    def _fetch_page(
+        self, client_id: str, cursor: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        query = (
+            self.rag_tool.supabase.table("documents")
+            .select("id,content")
+            .eq("client_id", client_id)
+        )
+        if cursor is not None:
+            query = query.gt("id", cursor)
+        return query.order("id").limit(self.page_size).execute().data or []
+
+    def _chunked_document_ids(self, document_ids: List[str]) -> Set[str]:
+        response = (
+            self.rag_tool.supabase.table("document_chunks")
+            .select("document_id")
+            .in_("document_id", document_ids)
+            .eq("chunk_index", 0)
+            .execute()
+        )
+        return {row["document_id"] for row in response.data or []}
+
+    def _write_page(
+        self, completed: List[Tuple[Dict[str, Any], List[DocumentChunk], List]]
+    ) -> int:
+        """Replace each document's chunks and refresh document embeddings in bulk."""
+        supabase = self.rag_tool.supabase
+        written = sum(
+            self.rag_tool.store_document_chunks(doc["id"], chunks, vectors)
+            for doc, chunks, vectors in completed
+        )
+
+        embeddings = [
+            {"id": doc["id"], "embedding": RAGTool.document_vector(vectors)}
+            for doc, _, vectors in completed
+            if vectors
+        ]
+        if embeddings:
+            try:
+                supabase.rpc(
+                    "update_document_embeddings", {"updates": embeddings}
+                ).execute()
+            except Exception as e:
+                # Databases without the migration: one update per document
+                logger.debug(f"Bulk embedding update unavailable, updating rows: {e}")
+                for item in embeddings:
+                    supabase.table("documents").update(
+                        {"embedding": item["embedding"]}
+                    ).eq("id", item["id"]).execute()
+        return written
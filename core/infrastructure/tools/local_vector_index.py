@@ -0,0 +1,406 @@
+"""Local retrieval over a filesystem knowledge base (no Supabase required).
+
+Markdown files under a client's knowledge base directory are split with the
+same chunker the Supabase path uses. Chunk embeddings live in a float32 ``.npy``
+matrix that is memory-mapped on load; a refresh compares file mtimes and sizes
+against the manifest and only embeds chunks of new or changed files. Searches
+rank chunks by BM25 and, when embeddings are available, by cosine similarity,
+and merge both rankings with reciprocal rank fusion.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:  # Optional dependency for the embedding matrix
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None
+
+from .document_chunker import chunk_markdown
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[List[str]], List[List[float]]]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+# Rank constant of reciprocal rank fusion (the usual value from the literature)
+_RRF_K = 60
+# BM25 parameters
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+# Wait before re-embedding files whose embedding failed (e.g. while offline)
+_EMBED_RETRY_SECONDS = 300.0
+
+
+def _tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if len(token) > 1]
+
+
+@dataclass
+class LocalSearchHit:
+    """A chunk returned by a local knowledge base search."""
+
+    path: str
+    heading: str
+    content: str
+    score: float
+    similarity: Optional[float]
+
+
+class LocalKnowledgeIndex:
+    """Chunk, BM25 and embedding index for one knowledge base directory."""
+
+    MANIFEST = "manifest.json"
+    VECTORS = "vectors.npy"
+
+    def __init__(
+        self,
+        source_dir: Path,
+        index_dir: Path,
+        model: str,
+        embedder: Optional[Embedder] = None,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+    ):
+        if np is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("numpy is required for the local knowledge index")
+        self.source_dir = Path(source_dir)
+        self.index_dir = Path(index_dir)
+        self.model = model
+        self.embedder = embedder
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self._lock = threading.Lock()
+        self._files: Dict[str, Dict] = {}
+        self._chunks: List[Dict] = []
+        self._vectors = None  # (rows, dims) float32 memmap, unit-normalized rows
+        self._postings: Dict[str, Tuple] = {}
+        self._lengths = None
+        self._embed_retry_at = 0.0
+        self._load()
+
+    # ------------------------------------------------------------------ storage
+
+    def _load(self) -> None:
+        manifest_path = self.index_dir / self.MANIFEST
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(f"⚠️ Rebuilding unreadable local RAG index: {e}")
+            return
+        if manifest.get("model") != self.model:
+            logger.info("🔄 Local RAG index built with another model; rebuilding")
+            return
+        self._files = manifest.get("files", {})
+        self._chunks = manifest.get("chunks", [])
+        vectors_path = self.index_dir / self.VECTORS
+        if vectors_path.exists():
+            self._vectors = np.load(vectors_path, mmap_mode="r")
+        self._build_bm25()
+
+    def _save(self, vectors) -> None:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        vectors_path = self.index_dir / self.VECTORS
+        if vectors is not None:
+            tmp_path = self.index_dir / f"vectors.{os.getpid()}.tmp.npy"
+            np.save(tmp_path, vectors)
+            os.replace(tmp_path, vectors_path)
+            self._vectors = np.load(vectors_path, mmap_mode="r")
+        else:
+            vectors_path.unlink(missing_ok=True)
+            self._vectors = None
+        manifest = {"model": self.model, "files": self._files, "chunks": self._chunks}
+        tmp_manifest = self.index_dir / f"{self.MANIFEST}.{os.getpid()}.tmp"
+        tmp_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_manifest, self.index_dir / self.MANIFEST)
+
+    # ------------------------------------------------------------------ refresh
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        signatures = {}
+        for path in sorted(self.source_dir.rglob("*.md")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file():
+                relative = path.relative_to(self.source_dir).as_posix()
+                signatures[relative] = (stat.st_mtime_ns, stat.st_size)
+        return signatures
+
+    def refresh(self) -> bool:
+        """
+        Re-index files whose mtime or size changed since the last refresh.
+
+        Files that were embedded before keep their rows in the matrix; only
+        chunks of new or modified files (or files whose embedding failed
+        earlier) are sent to the embedder.
+
+        Returns:
+            True if the index changed
+        """
+        with self._lock:
+            signatures = self._scan()
+            changed = [
+                name
+                for name, signature in signatures.items()
+                if name not in self._files
+                or tuple(self._files[name]["signature"]) != signature
+            ]
+            removed = [name for name in self._files if name not in signatures]
+            unembedded = []
+            if self.embedder is not None and time.monotonic() >= self._embed_retry_at:
+                unembedded = [
+                    name
+                    for name in signatures
+                    if name not in changed and not self._files[name].get("embedded")
+                ]
+            if not changed and not removed and not unembedded:
+                return False
+
+            kept_rows: Dict[str, List[int]] = {}
+            for row, chunk in enumerate(self._chunks):
+                kept_rows.setdefault(chunk["path"], []).append(row)
+
+            new_chunks: Dict[str, List[Dict]] = {}
+            for name in changed:
+                try:
+                    text = (self.source_dir / name).read_text(encoding="utf-8")
+                except Exception as e:
+                    logger.warning(f"⚠️ Skipping unreadable file {name}: {e}")
+                    signatures.pop(name, None)
+                    continue
+                new_chunks[name] = [
+                    {
+                        "path": name,
+                        "heading": chunk.heading,
+                        "content": chunk.content,
+                        "embedding_text": chunk.embedding_text,
+                    }
+                    for chunk in chunk_markdown(
+                        text,
+                        max_tokens=self.chunk_size,
+                        overlap_tokens=self.chunk_overlap,
+                    )
+                ]
+            for name in unembedded:
+                new_chunks[name] = [
+                    {**self._chunks[row], "embedding_text": self._embedding_text(row)}
+                    for row in kept_rows.get(name, [])
+                ]
+
+            embedded = self._embed(new_chunks)
+
+            chunks: List[Dict] = []
+            rows: List = []
+            files: Dict[str, Dict] = {}
+            for name, signature in signatures.items():
+                if name in new_chunks:
+                    file_chunks = new_chunks[name]
+                    vectors = embedded.get(name)
+                    for position, chunk in enumerate(file_chunks):
+                        chunk.pop("embedding_text", None)
+                        chunks.append(chunk)
+                        rows.append(vectors[position] if vectors is not None else None)
+                    is_embedded = vectors is not None
+                else:
+                    for row in kept_rows.get(name, []):
+                        chunks.append(self._chunks[row])
+                        rows.append(self._vector_row(row))
+                    is_embedded = self._files[name].get("embedded", False)
+                files[name] = {"signature": list(signature), "embedded": is_embedded}
+
+            self._files = files
+            self._chunks = chunks
+            self._save(self._stack(rows))
+            self._build_bm25()
+            logger.info(
+                f"📚 Local RAG index {self.source_dir.name}: {len(files)} files, "
+                f"{len(chunks)} chunks ({len(changed)} changed, {len(removed)} removed)"
+            )
+            return True
+
+    def _embedding_text(self, row: int) -> str:
+        chunk = self._chunks[row]
+        heading, content = chunk.get("heading"), chunk["content"]
+        return f"{heading}\n\n{content}" if heading else content
+
+    def _vector_row(self, row: int):
+        if self._vectors is None or row >= len(self._vectors):
+            return None
+        vector = np.asarray(self._vectors[row])
+        return vector if vector.any() else None
+
+    def _embed(self, new_chunks: Dict[str, List[Dict]]) -> Dict[str, List]:
+        """Embed chunks of several files in one batched call; {} on failure."""
+        if self.embedder is None:
+            return {}
+        names = [name for name, chunks in new_chunks.items() if chunks]
+        texts = [c["embedding_text"] for name in names for c in new_chunks[name]]
+        if not texts:
+            return {name: [] for name in new_chunks}
+        try:
+            vectors = self.embedder(texts)
+        except Exception as e:
+            logger.warning(f"⚠️ Local RAG embedding failed, using BM25 only: {e}")
+            self._embed_retry_at = time.monotonic() + _EMBED_RETRY_SECONDS
+            return {}
+        result: Dict[str, List] = {name: [] for name in new_chunks}
+        offset = 0
+        for name in names:
+            count = len(new_chunks[name])
+            result[name] = vectors[offset : offset + count]
+            offset += count
+        return result
+
+    @staticmethod
+    def _stack(rows: List):
+        """Stack vectors into a unit-normalized float32 matrix (zeros for gaps)."""
+        dims = next((len(row) for row in rows if row is not None), None)
+        if dims is None:
+            return None
+        matrix = np.zeros((len(rows), dims), dtype=np.float32)
+        for position, row in enumerate(rows):
+            if row is not None:
+                matrix[position] = row
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _build_bm25(self) -> None:
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths = np.zeros(len(self._chunks), dtype=np.float32)
+        for row, chunk in enumerate(self._chunks):
+            tokens = _tokenize(f"{chunk.get('heading') or ''} {chunk['content']}")
+            lengths[row] = len(tokens)
+            for token, tf in Counter(tokens).items():
+                rows, tfs = postings.setdefault(token, ([], []))
+                rows.append(row)
+                tfs.append(tf)
+        self._postings = {
+            token: (np.asarray(rows, dtype=np.int64), np.asarray(tfs, dtype=np.float32))
+            for token, (rows, tfs) in postings.items()
+        }
+        self._lengths = lengths
+
+    # ------------------------------------------------------------------ search
+
+    @property
+    def has_vectors(self) -> bool:
+        return self._vectors is not None and len(self._vectors) == len(self._chunks)
+
+    def _bm25_scores(self, query: str):
+        n = len(self._chunks)
+        scores = np.zeros(n, dtype=np.float32)
+        if not n:
+            return scores
+        avgdl = float(self._lengths.mean()) or 1.0
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self._lengths / avgdl)
+        for token in set(_tokenize(query)):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            rows, tfs = posting
+            idf = math.log(1 + (n - len(rows) + 0.5) / (len(rows) + 0.5))
+            scores[rows] += idf * tfs * (_BM25_K1 + 1) / (tfs + norm[rows])
+        return scores
+
+    @staticmethod
+    def _top(scores, k: int):
+        """Indices of the ``k`` highest positive scores, best first."""
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def search(
+        self, query: str, k: int = 5, query_vector: Optional[List[float]] = None
+    ) -> List[LocalSearchHit]:
+        """
+        Return the top ``k`` chunks for ``query``.
+
+        Args:
+            query: Free-text query (BM25)
+            k: Number of chunks to return
+            query_vector: Query embedding; enables cosine ranking when the
+                index has embeddings from the same model
+
+        Returns:
+            Hits ordered by fused score
+        """
+        with self._lock:
+            if not self._chunks or k <= 0:
+                return []
+            depth = max(k * 4, 50)
+            bm25 = self._bm25_scores(query)
+            rankings = [self._top(bm25, depth)]
+
+            similarity = None
+            if query_vector is not None and self.has_vectors:
+                vector = np.asarray(query_vector, dtype=np.float32)
+                norm = np.linalg.norm(vector)
+                if norm > 0 and vector.shape[0] == self._vectors.shape[1]:
+                    similarity = self._vectors @ (vector / norm)
+                    rankings.append(self._top(similarity, depth))
+
+            fused: Dict[int, float] = {}
+            for ranking in rankings:
+                for rank, row in enumerate(ranking.tolist()):
+                    fused[row] = fused.get(row, 0.0) + 1.0 / (_RRF_K + rank + 1)
+
+            best = sorted(fused.items(), key=lambda item: -item[1])[:k]
+            return [
+                LocalSearchHit(
+                    path=self._chunks[row]["path"],
+                    heading=self._chunks[row].get("heading") or "",
+                    content=self._chunks[row]["content"],
+                    score=score,
+                    similarity=(
+                        float(similarity[row]) if similarity is not None else None
+                    ),
+                )
+                for row, score in best
+            ]
+
+
+_indexes: Dict[str, LocalKnowledgeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_local_knowledge_index(
+    source_dir: Path,
+    index_root: Path,
+    model: str,
+    embedder: Optional[Embedder] = None,
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+) -> LocalKnowledgeIndex:
+    """Return the process-wide index for ``source_dir``, creating it once."""
+    source_dir = Path(source_dir).resolve()
+    key = str(source_dir)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+            index = LocalKnowledgeIndex(
+                source_dir,
+                Path(index_root) / f"{source_dir.name}-{digest}",
+                model=model,
+                embedder=embedder,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+            )
+            _indexes[key] = index
+        return index
@@ -7,7 +7,9 @@ import time
 import logging
 from typing import Optional, Dict, Any
 
-import aiohttp
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -122,17 +124,16 @@ class PerplexityResearchTool:
         }
 
         start = time.time()
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout,
-                ssl=False,
-            ) as resp:
-                data = await resp.json()
-                if resp.status != 200:
-                    raise Exception(f"API error {resp.status}: {data}")
+        client = http_client_registry.get_client(self.base_url, verify=False)
+        resp = await client.post(
+            self.base_url,
+            json=payload,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        data = resp.json()
+        if resp.status_code != 200:
+            raise Exception(f"API error {resp.status_code}: {data}")
 
         duration_ms = int((time.time() - start) * 1000)
         logger.debug("Perplexity search completed in %sms", duration_ms)
@@ -1,11 +1,21 @@
 """RAG (Retrieval-Augmented Generation) tool implementation."""
 
+import asyncio
 import logging
 import time
-from typing import Dict, Any, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+from ..cache.embedding_cache import get_embedding_cache
+from ..cache.tool_result_cache import get_tool_result_cache, rag_cache_tag
+from ..database.supabase_io import supabase_io
 from ..database.supabase_tracker import SupabaseTracker
+from .context_assembler import ContextDocument, assemble_context
+from .document_chunker import DocumentChunk, chunk_markdown
+from .local_vector_index import LocalKnowledgeIndex, get_local_knowledge_index
+from .tool_names import ToolNames
 from core.infrastructure.config.settings import get_settings
 
 try:  # Optional dependency for embeddings
@@ -15,6 +25,17 @@ except Exception:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 1536
+# Inputs per embeddings request (the API accepts up to 2048)
+EMBEDDING_BATCH_SIZE = 100
+
+# Tracking calls made by the tool call in progress, so cached results can
+# replay them for later runs
+_tracking_events: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar(
+    "rag_tracking_events", default=None
+)
+
 
 class RAGTool:
     """RAG tool for retrieving and processing knowledge base content using Supabase."""
@@ -22,8 +43,18 @@ class RAGTool:
     def __init__(
         self, tracker: Optional[SupabaseTracker] = None, run_id: Optional[str] = None
     ):
-        self.tracker = tracker
-        self.run_id = run_id
+        # Run binding and document selection are per run: they live in a context
+        # variable so one shared instance can serve concurrent requests
+        self._run_defaults: Dict[str, Any] = {
+            "tracker": tracker,
+            "run_id": run_id,
+            "selected_document_ids": None,
+            "context_query": None,
+            "context_token_budget": None,
+        }
+        self._run_state: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+            f"rag_run_state_{id(self)}", default=None
+        )
         if tracker:
             self.supabase = tracker.client
         else:
@@ -34,9 +65,6 @@ class RAGTool:
         self.rag_base_dir = Path(settings.knowledge_base_dir)
         self.use_filesystem_fallback = self.supabase is None
 
-        # Optional selection of documents (ids) to restrict retrieval during a run
-        self.selected_document_ids: Optional[set[str]] = None
-
     def _init_supabase_client(self):
         """Create a Supabase client if configuration is available."""
         try:
@@ -48,22 +76,170 @@ class RAGTool:
             logger.warning(f"Supabase client not initialized: {e}")
         return None
 
+    def _run_value(self, key: str) -> Any:
+        state = self._run_state.get()
+        if state is not None and key in state:
+            return state[key]
+        return self._run_defaults[key]
+
+    def _set_run_values(self, **values: Any) -> None:
+        # Copy on write: child tasks share the parent's dict until they set
+        self._run_state.set({**(self._run_state.get() or {}), **values})
+
+    @property
+    def tracker(self) -> Optional[SupabaseTracker]:
+        return self._run_value("tracker")
+
+    @property
+    def run_id(self) -> Optional[str]:
+        return self._run_value("run_id")
+
+    @property
+    def selected_document_ids(self) -> Optional[set[str]]:
+        """Optional selection of documents (ids) to restrict retrieval during a run."""
+        return self._run_value("selected_document_ids")
+
     def set_run(self, run_id: str, tracker: SupabaseTracker) -> None:
-        self.run_id = run_id
-        self.tracker = tracker
+        """Bind the current run (and its tasks) to a tracking run id."""
+        self._set_run_values(run_id=run_id, tracker=tracker)
         self.supabase = tracker.client
 
     def set_selected_documents(self, ids: Optional[list[str]]) -> None:
         """Restrict retrieval to a set of document IDs (strings). Pass None to clear."""
         if ids:
-            self.selected_document_ids = set(ids)
+            self._set_run_values(selected_document_ids=set(ids))
             logger.info(
                 f"📌 RAG: Selection filter active for {len(self.selected_document_ids)} document(s)"
             )
         else:
-            self.selected_document_ids = None
+            self._set_run_values(selected_document_ids=None)
             logger.info("📌 RAG: Selection filter cleared (all documents allowed)")
 
+    def set_context_request(
+        self, query: Optional[str], token_budget: Optional[int] = None
+    ) -> None:
+        """Describe the current task so client content is packed for it.
+
+        Args:
+            query: Task text used to rank knowledge base passages
+            token_budget: Token cap for ``get_client_content`` (None uses
+                RAG_CONTEXT_TOKEN_BUDGET, 0 disables the cap)
+        """
+        self._set_run_values(context_query=query, context_token_budget=token_budget)
+
+    def _context_token_budget(self) -> int:
+        budget = self._run_value("context_token_budget")
+        if budget is None:
+            budget = get_settings().rag_context_token_budget
+        return budget
+
+    def cache_scope(self, tool_name: Optional[str] = None) -> Optional[Any]:
+        """Return the state that tool results depend on (for caching)."""
+        scope: Dict[str, Any] = {}
+        if self.selected_document_ids:
+            scope["documents"] = sorted(self.selected_document_ids)
+        if tool_name in (None, ToolNames.RAG_GET_CLIENT_CONTENT):
+            # Budgeted client content is packed for the task at hand
+            budget = self._context_token_budget()
+            if budget > 0:
+                scope["context"] = [budget, self._run_value("context_query")]
+        if not scope:
+            return None
+        # Keep the historical key shape when only a document filter is active
+        return scope["documents"] if list(scope) == ["documents"] else scope
+
+    def cache_tag(self, tool_name: str, tool_input: str) -> Optional[str]:
+        """Return the invalidation tag of a cached tool result (its client)."""
+        parts = [part.strip() for part in tool_input.split(",", 1)]
+        if tool_name == ToolNames.RAG_SEARCH_CONTENT and len(parts) == 1:
+            # The executor searches siebert when only a query is given
+            return rag_cache_tag("siebert")
+        return rag_cache_tag(parts[0]) if parts[0] else None
+
+    def invalidate_cached_results(self, client_name: str) -> None:
+        """Drop cached RAG results for a client after its content changed."""
+        cache = get_tool_result_cache()
+        if cache is not None:
+            cache.invalidate(rag_cache_tag(client_name))
+
+    @contextmanager
+    def record_tracking(self) -> Iterator[List[Dict[str, Any]]]:
+        """Collect the run-tracking calls made inside the block."""
+        events: List[Dict[str, Any]] = []
+        token = _tracking_events.set(events)
+        try:
+            yield events
+        finally:
+            _tracking_events.reset(token)
+
+    def replay_tracking(
+        self, events: List[Dict[str, Any]], agent_name: Optional[str] = None
+    ) -> None:
+        """Log recorded tracking calls against the current run."""
+        for event in events:
+            if event.get("kind") == "document":
+                self._track_document(
+                    event["client_name"],
+                    event["document_path"],
+                    agent_name=agent_name,
+                    status=event.get("status"),
+                )
+            elif event.get("kind") == "chunk":
+                self._track_chunk(
+                    agent_name,
+                    event["document_id"],
+                    event["chunk_text"],
+                    event.get("score"),
+                )
+
+    def _track_document(
+        self,
+        client_name: str,
+        document_path: str,
+        agent_name: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> None:
+        events = _tracking_events.get()
+        if events is not None:
+            events.append(
+                {
+                    "kind": "document",
+                    "client_name": client_name,
+                    "document_path": document_path,
+                    "status": status,
+                }
+            )
+        if self.tracker and self.run_id:
+            self.tracker.log_rag_document(
+                self.run_id,
+                client_name,
+                document_path,
+                agent_name=agent_name,
+                status=status,
+            )
+
+    def _track_chunk(
+        self,
+        agent_name: Optional[str],
+        document_id: Optional[str],
+        chunk_text: str,
+        score: Optional[float] = None,
+    ) -> None:
+        events = _tracking_events.get()
+        if events is not None:
+            events.append(
+                {
+                    "kind": "chunk",
+                    "document_id": document_id,
+                    "chunk_text": chunk_text,
+                    "score": score,
+                }
+            )
+        if self.tracker and self.run_id:
+            self.tracker.log_rag_chunk(
+                self.run_id, agent_name or "", document_id, chunk_text, score
+            )
+
     async def get_client_content(
         self,
         client_name: str,
@@ -98,12 +274,11 @@ class RAGTool:
             )
 
         try:
-            client_res = (
+            client_res = await supabase_io.execute(
                 self.supabase.table("clients")
                 .select("id")
                 .eq("name", client_name)
                 .single()
-                .execute()
             )
             client_data = client_res.data
             if not client_data:
@@ -153,25 +328,22 @@ class RAGTool:
             return "Supabase client not configured"
 
         try:
-            doc_res = (
+            doc_res = await supabase_io.execute(
                 self.supabase.table("documents")
                 .select("id,title,content,file_path")
                 .eq("client_id", client_id)
                 .eq("title", document_name)
                 .single()
-                .execute()
             )
             doc = doc_res.data
             if not doc:
                 return f"Document '{document_name}' not found"
 
-            if self.tracker and self.run_id:
-                self.tracker.log_rag_document(
-                    self.run_id,
-                    client_name,
-                    doc.get("file_path") or doc.get("title"),
-                    agent_name=agent_name,
-                )
+            self._track_document(
+                client_name,
+                doc.get("file_path") or doc.get("title"),
+                agent_name=agent_name,
+            )
             return doc.get("content", "")
         except Exception as e:  # pragma: no cover
             logger.error(f"Error retrieving document {document_name}: {e}")
@@ -197,7 +369,7 @@ class RAGTool:
                     f"📌 RAG: Applying selection filter to documents (ids={ids_list})"
                 )
                 query = query.in_("id", ids_list)
-            docs_res = query.execute()
+            docs_res = await supabase_io.execute(query)
             docs = docs_res.data or []
             logger.info(
                 f"📚 RAG: Retrieved {len(docs)} document(s) for client '{client_name}'"
@@ -206,99 +378,52 @@ class RAGTool:
             logger.error(f"Error retrieving documents for {client_name}: {e}")
             return f"Error retrieving documents: {e}"
 
-        if self.tracker and self.run_id:
-            for doc in docs:
-                self.tracker.log_rag_document(
-                    self.run_id,
-                    client_name,
-                    doc.get("file_path") or doc.get("title"),
-                    agent_name=agent_name,
-                )
-
-        company_info: List[tuple[str, str]] = []
-        guidelines: List[tuple[str, str]] = []
-        knowledge_base: List[tuple[str, str]] = []
-        other_docs: List[tuple[str, str]] = []
-
-        for doc in docs:
-            doc_name = str(doc.get("title", "")).lower()
-            content = doc.get("content", "")
-
-            if any(
-                term in doc_name
-                for term in ["company", "about", "profile", "overview", "brand"]
-            ):
-                company_info.append((doc_name, content))
-            elif any(
-                term in doc_name
-                for term in [
-                    "guideline",
-                    "guide",
-                    "best_practice",
-                    "best-practice",
-                    "rule",
-                    "instruction",
-                    "style",
-                ]
-            ):
-                guidelines.append((doc_name, content))
-            elif any(
-                term in doc_name
-                for term in ["knowledge", "kb", "reference", "detail", "info"]
-            ):
-                knowledge_base.append((doc_name, content))
-            else:
-                other_docs.append((doc_name, content))
-
-        formatted_output: List[str] = []
-
-        if company_info:
-            formatted_output.append(
-                """## COMPANY INFORMATION
-
-The following documents contain essential information about the company, its brand, and positioning.
-This information should be reflected in all content creation.
-"""
-            )
-            for doc_name, content in company_info:
-                formatted_output.append(f"### {doc_name}\n\n{content}\n\n")
-
-        if guidelines:
-            formatted_output.append(
-                """\n## CONTENT GUIDELINES
-
-The following documents contain guidelines and best practices for content creation.
-These should be strictly followed when generating content.
-"""
+        documents = [
+            ContextDocument(
+                name=str(doc.get("title", "")).lower(),
+                content=doc.get("content", ""),
+                source=doc.get("file_path") or doc.get("title") or "",
             )
-            for doc_name, content in guidelines:
-                formatted_output.append(f"### {doc_name}\n\n{content}\n\n")
-
-        if knowledge_base:
-            formatted_output.append(
-                """\n## KNOWLEDGE BASE
+            for doc in docs
+        ]
+        if not documents:
+            return f"No documents found for client '{client_name}'"
+        return await self._assemble_client_content(client_name, documents, agent_name)
 
-The following documents contain detailed knowledge that can be referenced and incorporated into content.
-Use this information as needed to enhance content accuracy and depth.
-"""
+    async def _assemble_client_content(
+        self,
+        client_name: str,
+        documents: List[ContextDocument],
+        agent_name: Optional[str] = None,
+    ) -> str:
+        """Pack documents into the task's token budget and log what was used."""
+        settings = get_settings()
+        budget = self._context_token_budget()
+        context = await asyncio.to_thread(
+            assemble_context,
+            documents,
+            budget,
+            self._run_value("context_query"),
+            min(settings.rag_chunk_size, 400),
+        )
+        budgeted = bool(context.truncated or context.dropped)
+        if budgeted or context.duplicate_paragraphs:
+            logger.info(
+                f"✂️ RAG CONTEXT: {context.tokens}/{budget} tokens "
+                f"for {client_name} - "
+                f"{len(context.included)} full, {len(context.truncated)} excerpted, "
+                f"{len(context.dropped)} dropped, "
+                f"{context.duplicate_paragraphs} duplicate paragraph(s) removed"
             )
-            for doc_name, content in knowledge_base:
-                formatted_output.append(f"### {doc_name}\n\n{content}\n\n")
-
-        if other_docs:
-            formatted_output.append(
-                """\n## OTHER DOCUMENTS
-
-The following documents contain additional information that may be relevant to content creation.
-"""
+        for doc in documents:
+            self._track_document(
+                client_name,
+                doc.source,
+                agent_name=agent_name,
+                # Only budgeted retrievals carry a status; the rest are all included
+                status=context.status_of(doc.name) if budgeted else None,
             )
-            for doc_name, content in other_docs:
-                formatted_output.append(f"### {doc_name}\n\n{content}\n\n")
-
-        if not formatted_output:
-            return f"No documents found for client '{client_name}'"
-
-        return "\n\n".join(formatted_output)
+        return context.text
 
     async def get_available_documents(self, client_name: str) -> List[str]:
         """
@@ -314,22 +439,20 @@ The following documents contain additional information that may be relevant to c
             return []
 
         try:
-            client_res = (
+            client_res = await supabase_io.execute(
                 self.supabase.table("clients")
                 .select("id")
                 .eq("name", client_name)
                 .single()
-                .execute()
             )
             client_data = client_res.data
             if not client_data:
                 return []
 
-            docs_res = (
+            docs_res = await supabase_io.execute(
                 self.supabase.table("documents")
                 .select("title")
                 .eq("client_id", client_data["id"])
-                .execute()
             )
             docs = docs_res.data or []
             return [d["title"] for d in docs]
@@ -359,18 +482,30 @@ The following documents contain additional information that may be relevant to c
             return "Client name and search query are required"
 
         if self.supabase is None:
+            if self.use_filesystem_fallback:
+                return await self._search_filesystem(
+                    client_name, query, max_results, agent_name
+                )
             return "Supabase client not configured"
 
         try:
-            embedding = self._embed_text(query)
-            response = self.supabase.rpc(
-                "match_documents",
-                {
-                    "query_embedding": embedding,
-                    "match_count": max_results,
-                    "client_name": client_name,
-                },
-            ).execute()
+            embedding = await supabase_io.run(self._embed_text, query)
+            chunk_results = await self._search_document_chunks(
+                client_name, query, embedding, max_results, agent_name
+            )
+            if chunk_results:
+                return chunk_results
+
+            response = await supabase_io.execute(
+                self.supabase.rpc(
+                    "match_documents",
+                    {
+                        "query_embedding": embedding,
+                        "match_count": max_results,
+                        "client_name": client_name,
+                    },
+                )
+            )
             matches = response.data or []
             # Apply selection filter if active
             if self.selected_document_ids:
@@ -392,20 +527,10 @@ The following documents contain additional information that may be relevant to c
                 title = match.get("title") or match.get("file_path") or "document"
                 content = match.get("content", "")
                 formatted_results.append(f"## {title}\n\n{content}\n")
-                if self.tracker and self.run_id:
-                    self.tracker.log_rag_document(
-                        self.run_id,
-                        client_name,
-                        title,
-                        agent_name=agent_name,
-                    )
-                    self.tracker.log_rag_chunk(
-                        self.run_id,
-                        agent_name or "",
-                        match.get("id"),
-                        content,
-                        match.get("similarity"),
-                    )
+                self._track_document(client_name, title, agent_name=agent_name)
+                self._track_chunk(
+                    agent_name, match.get("id"), content, match.get("similarity")
+                )
             return "\n".join(formatted_results)
         except Exception as e:  # pragma: no cover
             logger.warning(
@@ -415,6 +540,58 @@ The following documents contain additional information that may be relevant to c
                 client_name, query, max_results, agent_name
             )
 
+    async def _search_document_chunks(
+        self,
+        client_name: str,
+        query: str,
+        embedding: List[float],
+        max_results: int,
+        agent_name: Optional[str] = None,
+    ) -> Optional[str]:
+        """Top-k chunk search via the `match_document_chunks` RPC.
+
+        Returns None when the RPC is unavailable or finds nothing, so callers
+        can fall back to whole-document search.
+        """
+        params: Dict[str, Any] = {
+            "query_embedding": embedding,
+            "match_count": max_results,
+            "client_name": client_name,
+        }
+        if self.selected_document_ids:
+            params["document_ids"] = sorted(self.selected_document_ids)
+        try:
+            response = await supabase_io.execute(
+                self.supabase.rpc("match_document_chunks", params)
+            )
+        except Exception as e:
+            logger.debug(f"RAG: chunk search unavailable ({e})")
+            return None
+
+        matches = response.data or []
+        if not matches:
+            return None
+
+        formatted_results = [f"# Search Results for '{query}'\n"]
+        logged_documents = set()
+        for match in matches:
+            title = match.get("title") or match.get("file_path") or "document"
+            heading = match.get("heading")
+            content = match.get("content", "")
+            label = f"{title} — {heading}" if heading else title
+            formatted_results.append(f"## {label}\n\n{content}\n")
+            if title not in logged_documents:
+                logged_documents.add(title)
+                self._track_document(client_name, title, agent_name=agent_name)
+            self._track_chunk(
+                agent_name, match.get("document_id"), content, match.get("similarity")
+            )
+        documents = {match.get("document_id") for match in matches}
+        logger.info(
+            f"🧩 RAG: {len(matches)} chunk(s) from {len(documents)} document(s) for '{query}'"
+        )
+        return "\n".join(formatted_results)
+
     async def _fallback_keyword_search_supabase(
         self,
         client_name: str,
@@ -431,12 +608,11 @@ The following documents contain additional information that may be relevant to c
 
         try:
             # Resolve client_id
-            client_res = (
+            client_res = await supabase_io.execute(
                 self.supabase.table("clients")
                 .select("id")
                 .eq("name", client_name)
                 .single()
-                .execute()
             )
             client_data = client_res.data
             if not client_data:
@@ -453,10 +629,8 @@ The following documents contain additional information that may be relevant to c
                 query_builder = query_builder.in_(
                     "id", list(self.selected_document_ids)
                 )
-            docs_res = (
-                query_builder.ilike("content", f"%{query}%")
-                .limit(max_results)
-                .execute()
+            docs_res = await supabase_io.execute(
+                query_builder.ilike("content", f"%{query}%").limit(max_results)
             )
             matches = docs_res.data or []
 
@@ -471,10 +645,8 @@ The following documents contain additional information that may be relevant to c
                     query_builder = query_builder.in_(
                         "id", list(self.selected_document_ids)
                     )
-                docs_res2 = (
-                    query_builder.ilike("title", f"%{query}%")
-                    .limit(max_results)
-                    .execute()
+                docs_res2 = await supabase_io.execute(
+                    query_builder.ilike("title", f"%{query}%").limit(max_results)
                 )
                 matches = docs_res2.data or []
 
@@ -489,13 +661,8 @@ The following documents contain additional information that may be relevant to c
                 title = match.get("title") or match.get("file_path") or "document"
                 content = match.get("content", "")
                 formatted_results.append(f"## {title}\n\n{content}\n")
-                if self.tracker and self.run_id:
-                    self.tracker.log_rag_document(
-                        self.run_id, client_name, title, agent_name=agent_name
-                    )
-                    self.tracker.log_rag_chunk(
-                        self.run_id, agent_name or "", match.get("id"), content, None
-                    )
+                self._track_document(client_name, title, agent_name=agent_name)
+                self._track_chunk(agent_name, match.get("id"), content)
 
             logger.info(
                 "RAG: Used keyword fallback for search (RPC `match_documents` unavailable or empty)"
@@ -505,18 +672,122 @@ The following documents contain additional information that may be relevant to c
             logger.warning(f"Keyword fallback search failed: {e}")
             return f"Error searching documents (fallback): {e}"
 
+    def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts with batched OpenAI requests (raises on failure).
+
+        Vectors already in the embedding cache are reused; only the misses,
+        deduplicated, are sent to the API and then cached.
+        """
+        cache = get_embedding_cache()
+        vectors: List[Optional[List[float]]] = (
+            cache.get_many(EMBEDDING_MODEL, texts) if cache else [None] * len(texts)
+        )
+        pending = list(
+            dict.fromkeys(t for t, vector in zip(texts, vectors) if vector is None)
+        )
+        if cache and len(pending) < len(texts):
+            logger.info(
+                f"♻️ Embedding cache: {len(texts) - len(pending)}/{len(texts)} "
+                f"texts served from cache"
+            )
+        if pending:
+            if openai is None:  # pragma: no cover - optional dependency
+                raise RuntimeError("openai package not installed")
+            embedded: Dict[str, List[float]] = {}
+            for start in range(0, len(pending), EMBEDDING_BATCH_SIZE):
+                batch = pending[start : start + EMBEDDING_BATCH_SIZE]
+                response = openai.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+                ordered = sorted(response.data, key=lambda item: item.index)
+                embedded.update(zip(batch, (item.embedding for item in ordered)))
+                if cache:
+                    cache.set_many(EMBEDDING_MODEL, batch, [embedded[t] for t in batch])
+            vectors = [
+                vector if vector is not None else embedded[text]
+                for text, vector in zip(texts, vectors)
+            ]
+        return vectors  # type: ignore[return-value]
+
     def _embed_text(self, text: str) -> List[float]:
-        """Generate embedding for given text using OpenAI if available."""
-        if openai is None:  # pragma: no cover - optional dependency
-            return [0.0] * 1536
+        """Generate embedding for given text (cached) using OpenAI if available."""
         try:
-            response = openai.Embeddings.create(
-                model="text-embedding-3-small", input=text
-            )
-            return response.data[0].embedding  # type: ignore
+            return self._embed_texts([text])[0]
         except Exception as e:  # pragma: no cover
             logger.warning(f"Embedding generation failed: {e}")
-            return [0.0] * 1536
+            return [0.0] * EMBEDDING_DIMENSIONS
+
+    def chunk_and_embed(
+        self, content: str
+    ) -> Tuple[List[DocumentChunk], Optional[List[List[float]]]]:
+        """Split a document into chunks and embed them in batches.
+
+        Returns:
+            ``(chunks, vectors)``; ``vectors`` is None when embedding failed so
+            chunks can be stored without embeddings and backfilled later.
+        """
+        settings = get_settings()
+        chunks = chunk_markdown(
+            content,
+            max_tokens=settings.rag_chunk_size,
+            overlap_tokens=settings.rag_chunk_overlap,
+        )
+        if not chunks:
+            return chunks, None
+        try:
+            vectors = self._embed_texts([chunk.embedding_text for chunk in chunks])
+        except Exception as e:
+            logger.warning(f"Chunk embedding failed ({len(chunks)} chunks): {e}")
+            return chunks, None
+        return chunks, vectors
+
+    @staticmethod
+    def document_vector(
+        vectors: Optional[List[List[float]]],
+    ) -> Optional[List[float]]:
+        """Unit-normalized mean of chunk vectors, used as the document embedding."""
+        if not vectors:
+            return None
+        mean = [sum(column) / len(vectors) for column in zip(*vectors)]
+        norm = sum(value * value for value in mean) ** 0.5
+        return [value / norm for value in mean] if norm else None
+
+    def store_document_chunks(
+        self,
+        document_id: str,
+        chunks: List[DocumentChunk],
+        vectors: Optional[List[List[float]]],
+    ) -> int:
+        """Atomically replace a document's rows in `document_chunks`.
+
+        The `replace_document_chunks` RPC deletes the old chunks and inserts the
+        new ones in one transaction, so a failed write keeps the previous chunks.
+        """
+        if self.supabase is None:
+            raise ValueError("Supabase client not configured")
+        rows = [
+            {
+                "chunk_index": chunk.index,
+                "heading": chunk.heading or None,
+                "content": chunk.content,
+                "token_count": chunk.token_count,
+                "embedding": vectors[position] if vectors else None,
+            }
+            for position, chunk in enumerate(chunks)
+        ]
+        self.supabase.rpc(
+            "replace_document_chunks", {"document_id": document_id, "rows": rows}
+        ).execute()
+        return len(rows)
+
+    def index_document(self, document_id: str, content: str) -> int:
+        """Chunk, embed and store a document's chunks; refresh its embedding."""
+        chunks, vectors = self.chunk_and_embed(content)
+        stored = self.store_document_chunks(document_id, chunks, vectors)
+        document_vector = self.document_vector(vectors)
+        if document_vector is not None:
+            self.supabase.table("documents").update({"embedding": document_vector}).eq(
+                "id", document_id
+            ).execute()
+        return stored
 
     def upload_document(self, client_name: str, path: str, content: str) -> str:
         """Upload a document to Supabase Storage and index it.
@@ -551,35 +822,44 @@ The following documents contain additional information that may be relevant to c
             raise ValueError(f"Client '{client_name}' not found")
         client_id = client_data["id"]
 
-        # 3) Insert document record (try with embedding, then fallback without)
-        embedding = self._embed_text(content)
+        # 3) Chunk and embed; the document embedding is the mean of its chunks
+        chunks, vectors = self.chunk_and_embed(content)
+        document_vector = self.document_vector(vectors)
+
+        # 4) Insert document record (try with embedding, then fallback without)
+        record = {
+            "client_id": client_id,
+            "title": path,
+            "content": content,
+            "file_path": storage_path,
+            "metadata": {"client_name": client_name},
+        }
+        document_id = None
         try:
-            self.supabase.table("documents").insert(
-                {
-                    "client_id": client_id,
-                    "title": path,
-                    "content": content,
-                    "file_path": storage_path,
-                    "metadata": {"client_name": client_name},
-                    "embedding": embedding,
-                }
-            ).execute()
+            inserted = (
+                self.supabase.table("documents")
+                .insert({**record, "embedding": document_vector})
+                .execute()
+            )
+            document_id = (inserted.data or [{}])[0].get("id")
         except Exception as e1:  # pragma: no cover
             logger.warning(f"Error inserting document record (with embedding): {e1}")
             try:
-                self.supabase.table("documents").insert(
-                    {
-                        "client_id": client_id,
-                        "title": path,
-                        "content": content,
-                        "file_path": storage_path,
-                        "metadata": {"client_name": client_name},
-                    }
-                ).execute()
+                inserted = self.supabase.table("documents").insert(record).execute()
+                document_id = (inserted.data or [{}])[0].get("id")
                 logger.info("Inserted document record without embedding (fallback)")
             except Exception as e2:  # pragma: no cover
                 logger.warning(f"Error inserting document record (fallback): {e2}")
 
+        # 5) Store chunks for per-chunk retrieval
+        if document_id:
+            try:
+                stored = self.store_document_chunks(document_id, chunks, vectors)
+                logger.info(f"🧩 Indexed {stored} chunk(s) for {storage_path}")
+            except Exception as e:  # pragma: no cover
+                logger.warning(f"Error storing document chunks for {storage_path}: {e}")
+
+        self.invalidate_cached_results(client_name)
         return storage_path
 
     def download_document(self, client_name: str, path: str) -> Optional[str]:
@@ -620,7 +900,9 @@ The following documents contain additional information that may be relevant to c
             document_name = f"{document_name}.md"
 
         try:
-            self.upload_document(client_name, document_name, content)
+            await supabase_io.run(
+                self.upload_document, client_name, document_name, content
+            )
             return f"Successfully added content to {document_name} for client {client_name}"
         except Exception as e:
             logger.error(f"Error adding content to Supabase: {e}")
@@ -635,22 +917,11 @@ The following documents contain additional information that may be relevant to c
         agent_name: Optional[str] = None,
     ) -> str:
         """Fallback method to get content from filesystem when Supabase is not available."""
-        client_dir = self.rag_base_dir / client_name
-
-        if not client_dir.exists():
-            # Fallback: allow knowledge bases stored inside profile directories
-            settings = get_settings()
-            profiles_dir = Path(settings.profiles_dir) / client_name / "knowledge_base"
-            if profiles_dir.exists():
-                logger.info(
-                    "📂 RAG FILESYSTEM: Using profile-scoped knowledge base for %s",
-                    client_name,
-                )
-                client_dir = profiles_dir
-            else:
-                error_msg = f"Knowledge base not found for client '{client_name}'"
-                logger.warning(f"⚠️ RAG WARNING: {error_msg}")
-                return error_msg
+        client_dir = self._resolve_client_dir(client_name)
+        if client_dir is None:
+            error_msg = f"Knowledge base not found for client '{client_name}'"
+            logger.warning(f"⚠️ RAG WARNING: {error_msg}")
+            return error_msg
 
         try:
             if document_name:
@@ -672,15 +943,9 @@ The following documents contain additional information that may be relevant to c
                 logger.info(
                     f"📚 RAG FILESYSTEM: Found {len(available_docs)} documents: {available_docs}"
                 )
-                result = await self._get_all_client_content_filesystem(
+                return await self._get_all_client_content_filesystem(
                     client_dir, client_name, agent_name
                 )
-                if self.tracker and self.run_id:
-                    for doc in available_docs:
-                        self.tracker.log_rag_document(
-                            self.run_id, client_name, doc, agent_name=agent_name
-                        )
-                return result
 
         except Exception as e:
             logger.error(
@@ -688,6 +953,85 @@ The following documents contain additional information that may be relevant to c
             )
             return f"Error retrieving content: {str(e)}"
 
+    def _resolve_client_dir(self, client_name: str) -> Optional[Path]:
+        """Locate a client's knowledge base directory on disk."""
+        client_dir = self.rag_base_dir / client_name
+        if client_dir.exists():
+            return client_dir
+        # Fallback: allow knowledge bases stored inside profile directories
+        settings = get_settings()
+        profiles_dir = Path(settings.profiles_dir) / client_name / "knowledge_base"
+        if profiles_dir.exists():
+            logger.info(
+                "📂 RAG FILESYSTEM: Using profile-scoped knowledge base for %s",
+                client_name,
+            )
+            return profiles_dir
+        return None
+
+    def _local_index(self, client_dir: Path) -> LocalKnowledgeIndex:
+        """Local chunk/BM25/vector index over a filesystem knowledge base."""
+        settings = get_settings()
+        # Without OpenAI the index still answers with BM25 alone
+        embedder = (
+            self._embed_texts
+            if openai is not None and settings.openai_api_key
+            else None
+        )
+        return get_local_knowledge_index(
+            client_dir,
+            Path(settings.cache_dir) / "rag_index",
+            model=EMBEDDING_MODEL,
+            embedder=embedder,
+            chunk_size=settings.rag_chunk_size,
+            chunk_overlap=settings.rag_chunk_overlap,
+        )
+
+    async def _search_filesystem(
+        self,
+        client_name: str,
+        query: str,
+        max_results: int,
+        agent_name: Optional[str] = None,
+    ) -> str:
+        """Top-k chunk search over the local knowledge base (BM25 + cosine)."""
+        client_dir = self._resolve_client_dir(client_name)
+        if client_dir is None:
+            return f"Knowledge base not found for client '{client_name}'"
+
+        try:
+            index = self._local_index(client_dir)
+            await asyncio.to_thread(index.refresh)
+            query_vector = None
+            if index.has_vectors and index.embedder is not None:
+                try:
+                    query_vector = (
+                        await asyncio.to_thread(self._embed_texts, [query])
+                    )[0]
+                except Exception as e:
+                    logger.warning(f"⚠️ Query embedding failed, BM25 only: {e}")
+            hits = await asyncio.to_thread(
+                index.search, query, max_results, query_vector
+            )
+        except Exception as e:
+            logger.error(f"❌ RAG FILESYSTEM ERROR: Local search failed: {e}")
+            return f"Error searching documents: {e}"
+
+        if not hits:
+            return f"No results found for '{query}' in {client_name}'s knowledge base"
+
+        formatted_results = [f"# Search Results for '{query}'\n"]
+        for hit in hits:
+            label = f"{hit.path} — {hit.heading}" if hit.heading else hit.path
+            formatted_results.append(f"## {label}\n\n{hit.content}\n")
+        for path in dict.fromkeys(hit.path for hit in hits):
+            self._track_document(client_name, path, agent_name=agent_name)
+        logger.info(
+            f"🧩 RAG FILESYSTEM: {len(hits)} chunk(s) from "
+            f"{len({hit.path for hit in hits})} document(s) for '{query}'"
+        )
+        return "\n".join(formatted_results)
+
     async def _get_specific_document_filesystem(
         self, client_dir: Path, document_name: str, agent_name: Optional[str] = None
     ) -> str:
@@ -731,10 +1075,7 @@ The following documents contain additional information that may be relevant to c
         try:
             with open(str(doc_path), "r", encoding="utf-8") as f:
                 content = f.read()
-            if self.tracker and self.run_id:
-                self.tracker.log_rag_document(
-                    self.run_id, client_dir.name, doc_path.name, agent_name=agent_name
-                )
+            self._track_document(client_dir.name, doc_path.name, agent_name=agent_name)
             return content
         except Exception as e:
             logger.error(f"Error reading document {doc_path}: {str(e)}")
@@ -744,100 +1085,21 @@ The following documents contain additional information that may be relevant to c
         self, client_dir: Path, client_name: str, agent_name: Optional[str] = None
     ) -> str:
         """Retrieve and categorize all content for a client from filesystem."""
-        # Categorize documents by type
-        company_info = []
-        guidelines = []
-        knowledge_base = []
-        other_docs = []
-
-        for doc_path in client_dir.rglob("*.md"):
+        documents: List[ContextDocument] = []
+        for doc_path in sorted(client_dir.rglob("*.md")):
             if not doc_path.is_file():
                 continue
-
-            doc_name = str(doc_path.relative_to(client_dir)).lower()
-
+            relative = str(doc_path.relative_to(client_dir))
             try:
                 with open(str(doc_path), "r", encoding="utf-8") as f:
                     content = f.read()
-
-                # Categorize based on filename patterns
-                if any(
-                    term in doc_name
-                    for term in ["company", "about", "profile", "overview", "brand"]
-                ):
-                    company_info.append((doc_name, content))
-                elif any(
-                    term in doc_name
-                    for term in [
-                        "guideline",
-                        "guide",
-                        "best_practice",
-                        "best-practice",
-                        "rule",
-                        "instruction",
-                        "style",
-                    ]
-                ):
-                    guidelines.append((doc_name, content))
-                elif any(
-                    term in doc_name
-                    for term in ["knowledge", "kb", "reference", "detail", "info"]
-                ):
-                    knowledge_base.append((doc_name, content))
-                else:
-                    other_docs.append((doc_name, content))
-
             except Exception as e:
                 logger.warning(f"Error reading {doc_path}: {str(e)}")
                 continue
-
-        # Format output
-        formatted_output = []
-
-        if company_info:
-            formatted_output.append(
-                """## COMPANY INFORMATION
-
-The following documents contain essential information about the company, its brand, and positioning.
-This information should be reflected in all content creation.
-"""
-            )
-            for doc_name, content in company_info:
-                formatted_output.append(f"### {doc_name}\\n\\n{content}\\n\\n")
-
-        if guidelines:
-            formatted_output.append(
-                """\\n## CONTENT GUIDELINES
-
-The following documents contain guidelines and best practices for content creation.
-These should be strictly followed when generating content.
-"""
+            documents.append(
+                ContextDocument(name=relative.lower(), content=content, source=relative)
             )
-            for doc_name, content in guidelines:
-                formatted_output.append(f"### {doc_name}\\n\\n{content}\\n\\n")
-
-        if knowledge_base:
-            formatted_output.append(
-                """\\n## KNOWLEDGE BASE
 
-The following documents contain detailed knowledge that can be referenced and incorporated into content.
-Use this information as needed to enhance content accuracy and depth.
-"""
-            )
-            for doc_name, content in knowledge_base:
-                formatted_output.append(f"### {doc_name}\\n\\n{content}\\n\\n")
-
-        if other_docs:
-            formatted_output.append(
-                """\\n## OTHER DOCUMENTS
-
-The following documents contain additional information that may be relevant to content creation.
-"""
-            )
-            for doc_name, content in other_docs:
-                formatted_output.append(f"### {doc_name}\\n\\n{content}\\n\\n")
-
-        if not formatted_output:
+        if not documents:
             return f"No markdown documents found for client '{client_name}'"
-
-        return "\\n\\n".join(formatted_output)
+        return await self._assemble_client_content(client_name, documents, agent_name)
@@ -2,16 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
 
-import requests
+import httpx
+
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _default_max_concurrency() -> int:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    return get_runtime_settings().serper_max_concurrency
+
+
+def _default_requests_per_second() -> float:
+    from core.infrastructure.config.settings import get_runtime_settings
+
+    return get_runtime_settings().serper_requests_per_second
+
+
+class RequestRateLimiter:
+    """Token bucket allowing ``rate`` requests per second on average.
+
+    Up to ``burst`` requests go through immediately; after that callers are
+    delayed so the long-run rate never exceeds ``rate``. Each caller reserves
+    its slot before sleeping, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class WebSearchTool:
     """Thin wrapper around the Serper search API."""
 
@@ -20,10 +62,21 @@ class WebSearchTool:
         api_key: Optional[str] = None,
         timeout: int = 30,
         cost_per_call_usd: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        requests_per_second: Optional[float] = None,
     ) -> None:
         self.api_key = api_key or os.getenv("SERPER_API_KEY")
         self.base_url = "https://google.serper.dev/search"
         self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency or _default_max_concurrency())
+        self._client = client
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        if requests_per_second is None:
+            requests_per_second = _default_requests_per_second()
+        self._rate_limiter = (
+            RequestRateLimiter(requests_per_second) if requests_per_second > 0 else None
+        )
         self.cost_per_call_usd, self.cost_source = self._resolve_cost(
             cost_per_call_usd, "SERPER_COST_PER_CALL_USD"
         )
@@ -81,8 +134,12 @@ class WebSearchTool:
             "Content-Type": "application/json",
         }
 
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+
+        client = self._client or http_client_registry.get_client(self.base_url)
         start = time.time()
-        response = requests.post(
+        response = await client.post(
             self.base_url, headers=headers, json=payload, timeout=self.timeout
         )
         data = response.json()
@@ -99,3 +156,37 @@ class WebSearchTool:
             "cost_per_call_usd": self.cost_per_call_usd,
             "cost_source": self.cost_source,
         }
+
+    async def search_many(
+        self,
+        queries: Sequence[str],
+        opts: Optional[Dict[str, Any]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run several searches concurrently.
+
+        At most ``max_concurrency`` searches are in flight at once (a
+        concurrency cap, not a rate limit); like every ``search`` call, they
+        also start no faster than ``requests_per_second`` allows.
+
+        Args:
+            queries: Search query strings.
+            opts: Optional dictionary merged into every request payload.
+            return_exceptions: Return failures in place instead of raising.
+
+        Returns:
+            One ``search`` result per query, in the order of ``queries``.
+        """
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        semaphore = self._semaphore
+
+        async def _limited(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search(query, opts)
+
+        return await asyncio.gather(
+            *(_limited(query) for query in queries),
+            return_exceptions=return_exceptions,
+        )
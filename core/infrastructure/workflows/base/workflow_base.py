@@ -2,6 +2,7 @@
 Base workflow handler for dynamic workflow execution.
 """
 
+import asyncio
 import json
 import logging
 import time
@@ -13,6 +14,7 @@ from ....domain.entities.task import Task, TaskStatus
 from ....domain.entities.workflow import Workflow
 from ...utils.template_utils import substitute_template
 from ...logging.workflow_reporter import workflow_reporter
+from ...orchestration.generation_events import STREAM_TOKENS_KEY, get_event_stream
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,10 @@ class WorkflowHandler(ABC):
     the specific business logic methods.
     """
 
+    # Upper bound on tasks executed concurrently; override per handler or via
+    # the ``max_parallel_tasks`` context variable
+    max_parallel_tasks: int = 4
+
     def __init__(self, workflow_type: str):
         self.workflow_type = workflow_type
         self.template = self.load_template()
@@ -116,10 +122,17 @@ class WorkflowHandler(ABC):
                     "cost_by_provider": workflow_metrics.cost_breakdown_by_provider,
                     "cost_by_agent": workflow_metrics.cost_breakdown_by_agent,
                     "cost_by_tool": workflow_metrics.cost_breakdown_by_tool,
+                    "tool_cache": {
+                        "hits": workflow_metrics.tool_cache_hits,
+                        "misses": workflow_metrics.tool_cache_misses,
+                        "cost_saved": workflow_metrics.cost_saved_by_tool_cache,
+                    },
                     "tool_usage": workflow_metrics.tool_usage_breakdown,
                     "llm_usage": workflow_metrics.llm_usage_breakdown,
                     "total_tool_calls": workflow_metrics.total_tool_calls,
                     "total_llm_calls": workflow_metrics.total_llm_calls,
+                    "llm_cache_hits": workflow_metrics.llm_cache_hits,
+                    "cost_saved_by_cache": workflow_metrics.cost_saved_by_cache,
                 }
 
             logger.info(f"🎉 Workflow execution completed: {self.workflow_type}")
@@ -224,32 +237,184 @@ class WorkflowHandler(ABC):
     async def execute_tasks(
         self, workflow: Workflow, context: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Execute all tasks in the workflow with dependency management."""
+        """
+        Execute workflow tasks as a dependency graph.
+
+        Every task whose dependencies are satisfied is launched immediately,
+        up to ``max_parallel_tasks`` at a time. Each task sees the shared
+        context plus the outputs of all of its (transitive) dependencies.
+        Dependencies on tasks that are not part of the workflow (for example
+        skipped tasks) are treated as already satisfied.
+        """
         execution_results = {}
-        task_outputs = {}
+        task_outputs: Dict[str, str] = {}
+
+        tasks_by_id = {task.id: task for task in workflow.tasks}
+        dependents, ancestors = self._build_task_graph(workflow.tasks)
+        remaining = {
+            task.id: {dep for dep in task.dependencies if dep in tasks_by_id}
+            for task in workflow.tasks
+        }
+        ready = [task.id for task in workflow.tasks if not remaining[task.id]]
+        max_parallel = max(
+            1, int(context.get("max_parallel_tasks") or self.max_parallel_tasks)
+        )
+        running: Dict[asyncio.Future, Task] = {}
+        started_at: Dict[Any, float] = {}
+
+        # Streamed runs push task progress and the final task's tokens
+        event_stream = get_event_stream(context)
+        stream_task_id = (
+            self.get_streaming_task_id(workflow, dependents) if event_stream else None
+        )
+
+        try:
+            while ready or running:
+                while ready and len(running) < max_parallel:
+                    task = tasks_by_id[ready.pop(0)]
+                    logger.info(f"🔄 Executing task: {task.name}")
+
+                    # Add dependency outputs to context
+                    enhanced_context = {
+                        **context,
+                        **{dep: task_outputs[dep] for dep in ancestors[task.id]},
+                    }
+                    if event_stream:
+                        enhanced_context[STREAM_TOKENS_KEY] = task.id == stream_task_id
+                        event_stream.emit(
+                            "task_started",
+                            {
+                                "task_id": task.id,
+                                "task_name": task.name,
+                                "agent": task.agent_name,
+                                "streaming": task.id == stream_task_id,
+                            },
+                        )
+                    started_at[task.id] = time.perf_counter()
+                    future = asyncio.ensure_future(
+                        self.execute_single_task(task, enhanced_context)
+                    )
+                    running[future] = task
 
-        for task in workflow.tasks:
-            logger.info(f"🔄 Executing task: {task.name}")
+                done, _ = await asyncio.wait(
+                    running.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
 
-            # Add previous task outputs to context
-            enhanced_context = {**context, **task_outputs}
+                # Handle completions in template order for deterministic context merges
+                for future in sorted(
+                    done, key=lambda f: workflow.tasks.index(running[f])
+                ):
+                    task = running.pop(future)
+                    try:
+                        task_output = future.result()
+                    except Exception as e:
+                        if event_stream:
+                            event_stream.emit(
+                                "task_failed",
+                                {
+                                    "task_id": task.id,
+                                    "task_name": task.name,
+                                    "error": str(e),
+                                },
+                            )
+                        raise
+
+                    # Store task output
+                    task_outputs[task.id] = task_output
+                    execution_results[f"{task.id}_output"] = task_output
+
+                    # Post-process task (can be overridden)
+                    enhanced_context = {
+                        **context,
+                        **{dep: task_outputs[dep] for dep in ancestors[task.id]},
+                    }
+                    enhanced_context = self.post_process_task(
+                        task.id, task_output, enhanced_context
+                    )
+                    context.update(enhanced_context)
+
+                    logger.info(f"✅ Task completed: {task.name}")
+                    if event_stream:
+                        event_stream.emit(
+                            "task_completed",
+                            {
+                                "task_id": task.id,
+                                "task_name": task.name,
+                                "output_chars": len(task_output or ""),
+                                "duration_seconds": round(
+                                    time.perf_counter() - started_at[task.id], 3
+                                ),
+                            },
+                        )
+
+                    for dependent_id in dependents[task.id]:
+                        remaining[dependent_id].discard(task.id)
+                        if not remaining[dependent_id]:
+                            ready.append(dependent_id)
+        finally:
+            # A failed task aborts the run: stop any siblings still in flight
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
 
-            # Execute task (this will be handled by the task orchestrator)
-            task_output = await self.execute_single_task(task, enhanced_context)
+        return execution_results
 
-            # Store task output
-            task_outputs[task.id] = task_output
-            execution_results[f"{task.id}_output"] = task_output
+    def get_streaming_task_id(
+        self, workflow: Workflow, dependents: Dict[Any, List[Any]]
+    ) -> Optional[Any]:
+        """
+        Return the task whose tokens are streamed in streaming mode.
 
-            # Post-process task (can be overridden)
-            enhanced_context = self.post_process_task(
-                task.id, task_output, enhanced_context
-            )
-            context.update(enhanced_context)
+        Defaults to the last task in template order that no other task
+        depends on, i.e. the final writing step. Override for workflows whose
+        user-facing output comes from a different task.
+        """
+        for task in reversed(workflow.tasks):
+            if not dependents.get(task.id):
+                return task.id
+        return None
 
-            logger.info(f"✅ Task completed: {task.name}")
+    def _build_task_graph(self, tasks: List[Task]):
+        """
+        Build dependents and transitive-ancestor maps for the workflow tasks.
 
-        return execution_results
+        Raises:
+            ValueError: If the task dependencies contain a cycle
+        """
+        tasks_by_id = {task.id: task for task in tasks}
+        dependents: Dict[Any, List[Any]] = {task.id: [] for task in tasks}
+        in_degree: Dict[Any, int] = {task.id: 0 for task in tasks}
+        for task in tasks:
+            for dep in task.dependencies:
+                if dep in tasks_by_id:
+                    dependents[dep].append(task.id)
+                    in_degree[task.id] += 1
+
+        # Kahn's algorithm gives a topological order to resolve ancestors in
+        order = [task.id for task in tasks if in_degree[task.id] == 0]
+        for task_id in order:
+            for dependent_id in dependents[task_id]:
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    order.append(dependent_id)
+
+        if len(order) != len(tasks):
+            cyclic = [task_id for task_id, degree in in_degree.items() if degree > 0]
+            raise ValueError(f"Circular task dependencies in workflow: {cyclic}")
+
+        ancestors: Dict[Any, List[Any]] = {}
+        for task_id in order:
+            resolved: List[Any] = []
+            for dep in tasks_by_id[task_id].dependencies:
+                if dep not in tasks_by_id:
+                    continue
+                for ancestor in ancestors[dep] + [dep]:
+                    if ancestor not in resolved:
+                        resolved.append(ancestor)
+            ancestors[task_id] = resolved
+
+        return dependents, ancestors
 
     async def execute_single_task(self, task: Task, context: Dict[str, Any]) -> str:
         """
@@ -7,6 +7,12 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from core.infrastructure.database.supabase_io import supabase_io
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
+from core.infrastructure.logging.event_loop_monitor import event_loop_monitor
+from core.infrastructure.logging.metrics import install_metrics
 from onboarding.config.settings import get_onboarding_settings
 from onboarding.api.endpoints import router as onboarding_router
 from onboarding.api.models import HealthCheckResponse
@@ -34,10 +40,15 @@ async def lifespan(app: FastAPI):
         status_icon = "✅" if configured else "⚠️"
         logger.info(f"  {status_icon} {service.capitalize()}: {'configured' if configured else 'not configured'}")
     
+    event_loop_monitor.start()
+
     yield
     
     # Shutdown
     logger.info("Shutting down onboarding service")
+    await event_loop_monitor.stop()
+    await http_client_registry.aclose()
+    supabase_io.shutdown(wait=True)
 
 
 # Create FastAPI app
@@ -58,6 +69,9 @@ app.add_middleware(
     allow_headers=_settings.cors_allow_headers,
 )
 
+# Prometheus request latency + /metrics
+install_metrics(app, app_name="onboarding")
+
 
 # Exception handlers
 @app.exception_handler(Exception)
@@ -9,6 +9,9 @@ from uuid import UUID
 
 import httpx
 
+from core.infrastructure.external_services.http_client_registry import (
+    http_client_registry,
+)
 from onboarding.config.settings import OnboardingSettings
 from onboarding.domain.cgs_contracts import (
     CgsPayloadLinkedInPost,
@@ -24,14 +27,14 @@ logger = logging.getLogger(__name__)
 class CgsAdapter:
     """
     Adapter for CGS API invocation.
-    
+
     Handles HTTP communication with CGS backend for workflow execution.
     """
-    
+
     def __init__(self, settings: OnboardingSettings):
         """
         Initialize CGS adapter.
-        
+
         Args:
             settings: Onboarding settings with CGS configuration
         """
@@ -39,34 +42,34 @@ class CgsAdapter:
         self.base_url = settings.cgs_api_url
         self.timeout = settings.cgs_api_timeout
         self.api_key = settings.cgs_api_key
-        
+
         logger.info(f"CGS adapter initialized: {self.base_url}")
-    
+
     def _build_headers(self) -> Dict[str, str]:
         """Build HTTP headers for CGS requests."""
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
-        
+
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-        
+
         return headers
-    
+
     async def execute_workflow(
         self,
         payload: CgsPayloadLinkedInPost | CgsPayloadNewsletter,
     ) -> ResultEnvelope:
         """
         Execute CGS workflow with payload.
-        
+
         Args:
             payload: CGS payload (LinkedIn post or newsletter)
-        
+
         Returns:
             ResultEnvelope with execution results
-        
+
         Raises:
             httpx.HTTPError: If CGS request fails
             ValueError: If response is invalid
@@ -75,33 +78,34 @@ class CgsAdapter:
             f"Executing CGS workflow: {payload.workflow} "
             f"(session: {payload.session_id})"
         )
-        
+
         # Convert payload to CGS API format
         cgs_request = self._convert_to_cgs_request(payload)
-        
+
         endpoint = f"{self.base_url}/api/v1/content/generate"
-        
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint,
-                    json=cgs_request,
-                    headers=self._build_headers(),
-                )
-                
-                response.raise_for_status()
-                data = response.json()
-            
+            client = http_client_registry.get_client(self.base_url)
+            response = await client.post(
+                endpoint,
+                json=cgs_request,
+                headers=self._build_headers(),
+                timeout=self.timeout,
+            )
+
+            response.raise_for_status()
+            data = response.json()
+
             # Convert CGS response to ResultEnvelope
             result = self._convert_to_result_envelope(data, payload)
-            
+
             logger.info(
                 f"CGS workflow completed: status={result.status}, "
                 f"run_id={result.cgs_run_id}"
             )
-            
+
             return result
-            
+
         except httpx.HTTPStatusError as e:
             logger.error(
                 f"CGS request failed: {e.response.status_code} - {e.response.text}"
@@ -113,7 +117,7 @@ class CgsAdapter:
         except Exception as e:
             logger.error(f"CGS workflow execution failed: {str(e)}")
             raise
-    
+
     def _convert_to_cgs_request(
         self,
         payload: Any,  # CgsPayloadOnboardingContent | CgsPayloadLinkedInPost | CgsPayloadNewsletter
@@ -145,7 +149,9 @@ class CgsAdapter:
         rich_context = {}
 
         if payload.company_snapshot:
-            rich_context["company_snapshot"] = payload.company_snapshot.model_dump(mode="json")
+            rich_context["company_snapshot"] = payload.company_snapshot.model_dump(
+                mode="json"
+            )
             logger.info(
                 f"📦 Rich context: Including company_snapshot "
                 f"(industry={payload.company_snapshot.company.industry}, "
@@ -170,19 +176,21 @@ class CgsAdapter:
         # Add rich context to request
         if rich_context:
             request["context"] = rich_context
-        
+
         # Map based on payload type
         if isinstance(payload, CgsPayloadOnboardingContent):
             # 🆕 NEW: Unified onboarding content payload
-            request.update({
-                "topic": payload.input.topic,
-                "client_name": payload.input.client_name,
-                "target_audience": payload.input.target_audience,
-                "tone": payload.input.tone,
-                "context": payload.input.context,
-                "custom_instructions": payload.input.custom_instructions,
-                "content_type": payload.input.content_type,  # ✅ FIX: Add content_type to request
-            })
+            request.update(
+                {
+                    "topic": payload.input.topic,
+                    "client_name": payload.input.client_name,
+                    "target_audience": payload.input.target_audience,
+                    "tone": payload.input.tone,
+                    "context": payload.input.context,
+                    "custom_instructions": payload.input.custom_instructions,
+                    "content_type": payload.input.content_type,  # ✅ FIX: Add content_type to request
+                }
+            )
             logger.info(
                 f"✅ Mapped CgsPayloadOnboardingContent to request "
                 f"(content_type={payload.input.content_type})"
@@ -190,33 +198,39 @@ class CgsAdapter:
 
         elif isinstance(payload, CgsPayloadLinkedInPost):
             # Legacy LinkedIn post payload
-            request.update({
-                "topic": payload.input.topic,
-                "client_name": payload.input.client_name,
-                "target_audience": payload.input.target_audience,
-                "tone": payload.input.tone,
-                "target_word_count": payload.input.target_word_count,
-                "include_statistics": payload.input.include_statistics,
-                "include_examples": payload.input.include_examples,
-                "include_sources": payload.input.include_sources,
-                "context": payload.input.context,
-                "custom_instructions": payload.input.custom_instructions or "",  # Convert None to empty string
-            })
+            request.update(
+                {
+                    "topic": payload.input.topic,
+                    "client_name": payload.input.client_name,
+                    "target_audience": payload.input.target_audience,
+                    "tone": payload.input.tone,
+                    "target_word_count": payload.input.target_word_count,
+                    "include_statistics": payload.input.include_statistics,
+                    "include_examples": payload.input.include_examples,
+                    "include_sources": payload.input.include_sources,
+                    "context": payload.input.context,
+                    "custom_instructions": payload.input.custom_instructions
+                    or "",  # Convert None to empty string
+                }
+            )
 
         elif isinstance(payload, CgsPayloadNewsletter):
             # Legacy newsletter payload
-            request.update({
-                "topic": payload.input.topic,
-                "newsletter_topic": payload.input.newsletter_topic,
-                "client_name": payload.input.client_name,
-                "target_audience": payload.input.target_audience,
-                "target_word_count": payload.input.target_word_count,
-                "premium_sources": payload.input.premium_sources,
-                "custom_instructions": payload.input.custom_instructions or "",  # Convert None to empty string
-            })
+            request.update(
+                {
+                    "topic": payload.input.topic,
+                    "newsletter_topic": payload.input.newsletter_topic,
+                    "client_name": payload.input.client_name,
+                    "target_audience": payload.input.target_audience,
+                    "target_word_count": payload.input.target_word_count,
+                    "premium_sources": payload.input.premium_sources,
+                    "custom_instructions": payload.input.custom_instructions
+                    or "",  # Convert None to empty string
+                }
+            )
 
         return request
-    
+
     def _convert_to_result_envelope(
         self,
         cgs_response: Dict[str, Any],
@@ -247,13 +261,13 @@ class CgsAdapter:
                 generated_image=cgs_response.get("generated_image"),
                 image_metadata=cgs_response.get("image_metadata"),
             )
-        
+
         # Extract workflow metrics
         workflow_metrics = None
         if cgs_response.get("workflow_metrics"):
             metrics_data = cgs_response["workflow_metrics"]
             workflow_metrics = WorkflowMetrics(**metrics_data)
-        
+
         # Extract error
         error = None
         if not success:
@@ -262,16 +276,23 @@ class CgsAdapter:
                 "code": "cgs_execution_failed",
                 "retryable": False,
             }
-        
+
         # Extract workflow_id and convert to UUID or None
         workflow_id_raw = cgs_response.get("workflow_id")
         cgs_run_id = None
         if workflow_id_raw and workflow_id_raw != "dynamic":
             try:
                 from uuid import UUID
-                cgs_run_id = UUID(workflow_id_raw) if isinstance(workflow_id_raw, str) else workflow_id_raw
+
+                cgs_run_id = (
+                    UUID(workflow_id_raw)
+                    if isinstance(workflow_id_raw, str)
+                    else workflow_id_raw
+                )
             except (ValueError, TypeError):
-                logger.warning(f"Invalid workflow_id format: {workflow_id_raw}, setting to None")
+                logger.warning(
+                    f"Invalid workflow_id format: {workflow_id_raw}, setting to None"
+                )
                 cgs_run_id = None
 
         return ResultEnvelope(
@@ -285,19 +306,18 @@ class CgsAdapter:
             content=content,
             workflow_metrics=workflow_metrics,
         )
-    
+
     async def health_check(self) -> bool:
         """
         Check if CGS API is healthy.
-        
+
         Returns:
             True if healthy, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(f"{self.base_url}/health")
-                return response.status_code == 200
+            client = http_client_registry.get_client(self.base_url)
+            response = await client.get(f"{self.base_url}/health", timeout=10)
+            return response.status_code == 200
         except Exception as e:
             logger.warning(f"CGS health check failed: {str(e)}")
             return False
-
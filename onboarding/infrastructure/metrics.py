@@ -0,0 +1,15 @@
+"""Onboarding metrics, registered in the shared Prometheus registry."""
+
+from core.infrastructure.logging.metrics import (
+    onboarding_batch_duration_ms,
+    onboarding_cards_created_total,
+    onboarding_errors_total,
+    onboarding_partial_creation_total,
+)
+
+__all__ = [
+    "onboarding_batch_duration_ms",
+    "onboarding_cards_created_total",
+    "onboarding_errors_total",
+    "onboarding_partial_creation_total",
+]
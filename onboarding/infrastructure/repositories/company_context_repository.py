@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 
 from supabase import Client
 
+from core.infrastructure.database.supabase_io import get_supabase_client, supabase_io
 from onboarding.config.settings import OnboardingSettings
 from onboarding.domain.models import CompanySnapshot
 
@@ -41,8 +42,7 @@ class CompanyContextRepository:
             if not settings.is_supabase_configured():
                 raise ValueError("Supabase not configured")
             
-            from supabase import create_client
-            self.client = create_client(
+            self.client = get_supabase_client(
                 settings.supabase_url,
                 settings.supabase_anon_key,
             )
@@ -70,14 +70,15 @@ class CompanyContextRepository:
         logger.info(f"🔍 RAG lookup: {normalized_name} (max age: {max_age_days} days)")
         
         try:
-            result = self.client.table(self.TABLE_NAME) \
-                .select("*") \
-                .eq("company_name", normalized_name) \
-                .eq("is_active", True) \
-                .gte("updated_at", cutoff_date.isoformat()) \
-                .order("version", desc=True) \
-                .limit(1) \
-                .execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .select("*")
+                .eq("company_name", normalized_name)
+                .eq("is_active", True)
+                .gte("updated_at", cutoff_date.isoformat())
+                .order("version", desc=True)
+                .limit(1)
+            )
             
             if result.data and len(result.data) > 0:
                 context = result.data[0]
@@ -149,7 +150,9 @@ class CompanyContextRepository:
             }
             
             # Insert new context
-            result = self.client.table(self.TABLE_NAME).insert(data).execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME).insert(data)
+            )
             
             if result.data and len(result.data) > 0:
                 context = result.data[0]
@@ -173,10 +176,11 @@ class CompanyContextRepository:
         
         try:
             # Get current context
-            result = self.client.table(self.TABLE_NAME) \
-                .select("usage_count") \
-                .eq("context_id", str(context_id)) \
-                .execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .select("usage_count")
+                .eq("context_id", str(context_id))
+            )
             
             if not result.data or len(result.data) == 0:
                 logger.warning(f"Context not found: {context_id}")
@@ -186,13 +190,16 @@ class CompanyContextRepository:
             new_count = current_count + 1
             
             # Update
-            self.client.table(self.TABLE_NAME) \
-                .update({
-                    "usage_count": new_count,
-                    "last_used_at": datetime.utcnow().isoformat()
-                }) \
-                .eq("context_id", str(context_id)) \
-                .execute()
+            await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .update(
+                    {
+                        "usage_count": new_count,
+                        "last_used_at": datetime.utcnow().isoformat(),
+                    }
+                )
+                .eq("context_id", str(context_id))
+            )
             
             logger.info(f"   Usage count: {current_count} → {new_count}")
             
@@ -211,10 +218,11 @@ class CompanyContextRepository:
             Context dict or None if not found
         """
         try:
-            result = self.client.table(self.TABLE_NAME) \
-                .select("*") \
-                .eq("context_id", str(context_id)) \
-                .execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .select("*")
+                .eq("context_id", str(context_id))
+            )
             
             if result.data and len(result.data) > 0:
                 return result.data[0]
@@ -252,10 +260,9 @@ class CompanyContextRepository:
             if industry:
                 query = query.eq("industry", industry)
             
-            result = query \
-                .order("updated_at", desc=True) \
-                .range(offset, offset + limit - 1) \
-                .execute()
+            result = await supabase_io.execute(
+                query.order("updated_at", desc=True).range(offset, offset + limit - 1)
+            )
             
             return result.data if result.data else []
             
@@ -273,10 +280,11 @@ class CompanyContextRepository:
         logger.info(f"Deactivating context: {context_id}")
         
         try:
-            self.client.table(self.TABLE_NAME) \
-                .update({"is_active": False}) \
-                .eq("context_id", str(context_id)) \
-                .execute()
+            await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .update({"is_active": False})
+                .eq("context_id", str(context_id))
+            )
             
             logger.info(f"✅ Context deactivated: {context_id}")
             
@@ -291,12 +299,13 @@ class CompanyContextRepository:
     async def _find_any_version(self, company_name: str) -> Optional[Dict[str, Any]]:
         """Find any version of a company context (active or not)."""
         try:
-            result = self.client.table(self.TABLE_NAME) \
-                .select("*") \
-                .eq("company_name", company_name) \
-                .order("version", desc=True) \
-                .limit(1) \
-                .execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .select("*")
+                .eq("company_name", company_name)
+                .order("version", desc=True)
+                .limit(1)
+            )
             
             if result.data and len(result.data) > 0:
                 return result.data[0]
@@ -309,10 +318,11 @@ class CompanyContextRepository:
     async def _deactivate_old_versions(self, company_name: str) -> None:
         """Deactivate all versions of a company context."""
         try:
-            self.client.table(self.TABLE_NAME) \
-                .update({"is_active": False}) \
-                .eq("company_name", company_name) \
-                .execute()
+            await supabase_io.execute(
+                self.client.table(self.TABLE_NAME)
+                .update({"is_active": False})
+                .eq("company_name", company_name)
+            )
         except Exception as e:
             logger.error(f"Error deactivating old versions: {str(e)}")
             # Don't raise - not critical
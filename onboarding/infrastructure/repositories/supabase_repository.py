@@ -8,8 +8,9 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 from datetime import datetime
 
-from supabase import create_client, Client
+from supabase import Client
 
+from core.infrastructure.database.supabase_io import get_supabase_client, supabase_io
 from onboarding.config.settings import OnboardingSettings
 from onboarding.domain.models import OnboardingSession, SessionState
 
@@ -37,7 +38,7 @@ class SupabaseSessionRepository:
         if not settings.is_supabase_configured():
             raise ValueError("Supabase not configured")
         
-        self.client: Client = create_client(
+        self.client: Client = get_supabase_client(
             settings.supabase_url,
             settings.supabase_anon_key,
         )
@@ -57,7 +58,9 @@ class SupabaseSessionRepository:
         
         try:
             # Upsert (insert or update)
-            result = self.client.table(self.TABLE_NAME).upsert(data).execute()
+            result = await supabase_io.execute(
+                self.client.table(self.TABLE_NAME).upsert(data)
+            )
             
             logger.info(f"Session saved: {session.session_id}")
             
@@ -78,11 +81,10 @@ class SupabaseSessionRepository:
         logger.info(f"Fetching session: {session_id}")
         
         try:
-            result = (
+            result = await supabase_io.execute(
                 self.client.table(self.TABLE_NAME)
                 .select("*")
                 .eq("session_id", str(session_id))
-                .execute()
             )
             
             if not result.data:
@@ -120,11 +122,10 @@ class SupabaseSessionRepository:
             data["error_message"] = error_message
         
         try:
-            result = (
+            result = await supabase_io.execute(
                 self.client.table(self.TABLE_NAME)
                 .update(data)
                 .eq("session_id", str(session_id))
-                .execute()
             )
             
             logger.info(f"Session state updated: {session_id}")
@@ -158,10 +159,9 @@ class SupabaseSessionRepository:
             if state:
                 query = query.eq("state", state.value)
             
-            result = (
+            result = await supabase_io.execute(
                 query.order("created_at", desc=True)
                 .range(offset, offset + limit - 1)
-                .execute()
             )
             
             sessions = [self._dict_to_session(row) for row in result.data]
@@ -184,11 +184,10 @@ class SupabaseSessionRepository:
         logger.info(f"Deleting session: {session_id}")
         
         try:
-            result = (
+            result = await supabase_io.execute(
                 self.client.table(self.TABLE_NAME)
                 .delete()
                 .eq("session_id", str(session_id))
-                .execute()
             )
             
             logger.info(f"Session deleted: {session_id}")
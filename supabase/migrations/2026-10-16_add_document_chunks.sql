@@ -0,0 +1,129 @@
+-- Per-chunk embeddings for RAG retrieval (pgvector) for Supabase
+-- Safe, idempotent migration adding public.document_chunks and the
+-- public.match_document_chunks RPC used by RAGTool.search_content, plus the
+-- public.replace_document_chunks RPC the indexer writes through.
+-- Run this in Supabase SQL editor on your project (schema: public)
+
+-- 1) Ensure required extensions
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS "vector"; -- pgvector for embeddings
+
+-- 2) Chunk table: one row per heading-bounded, token-limited chunk
+CREATE TABLE IF NOT EXISTS public.document_chunks (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    document_id UUID NOT NULL REFERENCES public.documents(id) ON DELETE CASCADE,
+    client_id UUID NOT NULL REFERENCES public.clients(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    heading TEXT,
+    content TEXT NOT NULL,
+    token_count INTEGER,
+    embedding VECTOR(1536),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE (document_id, chunk_index)
+);
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_client_id
+  ON public.document_chunks(client_id);
+
+-- HNSW index matching the cosine distance operator used below
+-- (requires pgvector >= 0.5.0)
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding
+  ON public.document_chunks USING hnsw (embedding vector_cosine_ops);
+
+-- Read-only under RLS: the app writes chunks through replace_document_chunks
+ALTER TABLE public.document_chunks ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Users can view all document chunks" ON public.document_chunks;
+CREATE POLICY "Users can view all document chunks"
+  ON public.document_chunks FOR SELECT USING (true);
+
+-- 3) Top-k chunk similarity search, optionally restricted to selected documents
+CREATE OR REPLACE FUNCTION public.match_document_chunks(
+    query_embedding vector(1536),
+    match_count integer,
+    client_name text,
+    document_ids uuid[] DEFAULT NULL
+)
+RETURNS TABLE (
+    id uuid,
+    document_id uuid,
+    title text,
+    file_path text,
+    heading text,
+    chunk_index integer,
+    content text,
+    similarity float
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT ch.id,
+         ch.document_id,
+         d.title::text,
+         d.file_path,
+         ch.heading,
+         ch.chunk_index,
+         ch.content,
+         1 - (ch.embedding <=> query_embedding) AS similarity
+  FROM public.document_chunks ch
+  JOIN public.clients c ON c.id = ch.client_id
+  JOIN public.documents d ON d.id = ch.document_id
+  WHERE c.name = client_name
+    AND ch.embedding IS NOT NULL
+    AND (document_ids IS NULL OR ch.document_id = ANY(document_ids))
+  ORDER BY ch.embedding <=> query_embedding
+  LIMIT LEAST(match_count, 50);
+$$;
+
+-- 4) Atomically replace a document's chunks. Expects a JSON array of
+-- {"chunk_index", "heading", "content", "token_count", "embedding"}; the client
+-- is taken from the document. Runs as the owner so the app key can write
+-- through RLS, and in one transaction so a failed insert keeps the old chunks.
+CREATE OR REPLACE FUNCTION public.replace_document_chunks(
+    document_id uuid,
+    rows jsonb
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  doc_client_id uuid;
+  inserted integer;
+BEGIN
+  SELECT d.client_id INTO doc_client_id
+  FROM public.documents d
+  WHERE d.id = replace_document_chunks.document_id;
+  IF doc_client_id IS NULL THEN
+    RAISE EXCEPTION 'document % not found', replace_document_chunks.document_id;
+  END IF;
+
+  DELETE FROM public.document_chunks ch
+  WHERE ch.document_id = replace_document_chunks.document_id;
+
+  INSERT INTO public.document_chunks
+    (document_id, client_id, chunk_index, heading, content, token_count, embedding)
+  SELECT replace_document_chunks.document_id,
+         doc_client_id,
+         (r->>'chunk_index')::integer,
+         r->>'heading',
+         r->>'content',
+         (r->>'token_count')::integer,
+         (r->>'embedding')::vector
+  FROM jsonb_array_elements(COALESCE(replace_document_chunks.rows, '[]'::jsonb)) AS r;
+  GET DIAGNOSTICS inserted = ROW_COUNT;
+  RETURN inserted;
+END;
+$$;
+
+-- 5) Permissions: allow anon/authenticated to execute the RPC functions
+DO $$
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+    GRANT EXECUTE ON FUNCTION public.match_document_chunks(vector(1536), integer, text, uuid[]) TO anon;
+    GRANT EXECUTE ON FUNCTION public.replace_document_chunks(uuid, jsonb) TO anon;
+  END IF;
+  IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+    GRANT EXECUTE ON FUNCTION public.match_document_chunks(vector(1536), integer, text, uuid[]) TO authenticated;
+    GRANT EXECUTE ON FUNCTION public.replace_document_chunks(uuid, jsonb) TO authenticated;
+  END IF;
+END$$;
@@ -0,0 +1,8 @@
+-- Record how each knowledge base document fared in budgeted RAG context
+-- Safe, idempotent migration adding public.run_documents.status, set by
+-- rag_get_client_content when the context token budget excerpts or drops
+-- documents ('included' | 'truncated' | 'dropped').
+-- Run this in Supabase SQL editor on your project (schema: public)
+
+ALTER TABLE IF EXISTS public.run_documents
+  ADD COLUMN IF NOT EXISTS status TEXT;
@@ -0,0 +1,20 @@
+-- Bulk update of documents.embedding for Supabase
+-- Safe, idempotent migration adding the public.update_document_embeddings RPC
+-- the embedding backfill job uses to refresh a whole page of documents at once.
+-- Run this in Supabase SQL editor on your project (schema: public)
+
+-- Expects a JSON array of {"id": <uuid>, "embedding": [<floats>]}; returns rows updated
+CREATE OR REPLACE FUNCTION public.update_document_embeddings(updates jsonb)
+RETURNS integer
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE public.documents d
+    SET embedding = (u->>'embedding')::vector,
+        updated_at = NOW()
+    FROM jsonb_array_elements(updates) AS u
+    WHERE d.id = (u->>'id')::uuid
+    RETURNING d.id
+  )
+  SELECT COUNT(*)::integer FROM updated;
+$$;
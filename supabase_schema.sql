@@ -244,6 +244,121 @@ AS $$
   LIMIT LEAST(match_count, 50);
 $$;
 
+-- =====================================================
+-- DOCUMENT CHUNKS (per-chunk embeddings for RAG)
+-- =====================================================
+CREATE TABLE document_chunks (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    document_id UUID NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    client_id UUID NOT NULL REFERENCES clients(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    heading TEXT,
+    content TEXT NOT NULL,
+    token_count INTEGER,
+    embedding VECTOR(1536),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE (document_id, chunk_index)
+);
+
+CREATE INDEX idx_document_chunks_client_id ON document_chunks(client_id);
+CREATE INDEX idx_document_chunks_embedding ON document_chunks USING hnsw (embedding vector_cosine_ops);
+
+-- Read-only under RLS: the app writes chunks through replace_document_chunks
+ALTER TABLE document_chunks ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Users can view all document chunks" ON document_chunks FOR SELECT USING (true);
+
+-- Top-k chunk similarity search, optionally restricted to selected documents
+CREATE OR REPLACE FUNCTION public.match_document_chunks(
+    query_embedding vector(1536),
+    match_count integer,
+    client_name text,
+    document_ids uuid[] DEFAULT NULL
+)
+RETURNS TABLE (
+    id uuid,
+    document_id uuid,
+    title text,
+    file_path text,
+    heading text,
+    chunk_index integer,
+    content text,
+    similarity float
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT ch.id,
+         ch.document_id,
+         d.title::text,
+         d.file_path,
+         ch.heading,
+         ch.chunk_index,
+         ch.content,
+         1 - (ch.embedding <=> query_embedding) AS similarity
+  FROM public.document_chunks ch
+  JOIN public.clients c ON c.id = ch.client_id
+  JOIN public.documents d ON d.id = ch.document_id
+  WHERE c.name = client_name
+    AND ch.embedding IS NOT NULL
+    AND (document_ids IS NULL OR ch.document_id = ANY(document_ids))
+  ORDER BY ch.embedding <=> query_embedding
+  LIMIT LEAST(match_count, 50);
+$$;
+
+-- Atomically replace a document's chunks (owner rights, single transaction)
+CREATE OR REPLACE FUNCTION public.replace_document_chunks(
+    document_id uuid,
+    rows jsonb
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  doc_client_id uuid;
+  inserted integer;
+BEGIN
+  SELECT d.client_id INTO doc_client_id
+  FROM public.documents d
+  WHERE d.id = replace_document_chunks.document_id;
+  IF doc_client_id IS NULL THEN
+    RAISE EXCEPTION 'document % not found', replace_document_chunks.document_id;
+  END IF;
+
+  DELETE FROM public.document_chunks ch
+  WHERE ch.document_id = replace_document_chunks.document_id;
+
+  INSERT INTO public.document_chunks
+    (document_id, client_id, chunk_index, heading, content, token_count, embedding)
+  SELECT replace_document_chunks.document_id,
+         doc_client_id,
+         (r->>'chunk_index')::integer,
+         r->>'heading',
+         r->>'content',
+         (r->>'token_count')::integer,
+         (r->>'embedding')::vector
+  FROM jsonb_array_elements(COALESCE(replace_document_chunks.rows, '[]'::jsonb)) AS r;
+  GET DIAGNOSTICS inserted = ROW_COUNT;
+  RETURN inserted;
+END;
+$$;
+
+-- Bulk-refresh document embeddings (used by the embedding backfill job)
+CREATE OR REPLACE FUNCTION public.update_document_embeddings(updates jsonb)
+RETURNS integer
+LANGUAGE sql
+AS $$
+  WITH updated AS (
+    UPDATE public.documents d
+    SET embedding = (u->>'embedding')::vector,
+        updated_at = NOW()
+    FROM jsonb_array_elements(updates) AS u
+    WHERE d.id = (u->>'id')::uuid
+    RETURNING d.id
+  )
+  SELECT COUNT(*)::integer FROM updated;
+$$;
+
 -- =====================================================
 -- INITIAL DATA
 -- =====================================================
@@ -65,6 +65,7 @@ CREATE TABLE IF NOT EXISTS run_documents (
     agent_name VARCHAR(200),
     document_path TEXT,
     source_url TEXT,
+    status TEXT, -- included / truncated / dropped by the RAG context budget
     retrieved_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
@@ -0,0 +1,243 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from core.domain.value_objects.provider_config import ProviderConfig
+from core.infrastructure.cache.tool_result_cache import ToolResultCache
+from core.infrastructure.orchestration.agent_executor import AgentExecutor
+
+
+def _executor(**kwargs):
+    return AgentExecutor(None, None, ProviderConfig(), **kwargs)
+
+
+def _slow_tool(active, delay=0.05):
+    async def tool(query: str):
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        await asyncio.sleep(delay)
+        active["now"] -= 1
+        return f"result for {query}"
+
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_run_concurrently_and_keep_positions():
+    active = {"now": 0, "max": 0}
+    executor = _executor()
+    executor.register_tool("search", _slow_tool(active), "mock search")
+    tracker = Mock()
+
+    response = (
+        "A [search]one[/search] B [search]two[/search] C [missing]x[/missing] "
+        "D [search]three[/search]"
+    )
+    start = time.perf_counter()
+    result = await executor.process_tool_calls(
+        response, agent_name="agent", tracker=tracker, run_id="run1"
+    )
+    elapsed = time.perf_counter() - start
+
+    assert active["max"] == 3
+    assert elapsed < 0.12
+    assert result.index("result for one") < result.index("result for two")
+    assert result.index("result for two") < result.index("Tool not found")
+    assert result.index("Tool not found") < result.index("result for three")
+    assert result.startswith("A [search RESULT]")
+    assert tracker.log_tool_execution.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_tool_concurrency_limits():
+    active = {"now": 0, "max": 0}
+    executor = _executor(max_concurrent_tool_calls=3)
+    executor.register_tool(
+        "search", _slow_tool(active), "mock search", {"max_concurrency": 2}
+    )
+
+    response = "".join(f"[search]{i}[/search]" for i in range(5))
+    await executor.process_tool_calls(response)
+
+    assert active["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_queued_on_a_saturated_tool_leave_global_slots_free():
+    finished = []
+
+    def _recording_tool(name, delay):
+        async def tool(query: str):
+            await asyncio.sleep(delay)
+            finished.append(name)
+            return name
+
+        return tool
+
+    executor = _executor(max_concurrent_tool_calls=2)
+    executor.register_tool(
+        "slow", _recording_tool("slow", 0.05), "slow tool", {"max_concurrency": 1}
+    )
+    executor.register_tool("fast", _recording_tool("fast", 0), "fast tool")
+
+    response = "[slow]a[/slow][slow]b[/slow][slow]c[/slow][fast]d[/fast]"
+    await executor.process_tool_calls(response)
+
+    assert finished[0] == "fast"
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_runs_one_call_at_a_time():
+    active = {"now": 0, "max": 0}
+    executor = _executor(parallel_tool_calls=False)
+    executor.register_tool("search", _slow_tool(active, delay=0.01), "mock search")
+
+    result = await executor.process_tool_calls("[search]a[/search][search]b[/search]")
+
+    assert active["max"] == 1
+    assert "result for a" in result and "result for b" in result
+
+
+@pytest.mark.asyncio
+async def test_identical_web_searches_share_one_upstream_call():
+    calls = []
+
+    async def search(query: str):
+        calls.append(query)
+        await asyncio.sleep(0.02)
+        return {"provider": "serper", "results": [query]}
+
+    executor = _executor(tool_result_cache=ToolResultCache())
+    executor.register_tool(
+        "web_search", search, "mock search", {"cost_per_call_usd": 0.01}
+    )
+
+    # Two concurrent identical calls coalesce; a later one differing only in
+    # whitespace and case is served from the cache
+    await executor.process_tool_calls(
+        "[web_search]AI news[/web_search] [web_search]AI news[/web_search]"
+    )
+    result = await executor._execute_tool_with_params(
+        "web_search", search, "  ai   NEWS ", tool_metadata={"cost_per_call_usd": 0.01}
+    )
+
+    assert calls == ["AI news"]
+    assert result.metadata["cache_hit"] is True
+    assert result.metadata["cost_usd"] == 0.0
+    assert result.metadata["cost_saved_usd"] == pytest.approx(0.01)
+    stats = executor.tool_result_cache.get_stats()["tools"]["web_search"]
+    assert stats == {"hits": 1, "misses": 1, "coalesced": 1}
+
+
+@pytest.mark.asyncio
+async def test_tool_cache_skips_errors_and_uncacheable_tools():
+    calls = []
+
+    async def rag(client_name, agent_name=None):
+        calls.append(client_name)
+        return "Error retrieving content: boom"
+
+    async def image(query: str):
+        calls.append(query)
+        return "image"
+
+    executor = _executor(tool_result_cache=ToolResultCache())
+    executor.register_tool("rag_get_client_content", rag, "mock rag")
+    executor.register_tool("other_tool", image, "mock other")
+
+    await executor.process_tool_calls(
+        "[rag_get_client_content]acme[/rag_get_client_content]"
+        "[other_tool]x[/other_tool]"
+    )
+    await executor.process_tool_calls(
+        "[rag_get_client_content]acme[/rag_get_client_content]"
+        "[other_tool]x[/other_tool]"
+    )
+
+    assert sorted(calls) == ["acme", "acme", "x", "x"]
+
+
+@pytest.mark.asyncio
+async def test_rag_lookups_keep_case_and_never_cache_misses():
+    calls = []
+
+    async def rag(client_name, agent_name=None):
+        calls.append(client_name)
+        if client_name != "siebert":
+            return f"Client '{client_name}' not found"
+        return "brand voice"
+
+    executor = _executor(tool_result_cache=ToolResultCache())
+    executor.register_tool("rag_get_client_content", rag, "mock rag")
+
+    for client in ("Siebert", "Siebert", "siebert", "siebert"):
+        await executor.process_tool_calls(
+            f"[rag_get_client_content]{client}[/rag_get_client_content]"
+        )
+
+    assert calls == ["Siebert", "Siebert", "siebert"]
+
+
+@pytest.mark.asyncio
+async def test_invalidated_tag_forces_a_fresh_call():
+    cache = ToolResultCache()
+    calls = []
+
+    async def execute():
+        calls.append(1)
+        return {"output_text": f"v{len(calls)}", "metadata": {}}
+
+    async def lookup(client):
+        result, _ = await cache.get_or_execute(
+            "rag_get_client_content", client, execute, tag=f"rag:{client}"
+        )
+        return result["output_text"]
+
+    assert await lookup("acme") == "v1"
+    assert await lookup("globex") == "v2"
+    cache.invalidate("rag:acme")
+
+    assert await lookup("acme") == "v3"
+    assert await lookup("acme") == "v3"
+    assert await lookup("globex") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_cached_rag_results_replay_run_tracking(tmp_path, monkeypatch):
+    from core.infrastructure.config.settings import get_settings
+    from core.infrastructure.tools.rag_tool import RAGTool
+
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("SUPABASE_URL", "")
+    monkeypatch.setenv("KNOWLEDGE_BASE_DIR", str(tmp_path))
+    monkeypatch.setenv("RAG_CONTEXT_TOKEN_BUDGET", "0")
+    get_settings.cache_clear()
+    (tmp_path / "acme").mkdir()
+    (tmp_path / "acme" / "brand.md").write_text("# Voice\n\nWarm and direct.")
+    try:
+        rag_tool = RAGTool()
+        executor = _executor(tool_result_cache=ToolResultCache())
+        tracker = Mock()
+
+        for run_id in ("run-1", "run-2"):
+            rag_tool._set_run_values(tracker=tracker, run_id=run_id)
+            result = await executor._execute_tool_with_params(
+                "rag_get_client_content",
+                rag_tool.get_client_content,
+                "acme",
+                agent_name="writer",
+            )
+
+        assert result.metadata["cache_hit"] is True
+        logged = [
+            (c.args[0], c.args[2], c.kwargs["agent_name"])
+            for c in tracker.log_rag_document.call_args_list
+        ]
+        assert logged == [
+            ("run-1", "brand.md", "writer"),
+            ("run-2", "brand.md", "writer"),
+        ]
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from core.domain.value_objects.provider_config import LLMProvider
+from core.infrastructure.config.settings import Settings, get_settings
+from core.infrastructure.tools.rag_tool import RAGTool
+from core.infrastructure.tools.tool_names import ToolNames
+
+
+@pytest.fixture
+def settings(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("USE_SUPABASE", "false")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    get_settings.cache_clear()
+    yield Settings(
+        output_dir=str(tmp_path / "output"),
+        workflows_dir=str(tmp_path / "workflows"),
+        profiles_dir=str(tmp_path / "profiles"),
+        knowledge_base_dir=str(tmp_path / "kb"),
+    )
+    get_settings.cache_clear()
+
+
+def test_container_shares_providers_and_tools(settings):
+    pytest.importorskip("google.generativeai")
+    from core.infrastructure.container import AppContainer
+
+    container = AppContainer(settings)
+
+    assert container.get_provider(LLMProvider.OPENAI) is container.get_provider(
+        LLMProvider.OPENAI
+    )
+
+    first = container.create_agent_executor(LLMProvider.OPENAI)
+    second = container.create_agent_executor(LLMProvider.OPENAI)
+    assert first is not second
+    assert first.llm_provider is second.llm_provider
+    rag_function = first.tools_registry[ToolNames.RAG_SEARCH_CONTENT]["function"]
+    assert rag_function.__self__ is container.rag_tool
+    assert set(first.tools_registry) == set(container.tool_registry)
+
+
+@pytest.mark.asyncio
+async def test_rag_run_state_is_isolated_per_task(settings):
+    rag_tool = RAGTool()  # one shared instance, as held by the container
+    seen = {}
+
+    async def run(name, documents):
+        rag_tool.set_selected_documents(documents)
+        await asyncio.sleep(0.01)
+        seen[name] = rag_tool.selected_document_ids
+
+    await asyncio.gather(run("a", ["doc-1"]), run("b", None), run("c", ["doc-2"]))
+
+    assert seen == {"a": {"doc-1"}, "b": None, "c": {"doc-2"}}
+    assert rag_tool.selected_document_ids is None
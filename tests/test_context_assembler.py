@@ -0,0 +1,120 @@
+import pytest
+
+from core.infrastructure.config.settings import get_settings
+from core.infrastructure.tools.context_assembler import (
+    COMPANY,
+    GUIDELINES,
+    KNOWLEDGE,
+    ContextDocument,
+    assemble_context,
+    categorize_document,
+)
+from core.infrastructure.tools.document_chunker import count_tokens
+from core.infrastructure.tools.rag_tool import RAGTool
+from core.infrastructure.tools.tool_names import ToolNames
+
+SHARED = "Every claim about returns must cite a source and carry the risk disclaimer."
+
+
+def _sections(topic, count, words=60):
+    return "\n\n".join(
+        f"## {topic.title()} {i}\n\n" + " ".join([f"{topic} detail {i}"] * words)
+        for i in range(count)
+    )
+
+
+def test_categorize_document_by_filename():
+    assert categorize_document("01_company_profile.md") == COMPANY
+    assert categorize_document("style_guide.md") == GUIDELINES
+    assert categorize_document("product_reference.md") == KNOWLEDGE
+    assert categorize_document("notes.md") == "other"
+
+
+def test_context_that_fits_is_returned_in_full():
+    docs = [
+        ContextDocument("brand_profile.md", "# Voice\n\nWarm and direct."),
+        ContextDocument("notes.md", "Misc notes."),
+    ]
+
+    context = assemble_context(docs, token_budget=10_000, query="anything")
+
+    assert context.included == ["brand_profile.md", "notes.md"]
+    assert context.truncated == context.dropped == []
+    assert "## COMPANY INFORMATION" in context.text
+    assert "### notes.md\n\nMisc notes." in context.text
+    assert assemble_context(docs, token_budget=0).text == context.text
+
+
+def test_duplicate_paragraphs_are_removed_before_cutting():
+    brand = ContextDocument("brand_profile.md", f"# Brand\n\n{SHARED}\n\nWe are warm.")
+    guide = ContextDocument(
+        "writing_guide.md", f"# Rules\n\n{SHARED}\n\nUse short lines."
+    )
+    full = assemble_context([brand, guide], token_budget=0)
+
+    context = assemble_context(
+        [guide, brand], token_budget=full.tokens - count_tokens(SHARED) // 2
+    )
+
+    assert context.duplicate_paragraphs == 1
+    assert context.text.count(SHARED) == 1
+    # The company profile outranks the guide, so it keeps the shared paragraph
+    assert context.text.index(SHARED) < context.text.index("## CONTENT GUIDELINES")
+    assert context.dropped == context.truncated == []
+
+
+def test_budget_keeps_relevant_chunks_and_reports_the_rest():
+    docs = [
+        ContextDocument("brand_profile.md", _sections("voice", 2)),
+        ContextDocument("product_reference.md", _sections("pricing", 6)),
+        ContextDocument("retirement_reference.md", _sections("retirement", 6)),
+        ContextDocument("notes.md", _sections("misc", 6)),
+    ]
+
+    context = assemble_context(
+        docs, token_budget=900, query="retirement savings", chunk_tokens=120
+    )
+
+    assert context.tokens == count_tokens(context.text) <= 900
+    assert context.included == ["brand_profile.md"]
+    assert context.truncated == ["retirement_reference.md"]
+    assert context.dropped == ["product_reference.md", "notes.md"]
+    assert "### retirement_reference.md (excerpts)" in context.text
+    assert "#### Retirement 0" in context.text
+    assert "pricing detail" not in context.text
+    assert "_Omitted to fit the context budget: product_reference.md, notes.md" in (
+        context.text
+    )
+    assert context.status_of("notes.md") == "dropped"
+    assert context.status_of("retirement_reference.md") == "truncated"
+    assert context.status_of("brand_profile.md") == "included"
+
+
+@pytest.mark.asyncio
+async def test_get_client_content_respects_task_budget(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("SUPABASE_URL", "")
+    monkeypatch.setenv("KNOWLEDGE_BASE_DIR", str(tmp_path / "kb"))
+    monkeypatch.setenv("RAG_CONTEXT_TOKEN_BUDGET", "0")
+    get_settings.cache_clear()
+    client_dir = tmp_path / "kb" / "acme"
+    client_dir.mkdir(parents=True)
+    (client_dir / "company_profile.md").write_text(_sections("voice", 1))
+    (client_dir / "pricing_reference.md").write_text(_sections("pricing", 8))
+    try:
+        rag_tool = RAGTool()
+        unbudgeted = await rag_tool.get_client_content("acme")
+        assert rag_tool.cache_scope(ToolNames.RAG_GET_CLIENT_CONTENT) is None
+
+        rag_tool.set_context_request("pricing tiers", token_budget=700)
+        budgeted = await rag_tool.get_client_content("acme")
+
+        assert count_tokens(budgeted) <= 700 < count_tokens(unbudgeted)
+        assert "### company_profile.md" in budgeted
+        assert "pricing_reference.md (excerpts)" in budgeted
+        assert rag_tool.cache_scope(ToolNames.RAG_GET_CLIENT_CONTENT) == {
+            "context": [700, "pricing tiers"]
+        }
+        assert rag_tool.cache_scope(ToolNames.RAG_SEARCH_CONTENT) is None
+    finally:
+        get_settings.cache_clear()
@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+
+from core.infrastructure.jobs.job_store import Job, SQLiteJobStore
+from core.infrastructure.tools.embedding_backfill import (
+    EmbeddingBackfill,
+    embedding_batches,
+)
+
+
+class FakeRAGTool:
+    def __init__(self, fail_on=None):
+        self.requests = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def _embed_texts(self, texts):
+        with self._lock:
+            self.requests.append(len(texts))
+        if self.fail_on and any(self.fail_on in text for text in texts):
+            raise RuntimeError("rate limited")
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class InMemoryBackfill(EmbeddingBackfill):
+    """Backfill over in-memory documents instead of Supabase tables."""
+
+    def __init__(self, documents, chunked=(), **kwargs):
+        super().__init__(FakeRAGTool(kwargs.pop("fail_on", None)), **kwargs)
+        self.documents = documents
+        self.chunked = set(chunked)
+        self.writes = []
+
+    def _count_documents(self, client_id):
+        return len(self.documents)
+
+    def _fetch_page(self, client_id, cursor):
+        ids = sorted(d for d in self.documents if cursor is None or d > cursor)
+        page = ids[: self.page_size]
+        return [{"id": doc_id, "content": self.documents[doc_id]} for doc_id in page]
+
+    def _chunked_document_ids(self, document_ids):
+        return self.chunked & set(document_ids)
+
+    def _write_page(self, completed):
+        self.writes.append([doc["id"] for doc, _, _ in completed])
+        return sum(len(chunks) for _, chunks, _ in completed)
+
+
+def _documents(count):
+    return {
+        f"doc-{i:02d}": f"# Doc {i}\n\n"
+        + "\n\n".join(f"Paragraph {j} of {i}." for j in range(3))
+        for i in range(count)
+    }
+
+
+def test_embedding_batches_respect_input_and_token_limits():
+    assert embedding_batches([10] * 5, max_inputs=2) == [(0, 2), (2, 4), (4, 5)]
+    assert embedding_batches([60, 60, 30, 90], max_tokens=100) == [
+        (0, 1),
+        (1, 3),
+        (3, 4),
+    ]
+    assert embedding_batches([]) == []
+
+
+@pytest.mark.asyncio
+async def test_backfill_batches_concurrently_and_checkpoints_pages():
+    backfill = InMemoryBackfill(
+        _documents(7),
+        chunked={"doc-03"},
+        page_size=3,
+        concurrency=2,
+        chunk_size=8,
+        chunk_overlap=0,
+    )
+    checkpoints = []
+
+    async def on_progress(progress):
+        checkpoints.append(progress)
+
+    result = await backfill.run("client-1", on_progress=on_progress)
+
+    assert [c["cursor"] for c in checkpoints] == ["doc-02", "doc-05", "doc-06"]
+    assert result["scanned"] == 7
+    assert result["skipped"] == 1
+    assert result["indexed"] == 6
+    assert result["chunks"] == sum(len(ids) for ids in backfill.writes) * 3
+    assert result["embedding_requests"] == len(backfill.rag_tool.requests)
+    # Chunks from every document in a page share embedding requests
+    assert max(backfill.rag_tool.requests) > 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_checkpoint_and_records_failures():
+    documents = _documents(6)
+    documents["doc-04"] = "Poison paragraph."
+    backfill = InMemoryBackfill(documents, page_size=2, fail_on="Poison")
+
+    checkpoint = {"cursor": "doc-01", "total_documents": 6, "scanned": 2}
+    checkpoint["indexed"] = 2
+    result = await backfill.run("client-1", progress=checkpoint)
+
+    # doc-05 shares the failed request with doc-04, so neither is written
+    assert backfill.writes == [["doc-02", "doc-03"]]
+    assert result["scanned"] == 6
+    assert result["indexed"] == 4
+    assert result["failed"] == 2
+    assert result["failed_document_ids"] == ["doc-04", "doc-05"]
+
+
+def test_job_store_persists_progress(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+    job = Job(kind="embedding_backfill", payload={})
+    store.insert(job)
+    store.save_progress(job.id, {"cursor": "doc-9", "scanned": 10})
+
+    reopened = SQLiteJobStore(str(tmp_path / "jobs.db"))
+    assert reopened.get(job.id).progress == {"cursor": "doc-9", "scanned": 10}
+    assert reopened.get(job.id).to_dict()["progress"]["cursor"] == "doc-9"
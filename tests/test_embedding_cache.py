@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from core.infrastructure.cache.embedding_cache import EmbeddingCache
+from core.infrastructure.config.settings import get_settings
+from core.infrastructure.tools import rag_tool as rag_tool_module
+from core.infrastructure.tools.rag_tool import EMBEDDING_MODEL, RAGTool
+
+
+def test_cache_normalizes_text_and_persists_across_instances(tmp_path):
+    db_path = str(tmp_path / "embeddings.sqlite3")
+    cache = EmbeddingCache(db_path=db_path, max_entries=1)
+    cache.set_many("model-a", ["alpha  beta", "gamma"], [[0.5, 1.0], [2.0, 3.0]])
+
+    # "alpha beta" was evicted from the 1-entry LRU and is read from disk
+    assert cache.get_many("model-a", [" alpha\nbeta ", "gamma", "delta"]) == [
+        [0.5, 1.0],
+        [2.0, 3.0],
+        None,
+    ]
+    assert cache.get_many("model-b", ["gamma"]) == [None]
+    stats = cache.get_stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+    cache.close()
+
+    reopened = EmbeddingCache(db_path=db_path)
+    assert reopened.get_stats()["disk_entries"] == 2
+    assert reopened.get_many("model-a", ["gamma"]) == [[2.0, 3.0]]
+
+
+def test_disk_tier_evicts_oldest_entries(tmp_path):
+    db_path = str(tmp_path / "embeddings.sqlite3")
+    cache = EmbeddingCache(db_path=db_path, max_entries=1, max_disk_entries=10)
+    for i in range(12):
+        cache.set_many("m", [f"text {i}"], [[float(i)]])
+
+    assert cache.get_stats()["disk_entries"] <= 10
+    assert cache.get_many("m", ["text 11"]) == [[11.0]]
+    assert cache.get_many("m", ["text 0"]) == [None]
+
+
+def test_rag_embeddings_only_request_cache_misses(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("SUPABASE_URL", "")
+    get_settings.cache_clear()
+    cache = EmbeddingCache(db_path=str(tmp_path / "embeddings.sqlite3"))
+    monkeypatch.setattr(rag_tool_module, "get_embedding_cache", lambda: cache)
+
+    def create(model, input):
+        data = [
+            SimpleNamespace(index=i, embedding=[float(len(text))])
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=list(reversed(data)))
+
+    create_mock = Mock(side_effect=create)
+    fake_openai = SimpleNamespace(embeddings=SimpleNamespace(create=create_mock))
+    monkeypatch.setattr(rag_tool_module, "openai", fake_openai)
+    rag_tool = RAGTool()
+
+    assert rag_tool._embed_texts(["tone", "voice", "tone"]) == [[4.0], [5.0], [4.0]]
+    assert create_mock.call_args.kwargs["input"] == ["tone", "voice"]
+
+    assert rag_tool._embed_text("tone") == [4.0]
+    assert rag_tool._embed_texts(["voice", "brand"]) == [[5.0], [5.0]]
+    assert create_mock.call_count == 2
+    assert create_mock.call_args.kwargs == {
+        "model": EMBEDDING_MODEL,
+        "input": ["brand"],
+    }
+    get_settings.cache_clear()
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.domain.entities.content import Content, ContentStatus, ContentType
+from core.infrastructure.repositories.file_content_repository import (
+    FileContentRepository,
+)
+
+
+def _content(title, minutes_ago, **kwargs):
+    created = datetime(2025, 1, 1, 12, 0) - timedelta(minutes=minutes_ago)
+    return Content(title=title, body=f"{title} body text", created_at=created, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_queries_use_index_and_read_only_matching_bodies(tmp_path, monkeypatch):
+    repo = FileContentRepository(str(tmp_path))
+    await repo.save(_content("Old", 30, client_profile="acme", tags=["macro"]))
+    newest = await repo.save(
+        _content("New", 1, client_profile="acme", content_type=ContentType.NEWSLETTER)
+    )
+    await repo.save(_content("Other", 10, client_profile="beta", tags=["rates"]))
+
+    opened = []
+    original = FileContentRepository._load_bodies
+
+    def tracking(self, rows):
+        opened.extend(row["title"] for row in rows)
+        return original(self, rows)
+
+    monkeypatch.setattr(FileContentRepository, "_load_bodies", tracking)
+
+    recent = await repo.get_recent(limit=1)
+    assert [c.id for c in recent] == [newest.id]
+    assert recent[0].body == "New body text"
+    assert opened == ["New"]
+
+    assert [c.title for c in await repo.get_by_client_profile("acme")] == [
+        "New",
+        "Old",
+    ]
+    assert [c.title for c in await repo.get_by_tags(["rates", "fx"])] == ["Other"]
+    assert [c.title for c in await repo.get_by_type(ContentType.NEWSLETTER)] == ["New"]
+    assert (await repo.get_by_title("Other")).client_profile == "beta"
+
+    opened.clear()
+    summaries = await repo.list_summaries(limit=10, client_profile="acme")
+    assert [s["title"] for s in summaries] == ["New", "Old"]
+    assert summaries[0]["word_count"] == 3
+    assert opened == []
+
+
+@pytest.mark.asyncio
+async def test_index_tracks_updates_deletes_and_backfills(tmp_path):
+    repo = FileContentRepository(str(tmp_path))
+    draft = await repo.save(_content("Draft", 5))
+    doomed = await repo.save(_content("Doomed", 2))
+
+    draft.change_status(ContentStatus.REVIEW)
+    await repo.update(draft)
+    assert [c.title for c in await repo.get_by_status(ContentStatus.REVIEW)] == [
+        "Draft"
+    ]
+
+    assert await repo.delete(doomed.id)
+    assert [c.title for c in await repo.get_all()] == ["Draft"]
+
+    # A missing or stale sidecar is rebuilt from the metadata files
+    (tmp_path / "index.sqlite3").unlink()
+    for suffix in ("-wal", "-shm"):
+        (tmp_path / f"index.sqlite3{suffix}").unlink(missing_ok=True)
+    reopened = FileContentRepository(str(tmp_path))
+    assert [c.title for c in await reopened.get_by_status(ContentStatus.REVIEW)] == [
+        "Draft"
+    ]
+    assert [c.title for c in await reopened.search("draft body")] == ["Draft"]
+
+
+@pytest.mark.asyncio
+async def test_full_text_search_ranks_and_paginates(tmp_path):
+    repo = FileContentRepository(str(tmp_path))
+    await repo.save(
+        Content(title="Weekly market recap", body="Stocks rallied on rate cuts.")
+    )
+    await repo.save(
+        Content(
+            title="Rate cuts explained",
+            body="Why central banks cut rates and what it means for savers.",
+            tags=["rates"],
+            client_profile="acme",
+        )
+    )
+    await repo.save(Content(title="Crypto primer", body="Bitcoin basics."))
+
+    found = await repo.search_index("rate cut", limit=1)
+    assert found["total_count"] == 2
+    top = found["results"][0]
+    assert top["title"] == "Rate cuts explained"
+    assert "<mark>" in top["snippet"]
+
+    second = await repo.search_index("rate cut", limit=1, offset=1)
+    assert second["results"][0]["title"] == "Weekly market recap"
+    only_acme = await repo.search_index("rates", client_profile="acme")
+    assert [hit["title"] for hit in only_acme["results"]] == ["Rate cuts explained"]
+    assert (await repo.search_index('") OR title:*'))["total_count"] == 0
+
+    assert [c.title for c in await repo.search("bitco*")] == ["Crypto primer"]
+    assert [c.title for c in await repo.search("bitco")] == ["Crypto primer"]
+    assert await repo.search("bitco basics") == []
+    assert [c.title for c in await repo.search("bitco* basi")] == ["Crypto primer"]
+    assert await repo.search("bi") == []
+
+
+@pytest.mark.asyncio
+async def test_search_pages_cover_every_counted_hit(tmp_path):
+    repo = FileContentRepository(str(tmp_path))
+    # The strongest match is the oldest row; it must still be ranked first
+    await repo.save(Content(title="Inflation inflation", body="Inflation outlook."))
+    for i in range(24):
+        await repo.save(Content(title=f"Note {i}", body="Brief inflation mention."))
+
+    first = await repo.search_index("inflation", limit=10)
+    assert first["total_count"] == 25
+    assert first["results"][0]["title"] == "Inflation inflation"
+
+    seen = set()
+    for offset in range(0, 30, 10):
+        page = await repo.search_index("inflation", limit=10, offset=offset)
+        seen.update(hit["id"] for hit in page["results"])
+    assert len(seen) == 25
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from core.domain.value_objects.provider_config import LLMProvider, ProviderConfig
+from core.infrastructure.external_services import gemini_adapter
+from core.infrastructure.external_services.gemini_adapter import GeminiAdapter
+
+
+class FakeResponse:
+    text = "ok"
+    usage_metadata = None
+    candidates = []
+
+
+class FakeModel:
+    def __init__(self, active):
+        self.active = active
+
+    async def generate_content_async(self, inputs, stream=False):
+        self.active["now"] += 1
+        self.active["peak"] = max(self.active["peak"], self.active["now"])
+        await asyncio.sleep(0.01)
+        self.active["now"] -= 1
+        return FakeResponse()
+
+
+@pytest.mark.asyncio
+async def test_vertex_generations_are_bounded_and_model_is_cached(monkeypatch):
+    active = {"now": 0, "peak": 0}
+    adapter = GeminiAdapter(project_id="p", location="l", max_concurrent_requests=2)
+    monkeypatch.setattr(adapter, "_init_vertex", lambda: None)
+    monkeypatch.setitem(
+        gemini_adapter._vertex_models, ("p", "l", "gemini-test"), FakeModel(active)
+    )
+    config = ProviderConfig(provider=LLMProvider.GEMINI, model="gemini-test")
+
+    responses = await asyncio.gather(
+        *[adapter.generate_content_detailed("hi", config) for _ in range(5)]
+    )
+
+    assert [r.content for r in responses] == ["ok"] * 5
+    assert active["peak"] == 2
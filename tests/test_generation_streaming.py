@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+
+from core.application.interfaces.llm_provider_interface import LLMStreamChunk
+from core.domain.entities.agent import Agent
+from core.domain.entities.task import Task
+from core.domain.entities.workflow import Workflow
+from core.domain.value_objects.provider_config import ProviderConfig
+from core.infrastructure.orchestration.agent_executor import AgentExecutor
+from core.infrastructure.orchestration.generation_events import (
+    EVENT_STREAM_KEY,
+    STREAM_TOKENS_KEY,
+    GenerationEventStream,
+)
+from core.infrastructure.workflows.base.workflow_base import WorkflowHandler
+
+
+class StreamingProvider:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.buffered_calls = 0
+
+    async def generate_content(self, prompt, config, system_message=None):
+        self.buffered_calls += 1
+        raise AssertionError("final task should stream")
+
+    async def generate_content_stream(self, prompt, config, system_message=None):
+        for text in self.chunks:
+            yield LLMStreamChunk(content=text)
+        yield LLMStreamChunk(content="", is_final=True)
+
+
+class FlagRecordingHandler(WorkflowHandler):
+    def __init__(self):
+        self.stream_flags = {}
+        super().__init__("test_stream")
+
+    def load_template(self):
+        return {"tasks": []}
+
+    async def execute_single_task(self, task, context):
+        self.stream_flags[task.id] = context.get(STREAM_TOKENS_KEY)
+        await asyncio.sleep(0)
+        return f"{task.id} done"
+
+
+async def _drain(stream):
+    stream.close()
+    events = []
+    async for frame in stream.sse():
+        lines = frame.strip().split("\n")
+        events.append(
+            (lines[0][len("event: ") :], json.loads(lines[1][len("data: ") :]))
+        )
+    return events
+
+
+@pytest.mark.asyncio
+async def test_task_events_and_only_final_task_streams():
+    handler = FlagRecordingHandler()
+    workflow = Workflow(name="stream")
+    for task_id, deps in (("research", []), ("write", ["research"])):
+        workflow.add_task(Task(id=task_id, name=task_id, dependencies=deps))
+    stream = GenerationEventStream()
+
+    await handler.execute_tasks(workflow, {EVENT_STREAM_KEY: stream})
+
+    assert handler.stream_flags == {"research": False, "write": True}
+    events = await _drain(stream)
+    assert [(name, data["task_id"]) for name, data in events] == [
+        ("task_started", "research"),
+        ("task_completed", "research"),
+        ("task_started", "write"),
+        ("task_completed", "write"),
+    ]
+    assert events[3][1]["output_chars"] == len("write done")
+
+
+@pytest.mark.asyncio
+async def test_executor_streams_tokens_for_final_task():
+    provider = StreamingProvider(["Hello", ", ", "world"])
+    executor = AgentExecutor(None, provider, ProviderConfig())
+    stream = GenerationEventStream()
+    context = {
+        EVENT_STREAM_KEY: stream,
+        STREAM_TOKENS_KEY: True,
+        "task_id": "write",
+        "workflow_id": "wf-stream",
+    }
+
+    result = await executor.execute_agent(Agent(name="writer"), "Write it", context)
+
+    assert result == "Hello, world"
+    assert provider.buffered_calls == 0
+    events = await _drain(stream)
+    assert [data["content"] for name, data in events if name == "token"] == [
+        "Hello",
+        ", ",
+        "world",
+    ]
+    assert all(data["task_id"] == "write" for _, data in events)
+
+
+@pytest.mark.asyncio
+async def test_sse_sends_keepalive_while_idle():
+    stream = GenerationEventStream(heartbeat_seconds=0.01)
+    frames = stream.sse()
+
+    assert await frames.__anext__() == ": keep-alive\n\n"
+    stream.emit("result", {"ok": True})
+    assert await frames.__anext__() == 'event: result\ndata: {"ok": true}\n\n'
+    stream.close()
+    with pytest.raises(StopAsyncIteration):
+        await frames.__anext__()
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from core.infrastructure.config.settings import get_settings
+from core.infrastructure.external_services.http_client_registry import (
+    HttpClientRegistry,
+    _pool_settings,
+)
+
+
+async def _keep_alive_server():
+    async def handle(reader, writer):
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                b"Content-Type: application/json\r\n\r\n{}"
+            )
+            await writer.drain()
+
+    async def handle_safely(reader, writer):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle_safely, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    return server, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_one_client_per_host():
+    registry = HttpClientRegistry()
+    search = registry.get_client("https://google.serper.dev/search")
+    assert registry.get_client("https://google.serper.dev/other") is search
+    assert registry.get_client("https://api.perplexity.ai/chat") is not search
+    assert registry.get_client("https://google.serper.dev", verify=False) is not search
+
+    await registry.aclose()
+    assert search.is_closed
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused_across_calls():
+    server, base_url = await _keep_alive_server()
+    registry = HttpClientRegistry()
+    try:
+        for _ in range(3):
+            client = registry.get_client(base_url)
+            response = await client.get(f"{base_url}/health")
+            assert response.status_code == 200
+    finally:
+        await registry.aclose()
+        server.close()
+
+    stats = registry.get_stats()[base_url]
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 2
+
+
+def test_clients_of_a_closed_loop_are_closed_on_next_lookup():
+    registry = HttpClientRegistry()
+
+    async def lookup():
+        client = registry.get_client("https://google.serper.dev/search")
+        await asyncio.sleep(0)
+        return client
+
+    first = asyncio.run(lookup())
+    second = asyncio.run(lookup())
+
+    assert second is not first
+    assert first.is_closed
+    assert not second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_aclose_reaches_clients_of_other_running_loops():
+    registry = HttpClientRegistry()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def lookup():
+        return registry.get_client("https://api.perplexity.ai/chat")
+
+    try:
+        other = asyncio.run_coroutine_threadsafe(lookup(), other_loop).result(5)
+        local = registry.get_client("https://api.perplexity.ai/chat")
+        assert local is not other
+
+        await registry.aclose()
+
+        assert local.is_closed
+        assert other.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(5)
+        other_loop.close()
+
+
+@pytest.fixture
+def no_secret_key(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    get_settings.cache_clear()
+    yield monkeypatch
+    get_settings.cache_clear()
+
+
+def test_pool_settings_load_without_secret_key(no_secret_key):
+    no_secret_key.setenv("HTTP_POOL_MAX_CONNECTIONS", "7")
+    no_secret_key.setenv("HTTP2_ENABLED", "false")
+
+    pool = _pool_settings()
+
+    assert pool["max_connections"] == 7
+    assert pool["max_keepalive_connections"] == 20
+    assert pool["http2"] is False
+
+
+def test_pool_settings_surface_invalid_values(no_secret_key):
+    no_secret_key.setenv("HTTP_POOL_MAX_CONNECTIONS", "many")
+
+    with pytest.raises(ValidationError):
+        _pool_settings()
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+from core.infrastructure.jobs.job_queue import JobQueue
+from core.infrastructure.jobs.job_store import Job, JobStatus, SQLiteJobStore
+
+
+async def _wait_for(queue, job_id, status, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        job = await queue.get(job_id)
+        if job.status == status:
+            return job
+        assert asyncio.get_running_loop().time() < deadline, job.status
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_priority_then_round_robin_across_clients(tmp_path):
+    order = []
+
+    async def handler(job):
+        order.append(job.payload["name"])
+        return {"name": job.payload["name"]}
+
+    queue = JobQueue(SQLiteJobStore(str(tmp_path / "jobs.db")), workers=1)
+    queue.register_handler("gen", handler)
+    submitted = []
+    for name, client, priority in [
+        ("a1", "acme", 0),
+        ("a2", "acme", 0),
+        ("a3", "acme", 0),
+        ("b1", "beta", 0),
+        ("c1", "corp", 5),
+    ]:
+        job = await queue.submit(
+            "gen", {"name": name}, client_id=client, priority=priority
+        )
+        submitted.append(job)
+
+    await queue.start()
+    try:
+        for job in submitted:
+            done = await _wait_for(queue, job.id, JobStatus.SUCCEEDED)
+            assert done.result == {"name": job.payload["name"]}
+    finally:
+        await queue.stop()
+
+    assert order == ["c1", "a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_and_running_jobs(tmp_path):
+    started = asyncio.Event()
+
+    async def handler(job):
+        started.set()
+        await asyncio.sleep(10)
+
+    queue = JobQueue(SQLiteJobStore(str(tmp_path / "jobs.db")), workers=1)
+    queue.register_handler("gen", handler)
+    await queue.start()
+    try:
+        running = await queue.submit("gen", {}, client_id="acme")
+        await asyncio.wait_for(started.wait(), timeout=2)
+        # Same client is at its concurrency cap, so this one stays queued
+        queued = await queue.submit("gen", {}, client_id="acme")
+
+        assert (await queue.cancel(queued.id)).status == JobStatus.CANCELLED
+        assert (await queue.cancel(running.id)).status == JobStatus.CANCELLED
+        assert queue.get_stats()["running"] == 0
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_jobs_are_recovered_on_start(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    store = SQLiteJobStore(db_path)
+    retry = Job(kind="gen", payload={"n": 1})
+    exhausted = Job(kind="gen", payload={"n": 2}, attempts=1)
+    for job in (retry, exhausted):
+        store.insert(job)
+        store.mark_running(job.id)  # simulate a crash mid-run
+    store.close()
+
+    async def handler(job):
+        return {"n": job.payload["n"]}
+
+    queue = JobQueue(SQLiteJobStore(db_path), workers=1, max_attempts=2)
+    queue.register_handler("gen", handler)
+    await queue.start()
+    try:
+        recovered = await _wait_for(queue, retry.id, JobStatus.SUCCEEDED)
+        assert recovered.attempts == 2
+        failed = await queue.get(exhausted.id)
+        assert failed.status == JobStatus.FAILED
+    finally:
+        await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_graceful_stop_does_not_use_up_attempts(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    started = asyncio.Event()
+
+    async def handler(job):
+        started.set()
+        await asyncio.sleep(10)
+
+    queue = JobQueue(SQLiteJobStore(db_path), workers=1, max_attempts=2)
+    queue.register_handler("gen", handler)
+    await queue.start()
+    job = await queue.submit("gen", {}, client_id="acme")
+    await asyncio.wait_for(started.wait(), timeout=2)
+    await queue.stop()
+
+    requeued = await queue.get(job.id)
+    assert requeued.status == JobStatus.QUEUED
+    assert requeued.attempts == 0
+
+    # A crash on the next run still leaves one attempt to recover with
+    store = SQLiteJobStore(db_path)
+    store.mark_running(job.id)
+    assert store.recover_interrupted(max_attempts=2) == (1, 0)
+    store.close()
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from core.application.interfaces.llm_provider_interface import LLMResponse
+from core.domain.value_objects.provider_config import LLMProvider, ProviderConfig
+from core.infrastructure.cache.tiered_cache import TieredCache
+from core.infrastructure.external_services.caching_provider import (
+    CachingLLMProvider,
+    llm_cache_hit,
+)
+
+
+class _FakeProvider:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content(self, prompt, config, system_message=None):
+        self.calls += 1
+        return f"answer {self.calls} to {prompt}"
+
+    async def chat_completion(self, messages, config):
+        self.calls += 1
+        return LLMResponse(
+            content="chat answer",
+            model=config.model,
+            usage={"total_tokens": 12},
+            metadata={"raw": object()},
+        )
+
+    def generate_image(self):
+        return "image"
+
+
+def _config(temperature=0.0):
+    return ProviderConfig(
+        provider=LLMProvider.OPENAI, model="gpt-4o", temperature=temperature
+    )
+
+
+def test_tiered_cache_lru_eviction_and_ttl():
+    cache = TieredCache("test", max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    cache.set("short", "x", ttl_seconds=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+    stats = cache.get_stats()
+    assert stats["evictions"] >= 1
+    assert stats["misses"] == 2
+
+
+def test_tiered_cache_disk_tier_survives_restart_and_evicts(tmp_path):
+    cache = TieredCache("test", max_entries=1, disk_dir=str(tmp_path))
+    cache.set("a", {"v": 1})
+    cache.set("b", {"v": 2})
+
+    assert cache.get("a") == {"v": 1}
+    assert cache.get_stats()["disk_hits"] == 1
+    assert TieredCache("test", disk_dir=str(tmp_path)).get("b") == {"v": 2}
+
+    small = TieredCache("small", disk_dir=str(tmp_path / "small"), disk_max_bytes=200)
+    for i in range(10):
+        small.set(f"k{i}", "x" * 40)
+    assert small.get_stats()["disk_bytes"] <= 200
+    assert small.get_stats()["disk_evictions"] > 0
+
+
+@pytest.mark.asyncio
+async def test_identical_deterministic_requests_hit_cache():
+    fake = _FakeProvider()
+    provider = CachingLLMProvider(fake, TieredCache("llm"))
+
+    first = await provider.generate_content("hi", _config(), "sys")
+    assert llm_cache_hit.get() is False
+    second = await provider.generate_content("hi", _config(), "sys")
+
+    assert first == second
+    assert fake.calls == 1
+    assert llm_cache_hit.get() is True
+    await provider.generate_content("hi", _config(), "other system message")
+    assert fake.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_bypass_cache():
+    fake = _FakeProvider()
+    provider = CachingLLMProvider(fake, TieredCache("llm"))
+
+    await provider.generate_content("hi", _config(temperature=0.7))
+    await provider.generate_content("hi", _config(temperature=0.7))
+
+    assert fake.calls == 2
+    assert llm_cache_hit.get() is False
+
+
+@pytest.mark.asyncio
+async def test_chat_completion_cached_response_is_marked(tmp_path):
+    fake = _FakeProvider()
+    provider = CachingLLMProvider(fake, TieredCache("llm", disk_dir=str(tmp_path)))
+    messages = [{"role": "user", "content": "hello"}]
+
+    await provider.chat_completion(messages, _config())
+    cached = await provider.chat_completion(messages, _config())
+
+    assert fake.calls == 1
+    assert cached.content == "chat answer"
+    assert cached.metadata["cache_hit"] is True
+    assert provider.generate_image() == "image"
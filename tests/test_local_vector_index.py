@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from core.infrastructure.config.settings import get_settings
+from core.infrastructure.tools.local_vector_index import LocalKnowledgeIndex
+from core.infrastructure.tools.rag_tool import RAGTool
+
+TOPICS = ("tone", "compliance", "pricing")
+
+
+def _write(path, text, mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+class TopicEmbedder:
+    """One dimension per topic word, so cosine similarity follows the topic."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(word in text.lower()) for word in TOPICS] for text in texts]
+
+
+def test_refresh_embeds_only_changed_files_and_reloads_from_disk(tmp_path):
+    kb, index_dir = tmp_path / "kb", tmp_path / "index"
+    _write(kb / "brand.md", "# Voice\n\nOur tone is warm and direct.")
+    _write(kb / "legal/rules.md", "# Rules\n\nCompliance: never promise returns.")
+    embedder = TopicEmbedder()
+    index = LocalKnowledgeIndex(kb, index_dir, model="m", embedder=embedder)
+
+    assert index.refresh() is True
+    assert len(embedder.calls[0]) == 2
+    assert index.refresh() is False
+
+    _write(kb / "brand.md", "# Voice\n\nOur tone is playful.", mtime=1)
+    (kb / "legal/rules.md").unlink()
+    _write(kb / "pricing.md", "# Plans\n\nPricing starts at zero.")
+    assert index.refresh() is True
+    assert sorted(embedder.calls[1]) == [
+        "Plans\n\nPricing starts at zero.",
+        "Voice\n\nOur tone is playful.",
+    ]
+
+    reloaded = LocalKnowledgeIndex(kb, index_dir, model="m", embedder=embedder)
+    assert reloaded.refresh() is False
+    assert reloaded.has_vectors
+    assert [hit.path for hit in reloaded.search("playful", k=5)] == ["brand.md"]
+    # A different embedding model invalidates the stored vectors
+    rebuilt = LocalKnowledgeIndex(kb, index_dir, model="other", embedder=embedder)
+    assert rebuilt.refresh() is True
+
+
+def test_search_fuses_bm25_and_cosine_rankings(tmp_path):
+    kb = tmp_path / "kb"
+    _write(kb / "voice.md", "# Voice\n\nThe brand tone is warm.")
+    _write(kb / "legal.md", "# Legal\n\nCompliance review for every brand claim.")
+    _write(kb / "faq.md", "# FAQ\n\nPricing questions about the brand.")
+    embedder = TopicEmbedder()
+    index = LocalKnowledgeIndex(kb, tmp_path / "index", model="m", embedder=embedder)
+    index.refresh()
+
+    keyword_only = index.search("compliance", k=3)
+    assert [hit.path for hit in keyword_only] == ["legal.md"]
+    assert keyword_only[0].similarity is None
+
+    # "brand" matches every file; the query vector breaks the tie towards tone
+    hits = index.search("brand", k=3, query_vector=embedder(["tone"])[0])
+    assert hits[0].path == "voice.md"
+    assert hits[0].similarity == pytest.approx(1.0, abs=1e-3)
+    assert len(hits) == 3
+
+
+@pytest.mark.asyncio
+async def test_search_content_uses_local_index_without_supabase(tmp_path, monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("SUPABASE_URL", "")
+    monkeypatch.setenv("OPENAI_API_KEY", "")
+    monkeypatch.setenv("KNOWLEDGE_BASE_DIR", str(tmp_path / "kb"))
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path / "cache"))
+    get_settings.cache_clear()
+    _write(tmp_path / "kb/acme/brand.md", "# Voice\n\nAcme speaks plainly.")
+    _write(tmp_path / "kb/acme/products.md", "# Widgets\n\nWidgets ship in blue.")
+    try:
+        rag_tool = RAGTool()
+        assert rag_tool.use_filesystem_fallback
+
+        result = await rag_tool.search_content("acme", "which widgets colours")
+
+        assert "## products.md — Widgets" in result
+        assert "Widgets ship in blue." in result
+        assert "Acme speaks plainly" not in result
+        missing = await rag_tool.search_content("nobody", "widgets")
+        assert missing == "Knowledge base not found for client 'nobody'"
+    finally:
+        get_settings.cache_clear()
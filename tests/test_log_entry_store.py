@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timedelta
+
+from core.infrastructure.logging.agent_logger import AgentLogger, LogEntry
+from core.infrastructure.logging.log_entry_store import LogEntryStore
+
+
+def _entry(i, workflow="wf1", agent="writer", session="s1", **kwargs):
+    return LogEntry(
+        workflow_id=workflow,
+        agent_name=agent,
+        message=f"entry {i}",
+        data={"session_id": session},
+        **kwargs,
+    )
+
+
+def test_ring_buffer_evicts_oldest_and_keeps_indexes_consistent():
+    store = LogEntryStore(max_entries=3)
+    for i in range(5):
+        store.append(_entry(i, workflow=f"wf{i % 2}"))
+
+    assert [e.message for e in store] == ["entry 2", "entry 3", "entry 4"]
+    assert [e.message for e in store.by_workflow("wf0")] == ["entry 2", "entry 4"]
+    assert [e.message for e in store.by_workflow("wf1")] == ["entry 3"]
+    assert len(store.by_session("s1")) == 3
+    assert store.get_stats()["evicted"] == 2
+
+
+def test_recent_filters_by_index_most_recent_first():
+    store = LogEntryStore()
+    for i in range(6):
+        store.append(_entry(i, workflow=f"wf{i % 2}", agent=f"agent{i % 3}"))
+
+    recent = store.recent(2, workflow_id="wf0")
+    assert [e.message for e in recent] == ["entry 4", "entry 2"]
+    both = store.recent(10, agent_name="agent0", workflow_id="wf1")
+    assert [e.message for e in both] == ["entry 3"]
+    assert store.recent(10, agent_name="missing") == []
+
+
+def test_since_stops_at_cutoff():
+    store = LogEntryStore()
+    now = datetime.utcnow()
+    for i in range(4):
+        store.append(_entry(i, timestamp=now - timedelta(hours=4 - i)))
+
+    assert [e.message for e in store.since(now - timedelta(hours=2, minutes=30))] == [
+        "entry 2",
+        "entry 3",
+    ]
+
+
+def test_evicted_entries_spill_to_jsonl(tmp_path):
+    spill = tmp_path / "agent_log.jsonl"
+    store = LogEntryStore(max_entries=2, spill_path=str(spill), spill_batch_size=2)
+    for i in range(5):
+        store.append(_entry(i))
+    store.flush()
+
+    rows = [json.loads(line) for line in spill.read_text().splitlines()]
+    assert [row["message"] for row in rows] == ["entry 0", "entry 1", "entry 2"]
+
+
+def test_stale_sessions_are_pruned():
+    logger = AgentLogger("test_agent_logger", max_entries=10, session_ttl_seconds=60)
+    stale = logger.start_agent_session("a", "agent", "t", "wf", "task")
+    logger.active_sessions[stale]["start_time"] -= 120
+    logger._last_session_prune = 0
+
+    fresh = logger.start_agent_session("a", "agent", "t", "wf", "task")
+
+    assert stale not in logger.active_sessions
+    assert fresh in logger.active_sessions
@@ -0,0 +1,48 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.infrastructure.logging import metrics
+from core.infrastructure.logging.metrics import _BoundedLabels, install_metrics
+
+
+def test_label_values_are_bounded():
+    limiter = _BoundedLabels(max_values=2)
+
+    assert limiter.bound("m", "model", "a") == "a"
+    assert limiter.bound("m", "model", "b") == "b"
+    assert limiter.bound("m", "model", "c") == "other"
+    assert limiter.bound("m", "model", "a") == "a"
+    assert limiter.bound("m", "tool", "c") == "c"
+    assert limiter.bound("m", "model", None) == "other"
+
+
+def test_observers_accept_calls_with_or_without_prometheus():
+    metrics.observe_llm_call("openai", "gpt-4o", 1.2, 100, 50, 0.01)
+    metrics.observe_tool_call("web_search", 0.3, 0.001)
+    metrics.observe_tool_call("web_search", 0.3, success=False)
+    metrics.observe_workflow("newsletter", 42.0, success=True)
+
+
+def test_metrics_endpoint_exposes_histograms():
+    pytest.importorskip("prometheus_client")
+    app = FastAPI()
+    install_metrics(app, app_name="test")
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    metrics.register_queue_depth("test_queue", lambda: 7)
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    metrics.observe_llm_call("openai", "gpt-4o", 1.2, 100, 50, 0.01)
+
+    body = client.get("/metrics").text
+    assert 'route="/items/{item_id}"' in body
+    assert (
+        'llm_request_duration_seconds_count{cache="miss",model="gpt-4o",provider="openai"}'
+        in body
+    )
+    assert 'queue_depth{queue="test_queue"} 7.0' in body
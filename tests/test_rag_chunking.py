@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from core.infrastructure.config.settings import get_settings
+from core.infrastructure.tools.document_chunker import chunk_markdown, count_tokens
+from core.infrastructure.tools.rag_tool import RAGTool
+
+
+@pytest.fixture
+def rag_tool(monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", "test-secret")
+    monkeypatch.setenv("SUPABASE_URL", "")
+    get_settings.cache_clear()
+    yield RAGTool()
+    get_settings.cache_clear()
+
+
+def _sum_part_tokens(chunk):
+    return sum(count_tokens(part) for part in chunk.content.split("\n\n"))
+
+
+def test_chunks_respect_headings_budget_and_overlap():
+    text = "\n".join(
+        [
+            "# Guide",
+            "Intro paragraph.",
+            "```",
+            "# not a heading inside a code fence",
+            "```",
+            "## Voice",
+            "\n\n".join(f"Sentence number {i} about tone." for i in range(40)),
+            "## Compliance",
+            "Never promise returns.",
+        ]
+    )
+
+    chunks = chunk_markdown(text, max_tokens=40, overlap_tokens=10)
+
+    assert chunks[0].heading == "Guide"
+    assert "not a heading" in chunks[0].content
+    voice = [c for c in chunks if c.heading == "Guide > Voice"]
+    assert len(voice) > 1
+    assert all(c.token_count <= 40 for c in chunks)
+    assert all(c.token_count == _sum_part_tokens(c) for c in chunks)
+    # Consecutive chunks of a section share their boundary paragraph
+    assert voice[0].content.split("\n\n")[-1] == voice[1].content.split("\n\n")[0]
+    assert chunks[-1].heading == "Guide > Compliance"
+    assert chunks[-1].content == "Never promise returns."
+    assert [c.index for c in chunks] == list(range(len(chunks)))
+
+
+def test_index_document_stores_chunks_and_mean_embedding(rag_tool, monkeypatch):
+    def embed_texts(texts):
+        return [[1.0, 0.0] if i % 2 == 0 else [0.0, 1.0] for i in range(len(texts))]
+
+    monkeypatch.setattr(rag_tool, "_embed_texts", embed_texts)
+    rag_tool.supabase = MagicMock()
+
+    stored = rag_tool.index_document("doc-1", "# A\n\nfirst part\n\n# B\n\nsecond part")
+
+    assert stored == 2
+    name, params = rag_tool.supabase.rpc.call_args.args
+    assert name == "replace_document_chunks"
+    assert params["document_id"] == "doc-1"
+    rows = params["rows"]
+    assert [(r["chunk_index"], r["heading"], r["content"]) for r in rows] == [
+        (0, "A", "first part"),
+        (1, "B", "second part"),
+    ]
+    assert rows[0]["embedding"] == [1.0, 0.0]
+    # Chunks are replaced in one RPC, never by separate delete and insert calls
+    rag_tool.supabase.table.return_value.delete.assert_not_called()
+    update = rag_tool.supabase.table.return_value.update.call_args.args[0]
+    assert update["embedding"] == pytest.approx([2**-0.5, 2**-0.5])
+
+
+@pytest.mark.asyncio
+async def test_search_content_returns_top_chunks(rag_tool, monkeypatch):
+    monkeypatch.setattr(rag_tool, "_embed_text", lambda text: [0.1, 0.2])
+    rag_tool.supabase = Mock()
+    rag_tool.supabase.rpc.return_value = Mock(
+        execute=Mock(
+            return_value=Mock(
+                data=[
+                    {
+                        "document_id": "doc-1",
+                        "title": "brand.md",
+                        "heading": "Voice",
+                        "content": "Be direct.",
+                        "similarity": 0.91,
+                    }
+                ]
+            )
+        )
+    )
+    rag_tool.set_selected_documents(["doc-1"])
+
+    result = await rag_tool.search_content("acme", "tone of voice")
+
+    name, params = rag_tool.supabase.rpc.call_args.args
+    assert name == "match_document_chunks"
+    assert params["document_ids"] == ["doc-1"]
+    assert "## brand.md — Voice" in result
+    assert "Be direct." in result
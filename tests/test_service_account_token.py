@@ -0,0 +1,108 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.infrastructure.external_services.service_account_token import (
+    ServiceAccountTokenProvider,
+)
+
+
+class FakeCredentials:
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.token = None
+        self.expiry = None
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        # google-auth hands back naive UTC expiries
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + self.lifetime
+
+
+def _provider(lifetime, margin=60.0):
+    creds = FakeCredentials(lifetime)
+    provider = ServiceAccountTokenProvider(
+        "sa.json",
+        refresh_margin_seconds=margin,
+        credentials_loader=lambda path: creds,
+        request_factory=lambda: None,
+    )
+    return provider, creds
+
+
+@pytest.mark.asyncio
+async def test_token_is_cached_between_calls():
+    provider, creds = _provider(timedelta(hours=1))
+    try:
+        assert await provider.get_token() == "token-1"
+        assert await provider.get_token() == "token-1"
+        assert creds.refreshes == 1
+    finally:
+        provider.close()
+
+
+@pytest.mark.asyncio
+async def test_expiring_token_is_returned_while_refreshing_in_background():
+    provider, creds = _provider(timedelta(seconds=60.05), margin=60.0)
+    try:
+        provider.refresh()
+        provider.close()  # disable the timer so only the on-access refresh runs
+        await asyncio.sleep(0.06)
+
+        assert await provider.get_token() == "token-1"
+        for _ in range(100):
+            if creds.refreshes == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert await provider.get_token() == "token-2"
+    finally:
+        provider.close()
+
+
+@pytest.mark.asyncio
+async def test_short_lived_token_is_not_refreshed_on_every_access():
+    provider, creds = _provider(timedelta(seconds=30), margin=60.0)
+    try:
+        assert await provider.get_token() == "token-1"
+        for _ in range(20):
+            assert await provider.get_token() == "token-1"
+            await asyncio.sleep(0.005)
+        assert creds.refreshes == 1
+    finally:
+        provider.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_is_scheduled_before_expiry():
+    provider, creds = _provider(timedelta(seconds=60.05), margin=60.0)
+    try:
+        await provider.get_token()
+        for _ in range(100):
+            if creds.refreshes >= 2:
+                break
+            await asyncio.sleep(0.01)
+        assert creds.refreshes >= 2
+    finally:
+        provider.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_start_refreshes_once():
+    provider, creds = _provider(timedelta(hours=1))
+    original_refresh = creds.refresh
+
+    def slow_refresh(request):
+        time.sleep(0.05)
+        original_refresh(request)
+
+    creds.refresh = slow_refresh
+    try:
+        tokens = await asyncio.gather(*(provider.get_token() for _ in range(5)))
+        assert tokens == ["token-1"] * 5
+        assert creds.refreshes == 1
+    finally:
+        provider.close()
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from core.infrastructure.database.supabase_io import SupabaseIO
+from core.infrastructure.logging.event_loop_monitor import EventLoopLagMonitor
+
+
+class SlowQuery:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def execute(self):
+        time.sleep(self.delay)
+        return Mock(data=[{"id": "1"}])
+
+
+@pytest.mark.asyncio
+async def test_execute_keeps_event_loop_free():
+    io = SupabaseIO(max_workers=4)
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+    monitor.start()
+    try:
+        results = await asyncio.gather(*[io.execute(SlowQuery(0.1)) for _ in range(4)])
+    finally:
+        await monitor.stop()
+        io.shutdown()
+
+    assert [r.data for r in results] == [[{"id": "1"}]] * 4
+    assert monitor.get_stats()["max_lag_ms"] < 50
+    assert io.get_stats()["calls"] == 4
+
+
+def test_submit_runs_inline_without_event_loop():
+    io = SupabaseIO(max_workers=1)
+    call = Mock()
+
+    assert io.submit(call, "inline write") is None
+    call.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_in_background_inside_event_loop():
+    io = SupabaseIO(max_workers=1)
+    call = Mock(side_effect=RuntimeError("boom"))
+
+    future = io.submit(call, "background write")
+    assert future is not None
+    io.shutdown(wait=True)
+
+    call.assert_called_once()
+    assert io.get_stats()["background_failed"] == 1
@@ -1,18 +1,26 @@
+import asyncio
+import threading
+import time
 from unittest.mock import Mock
 
+import pytest
+
+from core.infrastructure.database.supabase_io import supabase_io
 from core.infrastructure.database.supabase_tracker import SupabaseTracker
 
 
-def _mock_tracker():
+def _mock_tracker(**write_behind):
     tracker = SupabaseTracker.__new__(SupabaseTracker)
     tracker.client = Mock()
     tracker.client.table.return_value.insert.return_value.execute.return_value = None
+    tracker._init_write_behind(**write_behind)
     return tracker
 
 
 def test_log_rag_document_calls_supabase():
     tracker = _mock_tracker()
     tracker.log_rag_document("run1", "client", "doc.md", None, agent_name="agent")
+    tracker.flush()
     tracker.client.table.assert_called_with("run_documents")
     tracker.client.table.return_value.insert.assert_called()
 
@@ -20,6 +28,7 @@ def test_log_rag_document_calls_supabase():
 def test_save_run_content_calls_supabase():
     tracker = _mock_tracker()
     tracker.save_run_content("run1", "client", "workflow", "title", "body", {"a": 1})
+    tracker.flush()
     tracker.client.table.assert_called_with("content_generations")
     tracker.client.table.return_value.insert.assert_called()
 
@@ -27,5 +36,141 @@ def test_save_run_content_calls_supabase():
 def test_log_rag_chunk_calls_supabase():
     tracker = _mock_tracker()
     tracker.log_rag_chunk("run1", "agent", "doc1", "chunk", 0.9)
+    tracker.flush()
     tracker.client.table.assert_called_with("run_document_chunks")
     tracker.client.table.return_value.insert.assert_called()
+
+
+def test_rows_are_buffered_and_bulk_inserted():
+    tracker = _mock_tracker(batch_size=3)
+    insert = tracker.client.table.return_value.insert
+
+    tracker.add_log("run1", "info", "one")
+    tracker.add_log("run1", "info", "two")
+    insert.assert_not_called()
+
+    tracker.add_log("run1", "info", "three")
+    insert.assert_called_once()
+    rows = insert.call_args.args[0]
+    assert [row["message"] for row in rows] == ["one", "two", "three"]
+    assert tracker.get_telemetry_stats()["rows_pending"] == 0
+
+
+def test_bulk_insert_groups_rows_by_columns():
+    tracker = _mock_tracker()
+    tracker.add_log("run1", "info", "plain")
+    tracker.add_log("run1", "info", "with agent", agent_name="agent")
+    tracker.add_log("run1", "info", "plain again")
+    tracker.flush()
+
+    batches = [
+        c.args[0] for c in tracker.client.table.return_value.insert.call_args_list
+    ]
+    assert sorted(len(batch) for batch in batches) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_buffer_cap_drops_rows_without_blocking_the_caller():
+    release = threading.Event()
+    tracker = _mock_tracker(batch_size=5, max_buffered_rows=10)
+    tracker.client.table.return_value.insert.return_value.execute.side_effect = (
+        lambda: release.wait(5)
+    )
+
+    started = time.monotonic()
+    for i in range(14):
+        tracker.add_log("run1", "info", f"log {i}")
+    elapsed = time.monotonic() - started
+    stats = tracker.get_telemetry_stats()
+    release.set()
+    supabase_io.shutdown(wait=True)
+
+    assert elapsed < 0.5
+    assert stats["rows_dropped"] == 4
+    assert stats["rows_pending"] == 10
+    assert tracker.get_telemetry_stats()["rows_flushed"] == 10
+
+
+@pytest.mark.asyncio
+async def test_buffer_accepts_rows_again_once_writes_drain():
+    release = threading.Event()
+    tracker = _mock_tracker(batch_size=5, max_buffered_rows=10)
+    tracker.client.table.return_value.insert.return_value.execute.side_effect = (
+        lambda: release.wait(5)
+    )
+
+    for i in range(11):
+        tracker.add_log("run1", "info", f"log {i}")
+    release.set()
+    supabase_io.shutdown(wait=True)
+    tracker.add_log("run1", "info", "after drain")
+    tracker.flush(wait_for_completion=True)
+
+    stats = tracker.get_telemetry_stats()
+    assert stats["rows_dropped"] == 1
+    assert stats["rows_flushed"] == 11
+    assert stats["rows_pending"] == 0
+
+
+def test_failed_bulk_insert_falls_back_to_single_rows():
+    tracker = _mock_tracker()
+
+    def insert(rows):
+        request = Mock()
+        if isinstance(rows, list) and len(rows) > 1:
+            request.execute.side_effect = RuntimeError("column status not found")
+        elif not isinstance(rows, list) and rows["message"] == "bad":
+            request.execute.side_effect = RuntimeError("invalid row")
+        return request
+
+    tracker.client.table.return_value.insert.side_effect = insert
+    tracker.add_log("run1", "info", "good")
+    tracker.add_log("run1", "info", "bad")
+    tracker.add_log("run1", "info", "with agent", agent_name="agent")
+    tracker.flush()
+
+    stats = tracker.get_telemetry_stats()
+    assert (stats["rows_flushed"], stats["rows_failed"]) == (2, 1)
+    assert stats["batches_failed"] == 1
+    assert stats["rows_pending"] == 0
+
+
+def test_complete_workflow_run_flushes_buffer():
+    tracker = _mock_tracker()
+    tracker.add_log("run1", "info", "pending")
+    tracker.complete_workflow_run("run1")
+
+    tracker.client.table.return_value.insert.assert_called_once()
+    tracker.client.table.return_value.update.assert_called_once()
+    assert tracker.get_telemetry_stats()["tables_buffered"] == []
+
+
+@pytest.mark.asyncio
+async def test_complete_workflow_run_waits_for_in_flight_telemetry():
+    calls = []
+    release = threading.Event()
+    tracker = _mock_tracker(batch_size=2)
+    table = tracker.client.table.return_value
+
+    def slow_insert():
+        release.wait(5)
+        calls.append("insert")
+
+    table.insert.return_value.execute.side_effect = slow_insert
+    table.update.return_value.eq.return_value.execute.side_effect = (
+        lambda: calls.append("update")
+    )
+
+    tracker.add_log("run1", "info", "one")
+    tracker.add_log("run1", "info", "two")
+    tracker.add_log("run1", "info", "three")
+    tracker.complete_workflow_run("run1")
+    await asyncio.sleep(0.05)
+    assert calls == []
+
+    release.set()
+    for _ in range(100):
+        if "update" in calls:
+            break
+        await asyncio.sleep(0.01)
+    assert calls == ["insert", "insert", "update"]
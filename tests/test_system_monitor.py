@@ -0,0 +1,81 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.infrastructure.logging.system_monitor import SystemMetrics, SystemMonitor
+from core.infrastructure.logging.time_series import MetricRingBuffer, RollupSeries
+
+
+def _metrics(timestamp, cpu):
+    return SystemMetrics(
+        timestamp=timestamp,
+        cpu_percent=cpu,
+        memory_percent=50.0,
+        memory_used_gb=4.0,
+        memory_total_gb=8.0,
+        disk_percent=40.0,
+        disk_used_gb=10.0,
+        disk_total_gb=25.0,
+    )
+
+
+def test_ring_buffer_overwrites_oldest_samples():
+    buffer = MetricRingBuffer(capacity=3)
+    for i in range(5):
+        buffer.append(float(i), i * 10.0)
+
+    assert len(buffer) == 3
+    assert buffer.samples() == [(2.0, 20.0), (3.0, 30.0), (4.0, 40.0)]
+    assert buffer.latest() == (4.0, 40.0)
+    assert buffer.samples(since=3.0) == [(3.0, 30.0), (4.0, 40.0)]
+
+
+def test_rollup_buckets_aggregate_per_resolution():
+    rollup = RollupSeries(resolution_seconds=60, retention_seconds=180)
+    for ts, value in [(0, 1.0), (30, 3.0), (60, 10.0), (250, 5.0)]:
+        rollup.add(ts, value)
+
+    buckets = rollup.buckets()
+    assert [(b["bucket_start"], b["count"], b["avg"]) for b in buckets] == [
+        (0, 2, 2.0),
+        (60, 1, 10.0),
+        (240, 1, 5.0),
+    ]
+    assert buckets[0]["min"] == 1.0 and buckets[0]["max"] == 3.0
+    assert rollup.current()["avg"] == 5.0
+
+
+@pytest.mark.asyncio
+async def test_status_reads_rollups_and_persistence_appends(tmp_path):
+    monitor = SystemMonitor(log_dir=str(tmp_path), interval_seconds=60)
+    start = datetime(2026, 1, 1, 12, 0, 0)
+    for minute, cpu in enumerate([10.0, 30.0, 50.0]):
+        monitor.record_metrics(_metrics(start + timedelta(minutes=minute), cpu))
+        await monitor.save_metrics()
+
+    status = monitor.get_current_status()
+    assert status["system_metrics"]["cpu_percent"] == 50.0
+    assert status["rollups"]["1m"]["cpu_percent"]["avg"] == 50.0
+    assert status["rollups"]["1h"]["cpu_percent"]["avg"] == 30.0
+    assert status["rollups"]["1h"]["load_average"] is None
+    assert len(monitor.get_series("cpu_percent")) == 3
+
+    files = list(tmp_path.glob("system_metrics_*.jsonl"))
+    lines = files[0].read_text().splitlines()
+    assert [json.loads(line)["metrics"]["cpu_percent"] for line in lines] == [
+        10.0,
+        30.0,
+        50.0,
+    ]
+
+
+def test_errors_outside_24h_are_dropped(tmp_path):
+    monitor = SystemMonitor(log_dir=str(tmp_path))
+    monitor.error_history.append(
+        {"timestamp": (datetime.utcnow() - timedelta(hours=25)).isoformat()}
+    )
+    monitor.log_error("boom", "failed")
+
+    assert len(monitor.error_history) == 1
+    assert monitor._count_errors_since(datetime.utcnow() - timedelta(hours=1)) == 1
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from core.infrastructure.tools.web_search_tool import (
+    RequestRateLimiter,
+    WebSearchTool,
+)
+
+
+def _tool(handler, **kwargs):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    kwargs.setdefault("requests_per_second", 0)
+    return WebSearchTool("key", client=client, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_search_uses_async_client():
+    async def handler(request):
+        assert request.headers["X-API-KEY"] == "key"
+        body = json.loads(request.content)
+        return httpx.Response(200, json={"organic": [{"title": body["q"]}]})
+
+    result = await _tool(handler).search("python", {"num": 3})
+    assert result["provider"] == "serper"
+    assert result["data"] == {"organic": [{"title": "python"}]}
+
+
+@pytest.mark.asyncio
+async def test_search_raises_on_http_error():
+    tool = _tool(lambda request: httpx.Response(429, json={"message": "slow down"}))
+    with pytest.raises(Exception, match="API error 429"):
+        await tool.search("python")
+
+
+@pytest.mark.asyncio
+async def test_search_many_keeps_order_and_limits_concurrency():
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01)
+        active["now"] -= 1
+        return httpx.Response(200, json={"q": json.loads(request.content)["q"]})
+
+    tool = _tool(handler, max_concurrency=2)
+    results = await tool.search_many([f"q{i}" for i in range(6)])
+
+    assert [r["data"]["q"] for r in results] == [f"q{i}" for i in range(6)]
+    assert active["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_spaces_requests_after_the_burst():
+    limiter = RequestRateLimiter(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        await limiter.acquire()
+
+    # Two go through immediately, the other four wait 1/20s each
+    assert time.monotonic() - start >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_search_many_respects_requests_per_second():
+    started = []
+
+    async def handler(request):
+        started.append(time.monotonic())
+        return httpx.Response(200, json={})
+
+    tool = _tool(handler, max_concurrency=10, requests_per_second=20)
+    await tool.search_many([f"q{i}" for i in range(25)])
+
+    # 20 burst tokens, then one request every 50ms
+    assert started[-1] - started[0] >= 0.2
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from core.infrastructure.logging.agent_logger import AgentLogger
+from core.infrastructure.logging.workflow_reporter import (
+    WorkflowMetrics,
+    WorkflowReporter,
+)
+
+
+def _reporter(**kwargs):
+    source = AgentLogger("test_workflow_reporter")
+    return source, WorkflowReporter(source=source, **kwargs)
+
+
+def _run_agent(source, workflow_id, cost=0.01, tokens=100, output="done"):
+    session = source.start_agent_session(
+        "a1", "writer", "task3_content", workflow_id, "t"
+    )
+    source.log_llm_response(
+        session, "r1", "openai", "gpt-4o", "resp", tokens, cost, 50.0
+    )
+    source.log_tool_response(
+        session,
+        "c1",
+        "web_search",
+        "out",
+        10.0,
+        cost_usd=0.002,
+        metadata={"cache_hit": False},
+    )
+    source.end_agent_session(session, success=True, final_output=output)
+
+
+def test_metrics_are_aggregated_as_entries_are_logged():
+    source, reporter = _reporter()
+    reporter.start_workflow_tracking("wf1", "newsletter")
+    reporter.start_workflow_tracking("wf2", "newsletter")
+    _run_agent(source, "wf1")
+    _run_agent(source, "wf2", cost=1.0)
+    _run_agent(source, "untracked")
+
+    # Completion no longer reads the log
+    source.entries = None
+    metrics = reporter.complete_workflow_tracking("wf1")
+
+    assert metrics.total_llm_calls == 1
+    assert metrics.total_tool_calls == 1
+    assert metrics.total_tokens == 100
+    assert metrics.total_cost == 0.012
+    assert metrics.tasks_completed == 1
+    assert metrics.final_output_length == len("done")
+    assert metrics.tool_cache_misses == {"web_search": 1}
+    assert [a.agent_name for a in metrics.agents_used] == ["writer"]
+    assert reporter.get_workflow_report("wf1")["total_cost"] == 0.012
+    assert reporter.get_workflow_report("wf2")["total_cost"] == 1.002
+
+
+def test_completed_workflows_are_bounded_by_count_and_age():
+    _, reporter = _reporter(retention_days=7, max_completed_workflows=2)
+    old = WorkflowMetrics("old", "x", start_time=datetime.utcnow() - timedelta(days=8))
+    reporter._store_completed(old)
+    for i in range(3):
+        reporter.start_workflow_tracking(f"wf{i}", "x")
+        reporter.complete_workflow_tracking(f"wf{i}")
+
+    assert [w.workflow_id for w in reporter.completed_workflows] == ["wf1", "wf2"]
+    assert reporter.get_workflow_report("old") is None
+    assert reporter.get_workflow_report("wf0") is None
+    assert reporter.get_summary_report(days=7)["total_workflows"] == 2
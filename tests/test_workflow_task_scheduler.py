@@ -0,0 +1,98 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from core.domain.entities.task import Task
+from core.domain.entities.workflow import Workflow
+from core.infrastructure.workflows.base.workflow_base import WorkflowHandler
+
+TEMPLATES_DIR = (
+    Path(__file__).resolve().parents[1] / "core/infrastructure/workflows/templates"
+)
+
+
+class RecordingHandler(WorkflowHandler):
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.seen_contexts = {}
+        super().__init__("test_dag")
+
+    def load_template(self):
+        return {"tasks": []}
+
+    async def execute_single_task(self, task, context):
+        self.seen_contexts[task.id] = dict(context)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        return f"{task.id} done"
+
+
+def _workflow(*specs):
+    workflow = Workflow(name="dag")
+    for task_id, deps in specs:
+        workflow.add_task(Task(id=task_id, name=task_id, dependencies=deps))
+    return workflow
+
+
+@pytest.mark.asyncio
+async def test_independent_tasks_run_concurrently():
+    handler = RecordingHandler()
+    workflow = _workflow(
+        ("brief", []),
+        ("research", ["brief"]),
+        ("rag", ["brief"]),
+        ("write", ["research", "rag"]),
+    )
+
+    results = await handler.execute_tasks(workflow, {})
+
+    assert handler.max_running == 2
+    assert results["write_output"] == "write done"
+    write_context = handler.seen_contexts["write"]
+    assert write_context["brief"] == "brief done"
+    assert write_context["research"] == "research done"
+    assert write_context["rag"] == "rag done"
+    assert "research" not in handler.seen_contexts["rag"]
+
+
+@pytest.mark.asyncio
+async def test_parallelism_is_bounded_and_skipped_dependencies_are_ignored():
+    handler = RecordingHandler()
+    workflow = _workflow(("a", ["skipped"]), ("b", []), ("c", []), ("d", []))
+
+    await handler.execute_tasks(workflow, {"max_parallel_tasks": 2})
+
+    assert handler.max_running == 2
+    assert set(handler.seen_contexts) == {"a", "b", "c", "d"}
+
+
+@pytest.mark.asyncio
+async def test_circular_dependencies_are_rejected():
+    handler = RecordingHandler()
+    workflow = _workflow(("a", ["b"]), ("b", ["a"]))
+
+    with pytest.raises(ValueError):
+        await handler.execute_tasks(workflow, {})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "template", ["siebert_premium_newsletter", "siebert_newsletter_html"]
+)
+async def test_siebert_research_runs_alongside_context_setup(template):
+    tasks = json.loads((TEMPLATES_DIR / f"{template}.json").read_text())["tasks"]
+    handler = RecordingHandler()
+    workflow = _workflow(*[(task["id"], task["dependencies"]) for task in tasks])
+
+    await handler.execute_tasks(workflow, {})
+
+    assert handler.max_running == 2
+    assembly_context = handler.seen_contexts["task3_newsletter_assembly"]
+    assert "task1_siebert_context_setup" in assembly_context
+    assert "task2_perplexity_research" in assembly_context
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+import yaml
+
+from core.domain.entities.agent import AgentRole
+from core.infrastructure.repositories import yaml_agent_repository
+from core.infrastructure.repositories.yaml_agent_repository import YamlAgentRepository
+
+
+def _write_agent(base, profile, file_name, **data):
+    path = base / profile / "agents" / f"{file_name}.yaml"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump({"name": file_name, **data}))
+    return path
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    calls = []
+    original = yaml_agent_repository._read_agent_file
+
+    def counting(file_path):
+        calls.append(file_path.name)
+        return original(file_path)
+
+    monkeypatch.setattr(yaml_agent_repository, "_read_agent_file", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_lookups_are_served_from_the_catalog(tmp_path, parse_counter):
+    _write_agent(tmp_path, "acme", "Research Specialist", role="researcher")
+    _write_agent(tmp_path, "acme", "copywriter", role="copywriter")
+    _write_agent(tmp_path, "beta", "copywriter", role="copywriter", is_active=False)
+    repo = YamlAgentRepository(str(tmp_path), refresh_interval_seconds=60)
+
+    agent = await repo.get_by_profile_and_name("acme", "research_specialist")
+    assert agent.name == "Research Specialist"
+    assert agent.metadata["client_profile"] == "acme"
+    assert (await repo.get_by_id(agent.id)).name == "Research Specialist"
+    assert len(await repo.get_by_role(AgentRole.COPYWRITER)) == 2
+    assert (await repo.get_by_name("copywriter")).metadata["client_profile"] == "acme"
+    assert not (await repo.get_by_profile_and_name("beta", "copywriter")).is_active
+
+    for _ in range(5):
+        resolved = await repo.get_by_profile_and_name("acme", "Research Specialist")
+        assert resolved.id == agent.id
+
+    # Returned agents are copies; the catalog is not mutated by callers
+    resolved.metadata["client_profile"] = "other"
+    assert (await repo.get_by_id(agent.id)).metadata["client_profile"] == "acme"
+    assert len(parse_counter) == 3
+
+
+@pytest.mark.asyncio
+async def test_agent_factory_uses_profile_index(tmp_path, parse_counter):
+    pytest.importorskip("google.generativeai")
+    from core.infrastructure.factories.agent_factory import AgentFactory
+
+    _write_agent(tmp_path, "acme", "Research Specialist", role="researcher")
+    _write_agent(tmp_path, "default", "research_specialist", role="researcher")
+    factory = AgentFactory(YamlAgentRepository(str(tmp_path)))
+
+    for _ in range(3):
+        agent = await factory.get(
+            name="research_specialist", role=None, ctx={"client_profile": "acme"}
+        )
+        assert agent.metadata["client_profile"] == "acme"
+    assert len(parse_counter) == 2
+
+
+@pytest.mark.asyncio
+async def test_catalog_reloads_changed_files_only(tmp_path, parse_counter):
+    path = _write_agent(tmp_path, "acme", "writer", role="copywriter", goal="v1")
+    _write_agent(tmp_path, "acme", "editor", role="editor")
+    repo = YamlAgentRepository(str(tmp_path), refresh_interval_seconds=0)
+
+    before = await repo.get_by_profile_and_name("acme", "writer")
+    assert before.goal == "v1"
+
+    path.write_text(
+        yaml.safe_dump({"name": "writer", "role": "copywriter", "goal": "v2"})
+    )
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    _write_agent(tmp_path, "acme", "analyst", role="researcher")
+
+    after = await repo.get_by_profile_and_name("acme", "writer")
+    assert after.goal == "v2"
+    assert after.id == before.id
+    assert sorted(parse_counter) == [
+        "analyst.yaml",
+        "editor.yaml",
+        "writer.yaml",
+        "writer.yaml",
+    ]
+
+    assert await repo.delete(after.id)
+    assert await repo.get_by_profile_and_name("acme", "writer") is None
+    assert {a.name for a in await repo.get_by_client_profile("acme")} == {
+        "analyst",
+        "editor",
+    }